@@ -22,6 +22,9 @@ from backend.api_common.error_handler import (
 )
 from backend.db import db
 from backend.config import Config, ConfigProd
+from backend.extensions.access_token_cache import init_app as init_access_token_cache
+from backend.extensions.audit.deferred import init_app as init_deferred_audit
+from backend.extensions.jwks_cache import init_app as init_google_jwks_cache
 from backend.extensions.email_sender.email_sender import EmailSender
 from backend.extensions.metrics.middleware import init_metrics_middleware
 from backend.extensions.metrics.writer import (
@@ -29,8 +32,21 @@ from backend.extensions.metrics.writer import (
     validate_latency_cap_overrides,
 )
 from backend.extensions.notifications.notifications import NotificationSender
-from backend.extensions.request_timing import init_app as init_request_timing
+from backend.extensions.password_hashing import (
+    PasswordHashingBusyError,
+    handle_503_password_hashing_busy,
+    init_app as init_password_hashing,
+)
+from backend.extensions.request_timing import (
+    init_app as init_request_timing,
+    init_hook_timing,
+)
+from backend.extensions.response_compression import (
+    init_app as init_response_compression,
+)
+from backend.extensions.sql_tracing import init_app as init_sql_tracing
 from backend.extensions.url_validation.url_validator import UrlValidator
+from backend.cli.admin import register_admin_cli
 from backend.cli.metrics import register_metrics_cli
 from backend.cli.mock_options import register_mocks_db_cli
 from backend.cli.openapi import register_openapi_cli
@@ -153,6 +169,12 @@ def create_app(
     # before_request hook (notably the rate limiter, which can abort with a 429)
     # can short-circuit the request. app_logger and the metrics hook both read it.
     init_request_timing(app)
+    # Registered early so its after_request runs LAST (Flask runs them in
+    # reverse): every other hook sees the identity body.
+    init_response_compression(app)
+    # Ahead of any hook that can touch the DB, so the request's trace sees
+    # every statement.
+    init_sql_tracing(app)
 
     app_logger.init_app(app, show_test_logs)
 
@@ -161,6 +183,10 @@ def create_app(
 
     csrf.init_app(app)
     metrics_writer.init_app(app)
+    init_password_hashing(app)
+    init_access_token_cache(app)
+    init_google_jwks_cache(app)
+    init_deferred_audit(app)
     login_manager.init_app(app)
     oauth.init_app(app)
 
@@ -338,6 +364,7 @@ def create_app(
     # validate cap-override keys here (not in init_app, where url_map is empty).
     validate_latency_cap_overrides(app)
 
+    register_admin_cli(app)
     register_metrics_cli(app)
     register_mocks_db_cli(app)
     register_openapi_cli(app)
@@ -347,6 +374,9 @@ def create_app(
     app.register_error_handler(404, handle_404_response)
     app.register_error_handler(CSRFError, handle_403_response_from_csrf)
     app.register_error_handler(429, handle_429_response_default_ratelimit)
+    app.register_error_handler(
+        PasswordHashingBusyError, handle_503_password_hashing_busy
+    )
 
     if not testing:
         # Import models to initialize migration scripts
@@ -365,6 +395,9 @@ def create_app(
     add_security_headers(app)
     init_metrics_middleware(app)
     init_vite_app(app)
+    # Must stay LAST: its before_request runs after every other one and its
+    # after_request before every other one, bounding the hooks phase.
+    init_hook_timing(app)
     return app
 
 
@@ -11,20 +11,24 @@ Each function:
 
 from __future__ import annotations
 
+from collections import Counter, defaultdict
+from dataclasses import dataclass
+
 from flask import current_app, url_for
+from sqlalchemy import String, case, cast, func, literal, not_, or_, select, tuple_
 
 from backend import db
 from backend.admin.constants import AdminActionErrorCodes
 from backend.admin.guards import reject_leaving_zero_active_admins, reject_self_action
-from backend.admin.moderation_service import select_ownership_transfer_target
 from backend.api_common.responses import FlaskResponse
-from backend.api_v1.services.tokens import mark_all_refresh_tokens_revoked_for_user
+from backend.api_v1.services.tokens import mark_all_refresh_tokens_revoked_for_users
 from backend.extensions import audit
 from backend.extensions.extension_utils import safe_get_email_sender
 from backend.models.contact_form_entries import ContactFormEntries
 from backend.models.email_validations import Email_Validations
+from backend.models.forgot_passwords import Forgot_Passwords
 from backend.models.user_oauth_identities import UserOAuthIdentity
-from backend.models.users import Users
+from backend.models.users import User_Role, Users
 from backend.models.utub_members import Member_Role, Utub_Members
 from backend.models.utubs import Utubs
 from backend.schemas.admin_actions import AdminActionResponseSchema
@@ -67,6 +71,268 @@ def is_tombstoned(*, user: Users) -> bool:
     return user.username == build_tombstone_username(user_id=user.id)
 
 
+@dataclass(frozen=True)
+class AccountErasureCounts:
+    """Per-user tallies recorded in the ``USER_ERASE`` audit metadata."""
+
+    utubs_deleted: int = 0
+    ownerships_transferred: int = 0
+    memberships_removed: int = 0
+    contact_entries_deleted: int = 0
+    api_tokens_revoked: int = 0
+
+    def to_audit_metadata(self, *, reason: str) -> dict:
+        return {
+            "reason": reason,
+            "utubs_deleted": self.utubs_deleted,
+            "ownerships_transferred": self.ownerships_transferred,
+            "memberships_removed": self.memberships_removed,
+            "contact_entries_deleted": self.contact_entries_deleted,
+            "api_tokens_revoked": self.api_tokens_revoked,
+        }
+
+
+@dataclass(frozen=True)
+class MembershipErasurePlan:
+    """Set-based resolution of every UTub membership held by the erased users.
+
+    ``solo_utub_ids`` have no surviving member and are hard-deleted;
+    ``ownership_transfers`` maps each surviving UTub whose creator is being
+    erased to its new owner; ``surviving_utub_ids`` are every other affected
+    UTub that only loses the erased users' membership rows. The per-user
+    counters feed each user's audit row; a solo UTub counts once, for its
+    creator.
+    """
+
+    solo_utub_ids: frozenset[int]
+    surviving_utub_ids: frozenset[int]
+    ownership_transfers: dict[int, int]
+    utubs_deleted_by_user: Counter[int]
+    ownerships_transferred_by_user: Counter[int]
+    memberships_removed_by_user: Counter[int]
+
+
+@dataclass(frozen=True)
+class BulkErasureResult:
+    """Outcome of ``erase_users_in_batch``, one bucket per requested user id."""
+
+    erased: dict[int, AccountErasureCounts]
+    already_erased: list[int]
+    not_found: list[int]
+    blocked_last_admin: list[int]
+
+
+def plan_membership_erasure(*, user_ids: list[int]) -> MembershipErasurePlan:
+    """Resolve solo UTubs, ownership transfers, and removable memberships in one query.
+
+    A window pass over every membership of every affected UTub computes, per
+    UTub, the number of members that survive the erasure and ranks the
+    survivors with the same rule as ``select_ownership_transfer_target``
+    (lowest-user-id CO_CREATOR, else lowest user id). Only the erased users'
+    rows and each UTub's top-ranked successor are returned, so the cost is
+    one round-trip no matter how many UTubs the users belong to — nothing is
+    lazy-loaded per membership.
+
+    Example: erasing users ``[7, 9]`` who are the only two members of UTub 3
+    puts 3 in ``solo_utub_ids`` and credits its deletion to whichever of the
+    two created it; if user 7 also created UTub 4 shared with users 12
+    (MEMBER) and 15 (CO_CREATOR), ``ownership_transfers`` gets ``{4: 15}``.
+    """
+    is_erased_member = Utub_Members.user_id.in_(user_ids)
+    affected_utub_ids = select(Utub_Members.utub_id).where(is_erased_member)
+    ranked_memberships = (
+        select(
+            Utub_Members.utub_id.label("utub_id"),
+            Utub_Members.user_id.label("user_id"),
+            Utubs.utub_creator.label("creator_id"),
+            func.count()
+            .filter(not_(is_erased_member))
+            .over(partition_by=Utub_Members.utub_id)
+            .label("surviving_count"),
+            func.row_number()
+            .over(
+                partition_by=Utub_Members.utub_id,
+                order_by=(
+                    case((is_erased_member, 1), else_=0),
+                    case(
+                        (Utub_Members.member_role == Member_Role.CO_CREATOR, 0),
+                        else_=1,
+                    ),
+                    Utub_Members.user_id,
+                ),
+            )
+            .label("successor_rank"),
+        )
+        .join(Utubs, Utubs.id == Utub_Members.utub_id)
+        .where(Utub_Members.utub_id.in_(affected_utub_ids))
+        .subquery()
+    )
+    plan_rows = db.session.execute(
+        select(ranked_memberships).where(
+            or_(
+                ranked_memberships.c.user_id.in_(user_ids),
+                ranked_memberships.c.successor_rank == 1,
+            )
+        )
+    ).all()
+
+    erased_user_ids: set[int] = set(user_ids)
+    successor_by_utub: dict[int, int] = {
+        row.utub_id: row.user_id
+        for row in plan_rows
+        if row.successor_rank == 1 and row.user_id not in erased_user_ids
+    }
+    solo_utub_ids: set[int] = set()
+    surviving_utub_ids: set[int] = set()
+    ownership_transfers: dict[int, int] = {}
+    utubs_deleted_by_user: Counter[int] = Counter()
+    ownerships_transferred_by_user: Counter[int] = Counter()
+    memberships_removed_by_user: Counter[int] = Counter()
+
+    solo_creator_by_utub: dict[int, int] = {}
+    erased_members_by_solo_utub: defaultdict[int, list[int]] = defaultdict(list)
+
+    for row in plan_rows:
+        if row.user_id not in erased_user_ids:
+            continue
+        if row.surviving_count == 0:
+            solo_utub_ids.add(row.utub_id)
+            solo_creator_by_utub[row.utub_id] = row.creator_id
+            erased_members_by_solo_utub[row.utub_id].append(row.user_id)
+            continue
+        surviving_utub_ids.add(row.utub_id)
+        memberships_removed_by_user[row.user_id] += 1
+        if row.creator_id == row.user_id:
+            ownership_transfers[row.utub_id] = successor_by_utub[row.utub_id]
+            ownerships_transferred_by_user[row.user_id] += 1
+
+    # A solo UTub shared by several erased users is deleted once, so it is
+    # credited once: to its creator, else its lowest-id erased member.
+    for utub_id, erased_member_ids in erased_members_by_solo_utub.items():
+        creator_id = solo_creator_by_utub[utub_id]
+        credited_user_id = (
+            creator_id if creator_id in erased_member_ids else min(erased_member_ids)
+        )
+        utubs_deleted_by_user[credited_user_id] += 1
+
+    return MembershipErasurePlan(
+        solo_utub_ids=frozenset(solo_utub_ids),
+        surviving_utub_ids=frozenset(surviving_utub_ids),
+        ownership_transfers=ownership_transfers,
+        utubs_deleted_by_user=utubs_deleted_by_user,
+        ownerships_transferred_by_user=ownerships_transferred_by_user,
+        memberships_removed_by_user=memberships_removed_by_user,
+    )
+
+
+def apply_membership_erasure_plan(
+    *, plan: MembershipErasurePlan, user_ids: list[int]
+) -> None:
+    """Apply a ``MembershipErasurePlan`` with bulk statements; never commits.
+
+    Solo UTubs lose their membership rows and are then deleted — UTub URLs,
+    tags, and URL-tag rows go with them through their ``ON DELETE CASCADE``
+    foreign keys. Ownership transfers and ``lastUpdated`` stamps land in one
+    UPDATE, promoted successors in a second, and the erased users' remaining
+    memberships in one DELETE.
+    """
+    if plan.solo_utub_ids:
+        Utub_Members.query.filter(
+            Utub_Members.utub_id.in_(sorted(plan.solo_utub_ids))
+        ).delete(synchronize_session=False)
+        Utubs.query.filter(Utubs.id.in_(sorted(plan.solo_utub_ids))).delete(
+            synchronize_session=False
+        )
+
+    if not plan.surviving_utub_ids:
+        return
+
+    surviving_utub_values: dict = {Utubs.last_updated: utc_now()}
+    if plan.ownership_transfers:
+        surviving_utub_values[Utubs.utub_creator] = case(
+            plan.ownership_transfers, value=Utubs.id, else_=Utubs.utub_creator
+        )
+    Utubs.query.filter(Utubs.id.in_(sorted(plan.surviving_utub_ids))).update(
+        surviving_utub_values, synchronize_session=False
+    )
+
+    if plan.ownership_transfers:
+        Utub_Members.query.filter(
+            tuple_(Utub_Members.utub_id, Utub_Members.user_id).in_(
+                list(plan.ownership_transfers.items())
+            )
+        ).update(
+            {Utub_Members.member_role: Member_Role.CREATOR},
+            synchronize_session=False,
+        )
+
+    Utub_Members.query.filter(
+        Utub_Members.user_id.in_(user_ids),
+        Utub_Members.utub_id.in_(sorted(plan.surviving_utub_ids)),
+    ).delete(synchronize_session=False)
+
+
+def _erase_accounts(*, user_ids: list[int]) -> dict[int, AccountErasureCounts]:
+    """Run the full set-based erasure for ``user_ids``; never commits or audits.
+
+    Every step is a bulk statement keyed on the whole id set, so the number
+    of round-trips is constant in both the number of users and the number
+    of UTubs they belong to. The caller owns guards, audit rows, and the
+    final ``db.session.commit()``.
+    """
+    plan: MembershipErasurePlan = plan_membership_erasure(user_ids=user_ids)
+    apply_membership_erasure_plan(plan=plan, user_ids=user_ids)
+
+    # PII-bearing child rows.
+    Email_Validations.query.filter(Email_Validations.user_id.in_(user_ids)).delete(
+        synchronize_session=False
+    )
+    Forgot_Passwords.query.filter(Forgot_Passwords.user_id.in_(user_ids)).delete(
+        synchronize_session=False
+    )
+    UserOAuthIdentity.query.filter(UserOAuthIdentity.user_id.in_(user_ids)).delete(
+        synchronize_session=False
+    )
+    contact_entries_by_user: dict[int, int] = dict(
+        db.session.query(ContactFormEntries.user_id, func.count(ContactFormEntries.id))
+        .filter(ContactFormEntries.user_id.in_(user_ids))
+        .group_by(ContactFormEntries.user_id)
+        .all()
+    )
+    if contact_entries_by_user:
+        ContactFormEntries.query.filter(
+            ContactFormEntries.user_id.in_(user_ids)
+        ).delete(synchronize_session=False)
+
+    # Anonymize the Users rows themselves and kill web sessions via the
+    # invalidation stamp; tombstones are derived from each row's own id.
+    tombstone_username = literal(TOMBSTONE_USERNAME_PREFIX) + cast(Users.id, String)
+    Users.query.filter(Users.id.in_(user_ids)).update(
+        {
+            Users.username: tombstone_username,
+            Users.email: tombstone_username + f"@{TOMBSTONE_EMAIL_DOMAIN}",
+            Users.password: None,
+            Users.email_validated: False,
+            Users.sessions_invalidated_at: utc_now(),
+        },
+        synchronize_session=False,
+    )
+    api_tokens_revoked_by_user: dict[int, int] = (
+        mark_all_refresh_tokens_revoked_for_users(user_ids=user_ids)
+    )
+
+    return {
+        user_id: AccountErasureCounts(
+            utubs_deleted=plan.utubs_deleted_by_user[user_id],
+            ownerships_transferred=plan.ownerships_transferred_by_user[user_id],
+            memberships_removed=plan.memberships_removed_by_user[user_id],
+            contact_entries_deleted=contact_entries_by_user.get(user_id, 0),
+            api_tokens_revoked=api_tokens_revoked_by_user.get(user_id, 0),
+        )
+        for user_id in user_ids
+    }
+
+
 def erase_user(*, actor_id: int, target_user_id: int, reason: str) -> FlaskResponse:
     """Erase a user account: anonymize-in-place, scrub PII, resolve memberships.
 
@@ -80,10 +346,11 @@ def erase_user(*, actor_id: int, target_user_id: int, reason: str) -> FlaskRespo
     - the user's ``ContactFormEntries`` rows deleted (bodies may hold PII)
     - web sessions invalidated + all API refresh tokens revoked
 
-    UTub membership lifecycle is resolved per-UTub:
+    UTub membership lifecycle is resolved per-UTub (see
+    ``plan_membership_erasure``, which computes all of it set-based):
 
     - **solo UTub** (erased user is the only member): the UTub is hard-deleted
-      via ORM cascade
+      along with its URLs, tags, and membership row
     - **created UTub with other members**: ownership transfers to the
       deterministic remaining member (lowest-user-id CO_CREATOR, else lowest
       user id), then the erased user's membership row is removed
@@ -134,75 +401,16 @@ def erase_user(*, actor_id: int, target_user_id: int, reason: str) -> FlaskRespo
             message=ADMIN_ACTION_STRINGS.ACCOUNT_ERASE_NOOP,
         ).to_response()
 
-    utubs_deleted_count: int = 0
-    ownerships_transferred_count: int = 0
-    memberships_removed_count: int = 0
-
-    # Snapshot: deleting UTubs/memberships mutates the relationship in-place.
-    memberships: list[Utub_Members] = list(target_user.utubs_is_member_of)
-    for membership in memberships:
-        containing_utub: Utubs = membership.to_utub
-        other_members: list[Utub_Members] = [
-            utub_member
-            for utub_member in containing_utub.members
-            if utub_member.user_id != target_user_id
-        ]
-
-        if not other_members:
-            # Solo UTub: unshared after erasure — delete it entirely (the
-            # membership row goes with it via ORM cascade).
-            db.session.delete(containing_utub)
-            utubs_deleted_count += 1
-            continue
-
-        if containing_utub.utub_creator == target_user_id:
-            new_owner_membership: Utub_Members = select_ownership_transfer_target(
-                other_members=other_members
-            )
-            containing_utub.utub_creator = new_owner_membership.user_id
-            new_owner_membership.member_role = Member_Role.CREATOR
-            ownerships_transferred_count += 1
-
-        db.session.delete(membership)
-        containing_utub.set_last_updated()
-        memberships_removed_count += 1
-
-    # PII-bearing child rows.
-    if target_user.email_confirm is not None:
-        db.session.delete(target_user.email_confirm)
-    if target_user.forgot_password is not None:
-        db.session.delete(target_user.forgot_password)
-    for oauth_identity in list(target_user.oauth_identities):
-        db.session.delete(oauth_identity)
-    contact_entries_deleted_count: int = ContactFormEntries.query.filter(
-        ContactFormEntries.user_id == target_user_id
-    ).delete(synchronize_session=False)
-
-    # Anonymize the Users row itself.
-    target_user.username = build_tombstone_username(user_id=target_user_id)
-    target_user.email = build_tombstone_email(user_id=target_user_id)
-    target_user.password = None
-    target_user.email_validated = False
-
-    # Kill all sessions: web via the invalidation stamp, API via bulk revoke.
-    target_user.sessions_invalidated_at = utc_now()
-    api_tokens_revoked_count: int = mark_all_refresh_tokens_revoked_for_user(
-        user_id=target_user_id
-    )
+    erasure_counts: AccountErasureCounts = _erase_accounts(user_ids=[target_user_id])[
+        target_user_id
+    ]
 
     audit.record(
         actor_id=actor_id,
         action=ADMIN_AUDIT_ACTIONS.USER_ERASE,
         target_type="User",
         target_id=str(target_user_id),
-        metadata={
-            "reason": reason,
-            "utubs_deleted": utubs_deleted_count,
-            "ownerships_transferred": ownerships_transferred_count,
-            "memberships_removed": memberships_removed_count,
-            "contact_entries_deleted": contact_entries_deleted_count,
-            "api_tokens_revoked": api_tokens_revoked_count,
-        },
+        metadata=erasure_counts.to_audit_metadata(reason=reason),
     )
     db.session.commit()
     return AdminActionResponseSchema(
@@ -211,6 +419,91 @@ def erase_user(*, actor_id: int, target_user_id: int, reason: str) -> FlaskRespo
     ).to_response()
 
 
+def erase_users_in_batch(
+    *, actor_id: int, target_user_ids: list[int], reason: str
+) -> BulkErasureResult:
+    """Erase many accounts in one transaction with the set-based pipeline.
+
+    Applies the same guards as ``erase_user`` to the whole batch up front:
+    the actor's own id, unknown ids, and already-tombstoned users are
+    skipped; if the batch contains admins and erasing all of them would
+    leave no active admin outside the batch, those admins are skipped too.
+    Everyone else is erased with one pass of ``_erase_accounts`` and gets
+    their own ``USER_ERASE`` audit row (metadata carries ``batch_size``).
+    Commits once at the end.
+
+    Args:
+        actor_id:        ID of the admin performing the batch.
+        target_user_ids: Primary keys of the users to erase; duplicates ignored.
+        reason:          Required human-readable reason recorded per audit row.
+
+    Returns:
+        ``BulkErasureResult`` bucketing every requested id.
+    """
+    requested_user_ids: list[int] = sorted(set(target_user_ids) - {actor_id})
+    found_users: list[Users] = (
+        Users.query.filter(Users.id.in_(requested_user_ids)).all()
+        if requested_user_ids
+        else []
+    )
+    found_user_ids: set[int] = {user.id for user in found_users}
+    not_found: list[int] = [
+        user_id for user_id in requested_user_ids if user_id not in found_user_ids
+    ]
+    already_erased: list[int] = sorted(
+        user.id for user in found_users if is_tombstoned(user=user)
+    )
+    erasable_users: list[Users] = [
+        user for user in found_users if not is_tombstoned(user=user)
+    ]
+
+    blocked_last_admin: list[int] = []
+    batch_admin_ids: list[int] = sorted(
+        user.id for user in erasable_users if user.role == User_Role.ADMIN
+    )
+    if batch_admin_ids:
+        remaining_active_admin_count: int = Users.query.filter(
+            Users.role == User_Role.ADMIN,
+            Users.is_suspended == False,  # noqa: E712 — SQLAlchemy column comparison
+            Users.id.notin_(batch_admin_ids),
+        ).count()
+        if remaining_active_admin_count == 0:
+            blocked_last_admin = batch_admin_ids
+
+    user_ids_to_erase: list[int] = sorted(
+        user.id for user in erasable_users if user.id not in blocked_last_admin
+    )
+    if not user_ids_to_erase:
+        return BulkErasureResult(
+            erased={},
+            already_erased=already_erased,
+            not_found=not_found,
+            blocked_last_admin=blocked_last_admin,
+        )
+
+    erased: dict[int, AccountErasureCounts] = _erase_accounts(
+        user_ids=user_ids_to_erase
+    )
+    for user_id, erasure_counts in erased.items():
+        audit.record(
+            actor_id=actor_id,
+            action=ADMIN_AUDIT_ACTIONS.USER_ERASE,
+            target_type="User",
+            target_id=str(user_id),
+            metadata={
+                **erasure_counts.to_audit_metadata(reason=reason),
+                "batch_size": len(user_ids_to_erase),
+            },
+        )
+    db.session.commit()
+    return BulkErasureResult(
+        erased=erased,
+        already_erased=already_erased,
+        not_found=not_found,
+        blocked_last_admin=blocked_last_admin,
+    )
+
+
 def unlink_oauth_identity(
     *, actor_id: int, target_user_id: int, identity_id: int, reason: str
 ) -> FlaskResponse:
@@ -1,10 +1,15 @@
 from __future__ import annotations
 
+import base64
+import binascii
 from dataclasses import dataclass
 from datetime import datetime, timedelta
+import json
 
-from sqlalchemy import or_
+from sqlalchemy import or_, tuple_
+from sqlalchemy.orm import contains_eager
 
+from backend.admin.row_counts import count_query_rows
 from backend.admin.user_service import escape_like_wildcards, LIKE_ESCAPE_CHAR
 from backend.models.audit_log import AuditLog
 from backend.models.users import Users
@@ -25,13 +30,24 @@ class AuditLogFilters:
 
 @dataclass(frozen=True)
 class AuditLogPage:
-    """One page of audit-log entries, newest first."""
+    """One page of audit-log entries, newest first.
+
+    Pages are fetched by keyset on ``(created_at, id)``: ``next_cursor`` /
+    ``previous_cursor`` seek past the last / before the first entry, so a
+    page deep into the retention window costs the same as the first.
+    ``offset`` still tracks the page's position for display. ``has_next``
+    comes from probing one entry past the page rather than from
+    ``total_count``, which is an estimate when ``count_is_estimate`` is set.
+    """
 
     entries: list[AuditLog]
     total_count: int
     filters: AuditLogFilters
     limit: int
     offset: int
+    count_is_estimate: bool = False
+    next_cursor: str | None = None
+    previous_cursor: str | None = None
 
     @property
     def has_previous(self) -> bool:
@@ -39,7 +55,7 @@ class AuditLogPage:
 
     @property
     def has_next(self) -> bool:
-        return self.offset + self.limit < self.total_count
+        return self.next_cursor is not None
 
     @property
     def previous_offset(self) -> int:
@@ -66,11 +82,35 @@ def _parse_filter_date(raw_date: str) -> datetime | None:
         return None
 
 
+def _encode_cursor(audit_entry: AuditLog) -> str:
+    """An opaque URL-safe cursor holding ``audit_entry``'s ``(created_at, id)``."""
+    return base64.urlsafe_b64encode(
+        json.dumps(
+            [audit_entry.created_at.isoformat(), audit_entry.id],
+            separators=(",", ":"),
+        ).encode()
+    ).decode()
+
+
+def _decode_cursor(raw_cursor: str) -> tuple[datetime, int] | None:
+    """``(created_at, id)`` from a cursor, or ``None`` when it is malformed."""
+    try:
+        raw_created_at, raw_id = json.loads(
+            base64.urlsafe_b64decode(raw_cursor.encode())
+        )
+        return datetime.fromisoformat(raw_created_at), int(raw_id)
+    except (binascii.Error, UnicodeError, ValueError, TypeError):
+        return None
+
+
 def query_audit_log(
     *,
     filters: AuditLogFilters,
     limit: int = DEFAULT_AUDIT_PAGE_LIMIT,
     offset: int = 0,
+    after: str | None = None,
+    before: str | None = None,
+    exact_count: bool = False,
 ) -> AuditLogPage:
     """Filterable, paginated view over ``AuditLogs``, newest first.
 
@@ -84,14 +124,25 @@ def query_audit_log(
       ``created_at`` — ``until`` covers the whole named day by comparing
       against the following midnight.
 
+    The substring filters are served by the trigram indexes on
+    ``AuditLogs.action`` and ``Users.username``/``email``.
+
+    ``after`` / ``before`` are cursors from a previous page's
+    ``next_cursor`` / ``previous_cursor``; when one decodes, the page seeks
+    from it instead of skipping ``offset`` entries (``offset`` is then only
+    the displayed position). A large result reports the planner's estimate
+    as ``total_count`` unless ``exact_count`` is requested.
+
     Example: ``query_audit_log(filters=AuditLogFilters(action="search",
     since="2026-07-01", until="2026-07-01"))`` returns every search action
     recorded on July 1st, newest first.
     """
-    audit_query = AuditLog.query
+    # Joined unconditionally so the rows template reads each entry's actor
+    # from the page query instead of one lazy load per row.
+    audit_query = AuditLog.query.join(Users, AuditLog.actor_id == Users.id)
     if filters.actor.strip():
         actor_pattern = f"%{escape_like_wildcards(filters.actor.strip())}%"
-        audit_query = audit_query.join(Users, AuditLog.actor_id == Users.id).filter(
+        audit_query = audit_query.filter(
             or_(
                 Users.username.ilike(actor_pattern, escape=LIKE_ESCAPE_CHAR),
                 Users.email.ilike(actor_pattern, escape=LIKE_ESCAPE_CHAR),
@@ -114,17 +165,57 @@ def query_audit_log(
         audit_query = audit_query.filter(
             AuditLog.created_at < until_moment + timedelta(days=1)
         )
-    total_count = audit_query.count()
-    page_entries = (
-        audit_query.order_by(AuditLog.created_at.desc(), AuditLog.id.desc())
-        .limit(limit)
-        .offset(offset)
-        .all()
-    )
+    total_count, count_is_estimate = count_query_rows(audit_query, exact=exact_count)
+
+    seek_cursor: tuple[datetime, int] | None = None
+    seek_backwards = False
+    for raw_cursor, is_before in ((after, False), (before, True)):
+        if raw_cursor:
+            seek_cursor = _decode_cursor(raw_cursor)
+            seek_backwards = is_before
+            break
+
+    page_query = audit_query.options(contains_eager(AuditLog.actor))
+    if seek_backwards:
+        page_query = page_query.order_by(AuditLog.created_at, AuditLog.id)
+    else:
+        page_query = page_query.order_by(AuditLog.created_at.desc(), AuditLog.id.desc())
+    if seek_cursor is not None:
+        # One row comparison, so Postgres seeks idx_audit_logs_created_at_id
+        # straight to the cursor.
+        entry_key = tuple_(AuditLog.created_at, AuditLog.id)
+        page_query = page_query.filter(
+            entry_key > tuple_(*seek_cursor)
+            if seek_backwards
+            else entry_key < tuple_(*seek_cursor)
+        )
+    else:
+        page_query = page_query.offset(offset)
+    # One entry past the page tells whether another page follows.
+    page_entries = page_query.limit(limit + 1).all()
+    has_more = len(page_entries) > limit
+    page_entries = page_entries[:limit]
+
+    if seek_backwards:
+        page_entries.reverse()
+        # A short backwards page means the seek ran into the newest entry.
+        has_next = True
+        if not has_more:
+            offset = 0
+    else:
+        has_next = has_more
+
     return AuditLogPage(
         entries=page_entries,
         total_count=total_count,
         filters=filters,
         limit=limit,
         offset=offset,
+        count_is_estimate=count_is_estimate,
+        next_cursor=(
+            _encode_cursor(page_entries[-1]) if has_next and page_entries else None
+        ),
+        previous_cursor=(
+            _encode_cursor(page_entries[0]) if offset > 0 and page_entries else None
+        ),
     )
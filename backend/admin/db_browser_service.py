@@ -1,16 +1,29 @@
 from __future__ import annotations
 
+import base64
+import binascii
 import datetime
 import decimal
 import enum
 import json
 from dataclasses import dataclass
 
-from sqlalchemy import Enum as SQLEnum, String, inspect, or_
+from sqlalchemy import (
+    Enum as SQLEnum,
+    PrimaryKeyConstraint,
+    String,
+    UniqueConstraint,
+    and_,
+    inspect,
+    or_,
+    text,
+    tuple_,
+)
 from sqlalchemy.orm import ColumnProperty
 from sqlalchemy.sql.elements import ColumnElement
 
 from backend import db
+from backend.admin.row_counts import EXACT_COUNT_THRESHOLD, count_query_rows
 from backend.admin.user_service import LIKE_ESCAPE_CHAR, escape_like_wildcards
 
 # Imported for its side effect: backend/models/__init__.py imports every model
@@ -25,6 +38,13 @@ _TRUNCATION_SUFFIX: str = "…"
 _PK_SEGMENT_SEPARATOR: str = ","
 _SORT_DIRECTION_ASC: str = "asc"
 _SORT_DIRECTION_DESC: str = "desc"
+_BTREE_INDEX_METHOD: str = "btree"
+
+_ESTIMATED_ROW_COUNTS_SQL: str = (
+    "SELECT relname, reltuples::bigint FROM pg_class "
+    "WHERE relkind IN ('r', 'p') AND relnamespace = current_schema()::regnamespace "
+    "AND relname = ANY(:table_names)"
+)
 
 # Per-model column exclusions for sensitive data. The browser is read-only,
 # but password hashes and token/secret columns still must never render in a
@@ -32,7 +52,7 @@ _SORT_DIRECTION_DESC: str = "desc"
 # (``column.key``), excluded from BOTH the grid and the row-detail view.
 _SENSITIVE_COLUMN_EXCLUSIONS: dict[str, list[str]] = {
     "Users": ["password"],
-    "ApiRefreshTokens": ["token"],
+    "ApiRefreshTokens": ["token_hash"],
     "Forgot_Passwords": ["reset_token"],
     "Email_Validations": ["validation_token"],
     "UserOAuthIdentity": ["provider_subject"],
@@ -41,10 +61,12 @@ _SENSITIVE_COLUMN_EXCLUSIONS: dict[str, list[str]] = {
 
 @dataclass(frozen=True)
 class TableSummary:
-    """One entry on the DB-browser overview: a table and its live row count."""
+    """One entry on the DB-browser overview: a table and its row count, which
+    is the planner's estimate (``is_estimate``) for large tables."""
 
     table_name: str
     row_count: int
+    is_estimate: bool = False
 
 
 @dataclass(frozen=True)
@@ -90,14 +112,29 @@ class _PaginationBase:
 @dataclass(frozen=True)
 class TablePage(_PaginationBase):
     """One page of a table grid, mirroring the offset/limit pagination of
-    ``UserSearchPage`` / ``AuditLogPage``."""
+    ``UserSearchPage`` / ``AuditLogPage``.
+
+    Pages are fetched by keyset: ``next_cursor`` / ``previous_cursor`` seek
+    past the last / before the first row, so paging forward never rescans
+    skipped rows. ``offset`` still tracks the page's position for display.
+    ``has_next`` comes from probing one row past the page rather than from
+    ``total_count``, which is an estimate when ``count_is_estimate`` is set.
+    """
 
     table_name: str
     column_keys: list[str]
+    sortable_keys: list[str]
     rows: list[TableRow]
     sort_key: str
     direction: str
     query: str
+    count_is_estimate: bool = False
+    next_cursor: str | None = None
+    previous_cursor: str | None = None
+
+    @property
+    def has_next(self) -> bool:
+        return self.next_cursor is not None
 
 
 @dataclass(frozen=True)
@@ -178,8 +215,8 @@ def _primary_key_attr_keys(model_class: type) -> list[str]:
 def format_cell_value(value: object, *, truncate: int | None = None) -> str:
     """Render an arbitrary column value as a display-safe string.
 
-    Dispatches by type so JSONB, enums, timezone-aware datetimes, dates, and
-    Decimals each render deterministically; everything else falls back to
+    Dispatches by type so JSONB, enums, timezone-aware datetimes, dates,
+    Decimals, and binary digests each render deterministically; everything else falls back to
     ``str``. The returned string is NOT HTML-escaped — Jinja autoescape handles
     that at render time.
 
@@ -198,6 +235,8 @@ def format_cell_value(value: object, *, truncate: int | None = None) -> str:
         >>> import decimal
         >>> format_cell_value(decimal.Decimal("5.20"))
         '5.20'
+        >>> format_cell_value(bytes([0xAB, 0x01]))
+        'ab01'
         >>> format_cell_value("abcdef", truncate=3)
         'abc…'
         >>> format_cell_value("ab", truncate=3)
@@ -215,6 +254,8 @@ def format_cell_value(value: object, *, truncate: int | None = None) -> str:
         result = value.isoformat()
     elif isinstance(value, decimal.Decimal):
         result = str(value)
+    elif isinstance(value, bytes):
+        result = value.hex()
     else:
         result = str(value)
 
@@ -264,54 +305,221 @@ def _parse_row_pk(model_class: type, raw_pk: str) -> tuple | object | None:
     return tuple(coerced_parts)
 
 
+def _estimated_row_counts(table_names: list[str]) -> dict[str, int]:
+    """The planner's row estimate (``pg_class.reltuples``) per table name.
+
+    One catalog lookup for every table; a table missing from the result (not
+    yet created) is simply absent from the returned dict.
+    """
+    estimate_rows = db.session.execute(
+        text(_ESTIMATED_ROW_COUNTS_SQL), {"table_names": table_names}
+    ).all()
+    return {table_name: int(estimate) for table_name, estimate in estimate_rows}
+
+
+def _row_count(
+    model_class: type, *, estimate: int | None, exact: bool
+) -> tuple[int, bool]:
+    """``(row count, is_estimate)`` for an unfiltered table.
+
+    The catalog estimate is used as-is for large tables unless ``exact`` is
+    requested; small, never-analyzed, or unknown tables get an exact count.
+    """
+    if not exact and estimate is not None and estimate >= EXACT_COUNT_THRESHOLD:
+        return estimate, True
+    return db.session.query(model_class).count(), False
+
+
 def list_tables() -> list[TableSummary]:
-    """A ``TableSummary`` for every mapped model, ordered by table name."""
-    return [
-        TableSummary(
-            table_name=model_class.__tablename__,
-            row_count=db.session.query(model_class).count(),
+    """A ``TableSummary`` for every mapped model, ordered by table name.
+
+    Large tables report the catalog estimate instead of a full count.
+    """
+    model_classes = _iter_model_classes()
+    estimates = _estimated_row_counts(
+        [model_class.__tablename__ for model_class in model_classes]
+    )
+    summaries: list[TableSummary] = []
+    for model_class in model_classes:
+        row_count, is_estimate = _row_count(
+            model_class, estimate=estimates.get(model_class.__tablename__), exact=False
+        )
+        summaries.append(
+            TableSummary(
+                table_name=model_class.__tablename__,
+                row_count=row_count,
+                is_estimate=is_estimate,
+            )
         )
-        for model_class in _iter_model_classes()
+    return summaries
+
+
+def _sortable_column_keys(model_class: type) -> list[str]:
+    """Visible-column attribute keys that lead an index on the table.
+
+    Only these are offered as sort keys, so every grid ordering is an index
+    scan (the primary key always qualifies) rather than a full sort of a
+    large table. Primary-key and unique constraints count as indexes; indexes
+    using another method than B-tree (e.g. the GIN trigram indexes) do not,
+    as they cannot return rows in order.
+    """
+    table = model_class.__table__
+    leading_columns = {
+        index.columns.values()[0]
+        for index in table.indexes
+        if index.columns
+        and index.dialect_options["postgresql"]["using"] in (None, _BTREE_INDEX_METHOD)
+    }
+    leading_columns.update(
+        constraint.columns.values()[0]
+        for constraint in table.constraints
+        if isinstance(constraint, (PrimaryKeyConstraint, UniqueConstraint))
+        and constraint.columns
+    )
+    return [
+        column.key
+        for column in _visible_columns(model_class)
+        if column.columns[0] in leading_columns
     ]
 
 
 def _resolve_sort_attr_key(model_class: type, sort_key: str | None) -> str:
-    """The visible-column attribute key to sort on, or the primary key fallback.
+    """The sortable attribute key to sort on, or the primary key fallback.
 
     Invalid input is ignored rather than raising: a ``sort_key`` that is
-    ``None``, unknown, or a sensitive (hence non-visible) column falls back to
-    the first primary-key attribute so ordering is always well-defined.
+    ``None``, unknown, unindexed, or a sensitive (hence non-visible) column
+    falls back to the first primary-key attribute so ordering is always
+    well-defined.
 
     Examples:
         >>> # sort_key="username" for Users → "username"
         >>> # sort_key="password" (sensitive) or "nope" (unknown) → "id"
     """
-    visible_keys = {column.key for column in _visible_columns(model_class)}
-    if sort_key is not None and sort_key in visible_keys:
+    if sort_key is not None and sort_key in _sortable_column_keys(model_class):
         return sort_key
     return _primary_key_attr_keys(model_class)[0]
 
 
 def _build_order_by(
-    model_class: type, *, sort_key: str, direction: str
+    model_class: type, *, sort_key: str, direction: str, reverse: bool = False
 ) -> list[ColumnElement]:
     """Order-by clauses: the chosen column then every primary-key column.
 
     The primary-key columns are always appended ascending so ties on the
     chosen column resolve deterministically (stable pagination). ``direction``
-    only descends on an exact ``"desc"``; anything else ascends.
+    only descends on an exact ``"desc"``; anything else ascends. ``reverse``
+    flips every clause, for seeking backwards from a cursor; Postgres' default
+    NULL placement (last ascending, first descending) flips with it.
     """
+    sort_descending = (direction == _SORT_DIRECTION_DESC) != reverse
     sort_attr = getattr(model_class, sort_key)
-    if direction == _SORT_DIRECTION_DESC:
-        primary_clause = sort_attr.desc()
-    else:
-        primary_clause = sort_attr.asc()
+    primary_clause = sort_attr.desc() if sort_descending else sort_attr.asc()
     pk_clauses = [
-        getattr(model_class, pk_key) for pk_key in _primary_key_attr_keys(model_class)
+        getattr(model_class, pk_key).desc() if reverse else getattr(model_class, pk_key)
+        for pk_key in _primary_key_attr_keys(model_class)
     ]
     return [primary_clause, *pk_clauses]
 
 
+def _encode_cursor_value(value: object) -> object:
+    """A JSON-safe form of one cursor value, reversed by
+    ``_decode_cursor_value`` using the column's Python type."""
+    if isinstance(value, enum.Enum):
+        return value.name
+    if isinstance(value, (datetime.date, decimal.Decimal)):
+        return str(value)
+    if isinstance(value, bytes):
+        return value.hex()
+    return value
+
+
+def _decode_cursor_value(column_attr: ColumnProperty, raw_value: object) -> object:
+    if raw_value is None:
+        return None
+    python_type = column_attr.columns[0].type.python_type
+    if issubclass(python_type, enum.Enum):
+        return python_type[raw_value]
+    if issubclass(python_type, datetime.datetime):
+        return datetime.datetime.fromisoformat(raw_value)
+    if issubclass(python_type, datetime.date):
+        return datetime.date.fromisoformat(raw_value)
+    if issubclass(python_type, bytes):
+        return bytes.fromhex(raw_value)
+    return python_type(raw_value)
+
+
+def _encode_cursor(model_class: type, record: object, *, sort_key: str) -> str:
+    """An opaque URL-safe cursor holding ``record``'s sort value and PK."""
+    cursor_values = [
+        _encode_cursor_value(getattr(record, attr_key))
+        for attr_key in (sort_key, *_primary_key_attr_keys(model_class))
+    ]
+    return base64.urlsafe_b64encode(
+        json.dumps(cursor_values, separators=(",", ":")).encode()
+    ).decode()
+
+
+def _decode_cursor(
+    model_class: type, raw_cursor: str, *, sort_key: str
+) -> list[object] | None:
+    """``[sort value, *pk values]`` from a cursor, or ``None`` when it is
+    malformed or does not fit ``sort_key`` and the PK (e.g. a stale cursor
+    carried across a sort change)."""
+    try:
+        raw_values = json.loads(base64.urlsafe_b64decode(raw_cursor.encode()))
+    except (binascii.Error, UnicodeError, ValueError):
+        return None
+    mapper = inspect(model_class)
+    attr_keys = [sort_key, *_primary_key_attr_keys(model_class)]
+    if not isinstance(raw_values, list) or len(raw_values) != len(attr_keys):
+        return None
+    try:
+        return [
+            _decode_cursor_value(mapper.get_property(attr_key), raw_value)
+            for attr_key, raw_value in zip(attr_keys, raw_values)
+        ]
+    except (KeyError, NotImplementedError, TypeError, ValueError):
+        return None
+
+
+def _build_seek_filter(
+    model_class: type,
+    *,
+    sort_key: str,
+    direction: str,
+    cursor_values: list[object],
+    reverse: bool = False,
+) -> ColumnElement:
+    """Rows strictly after ``cursor_values`` in the ``_build_order_by`` order.
+
+    Expanded by hand rather than as one row comparison because the sort
+    column and the PK tiebreaker may run in opposite directions, and because
+    a nullable sort column needs NULLs placed where Postgres sorts them.
+    """
+    sort_descending = (direction == _SORT_DIRECTION_DESC) != reverse
+    sort_attr = getattr(model_class, sort_key)
+    pk_attrs = [
+        getattr(model_class, pk_key) for pk_key in _primary_key_attr_keys(model_class)
+    ]
+    sort_value, *pk_values = cursor_values
+
+    pk_tuple = tuple_(*pk_attrs) if len(pk_attrs) > 1 else pk_attrs[0]
+    pk_cursor = tuple_(*pk_values) if len(pk_values) > 1 else pk_values[0]
+    pk_after = pk_tuple < pk_cursor if reverse else pk_tuple > pk_cursor
+
+    if sort_value is None:
+        # NULLs sort first descending: every non-NULL row follows them.
+        tie_after = and_(sort_attr.is_(None), pk_after)
+        return or_(sort_attr.isnot(None), tie_after) if sort_descending else tie_after
+
+    sort_after = sort_attr < sort_value if sort_descending else sort_attr > sort_value
+    tie_after = and_(sort_attr == sort_value, pk_after)
+    if sort_descending:
+        return or_(sort_after, tie_after)
+    # NULLs sort last ascending: they follow every non-NULL cursor value.
+    return or_(sort_after, sort_attr.is_(None), tie_after)
+
+
 def _is_searchable_string_column(column_attr: ColumnProperty) -> bool:
     """Whether ``column_attr`` maps to a text-like column safe for ILIKE search.
 
@@ -357,16 +565,26 @@ def get_table_page(
     sort_key: str | None = None,
     direction: str = _SORT_DIRECTION_ASC,
     query: str = "",
+    after: str | None = None,
+    before: str | None = None,
+    exact_count: bool = False,
 ) -> TablePage | None:
     """One page of ``table_name``'s rows, or ``None`` for an unknown table.
 
     Rows are ordered by the resolved ``sort_key`` (falling back to the primary
-    key for invalid/sensitive/absent input) with a primary-key tiebreaker for
-    deterministic pagination. A non-blank ``query`` filters rows by a
-    case-insensitive substring match across visible string columns, and
-    ``total_count`` reflects that filter. Sensitive columns are excluded from
-    ``column_keys`` (so they are neither sortable nor searchable), and every
-    cell is truncated to the grid display length.
+    key for invalid/unindexed/sensitive/absent input) with a primary-key
+    tiebreaker for deterministic pagination. A non-blank ``query`` filters
+    rows by a case-insensitive substring match across visible string columns,
+    and ``total_count`` reflects that filter. Sensitive columns are excluded
+    from ``column_keys`` (so they are neither sortable nor searchable), and
+    every cell is truncated to the grid display length.
+
+    ``after`` / ``before`` are cursors from a previous page's
+    ``next_cursor`` / ``previous_cursor``; when one decodes, the page seeks
+    from it instead of skipping ``offset`` rows (``offset`` is then only the
+    displayed position). An unfiltered large table reports the catalog row
+    estimate as ``total_count``, and a large search result the planner's
+    estimate, unless ``exact_count`` is requested.
     """
     model_class = _model_by_table_name().get(table_name)
     if model_class is None:
@@ -382,17 +600,65 @@ def get_table_page(
         else _SORT_DIRECTION_ASC
     )
     normalized_query = query.strip()
-    order_by = _build_order_by(
-        model_class, sort_key=resolved_sort_key, direction=normalized_direction
-    )
 
     filtered_query = db.session.query(model_class)
     search_filter = _build_search_filter(model_class, normalized_query)
     if search_filter is not None:
         filtered_query = filtered_query.filter(search_filter)
+        total_count, count_is_estimate = count_query_rows(
+            filtered_query, exact=exact_count
+        )
+    else:
+        total_count, count_is_estimate = _row_count(
+            model_class,
+            estimate=_estimated_row_counts([table_name]).get(table_name),
+            exact=exact_count,
+        )
+
+    seek_cursor: list[object] | None = None
+    seek_backwards = False
+    for raw_cursor, is_before in ((after, False), (before, True)):
+        if raw_cursor:
+            seek_cursor = _decode_cursor(
+                model_class, raw_cursor, sort_key=resolved_sort_key
+            )
+            seek_backwards = is_before
+            break
+
+    page_query = filtered_query.order_by(
+        *_build_order_by(
+            model_class,
+            sort_key=resolved_sort_key,
+            direction=normalized_direction,
+            reverse=seek_backwards,
+        )
+    )
+    if seek_cursor is not None:
+        page_query = page_query.filter(
+            _build_seek_filter(
+                model_class,
+                sort_key=resolved_sort_key,
+                direction=normalized_direction,
+                cursor_values=seek_cursor,
+                reverse=seek_backwards,
+            )
+        )
+    else:
+        page_query = page_query.offset(offset)
+    # One row past the page tells whether another page follows.
+    records = page_query.limit(limit + 1).all()
+    has_more = len(records) > limit
+    records = records[:limit]
+
+    if seek_backwards:
+        records.reverse()
+        # A short backwards page means the seek ran into the first row.
+        has_next = True
+        if not has_more:
+            offset = 0
+    else:
+        has_next = has_more
 
-    total_count = filtered_query.count()
-    records = filtered_query.order_by(*order_by).limit(limit).offset(offset).all()
     rows = [
         TableRow(
             pk_segment=_row_pk_segment(model_class, record),
@@ -408,13 +674,25 @@ def get_table_page(
     return TablePage(
         table_name=table_name,
         column_keys=column_keys,
+        sortable_keys=_sortable_column_keys(model_class),
         rows=rows,
         total_count=total_count,
+        count_is_estimate=count_is_estimate,
         limit=limit,
         offset=offset,
         sort_key=resolved_sort_key,
         direction=normalized_direction,
         query=normalized_query,
+        next_cursor=(
+            _encode_cursor(model_class, records[-1], sort_key=resolved_sort_key)
+            if has_next and records
+            else None
+        ),
+        previous_cursor=(
+            _encode_cursor(model_class, records[0], sort_key=resolved_sort_key)
+            if offset > 0 and records
+            else None
+        ),
     )
 
 
@@ -1,12 +1,18 @@
 from __future__ import annotations
 
+from collections.abc import Callable
+from concurrent.futures import Future, ThreadPoolExecutor
+from concurrent.futures import TimeoutError as FutureTimeoutError
 from dataclasses import dataclass
 from datetime import datetime, timedelta, timezone
 import os
 import shutil
+import threading
+import time
+from typing import Any
 
-from flask import current_app
-from redis import Redis
+from flask import Flask, current_app
+from redis import ConnectionPool, Redis
 from sqlalchemy import func, text
 
 from backend import db
@@ -28,10 +34,10 @@ _DISK_PROBE_PATH: str = "/"
 # SESSION_TYPE == "redis" (see backend/config.py); absent under cachelib.
 _SESSION_REDIS_CONFIG_KEY: str = "SESSION_REDIS"
 
-# Lookback windows for the derived operational stats.
+# Lookback windows for the derived operational stats. The error rate and the
+# busiest endpoint share one window because they come from one grouped scan.
 _SLOWEST_ENDPOINT_WINDOW_DAYS: int = 7
-_ERROR_RATE_WINDOW_HOURS: int = 24
-_BUSIEST_ENDPOINT_WINDOW_HOURS: int = 24
+_API_TRAFFIC_WINDOW_HOURS: int = 24
 # HTTP status at or above which a response is counted as a server-side error.
 _SERVER_ERROR_STATUS_THRESHOLD: int = 500
 # Flush-worker liveness threshold: a flush sentinel older than this many seconds
@@ -47,6 +53,29 @@ _MEMINFO_PATH: str = "/proc/meminfo"
 _MEMINFO_TOTAL_KEY: str = "MemTotal"
 _MEMINFO_AVAILABLE_KEY: str = "MemAvailable"
 
+# Concurrent probe executor. Each probe gets its own deadline, measured from
+# when the batch was submitted; a probe that misses it reports its fallback
+# value (and keeps running to completion in the background, since a running
+# thread cannot be cancelled). So that such a thread does finish, database
+# probes run under a ``statement_timeout`` of their deadline and the Redis
+# probes use short socket timeouts; and a probe whose previous run is still in
+# flight is not submitted again, so a hung subsystem cannot fill the pool (or
+# drain the app's DB connection pool) across repeated polls. Threads are
+# started lazily on first submit, so creating the pool at import time is
+# fork-safe under gunicorn.
+_PROBE_TIMEOUT_SECONDS: float = 5.0
+_SLOW_PROBE_TIMEOUT_SECONDS: float = 10.0
+_PROBE_MAX_WORKERS: int = 8
+_probe_executor = ThreadPoolExecutor(
+    max_workers=_PROBE_MAX_WORKERS, thread_name_prefix="health-probe"
+)
+_in_flight_probes: dict[str, Future] = {}
+_in_flight_lock = threading.Lock()
+# Socket timeouts for the short-lived Redis probe clients, so a blackholed
+# Redis cannot pin a probe thread indefinitely. Below every probe deadline.
+_PROBE_REDIS_SOCKET_TIMEOUT_SECONDS: float = 2.0
+_STATEMENT_TIMEOUT_SQL: str = "SELECT set_config('statement_timeout', :timeout, true)"
+
 
 @dataclass(frozen=True)
 class SlowestEndpoint:
@@ -123,27 +152,47 @@ def _probe_database() -> tuple[str, int | None, int | None]:
     dashboard can render "connections vs max".
     """
     try:
-        db.session.execute(text("SELECT 1"))
-        connection_count_row = db.session.execute(
-            text("SELECT count(*) FROM pg_stat_activity")
-        ).scalar()
-        max_connections_row = db.session.execute(text("SHOW max_connections")).scalar()
-        return STATUS_UP, int(connection_count_row), int(max_connections_row)
+        connection_row = db.session.execute(
+            text(
+                "SELECT (SELECT count(*) FROM pg_stat_activity) AS connection_count, "
+                "current_setting('max_connections') AS max_connections"
+            )
+        ).one()
+        return (
+            STATUS_UP,
+            int(connection_row.connection_count),
+            int(connection_row.max_connections),
+        )
     except Exception as database_error:
         warning_log(f"health snapshot: database probe failed: {database_error}")
         return STATUS_DOWN, None, None
 
 
 def _probe_session_redis() -> str:
+    """Ping the session Redis through a short-lived client with probe socket
+    timeouts; Flask-Session's own client has none, so a blackholed server
+    would otherwise block the probe thread."""
     session_redis: Redis | None = current_app.config.get(_SESSION_REDIS_CONFIG_KEY)
     if session_redis is None:
         return STATUS_NOT_CONFIGURED
+    probe_pool: ConnectionPool | None = None
     try:
-        session_redis.ping()
+        probe_pool = ConnectionPool(
+            connection_class=session_redis.connection_pool.connection_class,
+            **{
+                **session_redis.connection_pool.connection_kwargs,
+                "socket_timeout": _PROBE_REDIS_SOCKET_TIMEOUT_SECONDS,
+                "socket_connect_timeout": _PROBE_REDIS_SOCKET_TIMEOUT_SECONDS,
+            },
+        )
+        Redis(connection_pool=probe_pool).ping()
         return STATUS_UP
     except Exception as redis_error:
         warning_log(f"health snapshot: session redis probe failed: {redis_error}")
         return STATUS_DOWN
+    finally:
+        if probe_pool is not None:
+            probe_pool.disconnect()
 
 
 def _epoch_bytes_to_datetime(epoch_bytes: bytes | None) -> datetime | None:
@@ -171,7 +220,11 @@ def _probe_metrics_redis() -> (
         return STATUS_NOT_CONFIGURED, None, None, None
     metrics_redis: Redis | None = None
     try:
-        metrics_redis = Redis.from_url(metrics_uri)
+        metrics_redis = Redis.from_url(
+            metrics_uri,
+            socket_timeout=_PROBE_REDIS_SOCKET_TIMEOUT_SECONDS,
+            socket_connect_timeout=_PROBE_REDIS_SOCKET_TIMEOUT_SECONDS,
+        )
         metrics_redis.ping()
         flush_epoch = metrics_redis.get(METRICS_REDIS.FLUSH_LAST_SUCCESS_KEY)
         gauge_epoch = metrics_redis.get(METRICS_REDIS.GAUGE_LAST_SUCCESS_KEY)
@@ -233,86 +286,69 @@ def _probe_slowest_endpoint() -> SlowestEndpoint | None:
         return None
 
 
-def _probe_error_rate() -> ErrorRate | None:
-    """Return the 5xx share of API_HIT traffic over the last 24 hours.
+def _probe_api_traffic() -> tuple[ErrorRate | None, BusiestEndpoint | None]:
+    """Return (5xx error rate, busiest endpoint) for API_HIT traffic over 24h.
 
-    ``rate`` is ``errors / total`` and is ``0.0`` when there was no traffic, so
-    the caller never divides by zero. Returns ``None`` only on query failure.
-    """
-    try:
-        window_start = datetime.now(timezone.utc) - timedelta(
-            hours=_ERROR_RATE_WINDOW_HOURS
-        )
-        api_hit_in_window = (
-            Anonymous_Metrics.event_name == EventName.API_HIT.value,
-            Anonymous_Metrics.bucket_start >= window_start,
-        )
-        total_sum = (
-            db.session.query(func.sum(Anonymous_Metrics.count))
-            .filter(*api_hit_in_window)
-            .scalar()
-        )
-        error_sum = (
-            db.session.query(func.sum(Anonymous_Metrics.count))
-            .filter(
-                *api_hit_in_window,
-                Anonymous_Metrics.status_code >= _SERVER_ERROR_STATUS_THRESHOLD,
-            )
-            .scalar()
-        )
-        total_count = int(total_sum) if total_sum is not None else 0
-        error_count = int(error_sum) if error_sum is not None else 0
-        rate = error_count / total_count if total_count > 0 else 0.0
-        return ErrorRate(
-            error_count=error_count,
-            total_count=total_count,
-            rate=rate,
-        )
-    except Exception as error_rate_error:
-        warning_log(f"health snapshot: error rate probe failed: {error_rate_error}")
-        return None
-
-
-def _probe_busiest_endpoint() -> BusiestEndpoint | None:
-    """Return the highest-volume (endpoint, method) API_HIT over the last 24h.
-
-    A direct grouped query is used rather than the query service's
+    One grouped scan of the window's ``AnonymousMetrics`` rows, per
+    (endpoint, method), yields both stats: the error rate sums every group's
+    hit and 5xx counts (``rate`` is ``0.0`` with no traffic, so the caller
+    never divides by zero), and the busiest endpoint is the group with the
+    most hits among those with a known endpoint and method (``None`` without
+    any). A direct grouped query is used rather than the query service's
     ``_top_endpoints_for_api_hit`` helper: that helper requires previous-window
-    parameters and rewrites the endpoint into a user-facing URL pattern, whereas
-    the health card needs only the raw top (endpoint, method, count).
+    parameters and rewrites the endpoint into a user-facing URL pattern,
+    whereas the health cards need only raw counts. Returns ``(None, None)``
+    only on query failure.
     """
     try:
         window_start = datetime.now(timezone.utc) - timedelta(
-            hours=_BUSIEST_ENDPOINT_WINDOW_HOURS
+            hours=_API_TRAFFIC_WINDOW_HOURS
         )
         hit_count = func.sum(Anonymous_Metrics.count).label("hit_count")
-        top_row = (
+        error_count = (
+            func.sum(Anonymous_Metrics.count)
+            .filter(Anonymous_Metrics.status_code >= _SERVER_ERROR_STATUS_THRESHOLD)
+            .label("error_count")
+        )
+        traffic_rows = (
             db.session.query(
                 Anonymous_Metrics.endpoint,
                 Anonymous_Metrics.method,
                 hit_count,
+                error_count,
             )
             .filter(
                 Anonymous_Metrics.event_name == EventName.API_HIT.value,
                 Anonymous_Metrics.bucket_start >= window_start,
-                Anonymous_Metrics.endpoint.isnot(None),
-                Anonymous_Metrics.method.isnot(None),
             )
             .group_by(Anonymous_Metrics.endpoint, Anonymous_Metrics.method)
-            .order_by(hit_count.desc())
-            .limit(1)
-            .one_or_none()
+            .all()
         )
-        if top_row is None:
-            return None
-        return BusiestEndpoint(
-            endpoint=top_row.endpoint,
-            method=top_row.method,
-            hit_count=int(top_row.hit_count),
-        )
-    except Exception as busiest_error:
-        warning_log(f"health snapshot: busiest endpoint probe failed: {busiest_error}")
-        return None
+    except Exception as traffic_error:
+        warning_log(f"health snapshot: api traffic probe failed: {traffic_error}")
+        return None, None
+
+    total_count = sum(int(row.hit_count or 0) for row in traffic_rows)
+    total_errors = sum(int(row.error_count or 0) for row in traffic_rows)
+    error_rate = ErrorRate(
+        error_count=total_errors,
+        total_count=total_count,
+        rate=total_errors / total_count if total_count > 0 else 0.0,
+    )
+
+    attributed_rows = [
+        row
+        for row in traffic_rows
+        if row.endpoint is not None and row.method is not None
+    ]
+    if not attributed_rows:
+        return error_rate, None
+    top_row = max(attributed_rows, key=lambda row: int(row.hit_count or 0))
+    return error_rate, BusiestEndpoint(
+        endpoint=top_row.endpoint,
+        method=top_row.method,
+        hit_count=int(top_row.hit_count),
+    )
 
 
 def _parse_meminfo_value(meminfo_text: str, key: str) -> int | None:
@@ -365,23 +401,140 @@ def _probe_system_resources() -> SystemResources | None:
     )
 
 
+@dataclass(frozen=True)
+class _HealthProbe:
+    """One independent probe: its callable, the value reported if it misses
+    its deadline, that deadline in seconds, and whether it queries Postgres
+    (and so runs under a matching ``statement_timeout``)."""
+
+    run: Callable[[], Any]
+    fallback: Any
+    timeout_seconds: float = _PROBE_TIMEOUT_SECONDS
+    uses_database: bool = False
+
+
+def _run_in_app_context(app: Flask, probe: _HealthProbe) -> Any:
+    # A fresh app context gives the probe thread its own Flask-SQLAlchemy
+    # session (and pooled connection), released on context teardown — which
+    # also ends the transaction the local statement_timeout is scoped to.
+    with app.app_context():
+        if probe.uses_database:
+            db.session.execute(
+                text(_STATEMENT_TIMEOUT_SQL),
+                {"timeout": f"{int(probe.timeout_seconds * 1000)}ms"},
+            )
+        return probe.run()
+
+
+def _submit_unless_in_flight(
+    app: Flask, name: str, probe: _HealthProbe
+) -> Future | None:
+    """Submit ``probe``, or return None when its previous run has not finished."""
+    with _in_flight_lock:
+        previous_future = _in_flight_probes.get(name)
+        if previous_future is not None and not previous_future.done():
+            return None
+        future = _probe_executor.submit(_run_in_app_context, app, probe)
+        _in_flight_probes[name] = future
+        return future
+
+
+def _run_probes(probes: dict[str, _HealthProbe]) -> dict[str, Any]:
+    """Run every probe and return ``{probe name: result}``.
+
+    With ``HEALTH_PROBES_CONCURRENT`` set, the probes run side by side on the
+    shared executor and each result is awaited until that probe's own deadline;
+    a probe that misses it, or whose run from an earlier snapshot is still in
+    flight (and so is not started again), is logged and reported as its
+    fallback. Otherwise
+    they run one after another on the calling thread — required when the
+    caller's session is pinned to a single connection (the test suite's
+    outer-transaction fixture), which cannot be shared across threads.
+    """
+    if not current_app.config.get(CONFIG_ENVS.HEALTH_PROBES_CONCURRENT, False):
+        return {name: probe.run() for name, probe in probes.items()}
+
+    app: Flask = current_app._get_current_object()  # type: ignore[attr-defined]
+    submitted_at = time.monotonic()
+    futures: dict[str, Future | None] = {
+        name: _submit_unless_in_flight(app, name, probe)
+        for name, probe in probes.items()
+    }
+    results: dict[str, Any] = {}
+    for name, future in futures.items():
+        probe = probes[name]
+        if future is None:
+            warning_log(
+                f"health snapshot: {name} probe skipped, previous run still in flight"
+            )
+            results[name] = probe.fallback
+            continue
+        remaining_seconds = max(
+            0.0, submitted_at + probe.timeout_seconds - time.monotonic()
+        )
+        try:
+            results[name] = future.result(timeout=remaining_seconds)
+        except FutureTimeoutError:
+            warning_log(
+                f"health snapshot: {name} probe timed out after "
+                f"{probe.timeout_seconds}s"
+            )
+            results[name] = probe.fallback
+        except Exception as probe_error:
+            warning_log(f"health snapshot: {name} probe failed: {probe_error}")
+            results[name] = probe.fallback
+    return results
+
+
 def collect_health_snapshot() -> HealthSnapshot:
     """Probe every subsystem once and return a frozen snapshot.
 
-    Never raises: each probe degrades to a "down"/None value on failure so
-    the dashboard always renders.
+    Never raises: each probe degrades to a "down"/None value on failure (or
+    on missing its deadline, see ``_run_probes``) so the dashboard always
+    renders.
     """
     captured_at = datetime.now(timezone.utc)
+    probe_results = _run_probes(
+        {
+            "database": _HealthProbe(
+                run=_probe_database,
+                fallback=(STATUS_DOWN, None, None),
+                uses_database=True,
+            ),
+            "session_redis": _HealthProbe(
+                run=_probe_session_redis, fallback=STATUS_DOWN
+            ),
+            "metrics_redis": _HealthProbe(
+                run=_probe_metrics_redis, fallback=(STATUS_DOWN, None, None, None)
+            ),
+            "disk": _HealthProbe(run=_probe_disk_used_percent, fallback=None),
+            "slowest_endpoint": _HealthProbe(
+                run=_probe_slowest_endpoint,
+                fallback=None,
+                timeout_seconds=_SLOW_PROBE_TIMEOUT_SECONDS,
+                uses_database=True,
+            ),
+            "api_traffic": _HealthProbe(
+                run=_probe_api_traffic,
+                fallback=(None, None),
+                timeout_seconds=_SLOW_PROBE_TIMEOUT_SECONDS,
+                uses_database=True,
+            ),
+            "system_resources": _HealthProbe(
+                run=_probe_system_resources, fallback=None
+            ),
+        }
+    )
     database_status, database_connection_count, database_max_connections = (
-        _probe_database()
+        probe_results["database"]
     )
-    session_redis_status = _probe_session_redis()
     (
         metrics_redis_status,
         flush_last_success_at,
         gauge_last_sample_at,
         backup_last_success_at,
-    ) = _probe_metrics_redis()
+    ) = probe_results["metrics_redis"]
+    error_rate, busiest_endpoint = probe_results["api_traffic"]
 
     flush_lag_seconds: int | None = None
     flush_is_stale: bool = False
@@ -399,9 +552,9 @@ def collect_health_snapshot() -> HealthSnapshot:
         database_status=database_status,
         database_connection_count=database_connection_count,
         database_max_connections=database_max_connections,
-        session_redis_status=session_redis_status,
+        session_redis_status=probe_results["session_redis"],
         metrics_redis_status=metrics_redis_status,
-        disk_used_percent=_probe_disk_used_percent(),
+        disk_used_percent=probe_results["disk"],
         flush_last_success_at=flush_last_success_at,
         flush_lag_seconds=flush_lag_seconds,
         flush_is_stale=flush_is_stale,
@@ -409,9 +562,59 @@ def collect_health_snapshot() -> HealthSnapshot:
         backup_last_success_at=backup_last_success_at,
         backup_lag_seconds=backup_lag_seconds,
         backup_is_stale=backup_is_stale,
-        slowest_endpoint=_probe_slowest_endpoint(),
-        error_rate=_probe_error_rate(),
-        busiest_endpoint=_probe_busiest_endpoint(),
-        system_resources=_probe_system_resources(),
+        slowest_endpoint=probe_results["slowest_endpoint"],
+        error_rate=error_rate,
+        busiest_endpoint=busiest_endpoint,
+        system_resources=probe_results["system_resources"],
         captured_at=captured_at,
     )
+
+
+class _SnapshotCache:
+    """Process-wide, short-lived holder for the last computed snapshot.
+
+    The lock is held while a snapshot is computed, so admins polling at the
+    same moment wait for the one in-flight computation and share its result
+    instead of each running every probe.
+    """
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self._snapshot: HealthSnapshot | None = None
+        self._expires_at: float = 0.0
+
+    def get_or_compute(
+        self, *, ttl_seconds: float, compute: Callable[[], HealthSnapshot]
+    ) -> HealthSnapshot:
+        with self._lock:
+            if self._snapshot is not None and time.monotonic() < self._expires_at:
+                return self._snapshot
+            snapshot = compute()
+            self._snapshot = snapshot
+            self._expires_at = time.monotonic() + ttl_seconds
+            return snapshot
+
+    def clear(self) -> None:
+        with self._lock:
+            self._snapshot = None
+            self._expires_at = 0.0
+
+
+_snapshot_cache = _SnapshotCache()
+
+
+def get_health_snapshot() -> HealthSnapshot:
+    """Return a health snapshot at most ``HEALTH_SNAPSHOT_CACHE_SECONDS`` old.
+
+    The polled ``/admin/health/snapshot`` fragment reads through this, so many
+    admins polling at once cost one probe run per cache window per worker. A
+    window of 0 disables the cache and always probes fresh.
+    """
+    ttl_seconds = float(
+        current_app.config.get(CONFIG_ENVS.HEALTH_SNAPSHOT_CACHE_SECONDS, 0)
+    )
+    if ttl_seconds <= 0:
+        return collect_health_snapshot()
+    return _snapshot_cache.get_or_compute(
+        ttl_seconds=ttl_seconds, compute=collect_health_snapshot
+    )
@@ -35,8 +35,9 @@ def select_ownership_transfer_target(
     """Pick the deterministic new owner for a UTub whose creator is departing.
 
     Prefers the CO_CREATOR with the lowest user id; falls back to the lowest
-    user id among all remaining members. Shared by admin member removal and
-    account erasure so both resolve creator departure identically.
+    user id among all remaining members. Account erasure resolves creator
+    departure with the same rule set-based (``plan_membership_erasure``), so
+    keep the two in step.
 
     Args:
         other_members: Remaining memberships, excluding the departing creator.
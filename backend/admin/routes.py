@@ -7,7 +7,6 @@ from flask.wrappers import Response as FlaskResponse
 from flask_login import current_user
 from sqlalchemy import or_
 
-from backend import db
 from backend.admin import db_browser_service
 from backend.admin.db_browser_service import _PaginationBase
 from backend.admin.audit_service import (
@@ -15,7 +14,7 @@ from backend.admin.audit_service import (
     DEFAULT_AUDIT_PAGE_LIMIT,
     query_audit_log,
 )
-from backend.admin.health_service import collect_health_snapshot
+from backend.admin.health_service import get_health_snapshot
 from backend.admin.account_data_service import is_tombstoned
 from backend.admin.user_service import (
     DEFAULT_SEARCH_LIMIT,
@@ -83,8 +82,7 @@ def admin_portal() -> FlaskResponse:
     the login page; authenticated non-admin requests receive a 403 —
     matching the established `/admin/metrics` gating semantics.
     """
-    audit.record(actor_id=current_user.id, action=ADMIN_AUDIT_ACTIONS.PORTAL_VIEW)
-    db.session.commit()
+    audit.record_view(actor_id=current_user.id, action=ADMIN_AUDIT_ACTIONS.PORTAL_VIEW)
     return render_template(
         "admin_portal/index.html",
         is_admin_portal=True,
@@ -100,8 +98,7 @@ def admin_health() -> FlaskResponse:
     ``/admin/health/snapshot`` by the client-side health-monitor controller;
     this route only renders the shell and audits the page view.
     """
-    audit.record(actor_id=current_user.id, action=ADMIN_AUDIT_ACTIONS.HEALTH_VIEW)
-    db.session.commit()
+    audit.record_view(actor_id=current_user.id, action=ADMIN_AUDIT_ACTIONS.HEALTH_VIEW)
     return render_template(
         "admin_portal/health.html",
         is_admin_portal=True,
@@ -117,7 +114,7 @@ def admin_health_snapshot() -> FlaskResponse:
     per-poll audit rows would flood the audit log; the page view itself is
     audited by ``admin_health``.
     """
-    health_snapshot = collect_health_snapshot()
+    health_snapshot = get_health_snapshot()
     return render_template(
         "admin_portal/_health_snapshot.html",
         snapshot=health_snapshot,
@@ -144,6 +141,8 @@ def admin_users() -> FlaskResponse:
 def admin_users_search() -> FlaskResponse:
     """HTML fragment of user-search result rows.
 
+    ``rank=1`` orders matches by similarity instead of id; ``after``/
+    ``before`` cursors and ``exact=1`` page and count as in the audit log.
     Every execution is audited with the query and result count — search
     strings land in AuditLogs.metadata and age out with the 90-day
     retention purge.
@@ -154,8 +153,18 @@ def admin_users_search() -> FlaskResponse:
         query=search_query,
         limit=DEFAULT_SEARCH_LIMIT,
         offset=result_offset,
+        after=request.args.get("after"),
+        before=request.args.get("before"),
+        ranked=request.args.get("rank") == "1",
+        exact_count=request.args.get("exact") == "1",
     )
-    audit.record(
+    # Rendered before the audit entry commits: the commit expires the listed
+    # users, and rendering them afterwards would reload each one.
+    results_html = render_template(
+        "admin_portal/users/_results.html",
+        search_page=search_page,
+    )
+    audit.record_view(
         actor_id=current_user.id,
         action=ADMIN_AUDIT_ACTIONS.USER_SEARCH,
         metadata={
@@ -163,11 +172,7 @@ def admin_users_search() -> FlaskResponse:
             "result_count": search_page.total_count,
         },
     )
-    db.session.commit()
-    return render_template(
-        "admin_portal/users/_results.html",
-        search_page=search_page,
-    )
+    return results_html
 
 
 @admin.route("/admin/users/<int:user_id>", methods=["GET"])
@@ -180,13 +185,12 @@ def admin_user_detail(user_id: int) -> FlaskResponse:
     detail_user = get_user_detail(user_id=user_id)
     if detail_user is None:
         abort(404)
-    audit.record(
+    audit.record_view(
         actor_id=current_user.id,
         action=ADMIN_AUDIT_ACTIONS.USER_VIEW,
         target_type="User",
         target_id=str(user_id),
     )
-    db.session.commit()
     return render_template(
         "admin_portal/users/detail.html",
         is_admin_portal=True,
@@ -204,8 +208,9 @@ def admin_system_operations() -> FlaskResponse:
     sample, audit purge, verify tables, backup trigger, short-urls sync);
     rendering this page mutates nothing and only records the page view.
     """
-    audit.record(actor_id=current_user.id, action=ADMIN_AUDIT_ACTIONS.SYSTEM_OPS_VIEW)
-    db.session.commit()
+    audit.record_view(
+        actor_id=current_user.id, action=ADMIN_AUDIT_ACTIONS.SYSTEM_OPS_VIEW
+    )
     return render_template(
         "admin_portal/system_operations/index.html",
         is_admin_portal=True,
@@ -220,9 +225,10 @@ def admin_utubs() -> FlaskResponse:
     Reuses the DB browser's generic table service (``get_table_page`` over the
     ``Utubs`` table) rather than a bespoke search endpoint, so the grid mirrors
     the DB browser's raw-column rendering. Query params ``q``/``sort``/``dir``/
-    ``offset`` shape the search, ordering, and pagination exactly as
-    ``admin_db_table``. Each row links to the per-UTub detail page. The page
-    view is audited with the query and result count.
+    ``offset``/``after``/``before``/``exact`` shape the search, ordering,
+    pagination, and count exactly as ``admin_db_table``. Each row links to the
+    per-UTub detail page. The page view is audited with the query and result
+    count.
     """
     search_query: str = request.args.get("q", "")
     table_page = db_browser_service.get_table_page(
@@ -231,8 +237,11 @@ def admin_utubs() -> FlaskResponse:
         sort_key=request.args.get("sort"),
         direction=request.args.get("dir", "asc"),
         query=search_query,
+        after=request.args.get("after"),
+        before=request.args.get("before"),
+        exact_count=request.args.get("exact") == "1",
     )
-    audit.record(
+    audit.record_view(
         actor_id=current_user.id,
         action=ADMIN_AUDIT_ACTIONS.UTUB_LIST,
         metadata={
@@ -240,7 +249,6 @@ def admin_utubs() -> FlaskResponse:
             "result_count": table_page.total_count,
         },
     )
-    db.session.commit()
     return render_template(
         "admin_portal/utubs/index.html",
         is_admin_portal=True,
@@ -343,13 +351,12 @@ def admin_utub_detail(utub_id: int) -> FlaskResponse:
         limit=_DETAIL_TABLE_PAGE_SIZE,
     )
 
-    audit.record(
+    audit.record_view(
         actor_id=current_user.id,
         action=ADMIN_AUDIT_ACTIONS.UTUB_VIEW,
         target_type="Utub",
         target_id=str(utub_id),
     )
-    db.session.commit()
     return render_template(
         "admin_portal/utubs/detail.html",
         is_admin_portal=True,
@@ -374,8 +381,9 @@ def admin_db() -> FlaskResponse:
     Native replacement for the removed Flask-Admin model list. Each table
     links to its paginated grid. The page view is audited.
     """
-    audit.record(actor_id=current_user.id, action=ADMIN_AUDIT_ACTIONS.DB_BROWSER_VIEW)
-    db.session.commit()
+    audit.record_view(
+        actor_id=current_user.id, action=ADMIN_AUDIT_ACTIONS.DB_BROWSER_VIEW
+    )
     return render_template(
         "admin_portal/db/index.html",
         is_admin_portal=True,
@@ -389,9 +397,11 @@ def admin_db_table(table_name: str) -> FlaskResponse:
     """One paginated grid page of ``table_name`` (50 rows/page).
 
     Optional query params ``sort`` (column key), ``dir`` ("asc"/"desc"), and
-    ``q`` (substring search) shape the ordering and filtering. Unknown tables
-    404 (and are not audited). Sensitive columns are excluded by the service;
-    every cell is HTML-escaped by Jinja autoescape.
+    ``q`` (substring search) shape the ordering and filtering; ``after`` /
+    ``before`` carry the keyset cursors of the Next/Previous links, and
+    ``exact=1`` asks for an exact row count instead of the catalog estimate.
+    Unknown tables 404 (and are not audited). Sensitive columns are excluded
+    by the service; every cell is HTML-escaped by Jinja autoescape.
     """
     table_page = db_browser_service.get_table_page(
         table_name=table_name,
@@ -399,15 +409,17 @@ def admin_db_table(table_name: str) -> FlaskResponse:
         sort_key=request.args.get("sort"),
         direction=request.args.get("dir", "asc"),
         query=request.args.get("q", ""),
+        after=request.args.get("after"),
+        before=request.args.get("before"),
+        exact_count=request.args.get("exact") == "1",
     )
     if table_page is None:
         abort(404)
-    audit.record(
+    audit.record_view(
         actor_id=current_user.id,
         action=ADMIN_AUDIT_ACTIONS.DB_BROWSER_VIEW,
         target_type=table_name,
     )
-    db.session.commit()
     return render_template(
         "admin_portal/db/table.html",
         is_admin_portal=True,
@@ -426,13 +438,12 @@ def admin_db_row(table_name: str, row_pk: str) -> FlaskResponse:
     row_detail = db_browser_service.get_row_detail(table_name=table_name, raw_pk=row_pk)
     if row_detail is None:
         abort(404)
-    audit.record(
+    audit.record_view(
         actor_id=current_user.id,
         action=ADMIN_AUDIT_ACTIONS.DB_BROWSER_VIEW,
         target_type=table_name,
         target_id=row_pk,
     )
-    db.session.commit()
     return render_template(
         "admin_portal/db/row.html",
         is_admin_portal=True,
@@ -467,8 +478,9 @@ def admin_audit_log() -> FlaskResponse:
     The page view itself is audited — yes, viewing the audit log is itself
     an audited action.
     """
-    audit.record(actor_id=current_user.id, action=ADMIN_AUDIT_ACTIONS.AUDIT_LOG_VIEW)
-    db.session.commit()
+    audit.record_view(
+        actor_id=current_user.id, action=ADMIN_AUDIT_ACTIONS.AUDIT_LOG_VIEW
+    )
     return render_template(
         "admin_portal/audit_log/index.html",
         is_admin_portal=True,
@@ -483,11 +495,18 @@ def admin_audit_log_rows() -> FlaskResponse:
     Not audited per-reload: the audited resource here IS the audit log,
     and the page view already records ``admin.audit_log.view`` — per-filter
     rows would only add self-referential noise.
+
+    ``after`` / ``before`` carry the keyset cursors of the Next/Previous
+    links, and ``exact=1`` asks for an exact entry count instead of the
+    planner's estimate.
     """
     audit_page = query_audit_log(
         filters=_audit_filters_from_request(),
         limit=DEFAULT_AUDIT_PAGE_LIMIT,
         offset=_parse_offset_arg(),
+        after=request.args.get("after"),
+        before=request.args.get("before"),
+        exact_count=request.args.get("exact") == "1",
     )
     return render_template(
         "admin_portal/audit_log/_rows.html",
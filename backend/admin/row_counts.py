@@ -0,0 +1,46 @@
+from __future__ import annotations
+
+import json
+
+from sqlalchemy.orm import Query
+
+from backend import db
+
+# Below this many estimated rows an exact COUNT(*) is cheap enough to always
+# run. ``pg_class.reltuples`` is -1 for a table never vacuumed or analyzed,
+# which also falls under the threshold and so gets an exact count.
+EXACT_COUNT_THRESHOLD: int = 10_000
+
+
+def planner_row_estimate(query: Query) -> int:
+    """The planner's row estimate for ``query``, from ``EXPLAIN``.
+
+    Only plans the query; nothing is scanned. The estimate comes from the
+    table statistics, so it can be off for selective substring filters.
+    """
+    connection = db.session.connection()
+    # Compiled against the connected dialect, which knows how this server
+    # escapes backslashes in string literals (the ILIKE ``ESCAPE`` clause).
+    compiled_query = query.statement.compile(dialect=connection.dialect)
+    query_plan = connection.exec_driver_sql(
+        f"EXPLAIN (FORMAT JSON) {compiled_query}", compiled_query.params
+    ).scalar()
+    if isinstance(query_plan, str):
+        query_plan = json.loads(query_plan)
+    return int(query_plan[0]["Plan"]["Plan Rows"])
+
+
+def count_query_rows(query: Query, *, exact: bool) -> tuple[int, bool]:
+    """``(row count, is_estimate)`` for a filtered admin query.
+
+    The planner's estimate is used as-is when it is large unless ``exact`` is
+    requested; smaller results get an exact count.
+
+    Example: a user search for ``"a"`` over a million users reports "about
+    600000" from the plan rather than counting every match on each keystroke.
+    """
+    if not exact:
+        estimate = planner_row_estimate(query)
+        if estimate >= EXACT_COUNT_THRESHOLD:
+            return estimate, True
+    return query.count(), False
@@ -1,25 +1,57 @@
 from __future__ import annotations
 
+import base64
+import binascii
 from dataclasses import dataclass
+import json
 
-from sqlalchemy import or_
+from sqlalchemy import REAL, and_, cast, func, or_, select
+from sqlalchemy.sql.elements import ColumnElement
 
+from backend.admin.row_counts import count_query_rows
 from backend.models.users import Users
 
 DEFAULT_SEARCH_LIMIT: int = 20
+# Similarity is scored over trigrams, so shorter queries match nearly everyone
+RANKED_SEARCH_MIN_QUERY_LENGTH: int = 3
+# Ranked mode pages through at most this many of the best matches
+RANKED_CANDIDATE_LIMIT: int = 1000
 
 LIKE_ESCAPE_CHAR: str = "\\"
 
 
 @dataclass(frozen=True)
 class UserSearchPage:
-    """One page of admin user-search results."""
+    """One page of admin user-search results.
+
+    Pages are fetched by keyset: ``next_cursor`` / ``previous_cursor`` seek
+    past the last / before the first user, so paging forward never rescans
+    skipped matches. ``offset`` still tracks the page's position for display.
+    ``has_next`` comes from probing one user past the page rather than from
+    ``total_count``, which is an estimate when ``count_is_estimate`` is set.
+    ``ranked`` pages are ordered best match first instead of by id, and
+    ``candidates_capped`` marks that they stop after the best
+    ``RANKED_CANDIDATE_LIMIT`` of the ``total_count`` matches.
+    """
 
     users: list[Users]
     total_count: int
     query: str
     limit: int
     offset: int
+    ranked: bool = False
+    candidates_capped: bool = False
+    count_is_estimate: bool = False
+    next_cursor: str | None = None
+    previous_cursor: str | None = None
+
+    @property
+    def candidate_limit(self) -> int:
+        return RANKED_CANDIDATE_LIMIT
+
+    @property
+    def can_rank(self) -> bool:
+        return len(self.query) >= RANKED_SEARCH_MIN_QUERY_LENGTH
 
     @property
     def has_previous(self) -> bool:
@@ -27,7 +59,7 @@ class UserSearchPage:
 
     @property
     def has_next(self) -> bool:
-        return self.offset + self.limit < self.total_count
+        return self.next_cursor is not None
 
     @property
     def previous_offset(self) -> int:
@@ -51,39 +83,176 @@ def escape_like_wildcards(raw_query: str) -> str:
     )
 
 
+def _similarity_score(normalized_query: str) -> ColumnElement:
+    """pg_trgm similarity of the closer of username and email to the query,
+    from 0 (no shared trigrams) to 1 (identical)."""
+    return func.greatest(
+        func.similarity(Users.username, normalized_query),
+        func.similarity(Users.email, normalized_query),
+        type_=REAL,
+    )
+
+
+def _encode_cursor(sort_values: list[object]) -> str:
+    """An opaque URL-safe cursor holding a user's ``[score, id]`` (ranked) or
+    ``[id]`` sort values."""
+    return base64.urlsafe_b64encode(
+        json.dumps(sort_values, separators=(",", ":")).encode()
+    ).decode()
+
+
+def _decode_cursor(raw_cursor: str, *, ranked: bool) -> tuple[float, int] | None:
+    """``(score, id)`` from a cursor (``score`` is 0 for id order), or
+    ``None`` when it is malformed or from the other ordering."""
+    try:
+        raw_values = json.loads(base64.urlsafe_b64decode(raw_cursor.encode()))
+        if not isinstance(raw_values, list) or len(raw_values) != (2 if ranked else 1):
+            return None
+        if ranked:
+            return float(raw_values[0]), int(raw_values[1])
+        return 0.0, int(raw_values[0])
+    except (binascii.Error, UnicodeError, ValueError, TypeError):
+        return None
+
+
 def search_users(
     *,
     query: str,
     limit: int = DEFAULT_SEARCH_LIMIT,
     offset: int = 0,
+    after: str | None = None,
+    before: str | None = None,
+    ranked: bool = False,
+    exact_count: bool = False,
 ) -> UserSearchPage:
     """Case-insensitive substring search over username and email.
 
     A blank query returns the first page of all users (ordered by id) so
-    the admin page is immediately useful on load. Results are always
-    ordered by id for stable pagination.
+    the admin page is immediately useful on load. Results are ordered by id
+    for stable pagination. The substring filters are served by the trigram
+    indexes on ``Users.username``/``email``.
+
+    ``ranked`` orders results by trigram similarity, best match first (id
+    breaks ties), and also admits near misses that pg_trgm's ``%`` operator
+    finds similar enough (e.g. ``"jonh"`` finds ``"john"``). No index serves
+    that order, so it only applies to queries of at least
+    ``RANKED_SEARCH_MIN_QUERY_LENGTH`` characters, and each ranked page seeks
+    within the best ``RANKED_CANDIDATE_LIMIT`` matches, picked by a bounded
+    top-N sort, rather than sorting every match. ``total_count`` still counts
+    every match.
+
+    ``after`` / ``before`` are cursors from a previous page's
+    ``next_cursor`` / ``previous_cursor``; when one decodes, the page seeks
+    from it instead of skipping ``offset`` users (``offset`` is then only the
+    displayed position). A large result reports the planner's estimate as
+    ``total_count`` unless ``exact_count`` is requested.
 
     Example: ``search_users(query="test", limit=2, offset=2)`` returns the
     third and fourth users whose username or email contains "test".
     """
     normalized_query = query.strip()
+    ranked = ranked and len(normalized_query) >= RANKED_SEARCH_MIN_QUERY_LENGTH
     users_query = Users.query
     if normalized_query:
         like_pattern = f"%{escape_like_wildcards(normalized_query)}%"
-        users_query = users_query.filter(
-            or_(
-                Users.username.ilike(like_pattern, escape=LIKE_ESCAPE_CHAR),
-                Users.email.ilike(like_pattern, escape=LIKE_ESCAPE_CHAR),
+        match_filters = [
+            Users.username.ilike(like_pattern, escape=LIKE_ESCAPE_CHAR),
+            Users.email.ilike(like_pattern, escape=LIKE_ESCAPE_CHAR),
+        ]
+        if ranked:
+            match_filters += [
+                Users.username.op("%")(normalized_query),
+                Users.email.op("%")(normalized_query),
+            ]
+        users_query = users_query.filter(or_(*match_filters))
+    total_count, count_is_estimate = count_query_rows(users_query, exact=exact_count)
+    candidates_capped = ranked and total_count > RANKED_CANDIDATE_LIMIT
+    if ranked:
+        candidate_ids = (
+            users_query.with_entities(Users.id)
+            .order_by(_similarity_score(normalized_query).desc(), Users.id)
+            .limit(RANKED_CANDIDATE_LIMIT)
+            .subquery()
+        )
+        users_query = Users.query.filter(Users.id.in_(select(candidate_ids.c.id)))
+
+    seek_cursor: tuple[float, int] | None = None
+    seek_backwards = False
+    for raw_cursor, is_before in ((after, False), (before, True)):
+        if raw_cursor:
+            seek_cursor = _decode_cursor(raw_cursor, ranked=ranked)
+            seek_backwards = is_before
+            break
+
+    if ranked:
+        score = _similarity_score(normalized_query)
+        page_query = users_query.add_columns(score)
+        if seek_backwards:
+            page_query = page_query.order_by(score, Users.id.desc())
+        else:
+            page_query = page_query.order_by(score.desc(), Users.id)
+        if seek_cursor is not None:
+            # Score descends while id ascends, so no single row comparison.
+            # The cursor's score is compared as ``real``, the type similarity()
+            # returns, so the row it came from compares equal to it.
+            seek_score = cast(seek_cursor[0], REAL)
+            seek_id = seek_cursor[1]
+            page_query = page_query.filter(
+                or_(score > seek_score, and_(score == seek_score, Users.id < seek_id))
+                if seek_backwards
+                else or_(
+                    score < seek_score, and_(score == seek_score, Users.id > seek_id)
+                )
             )
+    else:
+        page_query = users_query.order_by(
+            Users.id.desc() if seek_backwards else Users.id
         )
-    total_count = users_query.count()
-    matched_users = users_query.order_by(Users.id).limit(limit).offset(offset).all()
+        if seek_cursor is not None:
+            _, seek_id = seek_cursor
+            page_query = page_query.filter(
+                Users.id < seek_id if seek_backwards else Users.id > seek_id
+            )
+    if seek_cursor is None:
+        page_query = page_query.offset(offset)
+    # One user past the page tells whether another page follows.
+    page_rows = page_query.limit(limit + 1).all()
+    has_more = len(page_rows) > limit
+    page_rows = page_rows[:limit]
+
+    if seek_backwards:
+        page_rows.reverse()
+        # A short backwards page means the seek ran into the first match.
+        has_next = True
+        if not has_more:
+            offset = 0
+    else:
+        has_next = has_more
+
+    if ranked:
+        page_users = [matched_user for matched_user, _ in page_rows]
+        cursor_values = [
+            [score_value, matched_user.id] for matched_user, score_value in page_rows
+        ]
+    else:
+        page_users = page_rows
+        cursor_values = [[matched_user.id] for matched_user in page_rows]
+
     return UserSearchPage(
-        users=matched_users,
+        users=page_users,
         total_count=total_count,
         query=normalized_query,
         limit=limit,
         offset=offset,
+        ranked=ranked,
+        candidates_capped=candidates_capped,
+        count_is_estimate=count_is_estimate,
+        next_cursor=(
+            _encode_cursor(cursor_values[-1]) if has_next and page_rows else None
+        ),
+        previous_cursor=(
+            _encode_cursor(cursor_values[0]) if offset > 0 and page_rows else None
+        ),
     )
 
 
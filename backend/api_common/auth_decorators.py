@@ -6,6 +6,12 @@ from functools import wraps
 from backend.api_common.request_utils import is_current_utub_creator
 from backend.schemas.errors import build_message_error_response
 from backend.app_logger import critical_log, warning_log
+from backend.extensions.request_timing import (
+    end_request_phase,
+    request_phase,
+    start_request_phase,
+)
+from backend.metrics.latency import LatencyMetricName
 from backend.models.users import User_Role
 from backend.models.utub_members import Member_Role, Utub_Members
 from backend.models.utub_tags import Utub_Tags
@@ -21,6 +27,36 @@ _NOT_AUTHENTICATED_MESSAGE: str = "Authentication required."
 _NOT_FOUND_MESSAGE: str = "Not found."
 
 
+def _auth_phase(auth_decorator: Callable) -> Callable:
+    """Charge an auth decorator's checks to the ``AUTH_DURATION`` phase.
+
+    The view it guards runs outside the phase, so chained auth decorators
+    each time only their own checks and the view's work stays unphased.
+    """
+
+    @wraps(auth_decorator)
+    def timed_auth_decorator(func: Callable) -> Callable:
+        @wraps(func)
+        def view_outside_auth_phase(*args, **kwargs):
+            end_request_phase()
+            try:
+                return func(*args, **kwargs)
+            finally:
+                start_request_phase(LatencyMetricName.AUTH_DURATION)
+
+        checked_view = auth_decorator(view_outside_auth_phase)
+
+        @wraps(checked_view)
+        def view_with_timed_checks(*args, **kwargs):
+            with request_phase(LatencyMetricName.AUTH_DURATION):
+                return checked_view(*args, **kwargs)
+
+        return view_with_timed_checks
+
+    return timed_auth_decorator
+
+
+@_auth_phase
 def no_authenticated_users_allowed(func: Callable) -> Callable:
     @wraps(func)
     def decorated_view(*args, **kwargs) -> Callable:
@@ -39,6 +75,7 @@ def no_authenticated_users_allowed(func: Callable) -> Callable:
     return decorated_view
 
 
+@_auth_phase
 def email_validation_required(func: Callable) -> Callable:
     @wraps(func)
     @login_required
@@ -58,6 +95,7 @@ def email_validation_required(func: Callable) -> Callable:
     return decorated_view
 
 
+@_auth_phase
 def utub_membership_required(func: Callable) -> Callable:
     @wraps(func)
     @email_validation_required
@@ -81,6 +119,7 @@ def utub_membership_required(func: Callable) -> Callable:
     return decorated_view
 
 
+@_auth_phase
 def utub_creator_required(func: Callable) -> Callable:
     @wraps(func)
     @utub_membership_required
@@ -103,6 +142,7 @@ def utub_creator_required(func: Callable) -> Callable:
     return decorated_view
 
 
+@_auth_phase
 def utub_membership_with_valid_url_in_utub_required(func: Callable) -> Callable:
     @wraps(func)
     @utub_membership_required
@@ -130,6 +170,7 @@ def utub_membership_with_valid_url_in_utub_required(func: Callable) -> Callable:
 
 
 def url_adder_or_creator_required(message: str) -> Callable:
+    @_auth_phase
     def decorator(func: Callable) -> Callable:
         @wraps(func)
         @utub_membership_with_valid_url_in_utub_required
@@ -163,6 +204,7 @@ def _verify_and_get_utub_tag(**kwargs) -> Utub_Tags:
     return current_utub_tag
 
 
+@_auth_phase
 def utub_membership_with_valid_utub_tag(func: Callable) -> Callable:
     @wraps(func)
     @utub_membership_required
@@ -175,6 +217,7 @@ def utub_membership_with_valid_utub_tag(func: Callable) -> Callable:
     return decorated_view
 
 
+@_auth_phase
 def utub_membership_with_valid_url_tag(func: Callable) -> Callable:
     @wraps(func)
     @utub_membership_with_valid_url_in_utub_required
@@ -217,6 +260,7 @@ SESSION_AUTH_DECORATORS: frozenset[str] = frozenset(
 )
 
 
+@_auth_phase
 def admin_required(func: Callable) -> Callable:
     """Gate a view on `current_user.role == User_Role.ADMIN`.
 
@@ -251,6 +295,7 @@ def admin_required(func: Callable) -> Callable:
     return decorated_view
 
 
+@_auth_phase
 def admin_login_required(func: Callable) -> Callable:
     """Gate a server-rendered HTML view on an authenticated admin session.
 
@@ -292,6 +337,7 @@ ADMIN_AUTH_DECORATORS: frozenset[str] = frozenset(
 # `admin_required` above is the JSON 401 template these follow.
 
 
+@_auth_phase
 def api_authentication_required(func: Callable) -> Callable:
     """Gate an /api/v1 view on an authenticated bearer identity (401 JSON).
 
@@ -322,6 +368,7 @@ def api_authentication_required(func: Callable) -> Callable:
     return decorated_view
 
 
+@_auth_phase
 def api_email_validation_required(func: Callable) -> Callable:
     @wraps(func)
     @api_authentication_required
@@ -340,6 +387,7 @@ def api_email_validation_required(func: Callable) -> Callable:
     return decorated_view
 
 
+@_auth_phase
 def api_utub_membership_required(func: Callable) -> Callable:
     @wraps(func)
     @api_email_validation_required
@@ -363,6 +411,7 @@ def api_utub_membership_required(func: Callable) -> Callable:
     return decorated_view
 
 
+@_auth_phase
 def api_utub_creator_required(func: Callable) -> Callable:
     @wraps(func)
     @api_utub_membership_required
@@ -385,6 +434,7 @@ def api_utub_creator_required(func: Callable) -> Callable:
     return decorated_view
 
 
+@_auth_phase
 def api_utub_membership_with_valid_url_in_utub_required(func: Callable) -> Callable:
     @wraps(func)
     @api_utub_membership_required
@@ -412,6 +462,7 @@ def api_utub_membership_with_valid_url_in_utub_required(func: Callable) -> Calla
 
 
 def api_url_adder_or_creator_required(message: str) -> Callable:
+    @_auth_phase
     def decorator(func: Callable) -> Callable:
         @wraps(func)
         @api_utub_membership_with_valid_url_in_utub_required
@@ -430,6 +481,7 @@ def api_url_adder_or_creator_required(message: str) -> Callable:
     return decorator
 
 
+@_auth_phase
 def api_utub_membership_with_valid_utub_tag(func: Callable) -> Callable:
     @wraps(func)
     @api_utub_membership_required
@@ -442,6 +494,7 @@ def api_utub_membership_with_valid_utub_tag(func: Callable) -> Callable:
     return decorated_view
 
 
+@_auth_phase
 def api_utub_membership_with_valid_url_tag(func: Callable) -> Callable:
     @wraps(func)
     @api_utub_membership_with_valid_url_in_utub_required
@@ -1,12 +1,56 @@
 from dataclasses import dataclass, field
+import functools
 from typing import Any, Dict
-from flask import jsonify, Response
+from flask import current_app, jsonify, Response
 from pydantic import BaseModel
+import pydantic_core
 
+from backend.extensions.request_timing import request_phase
+from backend.metrics.latency import LatencyMetricName
+from backend.utils.strings.config_strs import CONFIG_ENVS
 from backend.utils.strings.json_strs import STD_JSON_RESPONSE as STD_JSON
 
 FlaskResponse = tuple[Response, int]
 
+# Values for the app-wide JSON_RESPONSE_ENCODER setting
+JSON_ENCODER_PYDANTIC = "pydantic"
+JSON_ENCODER_STDLIB = "stdlib"
+
+_ENVELOPE_KEYS: frozenset[str] = frozenset(
+    {
+        STD_JSON.STATUS,
+        STD_JSON.MESSAGE,
+        STD_JSON.ERROR_CODE,
+        STD_JSON.ERRORS,
+        STD_JSON.DETAILS,
+    }
+)
+
+
+@functools.lru_cache(maxsize=None)
+def _schema_overlaps_envelope(schema_class: type[BaseModel]) -> bool:
+    """True if a schema may serialize a key the response envelope also writes.
+
+    Such schemas (e.g. StatusMessageResponseSchema) cannot be spliced into the
+    envelope as pre-encoded JSON, since the envelope's precedence rules decide
+    which of the two values wins.
+    """
+    if schema_class.model_config.get("extra") == "allow":
+        return True
+    serialized_keys = {
+        model_field.serialization_alias or model_field.alias or field_name
+        for field_name, model_field in schema_class.model_fields.items()
+    } | {
+        computed_field.alias or field_name
+        for field_name, computed_field in schema_class.model_computed_fields.items()
+    }
+    return not serialized_keys.isdisjoint(_ENVELOPE_KEYS)
+
+
+def _json_object_members(json_object: bytes) -> bytes:
+    """The `"k":v,...` members of an encoded JSON object, without its braces."""
+    return json_object[1:-1]
+
 
 @dataclass
 class APIResponse:
@@ -23,6 +67,47 @@ class APIResponse:
     def to_response(self) -> FlaskResponse:
         """Convert to Flask response.
 
+        The encoder is chosen app-wide by JSON_RESPONSE_ENCODER. The default,
+        "pydantic", encodes straight to bytes with pydantic-core's Rust
+        serializer; "stdlib" keeps the original `jsonify` path.
+        """
+        encoder = current_app.config.get(
+            CONFIG_ENVS.JSON_RESPONSE_ENCODER, JSON_ENCODER_STDLIB
+        )
+        with request_phase(LatencyMetricName.SERIALIZE_DURATION):
+            if encoder == JSON_ENCODER_PYDANTIC:
+                return (
+                    Response(
+                        self._encode_payload(),
+                        status=self.status_code,
+                        mimetype="application/json",
+                    ),
+                    self.status_code,
+                )
+            return jsonify(self._build_payload()), self.status_code
+
+    def _envelope_tail(self) -> dict[str, Any]:
+        """The envelope keys written after the data, in payload order."""
+        envelope_tail: dict[str, Any] = {}
+        if self.message:
+            envelope_tail[STD_JSON.MESSAGE] = self.message
+
+        if self.error_code is not None:
+            envelope_tail[STD_JSON.ERROR_CODE] = self.error_code
+
+        if self.errors:
+            envelope_tail[STD_JSON.ERRORS] = self.errors
+
+        if self.details:
+            envelope_tail[STD_JSON.DETAILS] = self.details
+        return envelope_tail
+
+    def _default_status(self) -> str:
+        return STD_JSON.SUCCESS if self.status_code < 400 else STD_JSON.FAILURE
+
+    def _build_payload(self) -> dict[str, Any]:
+        """The response payload as a dict.
+
         `mode="json"` is critical for datetime fields: without it, Pydantic
         emits native `datetime` objects that Flask's `jsonify` serializes via
         `http_date()` (RFC 822 / HTTP-Date — "Sat, 06 Jun 2026 17:00:00 GMT").
@@ -37,25 +122,42 @@ class APIResponse:
             else self.data
         )
         payload = {
-            STD_JSON.STATUS: (
-                STD_JSON.SUCCESS if self.status_code < 400 else STD_JSON.FAILURE
-            ),
+            STD_JSON.STATUS: self._default_status(),
             **data_dict,
         }
 
         if self.status is not None:
             payload[STD_JSON.STATUS] = self.status
 
-        if self.message:
-            payload[STD_JSON.MESSAGE] = self.message
-
-        if self.error_code is not None:
-            payload[STD_JSON.ERROR_CODE] = self.error_code
+        payload.update(self._envelope_tail())
+        return payload
 
-        if self.errors:
-            payload[STD_JSON.ERRORS] = self.errors
+    def _encode_payload(self) -> bytes:
+        """The payload of `_build_payload`, encoded to JSON bytes.
 
-        if self.details:
-            payload[STD_JSON.DETAILS] = self.details
+        A schema whose keys cannot collide with the envelope is encoded once,
+        by pydantic-core, and its members spliced between the envelope's
+        status and trailing keys — no intermediate dict of the whole object
+        graph. Anything else goes through `_build_payload` first.
+        """
+        if not isinstance(self.data, BaseModel) or _schema_overlaps_envelope(
+            type(self.data)
+        ):
+            return pydantic_core.to_json(self._build_payload())
 
-        return jsonify(payload), self.status_code
+        envelope_members = [
+            _json_object_members(
+                pydantic_core.to_json(
+                    {
+                        STD_JSON.STATUS: (
+                            self.status
+                            if self.status is not None
+                            else self._default_status()
+                        )
+                    }
+                )
+            ),
+            _json_object_members(pydantic_core.to_json(self.data, by_alias=True)),
+            _json_object_members(pydantic_core.to_json(self._envelope_tail())),
+        ]
+        return b"{" + b",".join(member for member in envelope_members if member) + b"}"
@@ -2,7 +2,6 @@ from __future__ import annotations
 
 from flask import current_app, url_for
 from flask_login import current_user
-from werkzeug.security import check_password_hash
 
 from backend import db
 from backend.api_common.responses import APIResponse, FlaskResponse
@@ -18,6 +17,7 @@ from backend.api_v1.services.tokens import (
 )
 from backend.app_logger import safe_add_log, warning_log
 from backend.extensions.extension_utils import safe_get_email_sender
+from backend.extensions.password_hashing import get_password_hasher
 from backend.extensions.metrics.writer import record_event
 from backend.metrics.events import EventName
 from backend.models.email_validations import Email_Validations
@@ -44,7 +44,6 @@ from backend.splash.services.oauth.account_service import (
 from backend.splash.services.oauth.constants import Provider
 
 from backend.splash.services.oauth.google_service import resolve_preferred_username
-from backend.splash.services.user_login import DUMMY_HASH
 from backend.splash.services.validate_email import (
     build_response_for_email_attempts_rate_limited,
     build_response_for_max_email_attempts_sent,
@@ -112,7 +111,7 @@ def login_user_for_api(*, username: str, password: str) -> FlaskResponse:
         # Byte- and latency-identical to the wrong-password branch so
         # password-less (OAuth-only) accounts cannot be fingerprinted;
         # mirrors the web login service.
-        check_password_hash(DUMMY_HASH, password)
+        get_password_hasher().verify_dummy_password(password)
         return build_field_error_response(
             message=USER_FAILURE.UNABLE_TO_LOGIN,
             errors={"password": [USER_FAILURE.INVALID_PASSWORD]},
@@ -131,6 +130,10 @@ def login_user_for_api(*, username: str, password: str) -> FlaskResponse:
             error_code=ApiAuthErrorCodes.INVALID_FORM_INPUT,
         )
 
+    if db.session.is_modified(user):
+        # is_password_correct replaced an outdated password hash
+        db.session.commit()
+
     if user.is_suspended:
         # Suspended accounts never receive tokens; mirrors the web login gate.
         warning_log(f"Suspended User={user.id} attempted /api/v1 login")
@@ -244,9 +247,9 @@ def resend_validation_email_for_api() -> FlaskResponse:
         return build_response_for_max_email_attempts_sent()
 
     has_more_attempts = current_email_validation.increment_attempt()
-    db.session.commit()
 
     if not has_more_attempts:
+        db.session.commit()
         return build_response_for_email_attempts_rate_limited(current_email_validation)
 
     email_sender = safe_get_email_sender(current_app)
@@ -255,8 +258,12 @@ def resend_validation_email_for_api() -> FlaskResponse:
         token=current_email_validation.validation_token,
         _external=True,
     )
+    # Commits the attempt count, with the queued email in outbox mode
     email_send_result = email_sender.send_account_email_confirmation(
-        current_user.email, current_user.username, url_for_confirmation
+        current_user.email,
+        current_user.username,
+        url_for_confirmation,
+        commit_session=True,
     )
     return handle_email_sending_result(email_send_result)
 
@@ -4,21 +4,19 @@ from dataclasses import dataclass
 
 from flask import current_app
 import jwt
-from jwt import PyJWKClient
 from jwt import exceptions as JWTExceptions
 
+from backend.extensions.jwks_cache import get_google_jwks_cache
 from backend.utils.strings.config_strs import CONFIG_ENVS
 
 # Google's public signing keys for id_token verification (native mobile
-# Sign-In flow). PyJWKClient caches fetched keys in-process.
-GOOGLE_JWKS_URL = "https://www.googleapis.com/oauth2/v3/certs"
+# Sign-In flow) come from the app's JWKS cache, which fetches them from
+# GOOGLE_OAUTH_JWKS_URL off the request path.
 GOOGLE_ID_TOKEN_ALGORITHM = "RS256"
 # Google historically issues both forms; verify manually against this
 # closed set rather than passing a single issuer to jwt.decode.
 GOOGLE_ISSUERS = ("https://accounts.google.com", "accounts.google.com")
 
-_google_jwk_client = PyJWKClient(GOOGLE_JWKS_URL)
-
 
 @dataclass(frozen=True)
 class GoogleIdTokenClaims:
@@ -44,7 +42,7 @@ def verify_google_id_token(*, id_token: str) -> GoogleIdTokenClaims | None:
         return None
 
     try:
-        signing_key = _google_jwk_client.get_signing_key_from_jwt(id_token)
+        signing_key = get_google_jwks_cache().get_signing_key_from_jwt(id_token)
         claims = jwt.decode(
             jwt=id_token,
             key=signing_key.key,
@@ -9,9 +9,17 @@ import uuid
 from flask import current_app
 import jwt
 from jwt import exceptions as JWTExceptions
+from sqlalchemy import event, func, inspect
+from sqlalchemy.orm import make_transient_to_detached, object_session
+from sqlalchemy.orm.attributes import set_committed_value
 
 from backend import db
-from backend.models.api_refresh_tokens import ApiRefreshTokens
+from backend.extensions.access_token_cache import (
+    CachedAccessToken,
+    get_access_token_cache,
+    invalidate_cached_access_tokens,
+)
+from backend.models.api_refresh_tokens import ApiRefreshTokens, hash_refresh_token
 from backend.models.users import Users
 from backend.utils.datetime_utils import utc_now
 from backend.utils.strings.api_auth_strs import API_AUTH
@@ -19,6 +27,8 @@ from backend.utils.strings.config_strs import CONFIG_ENVS
 
 # secrets.token_urlsafe(48) yields a 64-character opaque refresh token
 REFRESH_TOKEN_URLSAFE_BYTES = 48
+# Left out of cached user snapshots; loaded from the DB if a request needs it
+_UNCACHED_USER_COLUMNS = frozenset({"password"})
 
 
 class RefreshRotationStatus(Enum):
@@ -69,7 +79,18 @@ def decode_access_token(*, token: str) -> Users | None:
 
     Never raises: any signature/expiry/claim failure returns None so the
     request_loader can fall through to an unauthenticated request.
+
+    A token this worker has already verified is answered from the access-token
+    cache until its ``exp``: no signature check and no ``Users`` SELECT, just
+    the cached column snapshot merged into the session.
     """
+    access_token_cache = get_access_token_cache()
+    if access_token_cache is not None:
+        cached_access_token = access_token_cache.get(token)
+        if cached_access_token is not None:
+            return _user_from_cached_access_token(cached_access_token)
+        fill_generation = access_token_cache.begin_fill()
+
     try:
         payload = jwt.decode(
             jwt=token,
@@ -88,7 +109,27 @@ def decode_access_token(*, token: str) -> Users | None:
     except (TypeError, ValueError):
         return None
 
-    return Users.query.get(user_id)
+    user: Users | None = Users.query.get(user_id)
+    expires_at = payload.get(API_AUTH.EXPIRATION_CLAIM)
+    if (
+        user is not None
+        and access_token_cache is not None
+        and isinstance(expires_at, int)
+    ):
+        access_token_cache.put(
+            token,
+            CachedAccessToken(
+                user_id=user.id,
+                expires_at=float(expires_at),
+                user_columns={
+                    column_attr.key: getattr(user, column_attr.key)
+                    for column_attr in inspect(Users).column_attrs
+                    if column_attr.key not in _UNCACHED_USER_COLUMNS
+                },
+            ),
+            generation=fill_generation,
+        )
+    return user
 
 
 def issue_refresh_token(*, user: Users) -> str:
@@ -115,9 +156,7 @@ def rotate_refresh_token(*, presented_token: str) -> RefreshRotationResult:
     held the same token (the legitimate client and a thief) — the whole family
     is revoked and REUSE_DETECTED is returned.
     """
-    presented_row: ApiRefreshTokens | None = ApiRefreshTokens.query.filter(
-        ApiRefreshTokens.token == presented_token
-    ).first()
+    presented_row = _find_refresh_token_row(presented_token=presented_token)
 
     if presented_row is None or presented_row.is_revoked():
         return RefreshRotationResult(status=RefreshRotationStatus.INVALID)
@@ -156,9 +195,7 @@ def revoke_refresh_token_family(*, presented_token: str) -> bool:
 
     Returns True when the token was found and its family revoked, else False.
     """
-    presented_row: ApiRefreshTokens | None = ApiRefreshTokens.query.filter(
-        ApiRefreshTokens.token == presented_token
-    ).first()
+    presented_row = _find_refresh_token_row(presented_token=presented_token)
     if presented_row is None:
         return False
 
@@ -171,8 +208,10 @@ def mark_all_refresh_tokens_revoked_for_user(*, user_id: int) -> int:
     """Mark every unrevoked refresh token for the user as revoked; never commits.
 
     The caller owns the ``db.session.commit()``. Returns the count of rows
-    marked revoked so the caller can include it in audit metadata.
+    marked revoked so the caller can include it in audit metadata. The user's
+    cached access tokens are dropped once that commit lands.
     """
+    invalidate_cached_access_tokens(db.session, [user_id])
     revoked_count: int = ApiRefreshTokens.query.filter(
         ApiRefreshTokens.user_id == user_id,
         ApiRefreshTokens.revoked_at.is_(None),
@@ -180,6 +219,36 @@ def mark_all_refresh_tokens_revoked_for_user(*, user_id: int) -> int:
     return revoked_count
 
 
+def mark_all_refresh_tokens_revoked_for_users(*, user_ids: list[int]) -> dict[int, int]:
+    """Set-based ``mark_all_refresh_tokens_revoked_for_user`` for many users; never commits.
+
+    One grouped COUNT plus one bulk UPDATE regardless of how many users are
+    passed. Returns ``{user_id: revoked_count}``; users with no unrevoked
+    tokens are omitted.
+    """
+    if not user_ids:
+        return {}
+    invalidate_cached_access_tokens(db.session, user_ids)
+    unrevoked_filter = (
+        ApiRefreshTokens.user_id.in_(user_ids),
+        ApiRefreshTokens.revoked_at.is_(None),
+    )
+    revoked_counts: dict[int, int] = {
+        user_id: token_count
+        for user_id, token_count in db.session.query(
+            ApiRefreshTokens.user_id, func.count(ApiRefreshTokens.id)
+        )
+        .filter(*unrevoked_filter)
+        .group_by(ApiRefreshTokens.user_id)
+        .all()
+    }
+    if revoked_counts:
+        ApiRefreshTokens.query.filter(*unrevoked_filter).update(
+            {ApiRefreshTokens.revoked_at: utc_now()}, synchronize_session=False
+        )
+    return revoked_counts
+
+
 def revoke_all_refresh_tokens_for_user(*, user_id: int) -> int:
     """Log out everywhere: revoke every unrevoked refresh token for the user.
 
@@ -190,6 +259,30 @@ def revoke_all_refresh_tokens_for_user(*, user_id: int) -> int:
     return revoked_count
 
 
+def _user_from_cached_access_token(cached_access_token: CachedAccessToken) -> Users:
+    cached_user: Users = Users.__mapper__.class_manager.new_instance()
+    for column_key, value in cached_access_token.user_columns.items():
+        set_committed_value(cached_user, column_key, value)
+    # Columns left out of the snapshot are marked expired, so they load on access
+    make_transient_to_detached(cached_user)
+    return db.session.merge(cached_user, load=False)
+
+
+@event.listens_for(Users, "after_update")
+def _invalidate_access_tokens_on_user_update(_mapper, _connection, user: Users) -> None:
+    # Suspension, password and role changes all land here; bulk query updates
+    # bypass ORM events and go through the refresh-token revocation helpers.
+    session = object_session(user)
+    if session is not None and session.is_modified(user, include_collections=False):
+        invalidate_cached_access_tokens(session, [user.id])
+
+
+def _find_refresh_token_row(*, presented_token: str) -> ApiRefreshTokens | None:
+    return ApiRefreshTokens.query.filter(
+        ApiRefreshTokens.token_hash == hash_refresh_token(presented_token)
+    ).first()
+
+
 def _generate_refresh_token_value() -> str:
     return secrets.token_urlsafe(REFRESH_TOKEN_URLSAFE_BYTES)
 
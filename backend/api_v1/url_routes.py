@@ -26,6 +26,7 @@ from backend.schemas.errors import ErrorResponse
 from backend.schemas.requests.search import SearchQuerySchema
 from backend.schemas.requests.urls import (
     CreateURLRequest,
+    ImportURLRequest,
     UpdateURLStringRequest,
     UpdateURLTitleRequest,
 )
@@ -33,6 +34,7 @@ from backend.schemas.search import SearchResultsSchema
 from backend.schemas.urls import (
     UrlCreatedResponseSchema,
     UrlDeletedResponseSchema,
+    UrlImportResponseSchema,
     UrlReadResponseSchema,
     UrlTitleUpdatedResponseSchema,
     UrlUpdatedResponseSchema,
@@ -42,6 +44,7 @@ from backend.search.services.cross_utub_search import search_across_user_utubs
 from backend.urls.constants import URLErrorCodes
 from backend.urls.services.create_urls import create_url_in_utub
 from backend.urls.services.delete_urls import delete_url_in_utub
+from backend.urls.services.import_urls import import_candidates_from_request
 from backend.urls.services.read_urls import get_url_in_utub
 from backend.urls.services.update_url_titles import update_url_title_if_new
 from backend.urls.services.update_urls import update_url_in_utub
@@ -80,6 +83,31 @@ def api_v1_create_url(
     )
 
 
+@api_v1.route("/utubs/<int:utub_id>/urls/import", methods=["POST"])
+@api_utub_membership_required
+@api_route(
+    request_schema=ImportURLRequest,
+    response_schema=UrlImportResponseSchema,
+    error_message=URL_FAILURE.UNABLE_TO_IMPORT_URLS_FORM,
+    error_code=URLErrorCodes.INVALID_FORM_INPUT,
+    ajax_required=False,
+    tags=[OPEN_API.MOBILE_API],
+    description="Import many URLs into a UTub from a list or a bookmarks file",
+    status_codes={
+        200: UrlImportResponseSchema,
+        400: ErrorResponse,
+        401: ErrorResponse,
+        403: ErrorResponse,
+        404: ErrorResponse,
+    },
+)
+def api_v1_import_urls(
+    utub_id: int, current_utub: Utubs, import_url_request: ImportURLRequest
+) -> FlaskResponse:
+    """Import many URLs into a UTub the authenticated user belongs to."""
+    return import_candidates_from_request(current_utub, import_url_request)
+
+
 @api_v1.route("/utubs/<int:utub_id>/urls/<int:utub_url_id>", methods=["GET"])
 @api_utub_membership_with_valid_url_in_utub_required
 @api_route(
@@ -1,9 +1,14 @@
-from datetime import datetime
+import atexit
+import copy
+from datetime import date, datetime, time, timedelta
 import json
 import logging
+from logging.handlers import QueueHandler, QueueListener
 import os
+import queue
 import re
 import sys
+import threading
 from typing import Optional
 import uuid
 
@@ -11,6 +16,7 @@ from flask import Flask, Request, Response, current_app, g, has_request_context,
 from flask.logging import default_handler
 
 from backend.extensions.request_timing import request_elapsed_ms
+from backend.extensions.sql_tracing import sql_trace_log_fields
 from backend.utils.all_routes import SYSTEM_ROUTES
 from backend.utils.strings.config_strs import CONFIG_ENVS
 
@@ -23,18 +29,47 @@ BLUE = "\033[94m"
 
 REQUEST_ID_PATTERN = re.compile(r"[^a-zA-Z0-9\-_]")
 
+# Set via `extra` by log_with_detailed_info; selects the detailed console format
+DETAILED_INFO = "detailed_info"
+
+LOG_QUEUE_MAX_SIZE: int = 10000
+
 
 class RequestInfoFilter(logging.Filter):
-    """Add request-specific information to log records."""
+    """Add request-specific information to log records.
+
+    Must run on the thread that logged the record, since it reads the request
+    context; in queue mode it is attached to the QueueHandler for that reason.
+    """
 
     def filter(self, record):
         record.request_id = getattr(g, "request_id", "-") if request else "-"
         record.remote_addr = getattr(g, "remote_addr", "-") if request else "-"
         record.user_agent = getattr(g, "user_agent", "-") if request else "-"
         record.module = request.endpoint if request and request.endpoint else "u4i"
+        record.endpoint = record.module
 
         # Skip logging health endpoint
-        return request.endpoint != SYSTEM_ROUTES.HEALTH
+        return not request or request.endpoint != SYSTEM_ROUTES.HEALTH
+
+
+class ConsoleFormatter(logging.Formatter):
+    """Pick the regular or detailed console format for each record.
+
+    Records flagged with ``DETAILED_INFO`` get the detailed format. Choosing
+    per record leaves the shared handler untouched, unlike swapping its
+    formatter, which raced between concurrent requests.
+    """
+
+    def __init__(self, regular: logging.Formatter, detailed: logging.Formatter):
+        super().__init__()
+        self.regular = regular
+        self.detailed = detailed
+
+    def format(self, record):
+        if getattr(record, DETAILED_INFO, False):
+            return self.detailed.format(record)
+        return self.regular.format(record)
 
 
 class StructuredJSONLoggingFormatter(logging.Formatter):
@@ -43,7 +78,7 @@ class StructuredJSONLoggingFormatter(logging.Formatter):
             "timestamp": datetime.fromtimestamp(record.created).isoformat(),
             "level": record.levelname,
             "request_id": getattr(record, "request_id", "-"),
-            "endpoint": request.endpoint if request and request.endpoint else "u4i",
+            "endpoint": getattr(record, "endpoint", "u4i"),
         }
 
         # Add structured fields from extra dict
@@ -72,6 +107,7 @@ class StructuredJSONLoggingFormatter(logging.Formatter):
             "request_id",
             "endpoint",
             "write_to_file",
+            DETAILED_INFO,
         }
 
         for key, value in record.__dict__.items():
@@ -85,30 +121,72 @@ class StructuredJSONLoggingFormatter(logging.Formatter):
         return json.dumps(log_data, default=str)
 
 
+def _next_midnight_timestamp(day: date) -> float:
+    return datetime.combine(day + timedelta(days=1), time.min).timestamp()
+
+
 # Create a custom handler that creates new files daily
 class DailyFileHandler(logging.FileHandler):
     def __init__(self, log_dir):
         self.log_dir = log_dir
         # Ensure log directory exists
         os.makedirs(log_dir, exist_ok=True)
-        super().__init__(self._get_log_file_path(log_dir), mode="a")
-
-    def _get_log_file_path(self, log_dir: str) -> str:
-        """Generate log file path based on current date."""
-        today = datetime.now().strftime("%Y-%m-%d")
-        return os.path.join(log_dir, f"{today}_daily.log")
+        today = date.today()
+        self._rollover_at = _next_midnight_timestamp(today)
+        super().__init__(self._get_log_file_path(log_dir, today), mode="a")
+
+    def _get_log_file_path(self, log_dir: str, day: date) -> str:
+        """Generate log file path based on the given date."""
+        return os.path.abspath(
+            os.path.join(log_dir, f"{day.strftime('%Y-%m-%d')}_daily.log")
+        )
 
     def emit(self, record):
-        current_file = self._get_log_file_path(self.log_dir)
+        # The dated path only changes at midnight, so skip re-deriving it until then
+        if record.created >= self._rollover_at:
+            record_day = date.fromtimestamp(record.created)
+            self._rollover_at = _next_midnight_timestamp(record_day)
+            current_file = self._get_log_file_path(self.log_dir, record_day)
 
-        if self.baseFilename != current_file:
-            self.close()
-            self.baseFilename = current_file
-            self.stream = self._open()
+            if self.baseFilename != current_file:
+                self.close()
+                self.baseFilename = current_file
+                self.stream = self._open()
 
         super().emit(record)
 
 
+class BoundedQueueHandler(QueueHandler):
+    """Hand records to a bounded queue, dropping (and counting) them when full.
+
+    Formatting is left to the QueueListener thread: ``prepare`` only resolves
+    the message arguments, which may be mutated once the caller moves on. The
+    exception info is kept so the listener's formatters can render it.
+    """
+
+    def __init__(self, log_queue: queue.Queue):
+        super().__init__(log_queue)
+        self._dropped_count = 0
+        self._dropped_lock = threading.Lock()
+
+    @property
+    def dropped_count(self) -> int:
+        return self._dropped_count
+
+    def prepare(self, record: logging.LogRecord) -> logging.LogRecord:
+        record = copy.copy(record)
+        record.msg = record.getMessage()
+        record.args = None
+        return record
+
+    def enqueue(self, record: logging.LogRecord):
+        try:
+            self.queue.put_nowait(record)
+        except queue.Full:
+            with self._dropped_lock:
+                self._dropped_count += 1
+
+
 def generate_request_id() -> str:
     return str(uuid.uuid4())[-12:]
 
@@ -163,20 +241,34 @@ def configure_logging(app: Flask, is_production=False):
         "[%(asctime)s] %(levelname)s [%(request_id)s] [%(remote_addr)s] [%(user_agent)s] %(module)s: %(message)s"
     )
 
+    use_log_queue = app.config.get(CONFIG_ENVS.LOG_QUEUE_ENABLED, False)
+    handlers: list[logging.Handler] = []
+
     # Create console handler
     console_handler = logging.StreamHandler()
     console_handler.set_name(CONFIG_ENVS.U4I_LOGGER)
-    console_handler.setFormatter(regular_formatter)
-    console_handler.addFilter(RequestInfoFilter())
-    app.logger.addHandler(console_handler)
+    console_handler.setFormatter(
+        ConsoleFormatter(regular_formatter, detailed_formatter)
+    )
+    handlers.append(console_handler)
 
     # Create file handler
     if not app.config.get("TESTING", False):
         file_handler = DailyFileHandler(app.config.get(CONFIG_ENVS.LOG_DIR, "logs/"))
         file_handler.setFormatter(StructuredJSONLoggingFormatter())
-        file_handler.addFilter(RequestInfoFilter())
         file_handler.addFilter(lambda record: getattr(record, "write_to_file", False))
-        app.logger.addHandler(file_handler)
+        handlers.append(file_handler)
+
+    if use_log_queue:
+        _start_log_queue(
+            app,
+            handlers,
+            max_size=app.config.get(CONFIG_ENVS.LOG_QUEUE_MAX_SIZE, LOG_QUEUE_MAX_SIZE),
+        )
+    else:
+        for handler in handlers:
+            handler.addFilter(RequestInfoFilter())
+            app.logger.addHandler(handler)
 
     # Store formatters for use in before_request logging
     setattr(app, "_detailed_formatter", detailed_formatter)
@@ -191,6 +283,43 @@ def configure_logging(app: Flask, is_production=False):
     logging.getLogger("gunicorn.access").disabled = True
 
 
+def _start_log_queue(app: Flask, handlers: list[logging.Handler], max_size: int):
+    """Route app.logger through a bounded queue drained by a listener thread.
+
+    Request threads only enrich the record (RequestInfoFilter) and enqueue it;
+    formatting and console/file writes happen on the listener thread.
+    """
+    log_queue: queue.Queue = queue.Queue(maxsize=max_size)
+    queue_handler = BoundedQueueHandler(log_queue)
+    queue_handler.addFilter(RequestInfoFilter())
+
+    listener = QueueListener(log_queue, *handlers, respect_handler_level=True)
+    listener.start()
+    app.logger.addHandler(queue_handler)
+    setattr(app, "_log_queue_listener", listener)
+
+    # Flush what is still queued when the worker exits
+    atexit.register(stop_log_queue, app)
+
+
+def stop_log_queue(app: Flask):
+    """Drain the log queue and stop its listener thread; safe to call twice."""
+    listener: QueueListener | None = getattr(app, "_log_queue_listener", None)
+    if listener is None:
+        return
+    delattr(app, "_log_queue_listener")
+    listener.stop()
+
+
+def get_dropped_log_count(app: Flask) -> int:
+    """Number of records dropped because the log queue was full."""
+    return sum(
+        handler.dropped_count
+        for handler in app.logger.handlers
+        if isinstance(handler, BoundedQueueHandler)
+    )
+
+
 def _output_logs_for_ui_tests(level: int, message: str):
     request_id = getattr(g, "request_id", "-")
     remote_addr = getattr(request, "remote_addr", "-")
@@ -206,21 +335,7 @@ def _output_logs_for_ui_tests(level: int, message: str):
 
 def log_with_detailed_info(app: Flask, level: int, message: str):
     """Log a message with detailed request info (user agent and remote addr)."""
-    # Temp swap formatters console handler
-
-    handler = None
-    for handler in app.logger.handlers:
-        if isinstance(handler, logging.StreamHandler):
-            break
-
-    if not handler:
-        return
-
-    original_formatter = handler.formatter
-    handler.setFormatter(getattr(app, "_detailed_formatter"))
-    app.logger.log(level, message)
-
-    handler.setFormatter(original_formatter)
+    app.logger.log(level, message, extra={DETAILED_INFO: True})
 
 
 def sanitize_request_id(request_id: Optional[str], max_length: int = 12) -> str:
@@ -333,6 +448,7 @@ def setup_before_after_request_logging(app: Flask, show_ui_flask_logs: bool = Fa
                 "user_agent": g.user_agent if g.user_agent != "-" else None,
                 "content_length": response.content_length,
                 "content_type": g.content_type,
+                **sql_trace_log_fields(),
                 "console": file_msg,
             },
         )
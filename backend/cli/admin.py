@@ -0,0 +1,95 @@
+from __future__ import annotations
+
+import sys
+
+import click
+from flask import Flask, current_app
+from flask.cli import AppGroup, with_appcontext
+
+from backend.admin.account_data_service import (
+    BulkErasureResult,
+    erase_users_in_batch,
+)
+from backend.models.users import User_Role, Users
+
+HELP_SUMMARY_ADMIN = """Admin account-maintenance CLI commands for U4I."""
+
+ERASE_USERS_NO_IDS = "No user ids given; nothing to erase."
+ERASE_USERS_ACTOR_NOT_ADMIN = "FATAL: --actor-id must reference an existing admin"
+ERASE_USERS_SUMMARY_HEADER = "user_id\tutubs_deleted\townerships_transferred\tmemberships_removed\tcontact_entries_deleted\tapi_tokens_revoked"
+
+admin_cli = AppGroup(
+    "admin",
+    context_settings={"ignore_unknown_options": True},
+    help=HELP_SUMMARY_ADMIN,
+)
+
+
+def _format_user_ids(user_ids: list[int]) -> str:
+    return ", ".join(str(user_id) for user_id in user_ids)
+
+
+@admin_cli.command(
+    "erase-users",
+    help="Erase many user accounts in one set-based batch (same rules as the portal erase).",
+)
+@click.option(
+    "--actor-id",
+    "actor_id",
+    required=True,
+    type=int,
+    help="Admin user id recorded as the actor on every audit row.",
+)
+@click.option(
+    "--reason",
+    required=True,
+    type=str,
+    help="Human-readable reason recorded on every audit row.",
+)
+@click.argument("user_ids", nargs=-1, type=int)
+@with_appcontext
+def erase_users_command(actor_id: int, reason: str, user_ids: tuple[int, ...]):
+    """Erase every account in ``USER_IDS`` with ``erase_users_in_batch``.
+
+    Prints one TSV row of erasure counts per erased user, then a line for
+    each id that was skipped (unknown, already erased, or the last active
+    admins). Exits non-zero when the actor is not an admin.
+    """
+    if not user_ids:
+        click.echo(ERASE_USERS_NO_IDS)
+        return
+
+    actor: Users | None = Users.query.get(actor_id)
+    if actor is None or actor.role != User_Role.ADMIN:
+        click.echo(f"{ERASE_USERS_ACTOR_NOT_ADMIN}: {actor_id}", err=True)
+        sys.exit(1)
+
+    result: BulkErasureResult = erase_users_in_batch(
+        actor_id=actor_id, target_user_ids=list(user_ids), reason=reason.strip()
+    )
+
+    click.echo(ERASE_USERS_SUMMARY_HEADER)
+    for user_id, erasure_counts in sorted(result.erased.items()):
+        click.echo(
+            f"{user_id}\t{erasure_counts.utubs_deleted}"
+            f"\t{erasure_counts.ownerships_transferred}"
+            f"\t{erasure_counts.memberships_removed}"
+            f"\t{erasure_counts.contact_entries_deleted}"
+            f"\t{erasure_counts.api_tokens_revoked}"
+        )
+    if result.already_erased:
+        click.echo(f"Already erased: {_format_user_ids(result.already_erased)}")
+    if result.not_found:
+        click.echo(f"Not found: {_format_user_ids(result.not_found)}")
+    if result.blocked_last_admin:
+        click.echo(
+            "Skipped (would leave no active admin): "
+            f"{_format_user_ids(result.blocked_last_admin)}"
+        )
+    current_app.cli_logger.info(  # type: ignore
+        f"admin erase-users: erased {len(result.erased)} account(s)"
+    )
+
+
+def register_admin_cli(app: Flask):
+    app.cli.add_command(admin_cli)
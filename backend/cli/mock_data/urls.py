@@ -21,7 +21,7 @@ def generate_mock_urls(db: SQLAlchemy):
         utub_members: list[Utub_Members] = utub.members
 
         for member, url in zip(utub_members, MOCK_URL_STRINGS):
-            url_to_add = Urls.query.filter(Urls.url_string == url).first()
+            url_to_add = Urls.find_by_url_string(url)
             if url_to_add is not None:
                 print(f"Already added {url} to database")
             else:
@@ -65,7 +65,7 @@ def generate_custom_mock_url(db: SQLAlchemy, urls_to_add: list[str]):
         ][0]
 
         for url in urls_to_add:
-            url_to_add = Urls.query.filter(Urls.url_string == url).first()
+            url_to_add = Urls.find_by_url_string(url)
             if url_to_add is not None:
                 print(f"Already added {url} to database")
             else:
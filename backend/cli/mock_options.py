@@ -254,7 +254,7 @@ def _add_tracking_seed_urls(db: SQLAlchemy):
         )
 
     for tracking_url, _ in MOCK_TRACKING_SEED_URL_PAIRS:
-        url_to_add: Urls = Urls.query.filter(Urls.url_string == tracking_url).first()
+        url_to_add: Urls = Urls.find_by_url_string(tracking_url)
         if url_to_add is None:
             url_to_add = Urls(
                 normalized_url=tracking_url,
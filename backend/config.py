@@ -19,6 +19,20 @@ IS_PRODUCTION = environ.get(ENV.PRODUCTION, default="false").lower() == "true"
 IS_DEV_SERVER = environ.get(ENV.DEV_SERVER, default="false").lower() == "true"
 NOTIFICATION_URL = environ.get(ENV.NOTIFICATION_URL, default="")
 CONTACT_US_URL = environ.get(ENV.CONTACT_US_URL, default="")
+# Webhook notifications are delivered by a small pool of long-lived worker
+# threads fed from a bounded queue (backend/extensions/notifications). 0 workers
+# delivers on the calling thread instead.
+# Must be a valid integer; a non-numeric value raises ValueError at import time (fail-fast behavior).
+NOTIFICATION_WORKERS = int(environ.get(ENV.NOTIFICATION_WORKERS, default="2"))
+# Must be a valid integer; a non-numeric value raises ValueError at import time (fail-fast behavior).
+NOTIFICATION_QUEUE_MAX_SIZE = int(
+    environ.get(ENV.NOTIFICATION_QUEUE_MAX_SIZE, default="100")
+)
+# Identical notifications within this window are coalesced or suppressed.
+# Must be a valid integer; a non-numeric value raises ValueError at import time (fail-fast behavior).
+NOTIFICATION_DEDUPE_SECONDS = int(
+    environ.get(ENV.NOTIFICATION_DEDUPE_SECONDS, default="60")
+)
 
 POSTGRES_USER = environ.get(ENV.POSTGRES_USER)
 POSTGRES_PASSWORD = environ.get(ENV.POSTGRES_PASSWORD)
@@ -45,6 +59,29 @@ METRICS_BATCH_NONCE_TTL_SECONDS = int(
     environ.get(ENV.METRICS_BATCH_NONCE_TTL_SECONDS, default="120")
 )
 
+# Opt-in response compression (backend/extensions/response_compression.py).
+RESPONSE_COMPRESSION_ENABLED = (
+    environ.get(ENV.RESPONSE_COMPRESSION_ENABLED, default="false").lower() == "true"
+)
+# Must be a valid integer; a non-numeric value raises ValueError at import time (fail-fast behavior).
+RESPONSE_COMPRESSION_MIN_BYTES = int(
+    environ.get(ENV.RESPONSE_COMPRESSION_MIN_BYTES, default="1024")
+)
+
+# Opt-in: EmailSender writes outbound email to the EmailOutbox table in the
+# caller's transaction instead of calling Mailjet in the request; the workflow
+# sidecar's scripts/send_email_outbox.py sends it.
+EMAIL_OUTBOX_ENABLED = (
+    environ.get(ENV.EMAIL_OUTBOX_ENABLED, default="false").lower() == "true"
+)
+
+# Opt-in: read-only admin page views buffer their audit entries per worker and
+# a background thread batch-inserts them (backend/extensions/audit/deferred.py),
+# instead of committing one row per page view.
+AUDIT_VIEWS_DEFERRED = (
+    environ.get(ENV.AUDIT_VIEWS_DEFERRED, default="false").lower() == "true"
+)
+
 # OAuth provider credentials (Google + GitHub). All four keys are soft-optional:
 # they default to None so unconfigured environments (local without OAuth apps, CI,
 # any env that has not registered provider clients) still boot. No ValueError guard
@@ -57,6 +94,11 @@ METRICS_BATCH_NONCE_TTL_SECONDS = int(
 # in create_app(). Each resulting URL must be registered in the provider's console.
 GOOGLE_OAUTH_CLIENT_ID = environ.get(ENV.GOOGLE_OAUTH_CLIENT_ID, default=None)
 GOOGLE_OAUTH_CLIENT_SECRET = environ.get(ENV.GOOGLE_OAUTH_CLIENT_SECRET, default=None)
+# Signing keys for native-app Google id_tokens (backend/extensions/jwks_cache.py);
+# overridable so tests can serve keys from a local stand-in.
+GOOGLE_OAUTH_JWKS_URL = environ.get(
+    ENV.GOOGLE_OAUTH_JWKS_URL, default="https://www.googleapis.com/oauth2/v3/certs"
+)
 GITHUB_OAUTH_CLIENT_ID = environ.get(ENV.GITHUB_OAUTH_CLIENT_ID, default=None)
 GITHUB_OAUTH_CLIENT_SECRET = environ.get(ENV.GITHUB_OAUTH_CLIENT_SECRET, default=None)
 
@@ -69,6 +111,12 @@ API_ACCESS_TOKEN_LIFETIME_SECONDS = int(
 API_REFRESH_TOKEN_LIFETIME_SECONDS = int(
     environ.get(ENV.API_REFRESH_TOKEN_LIFETIME_SECONDS, default="2592000")
 )
+# Per-worker cache of verified access tokens (backend/extensions/access_token_cache.py);
+# 0 verifies and loads the user on every request.
+# Must be a valid integer; a non-numeric value raises ValueError at import time (fail-fast behavior).
+ACCESS_TOKEN_CACHE_MAX_ENTRIES = int(
+    environ.get(ENV.ACCESS_TOKEN_CACHE_MAX_ENTRIES, default="10000")
+)
 
 DEV_DB_URI = build_db_uri(
     username=POSTGRES_USER,
@@ -112,6 +160,29 @@ TEST_GITHUB_OAUTH_CLIENT_ID = "test-github-client-id"
 TEST_GITHUB_OAUTH_CLIENT_SECRET = "test-github-client-secret"
 
 LOG_DIR = environ.get(ENV.LOG_DIR, default="logs")
+# Opt-in: move log formatting and console/file writes to a background thread
+# (backend/app_logger.py). Records are dropped, and counted, once the queue is full.
+LOG_QUEUE_ENABLED = (
+    environ.get(ENV.LOG_QUEUE_ENABLED, default="false").lower() == "true"
+)
+# Must be a valid integer; a non-numeric value raises ValueError at import time (fail-fast behavior).
+LOG_QUEUE_MAX_SIZE = int(environ.get(ENV.LOG_QUEUE_MAX_SIZE, default="10000"))
+
+# Password hashing (backend/extensions/password_hashing.py). The method is any
+# werkzeug generate_password_hash method, e.g. "scrypt" or "pbkdf2:sha256:600000";
+# hashes stored with a different method or cost are rehashed on login.
+PASSWORD_HASH_METHOD = environ.get(ENV.PASSWORD_HASH_METHOD, default="scrypt")
+# Process pool size for KDF work; 0 runs it on the request thread.
+# Must be a valid integer; a non-numeric value raises ValueError at import time (fail-fast behavior).
+PASSWORD_HASH_WORKERS = int(environ.get(ENV.PASSWORD_HASH_WORKERS, default="0"))
+# Must be a valid integer; a non-numeric value raises ValueError at import time (fail-fast behavior).
+PASSWORD_HASH_MAX_CONCURRENCY = int(
+    environ.get(ENV.PASSWORD_HASH_MAX_CONCURRENCY, default="4")
+)
+# Must be a valid integer; a non-numeric value raises ValueError at import time (fail-fast behavior).
+PASSWORD_HASH_QUEUE_TIMEOUT_SECONDS = int(
+    environ.get(ENV.PASSWORD_HASH_QUEUE_TIMEOUT_SECONDS, default="5")
+)
 
 if IS_PRODUCTION:
     redis_password = environ.get("REDIS_PASSWORD", "")
@@ -159,6 +230,8 @@ class Config:
     BASE_EMAIL = environ.get(ENV.BASE_EMAIL)
     MAILJET_API_KEY = environ.get(ENV.MAILJET_API_KEY)
     MAILJET_SECRET_KEY = environ.get(ENV.MAILJET_SECRET_KEY)
+    EMAIL_OUTBOX_ENABLED = EMAIL_OUTBOX_ENABLED
+    AUDIT_VIEWS_DEFERRED = AUDIT_VIEWS_DEFERRED
     TESTING = False
     SQLALCHEMY_TRACK_MODIFICATIONS = False
     SQLALCHEMY_DATABASE_URI = DEV_DB_URI
@@ -172,7 +245,16 @@ class Config:
     DEV_SERVER = IS_DEV_SERVER
     NOTIFICATION_URL = NOTIFICATION_URL
     LOG_DIR = LOG_DIR
+    LOG_QUEUE_ENABLED = LOG_QUEUE_ENABLED
+    LOG_QUEUE_MAX_SIZE = LOG_QUEUE_MAX_SIZE
+    PASSWORD_HASH_METHOD = PASSWORD_HASH_METHOD
+    PASSWORD_HASH_WORKERS = PASSWORD_HASH_WORKERS
+    PASSWORD_HASH_MAX_CONCURRENCY = PASSWORD_HASH_MAX_CONCURRENCY
+    PASSWORD_HASH_QUEUE_TIMEOUT_SECONDS = PASSWORD_HASH_QUEUE_TIMEOUT_SECONDS
     CONTACT_US_URL = CONTACT_US_URL
+    NOTIFICATION_WORKERS = NOTIFICATION_WORKERS
+    NOTIFICATION_QUEUE_MAX_SIZE = NOTIFICATION_QUEUE_MAX_SIZE
+    NOTIFICATION_DEDUPE_SECONDS = NOTIFICATION_DEDUPE_SECONDS
     # DEPRECATED: Use VITE_DEV_SERVER instead. Will be removed in future release.
     LOCAL = not IS_DEV_SERVER and not PRODUCTION
     VITE_DEV_SERVER = VITE_DEV_SERVER
@@ -186,10 +268,21 @@ class Config:
     METRICS_BATCH_NONCE_TTL_SECONDS = METRICS_BATCH_NONCE_TTL_SECONDS
     GOOGLE_OAUTH_CLIENT_ID = GOOGLE_OAUTH_CLIENT_ID
     GOOGLE_OAUTH_CLIENT_SECRET = GOOGLE_OAUTH_CLIENT_SECRET
+    GOOGLE_OAUTH_JWKS_URL = GOOGLE_OAUTH_JWKS_URL
     GITHUB_OAUTH_CLIENT_ID = GITHUB_OAUTH_CLIENT_ID
     GITHUB_OAUTH_CLIENT_SECRET = GITHUB_OAUTH_CLIENT_SECRET
     API_ACCESS_TOKEN_LIFETIME_SECONDS = API_ACCESS_TOKEN_LIFETIME_SECONDS
     API_REFRESH_TOKEN_LIFETIME_SECONDS = API_REFRESH_TOKEN_LIFETIME_SECONDS
+    ACCESS_TOKEN_CACHE_MAX_ENTRIES = ACCESS_TOKEN_CACHE_MAX_ENTRIES
+    # Admin health dashboard: run the subsystem probes side by side, and let
+    # concurrent polls within this many seconds share one snapshot.
+    HEALTH_PROBES_CONCURRENT = True
+    HEALTH_SNAPSHOT_CACHE_SECONDS = 10
+    # APIResponse encoder: "pydantic" encodes straight to bytes with
+    # pydantic-core; "stdlib" falls back to Flask's jsonify.
+    JSON_RESPONSE_ENCODER = "pydantic"
+    RESPONSE_COMPRESSION_ENABLED = RESPONSE_COMPRESSION_ENABLED
+    RESPONSE_COMPRESSION_MIN_BYTES = RESPONSE_COMPRESSION_MIN_BYTES
     # Set only by `tests/functional/conftest.py::worker_config`, before any
     # fixture calls `create_app()` — Authlib's `OAuth` registry caches a
     # "google" client the first time it's registered, and `build_app`,
@@ -249,6 +342,19 @@ class ConfigTest(Config):
     # Defense in depth: ensure the metrics CLI/sync helpers are no-ops in tests
     # unless a test explicitly opts in (overrides the flag and calls sync).
     METRICS_ENABLED = False
+    # The test session is pinned to one connection inside an outer
+    # transaction, which probe threads must not share; and tests assert on
+    # fresh snapshots, so nothing is cached.
+    HEALTH_PROBES_CONCURRENT = False
+    HEALTH_SNAPSHOT_CACHE_SECONDS = 0
+    # Deliver notifications on the request thread so tests see them (and the
+    # contact form's delivered flag) by the time the response returns.
+    NOTIFICATION_WORKERS = 0
+    # Tests commit inside an outer transaction, so after-commit invalidation
+    # fan-out never fires; always verify the token and load the user.
+    # tests/integration/mobile_api/test_access_token_cache_enabled.py turns
+    # the cache on.
+    ACCESS_TOKEN_CACHE_MAX_ENTRIES = 0
 
     SESSION_TYPE = (
         "redis"
@@ -1,3 +1,5 @@
+from functools import partial
+
 from flask import current_app, render_template, request
 from flask_login import current_user
 
@@ -27,17 +29,26 @@ def validate_and_contact(subject: str, content: str) -> FlaskResponse:
 
     notification_sender = safe_get_notif_sender(current_app)
 
-    message_delivered = notification_sender.send_contact_form_details(
+    notification_sender.send_contact_form_details(
         subject=subject,
         content=content,
         contact_id=contact_form_entry.id,
         username=(
             current_user.username if contact_form_entry.user_id is not None else None
         ),
+        on_delivered=partial(_mark_contact_form_delivered, contact_form_entry.id),
     )
 
-    if message_delivered:
-        contact_form_entry.delivered = True
-        db.session.commit()
-
     return APIResponse(message="Sent! Thanks for reaching out.").to_response()
+
+
+def _mark_contact_form_delivered(contact_id: int) -> None:
+    # Runs once the webhook acknowledges the message, usually on a
+    # notification worker after this request has already returned
+    contact_form_entry: ContactFormEntries | None = ContactFormEntries.query.get(
+        contact_id
+    )
+    if contact_form_entry is None:
+        return
+    contact_form_entry.delivered = True
+    db.session.commit()
@@ -0,0 +1,264 @@
+"""In-process cache of verified /api/v1 access tokens.
+
+Mobile clients present the same access JWT on every request for its whole
+lifetime, and each presentation would otherwise cost an HS256 verify plus a
+``Users`` SELECT. ``AccessTokenCache`` maps a token already verified in this
+process to a snapshot of its user's columns, kept no longer than the token's
+``exp``. The cache is a bounded LRU of ``ACCESS_TOKEN_CACHE_MAX_ENTRIES``
+entries; 0 disables it.
+
+Every gunicorn worker has its own cache, so invalidation fans out over Redis
+pub/sub on ``REDIS_URI``:
+
+- ``invalidate_cached_access_tokens(user_ids)`` evicts the users here right
+  away and queues them on the SQLAlchemy session; once that session commits,
+  their ids are published and every worker's subscriber thread evicts them.
+- While a worker's subscriber is not connected it could miss a message, so the
+  cache neither serves nor stores entries until it is, and it starts empty
+  after each (re)subscribe.
+- A fill started before an eviction is discarded, so a lookup racing a
+  suspension cannot put the pre-suspension snapshot back.
+
+With ``REDIS_URI`` set to ``memory://`` (a single-process dev server) there is
+nothing to fan out to, and evictions stay local.
+"""
+
+from __future__ import annotations
+
+import atexit
+from collections import OrderedDict
+from dataclasses import dataclass
+import json
+import logging
+import threading
+import time
+from typing import Any, Iterable, Mapping
+
+from flask import Flask, current_app
+from redis import Redis
+from redis.exceptions import RedisError
+from sqlalchemy import event
+from sqlalchemy.orm import Session
+
+from backend.app_logger import warning_log
+from backend.utils.strings.api_auth_strs import API_AUTH
+from backend.utils.strings.config_strs import CONFIG_ENVS
+
+ACCESS_TOKEN_CACHE = "access_token_cache"
+DEFAULT_MAX_ENTRIES = 10_000
+RESUBSCRIBE_DELAY_SECONDS = 1.0
+SHUTDOWN_JOIN_SECONDS = 5.0
+# Key in Session.info holding user ids to publish once the session commits
+_PENDING_INVALIDATIONS_KEY = "access_token_cache_pending_user_ids"
+
+
+@dataclass(frozen=True)
+class CachedAccessToken:
+    user_id: int
+    expires_at: float
+    user_columns: Mapping[str, Any]
+
+
+class AccessTokenCache:
+    def __init__(
+        self,
+        *,
+        max_entries: int = DEFAULT_MAX_ENTRIES,
+        redis_client: Redis | None = None,
+        resubscribe_delay_seconds: float = RESUBSCRIBE_DELAY_SECONDS,
+    ) -> None:
+        self._max_entries = max(max_entries, 0)
+        self._redis = redis_client
+        self._resubscribe_delay_seconds = resubscribe_delay_seconds
+        self._entries: OrderedDict[str, CachedAccessToken] = OrderedDict()
+        self._lock = threading.Lock()
+        # Bumped by every eviction; a fill begun under an older generation
+        # may hold a stale snapshot and is dropped
+        self._generation = 0
+        self._subscribed = threading.Event()
+        self._stopped = threading.Event()
+        self._subscriber: threading.Thread | None = None
+
+    @property
+    def enabled(self) -> bool:
+        return self._max_entries > 0
+
+    def begin_fill(self) -> int:
+        """Call before verifying a token and loading its user; pass to `put`."""
+        with self._lock:
+            return self._generation
+
+    def get(self, token: str, *, now: float | None = None) -> CachedAccessToken | None:
+        if not self._is_serving():
+            return None
+        now = time.time() if now is None else now
+        with self._lock:
+            entry = self._entries.get(token)
+            if entry is None:
+                return None
+            if entry.expires_at <= now:
+                del self._entries[token]
+                return None
+            self._entries.move_to_end(token)
+            return entry
+
+    def put(self, token: str, entry: CachedAccessToken, *, generation: int) -> bool:
+        if not self._is_serving():
+            return False
+        with self._lock:
+            if generation != self._generation:
+                return False
+            self._entries[token] = entry
+            self._entries.move_to_end(token)
+            while len(self._entries) > self._max_entries:
+                self._entries.popitem(last=False)
+            return True
+
+    def evict_users(self, user_ids: Iterable[int]) -> None:
+        evicted_user_ids = set(user_ids)
+        with self._lock:
+            self._generation += 1
+            self._entries = OrderedDict(
+                (token, entry)
+                for token, entry in self._entries.items()
+                if entry.user_id not in evicted_user_ids
+            )
+
+    def clear(self) -> None:
+        with self._lock:
+            self._generation += 1
+            self._entries.clear()
+
+    def publish_invalidation(self, user_ids: Iterable[int]) -> None:
+        """Evict the users here and in every other worker."""
+        invalidated_user_ids = sorted(set(user_ids))
+        if not invalidated_user_ids:
+            return
+        self.evict_users(invalidated_user_ids)
+        if self._redis is None:
+            return
+        try:
+            self._redis.publish(
+                API_AUTH.ACCESS_TOKEN_CACHE_INVALIDATION_CHANNEL,
+                json.dumps(invalidated_user_ids),
+            )
+        except RedisError as e:
+            warning_log(
+                f"Could not publish access token cache invalidation for "
+                f"users={invalidated_user_ids} | {e}"
+            )
+
+    def __len__(self) -> int:
+        with self._lock:
+            return len(self._entries)
+
+    def shutdown(self, timeout: float = SHUTDOWN_JOIN_SECONDS) -> None:
+        self._stopped.set()
+        subscriber = self._subscriber
+        if subscriber is not None:
+            subscriber.join(timeout=timeout)
+
+    def _is_serving(self) -> bool:
+        if not self.enabled:
+            return False
+        if self._redis is None:
+            return True
+        self._ensure_subscriber_started()
+        return self._subscribed.is_set()
+
+    def _ensure_subscriber_started(self) -> None:
+        # Started on first use, so in each gunicorn worker after the fork
+        if self._subscriber is not None:
+            return
+        with self._lock:
+            if self._subscriber is not None:
+                return
+            self._subscriber = threading.Thread(
+                target=self._run_subscriber,
+                name="access-token-cache-subscriber",
+                daemon=True,
+            )
+            self._subscriber.start()
+        atexit.register(self.shutdown)
+
+    def _run_subscriber(self) -> None:
+        while not self._stopped.is_set():
+            pubsub = self._redis.pubsub()
+            try:
+                pubsub.subscribe(API_AUTH.ACCESS_TOKEN_CACHE_INVALIDATION_CHANNEL)
+                while not self._stopped.is_set():
+                    message = pubsub.get_message(timeout=1.0)
+                    if message is None:
+                        continue
+                    if message["type"] == "subscribe":
+                        # Anything cached before now may have missed a message
+                        self.clear()
+                        self._subscribed.set()
+                    elif message["type"] == "message":
+                        self.evict_users(json.loads(message["data"]))
+            except (RedisError, ValueError) as e:
+                logging.warning(f"Access token cache subscriber disconnected | {e}")
+            finally:
+                self._subscribed.clear()
+                pubsub.close()
+            self._stopped.wait(self._resubscribe_delay_seconds)
+
+
+def get_access_token_cache() -> AccessTokenCache | None:
+    """The app's cache, or None outside an app context or when disabled."""
+    try:
+        cache: AccessTokenCache | None = current_app.extensions.get(ACCESS_TOKEN_CACHE)
+    except RuntimeError:
+        return None
+    if cache is None or not cache.enabled:
+        return None
+    return cache
+
+
+def invalidate_cached_access_tokens(session: Session, user_ids: Iterable[int]) -> None:
+    """Drop the users' cached tokens now, and in every worker once `session` commits.
+
+    Publishing waits for the commit so another worker cannot re-cache the
+    users' old state from the database in between.
+    """
+    cache = get_access_token_cache()
+    if cache is None:
+        return
+    invalidated_user_ids = set(user_ids)
+    cache.evict_users(invalidated_user_ids)
+    session.info.setdefault(_PENDING_INVALIDATIONS_KEY, set()).update(
+        invalidated_user_ids
+    )
+
+
+@event.listens_for(Session, "after_commit")
+def _publish_pending_invalidations(session: Session) -> None:
+    pending_user_ids: set[int] | None = session.info.pop(
+        _PENDING_INVALIDATIONS_KEY, None
+    )
+    if not pending_user_ids:
+        return
+    cache = get_access_token_cache()
+    if cache is not None:
+        cache.publish_invalidation(pending_user_ids)
+
+
+@event.listens_for(Session, "after_rollback")
+def _discard_pending_invalidations(session: Session) -> None:
+    # The local eviction already happened; the rolled-back change needs no
+    # fan-out
+    session.info.pop(_PENDING_INVALIDATIONS_KEY, None)
+
+
+def init_app(app: Flask) -> None:
+    redis_uri: str | None = app.config.get(CONFIG_ENVS.REDIS_URI)
+    app.extensions[ACCESS_TOKEN_CACHE] = AccessTokenCache(
+        max_entries=app.config.get(
+            CONFIG_ENVS.ACCESS_TOKEN_CACHE_MAX_ENTRIES, DEFAULT_MAX_ENTRIES
+        ),
+        redis_client=(
+            Redis.from_url(redis_uri)
+            if redis_uri and redis_uri != "memory://"
+            else None
+        ),
+    )
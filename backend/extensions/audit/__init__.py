@@ -1 +1 @@
-from backend.extensions.audit.record import record  # noqa: F401
+from backend.extensions.audit.record import record, record_view  # noqa: F401
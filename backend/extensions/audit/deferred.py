@@ -0,0 +1,202 @@
+"""Deferred audit writes for read-only admin page views.
+
+With ``AUDIT_VIEWS_DEFERRED`` set, ``audit.record_view`` does not touch the
+request's session: the entry is stamped with its time and appended to a
+per-worker ``DeferredAuditWriter`` buffer, and a background thread inserts the
+buffered entries every ``flush_interval_seconds`` (or as soon as
+``batch_size`` are waiting) with one multi-row INSERT. Browsing the portal then
+costs no commit per page view.
+
+- Only views use it. Mutating admin actions keep ``audit.record``, whose row
+  commits in the same transaction as the change it describes.
+- If a batch INSERT fails, its entries are retried one by one so a single bad
+  entry (e.g. an actor deleted in the meantime) is dropped, with a warning,
+  without taking the rest of the batch with it.
+- The buffer holds at most ``max_buffered`` entries; past that, views write
+  their entries synchronously as before rather than dropping them.
+- Entries still buffered at interpreter exit are flushed by an ``atexit``
+  hook; a killed worker loses at most one interval of view entries.
+
+Off (the default), ``record_view`` records and commits in the request, as
+every view did before.
+"""
+
+from __future__ import annotations
+
+import atexit
+from collections import deque
+import threading
+from typing import Any, Callable
+
+from flask import Flask, current_app
+from sqlalchemy import null
+
+from backend import db
+from backend.models.audit_log import AuditLog
+from backend.utils.datetime_utils import utc_now
+from backend.utils.strings.config_strs import CONFIG_ENVS
+
+DEFERRED_AUDIT_WRITER = "deferred_audit_writer"
+FLUSH_INTERVAL_SECONDS = 2.0
+BATCH_SIZE = 500
+MAX_BUFFERED = 10_000
+SHUTDOWN_JOIN_SECONDS = 5.0
+
+AuditRow = dict[str, Any]
+
+
+class DeferredAuditWriter:
+    def __init__(
+        self,
+        app: Flask,
+        *,
+        insert_rows: Callable[[list[AuditRow]], None] | None = None,
+        flush_interval_seconds: float = FLUSH_INTERVAL_SECONDS,
+        batch_size: int = BATCH_SIZE,
+        max_buffered: int = MAX_BUFFERED,
+    ) -> None:
+        self._app = app
+        self._insert_rows = insert_rows or _insert_audit_rows
+        self._flush_interval_seconds = flush_interval_seconds
+        self._batch_size = batch_size
+        self._max_buffered = max_buffered
+        self._buffer: deque[AuditRow] = deque()
+        self._buffer_lock = threading.Lock()
+        # Serializes flushes between the flusher thread and atexit
+        self._flush_lock = threading.Lock()
+        self._start_lock = threading.Lock()
+        self._wake = threading.Event()
+        self._stopped = threading.Event()
+        self._flusher: threading.Thread | None = None
+
+    def enqueue(
+        self,
+        *,
+        actor_id: int,
+        action: str,
+        target_type: str | None = None,
+        target_id: str | None = None,
+        metadata: dict | None = None,
+    ) -> bool:
+        """Buffer one entry; False when the buffer is full and nothing was queued."""
+        audit_row = _audit_row(
+            actor_id=actor_id,
+            action=action,
+            target_type=target_type,
+            target_id=target_id,
+            metadata=metadata,
+        )
+        with self._buffer_lock:
+            if len(self._buffer) >= self._max_buffered:
+                return False
+            self._buffer.append(audit_row)
+            buffered_count = len(self._buffer)
+        self._ensure_flusher_started()
+        if buffered_count >= self._batch_size:
+            self._wake.set()
+        return True
+
+    def flush(self) -> int:
+        """Insert every buffered entry now; returns how many were written."""
+        written_count = 0
+        with self._flush_lock, self._app.app_context():
+            while True:
+                with self._buffer_lock:
+                    batch = [
+                        self._buffer.popleft()
+                        for _ in range(min(self._batch_size, len(self._buffer)))
+                    ]
+                if not batch:
+                    return written_count
+                written_count += self._write_batch(batch)
+
+    def shutdown(self, timeout: float = SHUTDOWN_JOIN_SECONDS) -> None:
+        self._stopped.set()
+        self._wake.set()
+        flusher = self._flusher
+        if flusher is not None:
+            flusher.join(timeout=timeout)
+        self.flush()
+
+    def _write_batch(self, batch: list[AuditRow]) -> int:
+        # Called with an app context pushed
+        try:
+            self._insert_rows(batch)
+            return len(batch)
+        except Exception as batch_error:
+            current_app.logger.warning(
+                f"Deferred audit batch of {len(batch)} failed, "
+                f"retrying one by one | {batch_error}"
+            )
+        written_count = 0
+        for audit_row in batch:
+            try:
+                self._insert_rows([audit_row])
+                written_count += 1
+            except Exception as row_error:
+                current_app.logger.warning(
+                    f"Dropped deferred audit entry action={audit_row['action']} "
+                    f"| {row_error}"
+                )
+        return written_count
+
+    def _ensure_flusher_started(self) -> None:
+        # Started on first use, so in each gunicorn worker after the fork
+        if self._flusher is not None:
+            return
+        with self._start_lock:
+            if self._flusher is not None:
+                return
+            self._flusher = threading.Thread(
+                target=self._run_flusher, name="deferred-audit-flusher", daemon=True
+            )
+            self._flusher.start()
+        atexit.register(self.shutdown)
+
+    def _run_flusher(self) -> None:
+        while not self._stopped.is_set():
+            self._wake.wait(self._flush_interval_seconds)
+            self._wake.clear()
+            try:
+                self.flush()
+            except Exception as flush_error:
+                self._app.logger.warning(f"Deferred audit flush failed | {flush_error}")
+
+
+def _audit_row(
+    *,
+    actor_id: int,
+    action: str,
+    target_type: str | None,
+    target_id: str | None,
+    metadata: dict | None,
+) -> AuditRow:
+    """One ``AuditLogs`` row keyed by column, stamped when the view happened."""
+    return {
+        "actorId": actor_id,
+        "action": action,
+        "targetType": target_type,
+        "targetId": target_id,
+        # SQL NULL rather than a JSON null
+        "metadata": metadata if metadata is not None else null(),
+        "createdAt": utc_now(),
+    }
+
+
+def _insert_audit_rows(audit_rows: list[AuditRow]) -> None:
+    """One multi-row INSERT of ``audit_rows``, committed on its own."""
+    try:
+        db.session.execute(AuditLog.__table__.insert().values(audit_rows))
+        db.session.commit()
+    except Exception:
+        db.session.rollback()
+        raise
+
+
+def get_deferred_audit_writer() -> DeferredAuditWriter | None:
+    return current_app.extensions.get(DEFERRED_AUDIT_WRITER)
+
+
+def init_app(app: Flask) -> None:
+    if app.config.get(CONFIG_ENVS.AUDIT_VIEWS_DEFERRED, False):
+        app.extensions[DEFERRED_AUDIT_WRITER] = DeferredAuditWriter(app)
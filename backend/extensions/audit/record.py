@@ -2,6 +2,7 @@ from __future__ import annotations
 
 from backend import db
 from backend.app_logger import warning_log
+from backend.extensions.audit.deferred import get_deferred_audit_writer
 from backend.models.audit_log import AuditLog
 
 
@@ -36,3 +37,38 @@ def record(
             db.session.flush()
     except Exception as audit_error:
         warning_log(f"audit.record failed for action={action}: {audit_error}")
+
+
+def record_view(
+    *,
+    actor_id: int,
+    action: str,
+    target_type: str | None = None,
+    target_id: str | None = None,
+    metadata: dict | None = None,
+) -> None:
+    """Audit a read-only admin page view.
+
+    For views that change nothing: with ``AUDIT_VIEWS_DEFERRED`` the entry is
+    buffered and inserted in a later batch, off the request (see
+    ``backend/extensions/audit/deferred.py``). Otherwise, or when the buffer
+    is full, it is recorded and committed here, so the view needs no commit
+    of its own. Mutations use ``record`` and commit with their change.
+    """
+    deferred_audit_writer = get_deferred_audit_writer()
+    if deferred_audit_writer is not None and deferred_audit_writer.enqueue(
+        actor_id=actor_id,
+        action=action,
+        target_type=target_type,
+        target_id=target_id,
+        metadata=metadata,
+    ):
+        return
+    record(
+        actor_id=actor_id,
+        action=action,
+        target_type=target_type,
+        target_id=target_id,
+        metadata=metadata,
+    )
+    db.session.commit()
@@ -6,7 +6,9 @@ from requests import Response
 from mailjet_rest import Client
 from mailjet_rest.client import ApiError, TimeoutError
 
-from backend.app_logger import error_log, safe_get_request_id
+from backend import db
+from backend.app_logger import error_log, safe_add_log, safe_get_request_id
+from backend.models.email_outbox import Email_Outbox
 from backend.utils.strings.json_strs import STD_JSON_RESPONSE
 from backend.utils.strings.email_validation_strs import EMAILS
 from backend.utils.strings.config_strs import CONFIG_ENVS
@@ -16,15 +18,31 @@ STD_JSON = STD_JSON_RESPONSE
 
 
 class EmailSender:
+    """Builds the transactional emails and hands them to Mailjet.
+
+    With ``EMAIL_OUTBOX_ENABLED`` the ``send_*`` methods instead add one
+    ``Email_Outbox`` row per message to the current session and return a
+    200 response straight away. Nothing is written until the caller commits,
+    so the email is queued in the same transaction as the token row it
+    carries; ``scripts/send_email_outbox.py`` does the actual send.
+
+    Callers that pass ``commit_session=True`` leave the commit to the sender:
+    before a synchronous Mailjet send, so the caller's row locks (e.g. an
+    attempt counter) are not held across it, or after the outbox insert, so
+    the queued email commits with them.
+    """
+
     def __init__(self):
         self._base = EMAILS.BASE_API_URL
         self._testing = False
         self._in_production = False
+        self._use_outbox = False
 
     def init_app(self, app):
         self._testing = app.testing
         app.extensions[EMAILS.EMAIL] = self
         self._sender = app.config[CONFIG_ENVS.BASE_EMAIL]
+        self._use_outbox = app.config.get(CONFIG_ENVS.EMAIL_OUTBOX_ENABLED, False)
 
         api_key = app.config[CONFIG_ENVS.MAILJET_API_KEY]
         api_secret = app.config[CONFIG_ENVS.MAILJET_SECRET_KEY]
@@ -40,7 +58,12 @@ class EmailSender:
         return self._in_production
 
     def send_account_email_confirmation(
-        self, to_email: str, to_name: str, confirmation_url: str
+        self,
+        to_email: str,
+        to_name: str,
+        confirmation_url: str,
+        *,
+        commit_session: bool = False,
     ):
         message = {
             EMAILS.MESSAGES: [
@@ -63,10 +86,15 @@ class EmailSender:
         if self._testing:
             message[EMAILS.SANDBOXMODE] = True
 
-        return self._send_or_fail(message)
+        return self._send_or_fail(message, commit_session=commit_session)
 
     def send_password_reset_email(
-        self, to_email: str, to_name: str, reset_url: str
+        self,
+        to_email: str,
+        to_name: str,
+        reset_url: str,
+        *,
+        commit_session: bool = False,
     ) -> Response:
         message = {
             EMAILS.MESSAGES: [
@@ -89,10 +117,15 @@ class EmailSender:
         if self._testing:
             message[EMAILS.SANDBOXMODE] = True
 
-        return self._send_or_fail(message)
+        return self._send_or_fail(message, commit_session=commit_session)
 
     def send_oauth_provider_hint_email(
-        self, to_email: str, to_name: str, provider_names: list[str]
+        self,
+        to_email: str,
+        to_name: str,
+        provider_names: list[str],
+        *,
+        commit_session: bool = False,
     ) -> Response:
         message = {
             EMAILS.MESSAGES: [
@@ -115,7 +148,7 @@ class EmailSender:
         if self._testing:
             message[EMAILS.SANDBOXMODE] = True
 
-        return self._send_or_fail(message)
+        return self._send_or_fail(message, commit_session=commit_session)
 
     def _to_builder(self, email: str, name: str) -> dict:
         return {EMAILS.EMAIL: email, EMAILS.NAME: name}
@@ -137,7 +170,17 @@ class EmailSender:
             EMAILS.HTMLPART: htmlpart,
         }
 
-    def _send_or_fail(self, message: dict[str, list[dict]]) -> Response:
+    def _send_or_fail(
+        self, message: dict[str, list[dict]], *, commit_session: bool = False
+    ) -> Response:
+        if self._use_outbox:
+            outbox_response = self._add_to_outbox(message)
+            if commit_session:
+                db.session.commit()
+            return outbox_response
+
+        if commit_session:
+            db.session.commit()
         request_id = safe_get_request_id()
         try:
             return self._mailjet_client.send.create(data=message)
@@ -155,14 +198,26 @@ class EmailSender:
             error_log(f"[{request_id}] Error with Mailjet service: {e}")
             return self._mock_response_builder(500)
 
+    def _add_to_outbox(self, message: dict[str, list[dict]]) -> Response:
+        # SandboxMode is dropped: the worker sends each batch as one request
+        for outbox_message in message[EMAILS.MESSAGES]:
+            db.session.add(Email_Outbox(message=outbox_message))
+        safe_add_log("Queued email in outbox")
+        return self._mock_response_builder(
+            200, {EMAILS.MESSAGES: [{EMAILS.MAILJET_STATUS: EMAILS.QUEUED}]}
+        )
+
     @staticmethod
-    def _mock_response_builder(status_code: int = 500) -> Response:
+    def _mock_response_builder(
+        status_code: int = 500, json_include: dict | None = None
+    ) -> Response:
         mock_response = Response()
         mock_response.status_code = status_code
         mock_response.encoding = "utf-8"
-        json_include = {
-            EMAILS.MESSAGES: {EMAILS.MAILJET_ERRORS: EMAILS.ERROR_WITH_MAILJET}
-        }
+        if json_include is None:
+            json_include = {
+                EMAILS.MESSAGES: {EMAILS.MAILJET_ERRORS: EMAILS.ERROR_WITH_MAILJET}
+            }
         mock_response._content = bytes(
             dumps(json_include, allow_nan=False), encoding="utf-8"
         )
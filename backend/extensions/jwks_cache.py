@@ -0,0 +1,303 @@
+"""Cached JWKS signing keys for verifying Google id_tokens.
+
+The native mobile Google Sign-In flow verifies each id_token against Google's
+published signing keys. ``JwksCache`` keeps those keys off the request path:
+
+- Nothing is fetched or started until the first verification, so CLI runs and
+  processes that never see a Google sign-in never touch the network.
+- The key set is shared across workers through a persisted copy in Redis
+  (``REDIS_URI``); a worker adopts a copy another worker already fetched
+  instead of calling Google itself.
+- A background thread refreshes the keys ``refresh_ahead_seconds`` before the
+  ``Cache-Control: max-age`` Google sent with them runs out.
+- If a refresh fails, the expired keys keep being served for up to
+  ``max_stale_seconds`` while the refresher retries; only then, or when no
+  keys were ever loaded, does a sign-in wait on a fetch.
+- A token signed with an unknown ``kid`` (a key rotation this worker has not
+  seen yet) triggers at most one refetch per ``min_refetch_interval_seconds``.
+
+The endpoint is ``GOOGLE_OAUTH_JWKS_URL``, so tests can point it at a local
+stand-in serving their own keys.
+"""
+
+from __future__ import annotations
+
+import atexit
+from dataclasses import dataclass
+import json
+import logging
+import re
+import threading
+import time
+from typing import Any
+
+from flask import Flask, current_app
+import jwt
+from jwt import PyJWK, PyJWKSet
+from jwt.exceptions import PyJWKClientConnectionError, PyJWKClientError, PyJWKError
+from redis import Redis
+from redis.exceptions import RedisError
+import requests
+
+from backend.utils.strings.config_strs import CONFIG_ENVS
+
+GOOGLE_JWKS_CACHE = "google_jwks_cache"
+DEFAULT_GOOGLE_JWKS_URL = "https://www.googleapis.com/oauth2/v3/certs"
+GOOGLE_JWKS_REDIS_KEY = "api:google-jwks"
+
+DEFAULT_MAX_AGE_SECONDS = 3600
+REFRESH_AHEAD_SECONDS = 300
+MAX_STALE_SECONDS = 24 * 3600
+MIN_REFETCH_INTERVAL_SECONDS = 60
+RETRY_SECONDS = 30
+FETCH_TIMEOUT_SECONDS = 5
+SHUTDOWN_JOIN_SECONDS = 5.0
+
+_MAX_AGE_PATTERN = re.compile(r"max-age=(\d+)")
+
+
+@dataclass(frozen=True)
+class _KeySet:
+    jwks: dict[str, Any]
+    keys_by_id: dict[str, PyJWK]
+    fetched_at: float
+    expires_at: float
+
+    @classmethod
+    def from_jwks(
+        cls, jwks: dict[str, Any], *, fetched_at: float, expires_at: float
+    ) -> _KeySet:
+        try:
+            key_set = PyJWKSet.from_dict(jwks)
+        except PyJWKError as e:
+            raise PyJWKClientError(f"Unusable JWKS | {e}") from e
+        return cls(
+            jwks=jwks,
+            keys_by_id={
+                key.key_id: key
+                for key in key_set.keys
+                if key.key_id and key.public_key_use in ("sig", None)
+            },
+            fetched_at=fetched_at,
+            expires_at=expires_at,
+        )
+
+
+class JwksCache:
+    def __init__(
+        self,
+        *,
+        jwks_url: str,
+        redis_client: Redis | None = None,
+        redis_key: str = GOOGLE_JWKS_REDIS_KEY,
+        fetch_timeout_seconds: float = FETCH_TIMEOUT_SECONDS,
+        default_max_age_seconds: int = DEFAULT_MAX_AGE_SECONDS,
+        refresh_ahead_seconds: float = REFRESH_AHEAD_SECONDS,
+        max_stale_seconds: int = MAX_STALE_SECONDS,
+        min_refetch_interval_seconds: float = MIN_REFETCH_INTERVAL_SECONDS,
+        retry_seconds: float = RETRY_SECONDS,
+    ) -> None:
+        self._jwks_url = jwks_url
+        self._redis = redis_client
+        self._redis_key = redis_key
+        self._fetch_timeout_seconds = fetch_timeout_seconds
+        self._default_max_age_seconds = default_max_age_seconds
+        self._refresh_ahead_seconds = refresh_ahead_seconds
+        self._max_stale_seconds = max_stale_seconds
+        self._min_refetch_interval_seconds = min_refetch_interval_seconds
+        self._retry_seconds = retry_seconds
+        self._key_set: _KeySet | None = None
+        self._last_fetch_attempt_at: float | None = None
+        # Serializes loads and fetches; lookups read self._key_set without it
+        self._refresh_lock = threading.Lock()
+        self._session: requests.Session | None = None
+        self._refresher: threading.Thread | None = None
+        self._stopped = threading.Event()
+
+    def get_signing_key_from_jwt(self, token: str) -> PyJWK:
+        """The key for the token's ``kid``; raises PyJWKClientError if none."""
+        kid = jwt.get_unverified_header(token).get("kid")
+        if not isinstance(kid, str):
+            raise PyJWKClientError("Token has no kid header")
+        return self.get_signing_key(kid)
+
+    def get_signing_key(self, kid: str) -> PyJWK:
+        key_set = self._usable_key_set()
+        self._ensure_refresher_started()
+        signing_key = key_set.keys_by_id.get(kid)
+        if signing_key is None and self._may_refetch():
+            signing_key = self._refresh(wanted_kid=kid).keys_by_id.get(kid)
+        if signing_key is None:
+            raise PyJWKClientError(f"No signing key with kid={kid!r}")
+        return signing_key
+
+    def shutdown(self, timeout: float = SHUTDOWN_JOIN_SECONDS) -> None:
+        self._stopped.set()
+        refresher = self._refresher
+        if refresher is not None:
+            refresher.join(timeout=timeout)
+
+    def _usable_key_set(self) -> _KeySet:
+        key_set = self._key_set
+        if key_set is not None and not self._is_too_stale(key_set):
+            return key_set
+        with self._refresh_lock:
+            key_set = self._key_set
+            if key_set is not None and not self._is_too_stale(key_set):
+                return key_set
+            shared_key_set = self._load_shared()
+            if shared_key_set is not None and not self._is_too_stale(shared_key_set):
+                self._key_set = shared_key_set
+                return shared_key_set
+            return self._fetch_and_share()
+
+    def _refresh(self, *, wanted_kid: str | None = None) -> _KeySet:
+        with self._refresh_lock:
+            now = time.time()
+            current_key_set = self._key_set
+            shared_key_set = self._load_shared()
+            if shared_key_set is not None and (
+                current_key_set is None
+                or shared_key_set.fetched_at > current_key_set.fetched_at
+            ):
+                # Another worker already refreshed; use its copy if it is not
+                # itself due for a refresh and has the key being looked for
+                if (
+                    wanted_kid in shared_key_set.keys_by_id
+                    if wanted_kid is not None
+                    else shared_key_set.expires_at - self._refresh_ahead_seconds > now
+                ):
+                    self._key_set = shared_key_set
+                    return shared_key_set
+            return self._fetch_and_share()
+
+    def _fetch_and_share(self) -> _KeySet:
+        # Called with self._refresh_lock held
+        self._last_fetch_attempt_at = time.time()
+        key_set = self._fetch()
+        self._key_set = key_set
+        self._store_shared(key_set)
+        return key_set
+
+    def _fetch(self) -> _KeySet:
+        if self._session is None:
+            self._session = requests.Session()
+        try:
+            response = self._session.get(
+                self._jwks_url, timeout=self._fetch_timeout_seconds
+            )
+            response.raise_for_status()
+            jwks = response.json()
+        except (requests.exceptions.RequestException, ValueError) as e:
+            raise PyJWKClientConnectionError(
+                f"Could not fetch JWKS from {self._jwks_url} | {e}"
+            ) from e
+        max_age_match = _MAX_AGE_PATTERN.search(
+            response.headers.get("Cache-Control", "")
+        )
+        max_age_seconds = (
+            int(max_age_match.group(1))
+            if max_age_match is not None
+            else self._default_max_age_seconds
+        )
+        fetched_at = time.time()
+        return _KeySet.from_jwks(
+            jwks, fetched_at=fetched_at, expires_at=fetched_at + max_age_seconds
+        )
+
+    def _load_shared(self) -> _KeySet | None:
+        if self._redis is None:
+            return None
+        try:
+            raw_value = self._redis.get(self._redis_key)
+            if raw_value is None:
+                return None
+            stored = json.loads(raw_value)
+            return _KeySet.from_jwks(
+                stored["jwks"],
+                fetched_at=float(stored["fetched_at"]),
+                expires_at=float(stored["expires_at"]),
+            )
+        except (RedisError, ValueError, KeyError, TypeError, PyJWKClientError) as e:
+            logging.warning(f"Ignoring shared JWKS copy | {e}")
+            return None
+
+    def _store_shared(self, key_set: _KeySet) -> None:
+        if self._redis is None:
+            return
+        try:
+            self._redis.set(
+                self._redis_key,
+                json.dumps(
+                    {
+                        "jwks": key_set.jwks,
+                        "fetched_at": key_set.fetched_at,
+                        "expires_at": key_set.expires_at,
+                    }
+                ),
+                ex=max(
+                    int(key_set.expires_at - time.time()) + self._max_stale_seconds, 1
+                ),
+            )
+        except RedisError as e:
+            logging.warning(f"Could not share fetched JWKS | {e}")
+
+    def _is_too_stale(self, key_set: _KeySet) -> bool:
+        return key_set.expires_at + self._max_stale_seconds <= time.time()
+
+    def _may_refetch(self) -> bool:
+        last_attempt_at = self._last_fetch_attempt_at
+        return (
+            last_attempt_at is None
+            or time.time() - last_attempt_at >= self._min_refetch_interval_seconds
+        )
+
+    def _seconds_until_refresh(self) -> float:
+        key_set = self._key_set
+        if key_set is None:
+            return self._retry_seconds
+        return max(
+            key_set.expires_at - self._refresh_ahead_seconds - time.time(),
+            self._min_refetch_interval_seconds,
+        )
+
+    def _ensure_refresher_started(self) -> None:
+        # Started on first use, so in each gunicorn worker after the fork
+        if self._refresher is not None:
+            return
+        with self._refresh_lock:
+            if self._refresher is not None:
+                return
+            self._refresher = threading.Thread(
+                target=self._run_refresher, name="jwks-refresher", daemon=True
+            )
+            self._refresher.start()
+        atexit.register(self.shutdown)
+
+    def _run_refresher(self) -> None:
+        delay = self._seconds_until_refresh()
+        while not self._stopped.wait(delay):
+            try:
+                self._refresh()
+                delay = self._seconds_until_refresh()
+            except PyJWKClientError as e:
+                logging.warning(f"Serving cached JWKS after refresh failure | {e}")
+                delay = self._retry_seconds
+
+
+def get_google_jwks_cache() -> JwksCache:
+    return current_app.extensions[GOOGLE_JWKS_CACHE]
+
+
+def init_app(app: Flask) -> None:
+    redis_uri: str | None = app.config.get(CONFIG_ENVS.REDIS_URI)
+    app.extensions[GOOGLE_JWKS_CACHE] = JwksCache(
+        jwks_url=app.config.get(
+            CONFIG_ENVS.GOOGLE_OAUTH_JWKS_URL, DEFAULT_GOOGLE_JWKS_URL
+        ),
+        redis_client=(
+            Redis.from_url(redis_uri)
+            if redis_uri and redis_uri != "memory://"
+            else None
+        ),
+    )
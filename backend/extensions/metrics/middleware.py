@@ -5,7 +5,11 @@ from werkzeug.wrappers import Response
 
 from backend.extensions.metrics.ua_classifier import classify_user_agent
 from backend.extensions.metrics.writer import record_duration, record_event
-from backend.extensions.request_timing import request_elapsed_ms
+from backend.extensions.request_timing import (
+    request_elapsed_ms,
+    request_phase_durations,
+)
+from backend.extensions.sql_tracing import current_sql_trace
 from backend.metrics.events import DEVICE_TYPE_DIM_KEY, EventName
 from backend.metrics.latency import LatencyMetricName
 from backend.utils.all_routes import SYSTEM_ROUTES
@@ -13,6 +17,12 @@ from backend.utils.strings.config_strs import CONFIG_ENVS
 
 _SKIP_ENDPOINTS: frozenset[str] = frozenset({"static", SYSTEM_ROUTES.HEALTH})
 _METRICS_BLUEPRINT_NAME: str = "metrics"
+# Phases recorded at teardown, once every after_request hook has run
+_PHASE_METRICS: tuple[LatencyMetricName, ...] = (
+    LatencyMetricName.AUTH_DURATION,
+    LatencyMetricName.SERIALIZE_DURATION,
+    LatencyMetricName.HOOKS_DURATION,
+)
 
 
 def should_skip(endpoint: str | None, blueprint: str | None) -> bool:
@@ -40,6 +50,10 @@ def init_metrics_middleware(app: Flask) -> None:
     (e.g. in tests) takes effect without re-initialization. Delegates to
     `record_event` which is already wrapped in log-and-drop, so no extra
     try/except is required here.
+
+    The request's phase breakdown (auth / serialize / hooks) is recorded from
+    a `teardown_request` handler instead, so the hooks phase covers every
+    `after_request` hook — including this one's Redis writes.
     """
 
     @app.after_request
@@ -65,4 +79,33 @@ def init_metrics_middleware(app: Flask) -> None:
                 method=request.method,
                 dimensions={DEVICE_TYPE_DIM_KEY: device_type},
             )
+        sql_trace = current_sql_trace()
+        if sql_trace is not None and sql_trace.statement_count:
+            record_duration(
+                metric=LatencyMetricName.DB_QUERY_DURATION,
+                duration_ms=sql_trace.db_time_ms,
+                endpoint=request.endpoint,
+                method=request.method,
+                dimensions={DEVICE_TYPE_DIM_KEY: device_type},
+            )
         return response
+
+    @app.teardown_request
+    def _record_request_phases(exception: BaseException | None) -> None:
+        if not app.config.get(CONFIG_ENVS.METRICS_ENABLED, False):
+            return
+        if should_skip(request.endpoint, request.blueprint):
+            return
+        phase_durations = request_phase_durations()
+        if not phase_durations:
+            return
+        device_type = classify_user_agent(request.headers.get("User-Agent"))
+        for metric in _PHASE_METRICS:
+            if metric in phase_durations:
+                record_duration(
+                    metric=metric,
+                    duration_ms=phase_durations[metric],
+                    endpoint=request.endpoint,
+                    method=request.method,
+                    dimensions={DEVICE_TYPE_DIM_KEY: device_type},
+                )
@@ -1,13 +1,24 @@
+from __future__ import annotations
+
+import atexit
+from dataclasses import dataclass
 from enum import IntEnum
-import requests
-import threading
 import logging
+import queue
+import threading
+import time
+from typing import Callable
 
+import requests
 from flask import Flask
 
 from backend.app_logger import error_log, safe_add_log, safe_get_request_id, warning_log
 from backend.utils.strings.config_strs import CONFIG_ENVS
 
+# Cap on remembered dedupe keys; older entries are pruned once it is exceeded.
+DEDUPE_MAX_KEYS = 1024
+SHUTDOWN_JOIN_SECONDS = 5.0
+
 
 class NotificationType(IntEnum):
     THREADED_NOTIFICATIONS = 0
@@ -15,7 +26,12 @@ class NotificationType(IntEnum):
 
 
 def _send_msg(
-    url: str, msg: str, timeout: int, request_id: str, notif_type: NotificationType
+    url: str,
+    msg: str,
+    timeout: int,
+    request_id: str,
+    notif_type: NotificationType,
+    session: requests.Session,
 ) -> requests.Response | None:
     payload = {"content": msg}
     headers = {"Content-Type": "application/json"}
@@ -31,9 +47,7 @@ def _send_msg(
         prefix = ""
 
     try:
-        response = requests.post(
-            url=url, json=payload, headers=headers, timeout=timeout
-        )
+        response = session.post(url=url, json=payload, headers=headers, timeout=timeout)
         info_log(f"{prefix}Successfully sent notification: {response.status_code=}")
         return response
     except requests.exceptions.RequestException as e:
@@ -58,6 +72,229 @@ def _send_msg(
         return
 
 
+@dataclass
+class _NotificationJob:
+    url: str
+    msg: str
+    request_id: str
+    notif_type: NotificationType
+    on_response: Callable[[requests.Response | None], None] | None = None
+    dedupe_key: tuple[str, str] | None = None
+    duplicates: int = 0
+
+
+@dataclass(frozen=True)
+class NotificationDispatchStats:
+    queue_depth: int
+    sent: int
+    failed: int
+    coalesced: int
+    suppressed: int
+    dropped: int
+
+
+class NotificationDispatcher:
+    """Delivers webhook notifications from a bounded queue.
+
+    A small pool of daemon workers, each holding its own keep-alive
+    ``requests.Session``, drains the queue. Workers start on the first submit
+    rather than in ``init_app``, so they are created in each gunicorn worker
+    after the fork. With ``workers=0`` jobs are delivered on the calling thread.
+
+    Jobs submitted with ``dedupe=True`` are coalesced with an identical job
+    still waiting in the queue, and suppressed if an identical job was sent
+    within the last ``dedupe_seconds``. When the queue is full, new jobs are
+    dropped and counted.
+    """
+
+    def __init__(
+        self,
+        app: Flask | None = None,
+        *,
+        workers: int = 2,
+        max_queue_size: int = 100,
+        dedupe_seconds: float = 60,
+        timeout: int = 20,
+    ) -> None:
+        self._app = app
+        self._workers = max(workers, 0)
+        self._dedupe_seconds = dedupe_seconds
+        self._timeout = timeout
+        self._queue: queue.Queue[_NotificationJob | None] = queue.Queue(
+            maxsize=max_queue_size
+        )
+        self._lock = threading.Lock()
+        self._threads: list[threading.Thread] = []
+        self._sessions = threading.local()
+        self._pending: dict[tuple[str, str], _NotificationJob] = {}
+        self._last_sent_at: dict[tuple[str, str], float] = {}
+        self._sent = 0
+        self._failed = 0
+        self._coalesced = 0
+        self._suppressed = 0
+        self._dropped = 0
+
+    def submit(
+        self,
+        url: str,
+        msg: str,
+        request_id: str,
+        notif_type: NotificationType,
+        on_response: Callable[[requests.Response | None], None] | None = None,
+        dedupe: bool = False,
+    ) -> bool:
+        """Queue a notification. Returns False only if it was dropped."""
+        job = _NotificationJob(
+            url=url,
+            msg=msg,
+            request_id=request_id,
+            notif_type=notif_type,
+            on_response=on_response,
+            dedupe_key=(url, msg) if dedupe else None,
+        )
+
+        with self._lock:
+            if job.dedupe_key is not None:
+                pending_job = self._pending.get(job.dedupe_key)
+                if pending_job is not None:
+                    pending_job.duplicates += 1
+                    self._coalesced += 1
+                    return True
+                last_sent_at = self._last_sent_at.get(job.dedupe_key)
+                if (
+                    last_sent_at is not None
+                    and time.monotonic() - last_sent_at < self._dedupe_seconds
+                ):
+                    self._suppressed += 1
+                    return True
+
+            if self._workers == 0:
+                self._mark_taken(job)
+            else:
+                self._ensure_workers_started()
+                try:
+                    self._queue.put_nowait(job)
+                except queue.Full:
+                    self._dropped += 1
+                    logging.warning(
+                        f"[{request_id}] Dropped notification, queue is full: "
+                        + f"depth={self._queue.qsize()}"
+                    )
+                    return False
+                if job.dedupe_key is not None:
+                    self._pending[job.dedupe_key] = job
+                return True
+
+        self._deliver(job)
+        return True
+
+    def stats(self) -> NotificationDispatchStats:
+        with self._lock:
+            return NotificationDispatchStats(
+                queue_depth=self._queue.qsize(),
+                sent=self._sent,
+                failed=self._failed,
+                coalesced=self._coalesced,
+                suppressed=self._suppressed,
+                dropped=self._dropped,
+            )
+
+    def shutdown(self, timeout: float = SHUTDOWN_JOIN_SECONDS) -> None:
+        """Stop the workers once the jobs already queued have been sent."""
+        with self._lock:
+            threads, self._threads = self._threads, []
+        for _ in threads:
+            try:
+                self._queue.put(None, timeout=timeout)
+            except queue.Full:
+                break
+        deadline = time.monotonic() + timeout
+        for thread in threads:
+            thread.join(timeout=max(deadline - time.monotonic(), 0))
+
+    def _ensure_workers_started(self) -> None:
+        # Called with self._lock held
+        if self._threads:
+            return
+        for index in range(self._workers):
+            thread = threading.Thread(
+                target=self._run_worker,
+                name=f"notification-worker-{index}",
+                daemon=True,
+            )
+            thread.start()
+            self._threads.append(thread)
+        atexit.register(self.shutdown)
+
+    def _mark_taken(self, job: _NotificationJob) -> None:
+        # Called with self._lock held, once a job leaves the queue
+        if job.dedupe_key is None:
+            return
+        self._pending.pop(job.dedupe_key, None)
+        now = time.monotonic()
+        self._last_sent_at[job.dedupe_key] = now
+        if len(self._last_sent_at) > DEDUPE_MAX_KEYS:
+            self._last_sent_at = {
+                key: sent_at
+                for key, sent_at in self._last_sent_at.items()
+                if now - sent_at < self._dedupe_seconds
+            }
+
+    def _session(self) -> requests.Session:
+        session: requests.Session | None = getattr(self._sessions, "session", None)
+        if session is None:
+            session = requests.Session()
+            self._sessions.session = session
+        return session
+
+    def _run_worker(self) -> None:
+        while True:
+            job = self._queue.get()
+            if job is None:
+                return
+            with self._lock:
+                self._mark_taken(job)
+            try:
+                if self._app is not None:
+                    with self._app.app_context():
+                        self._deliver(
+                            job, notif_type=NotificationType.THREADED_NOTIFICATIONS
+                        )
+                else:
+                    self._deliver(
+                        job, notif_type=NotificationType.THREADED_NOTIFICATIONS
+                    )
+            except Exception as e:
+                logging.error(
+                    f"[{job.request_id}] Unexpected error delivering notification | {e}"
+                )
+
+    def _deliver(
+        self, job: _NotificationJob, notif_type: NotificationType | None = None
+    ) -> None:
+        msg = job.msg
+        if job.duplicates:
+            msg += f"\n*(+{job.duplicates} identical notification(s) coalesced)*"
+
+        response = _send_msg(
+            job.url,
+            msg,
+            self._timeout,
+            job.request_id,
+            notif_type if notif_type is not None else job.notif_type,
+            self._session(),
+        )
+
+        with self._lock:
+            if response is not None and response.status_code < 400:
+                self._sent += 1
+            else:
+                self._failed += 1
+
+        if job.on_response is not None:
+            job.on_response(response)
+
+
 class NotificationSender:
     def __init__(self):
         self._testing = False
@@ -66,6 +303,7 @@ class NotificationSender:
         self._notification_url = ""
         self._contact_form_url = ""
         self.timeout = 20
+        self._dispatcher = NotificationDispatcher(timeout=self.timeout)
 
     def init_app(self, app: Flask) -> None:
         app.extensions[CONFIG_ENVS.NOTIFICATION_MODULE] = self
@@ -80,6 +318,13 @@ class NotificationSender:
             is_production and not is_testing and not self._in_development
         )
         self._is_ui_testing = is_ui_testing
+        self._dispatcher = NotificationDispatcher(
+            app,
+            workers=app.config.get(CONFIG_ENVS.NOTIFICATION_WORKERS, 2),
+            max_queue_size=app.config.get(CONFIG_ENVS.NOTIFICATION_QUEUE_MAX_SIZE, 100),
+            dedupe_seconds=app.config.get(CONFIG_ENVS.NOTIFICATION_DEDUPE_SECONDS, 60),
+            timeout=self.timeout,
+        )
 
     def _modify_msg_if_not_in_production(self, msg: str) -> str:
         if self._in_development or not self._in_production:
@@ -91,33 +336,46 @@ class NotificationSender:
 
         return msg
 
+    def dispatch_stats(self) -> NotificationDispatchStats:
+        return self._dispatcher.stats()
+
     def send_notification(
         self,
         msg: str = "",
     ) -> None:
-        """Fire-and-forget POST request to send notification to Discord bot."""
+        """Fire-and-forget POST request to send notification to Discord bot.
+
+        Identical messages are coalesced while queued and suppressed for a
+        short window after being sent.
+        """
         if self._is_ui_testing:
             return
 
-        url = self._notification_url
-        request_id = safe_get_request_id()
-        final_msg = self._modify_msg_if_not_in_production(msg)
-
-        args = [
-            url,
-            final_msg,
-            self.timeout,
-            request_id,
+        self._dispatcher.submit(
+            self._notification_url,
+            self._modify_msg_if_not_in_production(msg),
+            safe_get_request_id(),
             NotificationType.THREADED_NOTIFICATIONS,
-        ]
-
-        thread = threading.Thread(target=_send_msg, args=args, daemon=True)
-        thread.start()
+            dedupe=True,
+        )
 
     def send_contact_form_details(
-        self, subject: str, content: str, contact_id: int, username: str | None
+        self,
+        subject: str,
+        content: str,
+        contact_id: int,
+        username: str | None,
+        on_delivered: Callable[[], None] | None = None,
     ) -> bool:
+        """Queue the contact form webhook without waiting on it.
+
+        Returns whether the message was accepted for delivery. `on_delivered`
+        is called once the webhook acknowledges it, from a notification worker
+        (inside an app context) unless notifications are delivered inline.
+        """
         if self._is_ui_testing:
+            if on_delivered is not None:
+                on_delivered()
             return True
 
         url = self._contact_form_url
@@ -138,27 +396,36 @@ class NotificationSender:
 
         final_msg = self._modify_msg_if_not_in_production(msg)
 
-        response = _send_msg(
+        def _on_response(response: requests.Response | None) -> None:
+            if _is_contact_form_delivered(response, contact_id):
+                safe_add_log("Sent contact form notification.")
+                if on_delivered is not None:
+                    on_delivered()
+
+        return self._dispatcher.submit(
             url,
             final_msg,
-            self.timeout,
             request_id,
-            notif_type=NotificationType.CONTACT_FORM,
+            NotificationType.CONTACT_FORM,
+            on_response=_on_response,
         )
 
-        if not response or response.status_code != 204 or response.text:
-            log_msg = "Could not send contact form notification."
 
-            if not response or not isinstance(response, requests.Response):
-                log_msg += f" | {type(response)=}"
-                error_log(log_msg)
-                return False
+def _is_contact_form_delivered(
+    response: requests.Response | None, contact_id: int
+) -> bool:
+    if response and response.status_code == 204 and not response.text:
+        return True
 
-            log_msg += f" | {response.status_code=}"
-            log_msg += f" | {response.text=}"
+    log_msg = f"Could not send contact form notification for {contact_id=}."
 
-            error_log(log_msg)
-            return False
+    if not response or not isinstance(response, requests.Response):
+        log_msg += f" | {type(response)=}"
+        error_log(log_msg)
+        return False
 
-        safe_add_log("Sent contact form notification.")
-        return True
+    log_msg += f" | {response.status_code=}"
+    log_msg += f" | {response.text=}"
+
+    error_log(log_msg)
+    return False
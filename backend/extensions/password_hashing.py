@@ -0,0 +1,177 @@
+"""Password hashing off the request thread, with bounded concurrency.
+
+Werkzeug's KDFs (scrypt by default, or PBKDF2) are deliberately CPU-bound, and a
+burst of logins would otherwise pin every gunicorn thread on them. Every hash
+and verify goes through one ``PasswordHasher`` per app, which:
+
+- caps in-flight KDF calls with a semaphore; a caller that cannot get a slot
+  within ``PASSWORD_HASH_QUEUE_TIMEOUT_SECONDS`` gets a
+  ``PasswordHashingBusyError``, answered app-wide with a 503,
+- runs the KDF in a process pool of ``PASSWORD_HASH_WORKERS`` processes, or on
+  the calling thread when that is 0 (the default, and what tests use),
+- hashes with ``PASSWORD_HASH_METHOD`` and reports stored hashes made with any
+  other method or cost, so logins can transparently rehash them,
+- records each call's duration as the ``password_hash_duration`` latency metric.
+
+The login flows' dummy verify for password-less accounts uses a hash made with
+the same configured method, so it costs the same as a real one.
+"""
+
+from __future__ import annotations
+
+from concurrent.futures import ProcessPoolExecutor
+from functools import lru_cache
+import multiprocessing
+import threading
+import time
+from typing import Callable, TypeVar
+
+from flask import Flask, current_app, has_request_context, request
+from werkzeug.security import check_password_hash, generate_password_hash
+
+from backend.app_logger import warning_log
+from backend.extensions.metrics.ua_classifier import classify_user_agent
+from backend.extensions.metrics.writer import record_duration
+from backend.metrics.events import DEVICE_TYPE_DIM_KEY
+from backend.metrics.latency import LatencyMetricName
+from backend.schemas.errors import build_message_error_response
+from backend.utils.strings.config_strs import CONFIG_ENVS
+from backend.utils.strings.json_strs import STD_JSON_RESPONSE
+
+PASSWORD_HASHER = "password_hasher"
+DEFAULT_HASH_METHOD = "scrypt"
+_DUMMY_PASSWORD = "__dummy__"
+
+_T = TypeVar("_T")
+
+
+class PasswordHashingBusyError(Exception):
+    """No hashing slot freed up within the queue-wait timeout."""
+
+
+def _hash_method_of(password_hash: str) -> str:
+    return password_hash.split("$", 1)[0]
+
+
+@lru_cache(maxsize=None)
+def _dummy_hash_for(method: str) -> str:
+    # One per method per process, not one per app
+    return generate_password_hash(_DUMMY_PASSWORD, method)
+
+
+class PasswordHasher:
+    def __init__(
+        self,
+        *,
+        method: str = DEFAULT_HASH_METHOD,
+        workers: int = 0,
+        max_concurrency: int = 4,
+        queue_timeout_seconds: float = 5,
+    ) -> None:
+        self._method = method
+        self._workers = max(workers, 0)
+        self._queue_timeout_seconds = queue_timeout_seconds
+        self._slots = threading.BoundedSemaphore(max(max_concurrency, 1))
+        self._pool: ProcessPoolExecutor | None = None
+        self._pool_lock = threading.Lock()
+        # Hashing once up front resolves the method's default parameters (e.g.
+        # "scrypt" -> "scrypt:32768:8:1"), which is what stored hashes carry
+        self._dummy_hash = _dummy_hash_for(method)
+        self._full_method = _hash_method_of(self._dummy_hash)
+
+    def hash_password(self, plaintext_password: str) -> str:
+        return self._run(generate_password_hash, plaintext_password, self._method)
+
+    def verify_password(self, password_hash: str, plaintext_password: str) -> bool:
+        return self._run(check_password_hash, password_hash, plaintext_password)
+
+    def verify_dummy_password(self, plaintext_password: str) -> None:
+        """Spend the time of a real verify; the result is discarded."""
+        self.verify_password(self._dummy_hash, plaintext_password)
+
+    def needs_rehash(self, password_hash: str) -> bool:
+        return _hash_method_of(password_hash) != self._full_method
+
+    def shutdown(self) -> None:
+        with self._pool_lock:
+            pool, self._pool = self._pool, None
+        if pool is not None:
+            pool.shutdown(wait=False, cancel_futures=True)
+
+    def _get_pool(self) -> ProcessPoolExecutor:
+        with self._pool_lock:
+            if self._pool is None:
+                # Created on first use, so in each gunicorn worker after the
+                # fork; spawn avoids forking a process that already has threads
+                self._pool = ProcessPoolExecutor(
+                    max_workers=self._workers,
+                    mp_context=multiprocessing.get_context("spawn"),
+                )
+            return self._pool
+
+    def _run(self, kdf: Callable[..., _T], *args: str) -> _T:
+        start_time = time.perf_counter()
+        if not self._slots.acquire(timeout=self._queue_timeout_seconds):
+            raise PasswordHashingBusyError(
+                f"No password hashing slot after {self._queue_timeout_seconds}s"
+            )
+        try:
+            if self._workers == 0:
+                result = kdf(*args)
+            else:
+                result = self._get_pool().submit(kdf, *args).result()
+        finally:
+            self._slots.release()
+        _record_hash_duration((time.perf_counter() - start_time) * 1000)
+        return result
+
+
+def _record_hash_duration(duration_ms: float) -> None:
+    if not has_request_context():
+        return
+    record_duration(
+        metric=LatencyMetricName.PASSWORD_HASH_DURATION,
+        duration_ms=duration_ms,
+        endpoint=request.endpoint,
+        method=request.method,
+        dimensions={
+            DEVICE_TYPE_DIM_KEY: classify_user_agent(request.headers.get("User-Agent"))
+        },
+    )
+
+
+_default_hasher: PasswordHasher | None = None
+
+
+def get_password_hasher() -> PasswordHasher:
+    """The app's hasher, or an inline default outside an app context."""
+    global _default_hasher
+    try:
+        hasher: PasswordHasher | None = current_app.extensions.get(PASSWORD_HASHER)
+    except RuntimeError:
+        hasher = None
+    if hasher is None:
+        if _default_hasher is None:
+            _default_hasher = PasswordHasher()
+        hasher = _default_hasher
+    return hasher
+
+
+def handle_503_password_hashing_busy(busy_error: PasswordHashingBusyError):
+    warning_log(str(busy_error))
+    response, status_code = build_message_error_response(
+        message=STD_JSON_RESPONSE.SERVICE_BUSY, status_code=503
+    )
+    response.headers["Retry-After"] = "1"
+    return response, status_code
+
+
+def init_app(app: Flask) -> None:
+    app.extensions[PASSWORD_HASHER] = PasswordHasher(
+        method=app.config.get(CONFIG_ENVS.PASSWORD_HASH_METHOD, DEFAULT_HASH_METHOD),
+        workers=app.config.get(CONFIG_ENVS.PASSWORD_HASH_WORKERS, 0),
+        max_concurrency=app.config.get(CONFIG_ENVS.PASSWORD_HASH_MAX_CONCURRENCY, 4),
+        queue_timeout_seconds=app.config.get(
+            CONFIG_ENVS.PASSWORD_HASH_QUEUE_TIMEOUT_SECONDS, 5
+        ),
+    )
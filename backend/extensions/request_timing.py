@@ -10,13 +10,69 @@ rather than incidental hook-registration order.
 Both consumers — ``app_logger``'s ``after_request`` (which logs ``duration_ms``)
 and the metrics ``after_request`` hook (which records latency samples) — call
 ``request_elapsed_ms()`` so the duration math lives in exactly one place.
+
+The same clock also splits the request into *phases*, each named by its
+``LatencyMetricName``:
+
+- ``AUTH_DURATION`` — the auth decorators' checks and loading the current user,
+- ``SERIALIZE_DURATION`` — encoding JSON responses (``to_response``),
+- ``HOOKS_DURATION`` — the ``before_request`` hooks, plus every
+  ``after_request`` hook and the teardown up to where the metrics middleware
+  records the phases (logging, metrics writes, CSP headers, compression).
+
+Phases are exclusive: a phase entered inside another pauses the outer one, and
+time spent in SQL (see ``sql_tracing``) is left out of every phase because it
+is recorded separately as ``DB_QUERY_DURATION``. Time in no phase is the
+view's own work.
 """
 
 from __future__ import annotations
 
+from collections import defaultdict
+from contextlib import contextmanager
+from dataclasses import dataclass, field
 import time
+from typing import Iterator
+
+from flask import Flask, g, has_request_context
+from werkzeug.wrappers import Response
+
+from backend.extensions.sql_tracing import current_sql_trace
+from backend.metrics.latency import LatencyMetricName
+
+
+@dataclass
+class _PhaseClock:
+    """Charges elapsed non-SQL time to whichever phase is innermost."""
+
+    marked_at: float
+    sql_ms_at_mark: float = 0.0
+    active: list[LatencyMetricName] = field(default_factory=list)
+    totals_ms: defaultdict[LatencyMetricName, float] = field(
+        default_factory=lambda: defaultdict(float)
+    )
 
-from flask import Flask, g
+    def charge(self) -> None:
+        now = time.perf_counter()
+        sql_ms = _sql_ms_so_far()
+        if self.active:
+            elapsed_ms = (now - self.marked_at) * 1000.0
+            self.totals_ms[self.active[-1]] += max(
+                elapsed_ms - (sql_ms - self.sql_ms_at_mark), 0.0
+            )
+        self.marked_at = now
+        self.sql_ms_at_mark = sql_ms
+
+
+def _sql_ms_so_far() -> float:
+    sql_trace = current_sql_trace()
+    return 0.0 if sql_trace is None else sql_trace.db_time_ms
+
+
+def _phase_clock() -> _PhaseClock | None:
+    if not has_request_context():
+        return None
+    return g.get("request_phase_clock")
 
 
 def init_app(app: Flask) -> None:
@@ -30,6 +86,28 @@ def init_app(app: Flask) -> None:
     def _stash_request_start() -> None:
         # perf_counter() — monotonic; used only for the duration delta, never as a wall-clock timestamp
         g.request_start_time = time.perf_counter()
+        g.request_phase_clock = _PhaseClock(
+            marked_at=g.request_start_time,
+            active=[LatencyMetricName.HOOKS_DURATION],
+        )
+
+
+def init_hook_timing(app: Flask) -> None:
+    """Register the hooks that close and reopen the ``HOOKS_DURATION`` phase.
+
+    Must be registered LAST in ``create_app``: its ``before_request`` then runs
+    after every other one (ending the phase ``init_app`` opened), and its
+    ``after_request`` runs before every other one (Flask runs them in reverse).
+    """
+
+    @app.before_request
+    def _end_before_request_hooks() -> None:
+        end_request_phase()
+
+    @app.after_request
+    def _start_after_request_hooks(response: Response) -> Response:
+        start_request_phase(LatencyMetricName.HOOKS_DURATION)
+        return response
 
 
 def request_elapsed_ms() -> float | None:
@@ -40,3 +118,43 @@ def request_elapsed_ms() -> float | None:
     """
     start = getattr(g, "request_start_time", None)
     return None if start is None else (time.perf_counter() - start) * 1000.0
+
+
+def start_request_phase(phase: LatencyMetricName) -> None:
+    """Enter ``phase``, pausing whichever phase was running until it ends."""
+    clock = _phase_clock()
+    if clock is None:
+        return
+    clock.charge()
+    clock.active.append(phase)
+
+
+def end_request_phase() -> None:
+    """Leave the innermost phase, resuming the one it paused."""
+    clock = _phase_clock()
+    if clock is None or not clock.active:
+        return
+    clock.charge()
+    clock.active.pop()
+
+
+@contextmanager
+def request_phase(phase: LatencyMetricName) -> Iterator[None]:
+    """Charge the block's non-SQL time to ``phase``; a no-op outside a request."""
+    start_request_phase(phase)
+    try:
+        yield
+    finally:
+        end_request_phase()
+
+
+def request_phase_durations() -> dict[LatencyMetricName, float]:
+    """Milliseconds charged to each phase so far, including any still running.
+
+    Empty when the request clock was never stamped.
+    """
+    clock = _phase_clock()
+    if clock is None:
+        return {}
+    clock.charge()
+    return dict(clock.totals_ms)
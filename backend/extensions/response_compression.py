@@ -0,0 +1,142 @@
+"""Opt-in compression of large text responses (gzip, plus brotli/zstd if installed).
+
+UTub detail, search, the mobile UTub listing, and metrics timeseries bodies are
+JSON that repeats the same keys per row, so they compress very well. With
+``RESPONSE_COMPRESSION_ENABLED`` set, the ``after_request`` hook registered here
+encodes any response that:
+
+- has an allowlisted content type (``COMPRESSIBLE_MIMETYPES``),
+- is at least ``RESPONSE_COMPRESSION_MIN_BYTES`` long,
+- is not streamed, not already encoded, and not marked ``no-transform``,
+
+using the client's preferred encoding out of those available in this process.
+``br`` needs the ``brotli`` package and ``zstd`` the ``zstandard`` package; both
+are optional, and ``gzip`` is always available.
+
+A strong ETag on a compressed response is weakened, since the encoded bytes
+differ from the identity body.
+
+Registered right after ``request_timing`` in ``create_app`` so that, with
+Flask running ``after_request`` hooks in reverse order, it runs last and every
+other hook sees the uncompressed body.
+"""
+
+from __future__ import annotations
+
+import gzip
+from typing import Callable
+
+from flask import Flask, request
+from werkzeug.wrappers import Response
+
+from backend.utils.strings.config_strs import CONFIG_ENVS
+
+try:
+    import brotli
+except ImportError:  # pragma: no cover - depends on the deployment image
+    brotli = None
+
+try:
+    import zstandard
+except ImportError:  # pragma: no cover - depends on the deployment image
+    zstandard = None
+
+COMPRESSIBLE_MIMETYPES: frozenset[str] = frozenset(
+    {
+        "application/json",
+        "application/javascript",
+        "image/svg+xml",
+        "text/css",
+        "text/html",
+        "text/javascript",
+        "text/plain",
+    }
+)
+
+GZIP = "gzip"
+BROTLI = "br"
+ZSTD = "zstd"
+
+# Fast levels: every body is encoded per request.
+_COMPRESSION_LEVELS: dict[str, int] = {GZIP: 6, BROTLI: 5, ZSTD: 3}
+
+
+def _compress_gzip(body: bytes, level: int) -> bytes:
+    return gzip.compress(body, compresslevel=level, mtime=0)
+
+
+def _compress_brotli(body: bytes, level: int) -> bytes:
+    return brotli.compress(body, quality=level)
+
+
+def _compress_zstd(body: bytes, level: int) -> bytes:
+    return zstandard.ZstdCompressor(level=level).compress(body)
+
+
+def available_encodings() -> dict[str, Callable[[bytes, int], bytes]]:
+    """Encoders usable in this process, in server preference order."""
+    encoders: dict[str, Callable[[bytes, int], bytes]] = {}
+    if brotli is not None:
+        encoders[BROTLI] = _compress_brotli
+    if zstandard is not None:
+        encoders[ZSTD] = _compress_zstd
+    encoders[GZIP] = _compress_gzip
+    return encoders
+
+
+def _is_compressible(response: Response, min_bytes: int) -> bool:
+    if response.direct_passthrough or response.is_streamed:
+        return False
+    if response.status_code < 200 or response.status_code in (204, 206, 304):
+        return False
+    if response.mimetype not in COMPRESSIBLE_MIMETYPES:
+        return False
+    if "Content-Encoding" in response.headers:
+        return False
+    if "no-transform" in response.headers.get("Cache-Control", ""):
+        return False
+    content_length = response.content_length
+    return content_length is not None and content_length >= min_bytes
+
+
+def compress_response(response: Response, *, min_bytes: int) -> Response:
+    """Encode ``response`` in place for the current request, if worthwhile."""
+    if not _is_compressible(response, min_bytes):
+        return response
+
+    # The body depends on Accept-Encoding from here on, whichever branch runs.
+    response.vary.add("Accept-Encoding")
+
+    encoders = available_encodings()
+    encoding = request.accept_encodings.best_match(list(encoders))
+    if encoding is None:
+        return response
+
+    body = response.get_data()
+    compressed_body = encoders[encoding](body, _COMPRESSION_LEVELS[encoding])
+    if len(compressed_body) >= len(body):
+        return response
+
+    etag, is_weak = response.get_etag()
+    if etag is not None and not is_weak:
+        response.set_etag(etag, weak=True)
+    response.set_data(compressed_body)
+    response.headers["Content-Encoding"] = encoding
+    return response
+
+
+def init_app(app: Flask) -> None:
+    """Register the compression ``after_request`` hook.
+
+    Reads ``RESPONSE_COMPRESSION_ENABLED`` at request time, so the flag can be
+    toggled at runtime (e.g. in tests) without re-initialization.
+    """
+
+    @app.after_request
+    def _compress_response(response: Response) -> Response:
+        if not app.config.get(CONFIG_ENVS.RESPONSE_COMPRESSION_ENABLED, False):
+            return response
+        return compress_response(
+            response,
+            min_bytes=app.config.get(CONFIG_ENVS.RESPONSE_COMPRESSION_MIN_BYTES, 1024),
+        )
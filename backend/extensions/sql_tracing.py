@@ -0,0 +1,172 @@
+"""Per-request SQL statement tracing.
+
+Engine-level ``before_cursor_execute`` / ``after_cursor_execute`` listeners
+time every statement. Statements run inside a request context are added to
+that request's ``SqlTrace``, stashed on ``g`` by a ``before_request`` hook:
+
+- ``statement_count`` and ``db_time_ms`` (time spent in the DB driver),
+- per-statement counts, folded into fingerprints (literals and bound
+  parameters replaced by ``?``) so an N+1 loop shows up as one fingerprint
+  executed N times.
+
+``app_logger``'s ``http_transaction`` record carries ``sql_trace_log_fields()``,
+and the metrics middleware records ``db_time_ms`` as the ``db_query_duration``
+latency metric. ``capture_sql_statements()`` traces every statement the process
+runs within a block, whatever the request; the ``assert_max_queries`` test
+fixture is built on it.
+
+Statements on threads without a request context (health probes, workers) are
+only seen by ``capture_sql_statements()``.
+"""
+
+from __future__ import annotations
+
+from collections import Counter
+from contextlib import contextmanager
+from dataclasses import dataclass, field
+import re
+import threading
+import time
+from typing import Any, Iterator
+
+from flask import Flask, g, has_request_context
+from sqlalchemy import event
+from sqlalchemy.engine import Engine
+
+# How many repeated fingerprints a log record lists, most-executed first
+REPEATED_STATEMENTS_LOG_LIMIT = 5
+_FINGERPRINT_MAX_LENGTH = 300
+_START_TIMES_KEY = "sql_tracing_start_times"
+
+_BOUND_PARAMETER = re.compile(r"%\([^)]*\)s|%s|\?|(?<![:\w]):\w+")
+_STRING_LITERAL = re.compile(r"'(?:[^']|'')*'")
+_NUMBER_LITERAL = re.compile(r"\b\d+(?:\.\d+)?\b")
+_IN_LIST = re.compile(r"\bIN\s*\(\s*\?(?:\s*,\s*\?)*\s*\)", re.IGNORECASE)
+_WHITESPACE = re.compile(r"\s+")
+
+
+def fingerprint_statement(statement: str) -> str:
+    """Normalize a statement so executions differing only in values match.
+
+    Bound parameters and literals become ``?``, and an expanded ``IN
+    (%(id_1_1)s, %(id_1_2)s)`` of any length becomes ``IN (...)``.
+    """
+    fingerprint = _STRING_LITERAL.sub("?", statement)
+    fingerprint = _BOUND_PARAMETER.sub("?", fingerprint)
+    fingerprint = _NUMBER_LITERAL.sub("?", fingerprint)
+    fingerprint = _IN_LIST.sub("IN (...)", fingerprint)
+    fingerprint = _WHITESPACE.sub(" ", fingerprint).strip()
+    return fingerprint[:_FINGERPRINT_MAX_LENGTH]
+
+
+@dataclass
+class SqlTrace:
+    statement_count: int = 0
+    db_time_ms: float = 0.0
+    # Keyed by raw statement text; fingerprinting is deferred to reporting so
+    # the per-statement cost stays a counter increment
+    statements: Counter[str] = field(default_factory=Counter)
+
+    def record(self, statement: str, duration_ms: float) -> None:
+        self.statement_count += 1
+        self.db_time_ms += duration_ms
+        self.statements[statement] += 1
+
+    def repeated_statements(self) -> list[tuple[str, int]]:
+        """Fingerprints executed more than once, most-executed first."""
+        fingerprint_counts: Counter[str] = Counter()
+        for statement, count in self.statements.items():
+            fingerprint_counts[fingerprint_statement(statement)] += count
+        return [
+            (fingerprint, count)
+            for fingerprint, count in fingerprint_counts.most_common()
+            if count > 1
+        ]
+
+    def describe(self) -> str:
+        lines = [
+            f"{self.statement_count} statement(s) in {self.db_time_ms:.2f}ms",
+            *(
+                f"  {count}x {fingerprint}"
+                for fingerprint, count in self.repeated_statements()
+            ),
+        ]
+        return "\n".join(lines)
+
+
+_captures: list[SqlTrace] = []
+_captures_lock = threading.Lock()
+
+
+@contextmanager
+def capture_sql_statements() -> Iterator[SqlTrace]:
+    """Trace every statement this process runs inside the block, on any thread."""
+    sql_trace = SqlTrace()
+    with _captures_lock:
+        _captures.append(sql_trace)
+    try:
+        yield sql_trace
+    finally:
+        with _captures_lock:
+            _captures.remove(sql_trace)
+
+
+def current_sql_trace() -> SqlTrace | None:
+    if not has_request_context():
+        return None
+    return g.get("sql_trace")
+
+
+def sql_trace_log_fields() -> dict[str, Any]:
+    """Fields for the request's ``http_transaction`` log record."""
+    sql_trace = current_sql_trace()
+    if sql_trace is None:
+        return {}
+    return {
+        "db_statement_count": sql_trace.statement_count,
+        "db_time_ms": round(sql_trace.db_time_ms, 2),
+        "db_repeated_statements": [
+            {"fingerprint": fingerprint, "count": count}
+            for fingerprint, count in sql_trace.repeated_statements()[
+                :REPEATED_STATEMENTS_LOG_LIMIT
+            ]
+        ],
+    }
+
+
+@event.listens_for(Engine, "before_cursor_execute")
+def _stamp_statement_start(
+    conn, cursor, statement, parameters, context, executemany
+) -> None:
+    conn.info.setdefault(_START_TIMES_KEY, []).append(time.perf_counter())
+
+
+@event.listens_for(Engine, "after_cursor_execute")
+def _record_statement(conn, cursor, statement, parameters, context, executemany):
+    start_times: list[float] = conn.info.get(_START_TIMES_KEY, [])
+    if not start_times:
+        return
+    duration_ms = (time.perf_counter() - start_times.pop()) * 1000.0
+    sql_trace = current_sql_trace()
+    if sql_trace is not None:
+        sql_trace.record(statement, duration_ms)
+    if _captures:
+        with _captures_lock:
+            for capture in _captures:
+                capture.record(statement, duration_ms)
+
+
+@event.listens_for(Engine, "handle_error")
+def _discard_statement_start(exception_context) -> None:
+    # A failed statement never reaches after_cursor_execute
+    connection = exception_context.connection
+    if connection is not None:
+        start_times: list[float] = connection.info.get(_START_TIMES_KEY, [])
+        if start_times:
+            start_times.pop()
+
+
+def init_app(app: Flask) -> None:
+    @app.before_request
+    def _start_sql_trace() -> None:
+        g.sql_trace = SqlTrace()
@@ -1,7 +1,3 @@
-PROTOCOL = "protocol"
-HOSTNAME = "hostname"
-HREF = "href"
-
 INVALID_SCHEME_PREFIXES = (
     "javascript",
     "data",
@@ -117,3 +113,8 @@ TRACKING_QUERY_PARAMS: frozenset[str] = frozenset(
 TRACKING_QUERY_PARAM_PREFIXES: tuple[str, ...] = ("utm_",)
 
 WEB_SCHEMES_FOR_TRACKING_STRIP: frozenset[str] = frozenset({"http", "https"})
+
+# Entries kept by UrlValidator's outcome cache. Each entry is a raw input string
+# plus its validated form (both capped at the 8000-char URL limit in practice),
+# so the worst case stays in the tens of MB per process.
+VALIDATION_CACHE_MAX_ENTRIES: int = 4096
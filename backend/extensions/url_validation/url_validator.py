@@ -24,8 +24,11 @@ If URL does not contain a scheme, presumptively prepends 'https://'.
 
 """
 
+from collections import OrderedDict
+from dataclasses import dataclass
 import ipaddress
 import re
+import threading
 
 import ada_url
 from flask import Flask
@@ -44,13 +47,11 @@ if __name__ == "__main__":
     from extensions.url_validation.constants import (
         CORE_SCHEMES,
         DEV_URLS,
-        HOSTNAME,
-        HREF,
         INVALID_SCHEME_PREFIXES,
         OTHER_VALID_SCHEMES,
-        PROTOCOL,
         TRACKING_QUERY_PARAMS,
         TRACKING_QUERY_PARAM_PREFIXES,
+        VALIDATION_CACHE_MAX_ENTRIES,
         WEB_SCHEMES_FOR_TRACKING_STRIP,
     )
 
@@ -62,13 +63,11 @@ else:
     from backend.extensions.url_validation.constants import (
         CORE_SCHEMES,
         DEV_URLS,
-        HOSTNAME,
-        HREF,
         INVALID_SCHEME_PREFIXES,
         OTHER_VALID_SCHEMES,
-        PROTOCOL,
         TRACKING_QUERY_PARAMS,
         TRACKING_QUERY_PARAM_PREFIXES,
+        VALIDATION_CACHE_MAX_ENTRIES,
         WEB_SCHEMES_FOR_TRACKING_STRIP,
     )
 
@@ -91,12 +90,57 @@ class URLWithCredentialsError(InvalidURLError):
     pass
 
 
+@dataclass(frozen=True)
+class ValidationResult:
+    """The full result of `UrlValidator.process` for one raw URL string.
+
+    `had_tracking` is True when the parsed URL carried tracking query params,
+    whether or not its scheme gets them stripped. Failures keep the exception
+    class and message rather than the instance, so a cached outcome can be
+    re-raised as a fresh exception on every lookup.
+    """
+
+    had_tracking: bool
+    validated_url: str | None = None
+    error_type: type[Exception] | None = None
+    error_message: str = ""
+
+    def raise_for_error(self) -> str:
+        """Returns the validated URL, or raises the error recorded for it."""
+        if self.error_type is not None:
+            raise self.error_type(self.error_message)
+        assert self.validated_url is not None
+        return self.validated_url
+
+
+@dataclass(frozen=True)
+class UrlValidationCacheStats:
+    hits: int
+    misses: int
+    size: int
+    max_size: int
+
+    @property
+    def hit_rate(self) -> float:
+        lookups = self.hits + self.misses
+        return self.hits / lookups if lookups else 0.0
+
+
 class UrlValidator:
-    def __init__(self, skip_logs: bool = False) -> None:
+    def __init__(
+        self,
+        skip_logs: bool = False,
+        cache_size: int = VALIDATION_CACHE_MAX_ENTRIES,
+    ) -> None:
         self._has_app = False
         self._skip_logs = skip_logs
         self.scheme_regex = re.compile(r"^([a-z][a-z0-9+.-]*):(.*)$")
         self.host_and_port_regex = re.compile(r"^([^:]+):(\d{1,5})(.*)$")
+        self._cache_size = cache_size
+        self._cache: OrderedDict[str, ValidationResult] = OrderedDict()
+        self._cache_lock = threading.Lock()
+        self._cache_hits = 0
+        self._cache_misses = 0
 
     def init_app(self, app: Flask) -> None:
         app.extensions[VALIDATION_STRS.URL_VALIDATION_MODULE] = self
@@ -105,6 +149,80 @@ class UrlValidator:
         is_ui_testing: bool = app.config.get("UI_TESTING", False)
         is_debug: bool = app.config.get("FLASK_DEBUG", False)
         self._has_app = is_testing or is_production or is_ui_testing or is_debug
+        self.clear_cache()
+
+    def process(self, url: str | None) -> ValidationResult:
+        """
+        Normalizes, validates, and canonicalizes a raw URL string, memoizing the result.
+
+        The URL is parsed by ada-url exactly once; the parsed object is then
+        checked (scheme, domain), host-lowercased, and tracking-stripped in
+        place. Popular links get added by many users, so results are kept in a
+        bounded LRU keyed on the raw input, letting a repeat lookup skip the
+        parse entirely. Expected validation failures are cached; unexpected
+        exceptions propagate and are not.
+
+        Args:
+            url (str | None): The raw URL string as submitted
+
+        Returns:
+            (ValidationResult): Call `raise_for_error()` for the validated URL
+        """
+        if not url or self._cache_size <= 0:
+            return self._process_uncached(url)
+
+        with self._cache_lock:
+            cached_result = self._cache.get(url)
+            if cached_result is not None:
+                self._cache.move_to_end(url)
+                self._cache_hits += 1
+            else:
+                self._cache_misses += 1
+
+        if cached_result is not None:
+            self._log(safe_add_log, f"Validating {url} (cached)")
+            return cached_result
+
+        result = self._process_uncached(url)
+        with self._cache_lock:
+            self._cache[url] = result
+            self._cache.move_to_end(url)
+            if len(self._cache) > self._cache_size:
+                self._cache.popitem(last=False)
+        return result
+
+    def _process_uncached(self, url: str | None) -> ValidationResult:
+        try:
+            normalized_url = self.normalize_url(url)
+            parsed_url = self._parse(normalized_url)
+            tracking_query = self._find_tracking_params(parsed_url)
+            validated_url = self._canonicalize(
+                parsed_url, normalized_url, tracking_query=tracking_query
+            )
+        except (InvalidURLError, AdaUrlParsingError) as e:
+            return ValidationResult(
+                had_tracking=False,
+                error_type=type(e),
+                error_message=str(e),
+            )
+        return ValidationResult(
+            had_tracking=tracking_query is not None, validated_url=validated_url
+        )
+
+    def cache_stats(self) -> UrlValidationCacheStats:
+        with self._cache_lock:
+            return UrlValidationCacheStats(
+                hits=self._cache_hits,
+                misses=self._cache_misses,
+                size=len(self._cache),
+                max_size=self._cache_size,
+            )
+
+    def clear_cache(self) -> None:
+        with self._cache_lock:
+            self._cache.clear()
+            self._cache_hits = 0
+            self._cache_misses = 0
 
     def _log(self, log_fn, log):
         log_fn(log) if self._has_app and not self._skip_logs else None
@@ -204,52 +322,66 @@ class UrlValidator:
             TRACKING_QUERY_PARAM_PREFIXES
         )
 
-    def _strip_tracking_params(self, href: str) -> str:
+    def _find_tracking_params(
+        self, parsed_url: ada_url.URL
+    ) -> tuple[ada_url.URLSearchParams, list[str]] | None:
         """
-        Removes known marketing/advertising tracking query params from a URL,
-        preserving all non-tracking params and their original order/repeats.
-
-        Example:
-            "https://x.com/p?utm_source=g&q=1&fbclid=z" -> "https://x.com/p?q=1"
+        Parses the query of an already-parsed URL and returns it alongside the
+        names of any tracking params in it, or None if there are none.
         """
-        search = ada_url.URL(href).search
+        search = parsed_url.search
         if not search:
-            return href
+            return None
 
         params = ada_url.URLSearchParams(search.lstrip("?"))
         tracking_keys = [
             key for key, _ in params.items() if self._is_tracking_param(key)
         ]
+        return (params, tracking_keys) if tracking_keys else None
+
+    def _strip_tracking_params(self, href: str) -> str:
+        """
+        Removes known marketing/advertising tracking query params from a URL,
+        preserving all non-tracking params and their original order/repeats.
+
+        Example:
+            "https://x.com/p?utm_source=g&q=1&fbclid=z" -> "https://x.com/p?q=1"
+        """
+        parsed_url = ada_url.URL(href)
+        tracking_query = self._find_tracking_params(parsed_url)
         # No tracking params present: return the href untouched so that the
         # original query-string encoding (e.g. "%20" vs "+", literal "://") is
         # preserved rather than being re-serialized by URLSearchParams.
-        if not tracking_keys:
+        if tracking_query is None:
             return href
 
+        self._strip_parsed_tracking_params(parsed_url, tracking_query)
+        return parsed_url.href
+
+    @staticmethod
+    def _strip_parsed_tracking_params(
+        parsed_url: ada_url.URL,
+        tracking_query: tuple[ada_url.URLSearchParams, list[str]],
+    ) -> None:
+        params, tracking_keys = tracking_query
         for key in tracking_keys:
             params.delete(key)
-
-        new_search = str(params)
-        return ada_url.replace_url(href, search=new_search)
+        parsed_url.search = str(params)
 
     def contains_tracking_params(self, url: str) -> bool:
         """
         Returns True if a URL contains any known marketing/advertising tracking
         query param. Best-effort metric signal only: never raises — any parse
-        failure yields False.
+        or validation failure yields False. Answered from the `process` cache.
 
         Example:
             "https://x.com/p?utm_source=g" -> True
             "https://x.com/p?q=1"          -> False
         """
-        try:
-            search = ada_url.URL(url).search
-            return any(
-                self._is_tracking_param(key)
-                for key, _ in ada_url.URLSearchParams(search.lstrip("?")).items()
-            )
         # Broad catch is intentional: this produces a best-effort metric signal
         # only and must never raise into the request path.
+        try:
+            return self.process(url).had_tracking
         except Exception:
             return False
 
@@ -314,31 +446,42 @@ class UrlValidator:
         return len(tld) >= 2
 
     def validate_url(self, normalized_url: str) -> str:
-        if not ada_url.check_url(normalized_url):
-            self._log(
-                warning_log,
-                f"Invalid URL passed to validate in check_url: {normalized_url}",
-            )
-            raise InvalidURLError("URL is invalid")
+        """
+        Validates and canonicalizes an already-normalized URL string.
 
-        try:
-            parsed_url = ada_url.parse_url(
-                normalized_url,
-                attributes=(
-                    PROTOCOL,
-                    HOSTNAME,
-                    HREF,
-                ),
-            )
+        Prefer `process`, which also normalizes, reports tracking params, and
+        caches the result.
+        """
+        parsed_url = self._parse(normalized_url)
+        return self._canonicalize(
+            parsed_url,
+            normalized_url,
+            tracking_query=self._find_tracking_params(parsed_url),
+        )
 
+    def _parse(self, normalized_url: str) -> ada_url.URL:
+        """The single ada-url parse every later check and rewrite works from."""
+        try:
+            return ada_url.URL(normalized_url)
         except ValueError:
             self._log(
                 warning_log,
-                f"Invalid URL passed to validate via parse_url: {normalized_url}",
+                f"Invalid URL passed to validate in check_url: {normalized_url}",
             )
-            raise InvalidURLError("URL could not be parsed")
+            raise InvalidURLError("URL is invalid")
 
-        scheme = parsed_url.get(PROTOCOL)
+    def _canonicalize(
+        self,
+        parsed_url: ada_url.URL,
+        normalized_url: str,
+        *,
+        tracking_query: tuple[ada_url.URLSearchParams, list[str]] | None,
+    ) -> str:
+        """
+        Checks the scheme and domain of a parsed URL, then lowercases its host
+        and strips tracking params in place and returns the final href.
+        """
+        scheme = parsed_url.protocol
         if not scheme or scheme.startswith(INVALID_SCHEME_PREFIXES):
             self._log(
                 critical_log, f"Invalid URL scheme during validation: {normalized_url}"
@@ -352,7 +495,7 @@ class UrlValidator:
             )
             raise InvalidURLError("Invalid URL protocol during validation")
 
-        hostname = parsed_url.get(HOSTNAME)
+        hostname = parsed_url.hostname
         if scheme.startswith("http") and (
             not hostname or not self._has_valid_domain(hostname)
         ):
@@ -361,28 +504,25 @@ class UrlValidator:
             )
             raise InvalidURLError(f"Invalid URL hostname: {hostname}")
 
-        validated_ada_url_href = parsed_url.get(HREF, None)
-        if not validated_ada_url_href:
+        if not parsed_url.href:
             self._log(
                 critical_log,
                 f"URL could not be serialized using ada-url: {normalized_url}",
             )
             raise AdaUrlParsingError(f"Invalid URL hostname: {hostname}")
 
-        validated_ada_url = ada_url.URL(validated_ada_url_href)
+        # ada-url only lowercases hosts of special schemes (http, ftp, ...)
+        host = parsed_url.host
+        if host and host != host.lower():
+            parsed_url.host = host.lower()
 
-        final_ada_url = (
-            ada_url.replace_url(
-                validated_ada_url_href, host=validated_ada_url.host.lower()
-            )
-            if validated_ada_url.host
-            else validated_ada_url_href
-        )
-
-        if scheme.rstrip(":") in WEB_SCHEMES_FOR_TRACKING_STRIP:
-            final_ada_url = self._strip_tracking_params(final_ada_url)
+        if (
+            tracking_query is not None
+            and scheme.rstrip(":") in WEB_SCHEMES_FOR_TRACKING_STRIP
+        ):
+            self._strip_parsed_tracking_params(parsed_url, tracking_query)
 
-        return final_ada_url
+        return parsed_url.href
 
 
 if __name__ == "__main__":
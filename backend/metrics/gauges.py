@@ -23,6 +23,7 @@ same key. The unit test `tests/unit/test_gauges.py` asserts
 from __future__ import annotations
 
 import re
+from collections.abc import Iterable
 from dataclasses import dataclass
 from enum import StrEnum
 
@@ -355,13 +356,373 @@ def build_gauge_sql(gauge_name: GaugeName) -> str:
     )
 
 
+@dataclass(frozen=True)
+class CompiledGaugeQuery:
+    """One statement that yields the values of several gauges in a single row.
+
+    `gauge_names[i]` is the gauge whose value is column `i` of the row `sql`
+    returns.
+    """
+
+    table: str | None
+    gauge_names: tuple[GaugeName, ...]
+    sql: str
+
+
+def _compiled_table_sql(table: str, gauge_names: tuple[GaugeName, ...]) -> str:
+    """Generate the CTE statement computing every `table` gauge in one scan.
+
+    A `MATERIALIZED` base CTE reads the source table exactly once, projecting
+    only the columns the gauges need. Each distinct (group-by column, inner
+    count) pair becomes one grouped CTE over that base, shared by the MAX and
+    AVG gauges that aggregate it. The final SELECT emits one column per gauge
+    in `gauge_names` order, with the same k-anonymity guard and
+    non-empty-population semantics as `build_gauge_sql` (the guard counts
+    non-NULL group keys, matching `COUNT(DISTINCT "<group_by_column>")`).
+
+    Example, TOTAL_UTUB_URL_ASSOCIATIONS + MAX/AVG_URLS_PER_UTUB on "UtubUrls":
+        WITH base AS MATERIALIZED (SELECT "utubID" FROM "UtubUrls"),
+        g0 AS (SELECT "utubID" AS k, COUNT(*) AS c FROM base GROUP BY "utubID")
+        SELECT (SELECT COUNT(*) FROM base),
+        CASE WHEN (SELECT COUNT(k) FROM g0) < 5 THEN NULL
+        ELSE (SELECT MAX(c) FROM g0) END, (SELECT AVG(c) FROM g0)
+    """
+    definitions = [GAUGE_REGISTRY[gauge_name] for gauge_name in gauge_names]
+    base_columns = sorted(
+        {
+            column
+            for definition in definitions
+            for column in (
+                definition.distinct_column,
+                definition.group_by_column,
+                definition.count_column,
+            )
+            if column is not None
+        }
+    )
+    base_projection = ", ".join(f'"{column}"' for column in base_columns) or "1"
+    ctes = [f'base AS MATERIALIZED (SELECT {base_projection} FROM "{table}")']
+
+    group_cte_names: dict[tuple[str, str], str] = {}
+    value_exprs: list[str] = []
+    for definition in definitions:
+        if definition.kind is GaugeKind.VOLUME:
+            if definition.distinct_column is None:
+                value_exprs.append("(SELECT COUNT(*) FROM base)")
+            else:
+                value_exprs.append(
+                    f'(SELECT COUNT(DISTINCT "{definition.distinct_column}") '
+                    f"FROM base)"
+                )
+            continue
+
+        inner_count = _inner_count_expr(definition.count_column)
+        group_key = (str(definition.group_by_column), inner_count)
+        if group_key not in group_cte_names:
+            cte_name = f"g{len(group_cte_names)}"
+            group_cte_names[group_key] = cte_name
+            ctes.append(
+                f'{cte_name} AS (SELECT "{definition.group_by_column}" AS k, '
+                f'{inner_count} AS c FROM base GROUP BY "{definition.group_by_column}")'
+            )
+        cte_name = group_cte_names[group_key]
+
+        if definition.kind is GaugeKind.DISTRIBUTION_AVG:
+            value_exprs.append(f"(SELECT AVG(c) FROM {cte_name})")
+        else:
+            value_exprs.append(
+                f"CASE WHEN (SELECT COUNT(k) FROM {cte_name}) < {MIN_GAUGE_POPULATION} "
+                f"THEN NULL ELSE (SELECT MAX(c) FROM {cte_name}) END"
+            )
+
+    return f"WITH {', '.join(ctes)} SELECT {', '.join(value_exprs)}"
+
+
+def build_compiled_gauge_queries(
+    gauge_names: Iterable[GaugeName] | None = None,
+) -> tuple[CompiledGaugeQuery, ...]:
+    """Group `GAUGE_REGISTRY` by source table into one statement per table.
+
+    Tables backing two or more VOLUME / DISTRIBUTION gauges get a single CTE
+    statement (`_compiled_table_sql`) instead of one full-table aggregate per
+    gauge — e.g. the five `UtubUrls` gauges become one scan. A table with a
+    single gauge, and every EVENT_DERIVED_MAX gauge, reuses `build_gauge_sql`
+    unchanged. Together the queries cover every gauge in `gauge_names` (all of
+    `GaugeName` when omitted) exactly once, in enum order within each table.
+    """
+    selected = set(GaugeName if gauge_names is None else gauge_names)
+    gauges_by_table: dict[str, list[GaugeName]] = {}
+    compiled_queries: list[CompiledGaugeQuery] = []
+    for gauge_name in GaugeName:
+        if gauge_name not in selected:
+            continue
+        definition = GAUGE_REGISTRY[gauge_name]
+        if definition.kind is GaugeKind.EVENT_DERIVED_MAX or definition.table is None:
+            compiled_queries.append(
+                CompiledGaugeQuery(
+                    table=definition.table,
+                    gauge_names=(gauge_name,),
+                    sql=build_gauge_sql(gauge_name),
+                )
+            )
+            continue
+        gauges_by_table.setdefault(definition.table, []).append(gauge_name)
+
+    for table, table_gauge_names in gauges_by_table.items():
+        if len(table_gauge_names) == 1:
+            sql = build_gauge_sql(table_gauge_names[0])
+        else:
+            sql = _compiled_table_sql(table, tuple(table_gauge_names))
+        compiled_queries.append(
+            CompiledGaugeQuery(
+                table=table, gauge_names=tuple(table_gauge_names), sql=sql
+            )
+        )
+    return tuple(compiled_queries)
+
+
+# ---------------------------------------------------------------------------
+# Incrementally maintained VOLUME gauges
+# ---------------------------------------------------------------------------
+# Every VOLUME gauge is also kept as a running total, maintained by
+# statement-level triggers on its source table (using transition tables). The
+# hot write path never updates a shared row: each INSERT / DELETE statement
+# appends one `GaugeCounterDeltas` row, so concurrent writers to the same
+# table take no common lock and cannot deadlock across gauges. A gauge's value
+# is its `GaugeCounters` base row plus the sum of its pending deltas; every
+# run of the hourly sampler in `scripts/sample_gauges.py` folds the deltas back
+# into the base row, and its daily reconciliation resets any drift (e.g. after
+# a restore that loaded rows with triggers disabled). TRUNCATE resets the base row and drops the deltas. A
+# COUNT(DISTINCT ...) gauge additionally keeps one `GaugeDistinctRefs` row per
+# distinct value holding how many source rows carry it, so the distinct total
+# only moves when a value's reference count crosses zero. The sampler then
+# reads the volume gauges from these small tables instead of scanning each
+# source table.
+GAUGE_COUNTERS_TABLE = "GaugeCounters"
+GAUGE_COUNTER_DELTAS_TABLE = "GaugeCounterDeltas"
+GAUGE_DISTINCT_REFS_TABLE = "GaugeDistinctRefs"
+
+INCREMENTAL_GAUGE_NAMES: tuple[GaugeName, ...] = tuple(
+    gauge_name
+    for gauge_name in GaugeName
+    if GAUGE_REGISTRY[gauge_name].kind is GaugeKind.VOLUME
+)
+
+
+def counter_function_name(gauge_name: GaugeName) -> str:
+    """Name of the trigger function maintaining `gauge_name`'s counter row.
+
+    Example:
+        counter_function_name(GaugeName.TOTAL_USERS) -> "gauge_counter_total_users"
+    """
+    return f"gauge_counter_{gauge_name.value}"
+
+
+def _counter_delta_sql(gauge_name: GaugeName, delta_expr: str) -> str:
+    """Append the statement's delta as a `GaugeCounterDeltas` row (none if 0)."""
+    return (
+        f'INSERT INTO "{GAUGE_COUNTER_DELTAS_TABLE}" ("gaugeName", "delta") '
+        f"SELECT '{gauge_name.value}', d FROM ({delta_expr}) AS delta_rows(d) "
+        "WHERE d <> 0;"
+    )
+
+
+def _counter_reset_sql(gauge_name: GaugeName) -> str:
+    return (
+        f'UPDATE "{GAUGE_COUNTERS_TABLE}" SET "value" = 0, "updatedAt" = now() '
+        f"WHERE \"gaugeName\" = '{gauge_name.value}'; "
+        f'DELETE FROM "{GAUGE_COUNTER_DELTAS_TABLE}" '
+        f"WHERE \"gaugeName\" = '{gauge_name.value}';"
+    )
+
+
+def _count_function_body(gauge_name: GaugeName) -> str:
+    """plpgsql body for a COUNT(*) gauge: add / subtract the statement's rows."""
+    return (
+        "BEGIN "
+        "IF TG_OP = 'INSERT' THEN "
+        f"{_counter_delta_sql(gauge_name, 'SELECT COUNT(*) FROM new_rows')} "
+        "ELSIF TG_OP = 'DELETE' THEN "
+        f"{_counter_delta_sql(gauge_name, 'SELECT -COUNT(*) FROM old_rows')} "
+        "ELSE "
+        f"{_counter_reset_sql(gauge_name)} "
+        "END IF; "
+        "RETURN NULL; "
+        "END;"
+    )
+
+
+def _distinct_function_body(gauge_name: GaugeName, column: str) -> str:
+    """plpgsql body for a COUNT(DISTINCT column) gauge.
+
+    Values leaving the table decrement their `GaugeDistinctRefs` row — rows
+    reaching zero are deleted and subtracted from the counter — and values
+    entering it are upserted, with brand-new rows (refs == the amount just
+    added) added to the counter. An UPDATE only moves the values that actually
+    changed (`EXCEPT ALL` of the old and new transition tables). The net change
+    is appended as one delta row; the only row locks taken are those of the
+    reference rows for the values the statement touched.
+    """
+    gauge_literal = f"'{gauge_name.value}'"
+    old_values = (
+        f'SELECT "{column}"::text AS v FROM old_rows WHERE "{column}" IS NOT NULL'
+    )
+    new_values = (
+        f'SELECT "{column}"::text AS v FROM new_rows WHERE "{column}" IS NOT NULL'
+    )
+
+    def decrement(removed_sql: str) -> str:
+        return (
+            f'UPDATE "{GAUGE_DISTINCT_REFS_TABLE}" AS r SET "refs" = r."refs" - d.n '
+            f"FROM (SELECT v, COUNT(*) AS n FROM ({removed_sql}) AS removed "
+            f"GROUP BY v) AS d "
+            f'WHERE r."gaugeName" = {gauge_literal} AND r."distinctValue" = d.v; '
+            f'DELETE FROM "{GAUGE_DISTINCT_REFS_TABLE}" '
+            f'WHERE "gaugeName" = {gauge_literal} AND "refs" <= 0 '
+            f'AND "distinctValue" IN (SELECT v FROM ({removed_sql}) AS removed); '
+            "GET DIAGNOSTICS affected = ROW_COUNT; "
+            "delta := delta - affected;"
+        )
+
+    def increment(added_sql: str) -> str:
+        return (
+            f"WITH added AS (SELECT v, COUNT(*) AS n FROM ({added_sql}) AS a "
+            f"GROUP BY v), "
+            f'upserted AS (INSERT INTO "{GAUGE_DISTINCT_REFS_TABLE}" '
+            f'("gaugeName", "distinctValue", "refs") '
+            f"SELECT {gauge_literal}, v, n FROM added "
+            f'ON CONFLICT ("gaugeName", "distinctValue") DO UPDATE '
+            f'SET "refs" = "{GAUGE_DISTINCT_REFS_TABLE}"."refs" + EXCLUDED."refs" '
+            f'RETURNING "distinctValue", "refs") '
+            f"SELECT COUNT(*) INTO affected FROM upserted AS u "
+            f'JOIN added ON added.v = u."distinctValue" WHERE u."refs" = added.n; '
+            "delta := delta + affected;"
+        )
+
+    return (
+        "DECLARE delta bigint := 0; affected bigint; "
+        "BEGIN "
+        "IF TG_OP = 'TRUNCATE' THEN "
+        f'DELETE FROM "{GAUGE_DISTINCT_REFS_TABLE}" WHERE "gaugeName" = {gauge_literal}; '
+        f"{_counter_reset_sql(gauge_name)} "
+        "RETURN NULL; "
+        "END IF; "
+        "IF TG_OP = 'INSERT' THEN "
+        f"{increment(new_values)} "
+        "ELSIF TG_OP = 'DELETE' THEN "
+        f"{decrement(old_values)} "
+        "ELSE "
+        f"{decrement(f'({old_values}) EXCEPT ALL ({new_values})')} "
+        f"{increment(f'({new_values}) EXCEPT ALL ({old_values})')} "
+        "END IF; "
+        "IF delta <> 0 THEN "
+        f"{_counter_delta_sql(gauge_name, 'SELECT delta')} "
+        "END IF; "
+        "RETURN NULL; "
+        "END;"
+    )
+
+
+def build_counter_trigger_ddl() -> tuple[str, ...]:
+    """Generate the idempotent DDL installing every counter-maintenance trigger.
+
+    Per incremental gauge: one `CREATE OR REPLACE FUNCTION` plus statement-level
+    `CREATE OR REPLACE TRIGGER`s on the gauge's table — AFTER INSERT (new
+    transition table), AFTER DELETE (old transition table), AFTER TRUNCATE
+    and, for COUNT(DISTINCT ...) gauges only, AFTER UPDATE (both transition
+    tables; Postgres forbids an `UPDATE OF <column>` list on transition-table
+    triggers, so the body diffs the values itself). Re-running the DDL is a
+    no-op, so the Flask `create_all` hook and the migration share it safely.
+    """
+    statements: list[str] = []
+    for gauge_name in INCREMENTAL_GAUGE_NAMES:
+        definition = GAUGE_REGISTRY[gauge_name]
+        function_name = counter_function_name(gauge_name)
+        if definition.distinct_column is None:
+            body = _count_function_body(gauge_name)
+        else:
+            body = _distinct_function_body(gauge_name, definition.distinct_column)
+        statements.append(
+            f'CREATE OR REPLACE FUNCTION "{function_name}"() RETURNS trigger '
+            f"LANGUAGE plpgsql AS $gauge_counter$ {body} $gauge_counter$"
+        )
+
+        trigger_events = [
+            ("ins", "INSERT", "REFERENCING NEW TABLE AS new_rows "),
+            ("del", "DELETE", "REFERENCING OLD TABLE AS old_rows "),
+            ("trunc", "TRUNCATE", ""),
+        ]
+        if definition.distinct_column is not None:
+            trigger_events.append(
+                (
+                    "upd",
+                    "UPDATE",
+                    "REFERENCING OLD TABLE AS old_rows NEW TABLE AS new_rows ",
+                )
+            )
+        for suffix, event, referencing in trigger_events:
+            statements.append(
+                f'CREATE OR REPLACE TRIGGER "{function_name}_{suffix}" '
+                f'AFTER {event} ON "{definition.table}" {referencing}'
+                f'FOR EACH STATEMENT EXECUTE FUNCTION "{function_name}"()'
+            )
+    return tuple(statements)
+
+
+def build_counter_seed_sql(gauge_name: GaugeName) -> str:
+    """Generate the INSERT creating `gauge_name`'s counter row at its true value.
+
+    Leaves an existing row alone (`ON CONFLICT DO NOTHING`); correcting an
+    existing row is the reconciliation job's business.
+
+    Example, TOTAL_USERS:
+        INSERT INTO "GaugeCounters" ("gaugeName", "value", "updatedAt")
+        SELECT 'total_users', (SELECT COUNT(*) FROM "Users"), now()
+        ON CONFLICT ("gaugeName") DO NOTHING
+    """
+    return (
+        f'INSERT INTO "{GAUGE_COUNTERS_TABLE}" ("gaugeName", "value", "updatedAt") '
+        f"SELECT '{gauge_name.value}', ({build_gauge_sql(gauge_name)}), now() "
+        f'ON CONFLICT ("gaugeName") DO NOTHING'
+    )
+
+
+def build_distinct_refs_rebuild_sql(gauge_name: GaugeName) -> str:
+    """Generate the INSERT rebuilding `gauge_name`'s `GaugeDistinctRefs` rows.
+
+    Expects the gauge's existing reference rows to have been deleted first.
+
+    Example, TOTAL_TAGS:
+        INSERT INTO "GaugeDistinctRefs" ("gaugeName", "distinctValue", "refs")
+        SELECT 'total_tags', "tagString"::text, COUNT(*) FROM "UtubTags"
+        WHERE "tagString" IS NOT NULL GROUP BY "tagString"
+    """
+    definition = GAUGE_REGISTRY[gauge_name]
+    column = definition.distinct_column
+    return (
+        f'INSERT INTO "{GAUGE_DISTINCT_REFS_TABLE}" '
+        f'("gaugeName", "distinctValue", "refs") '
+        f"SELECT '{gauge_name.value}', \"{column}\"::text, COUNT(*) "
+        f'FROM "{definition.table}" WHERE "{column}" IS NOT NULL GROUP BY "{column}"'
+    )
+
+
 __all__ = [
     "ALL_GAUGE_NAMES",
+    "GAUGE_COUNTERS_TABLE",
+    "GAUGE_DISTINCT_REFS_TABLE",
     "GAUGE_REGISTRY",
+    "INCREMENTAL_GAUGE_NAMES",
     "MIN_GAUGE_POPULATION",
+    "CompiledGaugeQuery",
     "GaugeDefinition",
     "GaugeKind",
     "GaugeName",
+    "build_compiled_gauge_queries",
+    "build_counter_seed_sql",
+    "build_counter_trigger_ddl",
+    "build_distinct_refs_rebuild_sql",
     "build_gauge_sql",
+    "counter_function_name",
     "value_column_for",
 ]
@@ -1,11 +1,12 @@
 """Code-side single source of truth for anonymous-metrics *latency* metadata.
 
-A *latency* metric is a raw request-duration observation (milliseconds) captured
-once per non-skipped HTTP request and stored as one row per sample in
-``AnonymousLatencySamples``. Unlike counters (occurrence tallies) and gauges
-(periodically-sampled scalars), latency retains the full value distribution so
-arbitrary quantiles (p50/p95/p99) can be computed exactly at query time with
-Postgres ``percentile_cont``.
+A *latency* metric is a raw duration observation (milliseconds) — captured once
+per non-skipped HTTP request (total, time spent in SQL, and the auth /
+serialize / hooks phases), or once per password hash/verify — and stored as one
+row per sample in ``AnonymousLatencySamples``. Unlike counters (occurrence
+tallies) and gauges (periodically-sampled scalars), latency retains the full
+value distribution so arbitrary quantiles (p50/p95/p99) can be computed exactly
+at query time with Postgres ``percentile_cont``.
 
 Each latency metric is one ``LatencyMetricEntry`` in ``LATENCY_REGISTRY`` keyed
 by a ``LatencyMetricName`` member. A contributor adds a new latency metric with
@@ -58,6 +59,11 @@ LATENCY_PRUNE_INTERVAL_SECONDS: int = 86_400
 
 class LatencyMetricName(StrEnum):
     API_REQUEST_DURATION = "api_request_duration"
+    PASSWORD_HASH_DURATION = "password_hash_duration"
+    DB_QUERY_DURATION = "db_query_duration"
+    AUTH_DURATION = "auth_duration"
+    SERIALIZE_DURATION = "serialize_duration"
+    HOOKS_DURATION = "hooks_duration"
 
 
 @dataclass(frozen=True)
@@ -73,6 +79,37 @@ LATENCY_REGISTRY: dict[LatencyMetricName, LatencyMetricEntry] = {
             "End-to-end HTTP request handling time (ms), per endpoint/method/device."
         )
     ),
+    LatencyMetricName.PASSWORD_HASH_DURATION: LatencyMetricEntry(
+        description=(
+            "Password hash/verify time (ms) including any wait for a hashing "
+            "slot, per endpoint/method/device."
+        )
+    ),
+    LatencyMetricName.DB_QUERY_DURATION: LatencyMetricEntry(
+        description=(
+            "Total time (ms) a request spent executing SQL statements, for "
+            "requests that ran any, per endpoint/method/device."
+        )
+    ),
+    LatencyMetricName.AUTH_DURATION: LatencyMetricEntry(
+        description=(
+            "Request phase: time (ms) in auth decorator checks and current-user "
+            "loading, excluding SQL, per endpoint/method/device."
+        )
+    ),
+    LatencyMetricName.SERIALIZE_DURATION: LatencyMetricEntry(
+        description=(
+            "Request phase: time (ms) encoding JSON responses, per "
+            "endpoint/method/device."
+        )
+    ),
+    LatencyMetricName.HOOKS_DURATION: LatencyMetricEntry(
+        description=(
+            "Request phase: time (ms) in before/after-request hooks (logging, "
+            "metrics writes, security headers, compression), excluding SQL, per "
+            "endpoint/method/device."
+        )
+    ),
 }
 
 
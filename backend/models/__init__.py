@@ -8,4 +8,10 @@ from backend.models.anonymous_latency_samples import (  # noqa: F401
 from backend.models.anonymous_metrics import Anonymous_Metrics  # noqa: F401
 from backend.models.api_refresh_tokens import ApiRefreshTokens  # noqa: F401
 from backend.models.audit_log import AuditLog  # noqa: F401
+from backend.models.email_outbox import Email_Outbox  # noqa: F401
 from backend.models.event_registry import Event_Registry  # noqa: F401
+from backend.models.gauge_counters import (  # noqa: F401
+    Gauge_Counter_Deltas,
+    Gauge_Counters,
+    Gauge_Distinct_Refs,
+)
@@ -41,6 +41,9 @@ class Anonymous_Latency_Samples(db.Model):
     __table_args__ = (
         Index("idx_latency_metric_time", "metricName", "observedAt"),
         Index("idx_latency_endpoint_time", "endpoint", "method", "observedAt"),
+        # Leads on observedAt alone: backs the retention prune's range delete
+        # and the admin DB browser's keyset paging by time.
+        Index("idx_latency_observed_at", "observedAt"),
     )
 
     id: int = Column(Integer, primary_key=True)
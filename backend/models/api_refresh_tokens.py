@@ -1,6 +1,7 @@
 from __future__ import annotations
 
 from datetime import datetime
+import hashlib
 from typing import TYPE_CHECKING
 
 from sqlalchemy import (
@@ -23,10 +24,20 @@ if TYPE_CHECKING:
 # module is imported by backend/models/__init__.py, which backend/utils/
 # constants.py itself triggers via its Member_Role import — importing constants
 # back from here would be circular.
-REFRESH_TOKEN_MAX_LENGTH = 128
+REFRESH_TOKEN_HASH_LENGTH = 64  # hex SHA-256 digest length
 FAMILY_ID_LENGTH = 36  # canonical str(uuid.uuid4()) length
 
 
+def hash_refresh_token(token: str) -> str:
+    """SHA-256 hex digest of a refresh token — the only form that is stored.
+
+    Tokens are 384 random bits, so a fast unsalted digest is enough: there is
+    nothing to brute-force, and equal tokens must map to equal digests for the
+    unique-index lookup.
+    """
+    return hashlib.sha256(token.encode("utf-8")).hexdigest()
+
+
 class ApiRefreshTokens(db.Model):
     """A revocable, rotating refresh token for the mobile /api/v1 surface.
 
@@ -35,6 +46,9 @@ class ApiRefreshTokens(db.Model):
     ``rotatedAt``/``replacedBy``. Presenting an already-rotated token is
     treated as theft (reuse detection) and revokes the entire family.
 
+    Only the token's SHA-256 digest is stored (``tokenHash``); presented tokens
+    are hashed and looked up through its unique index.
+
     Uses physical column-name strings in ``__table_args__`` (not
     class-qualified attribute references) because the class object does not
     yet exist when ``__table_args__`` is evaluated; SQLAlchemy resolves these
@@ -44,7 +58,7 @@ class ApiRefreshTokens(db.Model):
 
     __tablename__ = "ApiRefreshTokens"
     __table_args__ = (
-        UniqueConstraint("token", name="unique_api_refresh_token"),
+        UniqueConstraint("tokenHash", name="unique_api_refresh_token_hash"),
         Index("idx_api_refresh_token_user", "userID"),
         Index("idx_api_refresh_token_family", "familyId"),
     )
@@ -56,7 +70,9 @@ class ApiRefreshTokens(db.Model):
         nullable=False,
         name="userID",
     )
-    token: str = Column(String(REFRESH_TOKEN_MAX_LENGTH), nullable=False)
+    token_hash: str = Column(
+        String(REFRESH_TOKEN_HASH_LENGTH), nullable=False, name="tokenHash"
+    )
     family_id: str = Column(String(FAMILY_ID_LENGTH), nullable=False, name="familyId")
     issued_at: datetime = Column(
         DateTime(timezone=True), nullable=False, default=utc_now, name="issuedAt"
@@ -84,7 +100,7 @@ class ApiRefreshTokens(db.Model):
         self, *, user_id: int, token: str, family_id: str, expires_at: datetime
     ) -> None:
         self.user_id = user_id
-        self.token = token
+        self.token_hash = hash_refresh_token(token)
         self.family_id = family_id
         self.expires_at = expires_at
 
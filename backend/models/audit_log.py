@@ -7,6 +7,7 @@ from sqlalchemy import Column, DateTime, ForeignKey, Index, Integer, String, tex
 from sqlalchemy.dialects.postgresql import JSONB
 
 from backend import db
+from backend.models.trigram import trigram_index
 from backend.utils.datetime_utils import utc_now
 
 if TYPE_CHECKING:
@@ -31,14 +32,22 @@ class AuditLog(db.Model):
     """
 
     __tablename__ = "AuditLogs"
-    # Composite index for the audit-log viewer's dominant access pattern:
-    # newest-first time-windowed scans, optionally narrowed by actor.
     __table_args__ = (
+        # Composite index for time-windowed scans narrowed by actor.
         Index(
             "idx_audit_logs_created_at_actor",
             text('"createdAt" DESC'),
             "actorId",
         ),
+        # Matches the audit-log viewer's (createdAt, id) DESC keyset order, so
+        # every page is an index range scan however deep the cursor.
+        Index(
+            "idx_audit_logs_created_at_id",
+            text('"createdAt" DESC'),
+            text("id DESC"),
+        ),
+        # The viewer's "action contains" filter.
+        trigram_index("idx_audit_logs_action_trgm", "action"),
     )
 
     id: int = Column(Integer, primary_key=True)
@@ -0,0 +1,50 @@
+from __future__ import annotations
+
+from datetime import datetime
+
+from sqlalchemy import Column, DateTime, Index, Integer, String, text
+from sqlalchemy.dialects.postgresql import JSONB
+
+from backend import db
+from backend.utils.datetime_utils import utc_now
+
+
+class Email_Outbox(db.Model):
+    """An outbound email waiting to be sent by ``scripts/send_email_outbox.py``.
+
+    Written by ``EmailSender`` in outbox mode inside the caller's transaction,
+    so the email exists if and only if the user/token row it refers to does.
+    ``message`` holds one fully rendered Mailjet v3.1 ``Messages`` entry; the
+    worker has no Flask, so nothing is rendered after enqueueing.
+
+    The worker deletes a row once Mailjet accepts it. A row that Mailjet
+    rejects, or that runs out of retries, gets ``failed_at`` and stays for
+    inspection until the worker's retention purge.
+    """
+
+    __tablename__ = "EmailOutbox"
+    # The worker's claim query: due, not-yet-failed rows in send order.
+    __table_args__ = (
+        Index(
+            "idx_email_outbox_pending",
+            "nextAttemptAt",
+            postgresql_where=text('"failedAt" IS NULL'),
+        ),
+    )
+
+    id: int = Column(Integer, primary_key=True)
+    message: dict = Column(JSONB, nullable=False, name="message")
+    attempts: int = Column(Integer, nullable=False, default=0)
+    next_attempt_at: datetime = Column(
+        DateTime(timezone=True), nullable=False, default=utc_now, name="nextAttemptAt"
+    )
+    last_error: str | None = Column(String(1000), nullable=True, name="lastError")
+    failed_at: datetime | None = Column(
+        DateTime(timezone=True), nullable=True, default=None, name="failedAt"
+    )
+    created_at: datetime = Column(
+        DateTime(timezone=True), nullable=False, default=utc_now, name="createdAt"
+    )
+
+    def __init__(self, message: dict):
+        self.message = message
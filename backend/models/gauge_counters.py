@@ -0,0 +1,129 @@
+from __future__ import annotations
+
+from datetime import datetime
+
+from sqlalchemy import (
+    BigInteger,
+    Column,
+    DateTime,
+    Index,
+    String,
+    Text,
+    event,
+    text,
+)
+from sqlalchemy.engine import Connection
+
+from backend import db
+from backend.metrics.gauges import (
+    GAUGE_COUNTER_DELTAS_TABLE,
+    GAUGE_COUNTERS_TABLE,
+    GAUGE_DISTINCT_REFS_TABLE,
+    GAUGE_REGISTRY,
+    INCREMENTAL_GAUGE_NAMES,
+    build_counter_seed_sql,
+    build_counter_trigger_ddl,
+    build_distinct_refs_rebuild_sql,
+)
+from backend.utils.datetime_utils import utc_now
+
+
+class Gauge_Counters(db.Model):
+    """Base totals for the VOLUME gauges, one row per gauge.
+
+    A gauge's value is this row plus its pending ``Gauge_Counter_Deltas``,
+    which the statement-level triggers generated in
+    ``backend/metrics/gauges.py`` (``build_counter_trigger_ddl``) append, so the
+    gauge sampler reads these rows instead of counting each source table.
+    Each sampler run folds the deltas into these rows, and
+    ``scripts/sample_gauges.py --reconcile`` corrects drift.
+    """
+
+    __tablename__ = GAUGE_COUNTERS_TABLE
+
+    gauge_name: str = Column(String(100), primary_key=True, name="gaugeName")
+    value: int = Column(BigInteger, nullable=False, default=0, name="value")
+    updated_at: datetime = Column(
+        DateTime(timezone=True), nullable=False, default=utc_now, name="updatedAt"
+    )
+
+
+class Gauge_Counter_Deltas(db.Model):
+    """Append-only changes to the ``Gauge_Counters`` totals, one row per
+    source-table write statement.
+
+    Appending instead of updating the shared counter row keeps concurrent
+    writers (signups, UTub/URL creation, bulk imports) from serializing on one
+    row lock.
+    """
+
+    __tablename__ = GAUGE_COUNTER_DELTAS_TABLE
+    __table_args__ = (Index("idx_gauge_counter_deltas_gauge_name", "gaugeName"),)
+
+    id: int = Column(BigInteger, primary_key=True)
+    gauge_name: str = Column(String(100), nullable=False, name="gaugeName")
+    delta: int = Column(BigInteger, nullable=False, name="delta")
+
+
+class Gauge_Distinct_Refs(db.Model):
+    """Per-value reference counts behind a COUNT(DISTINCT ...) VOLUME gauge.
+
+    One row per (gauge, distinct value) holding how many source rows carry the
+    value; the gauge's ``Gauge_Counters`` total only moves when a value's row
+    is created or its count drops to zero (and the row is deleted).
+    """
+
+    __tablename__ = GAUGE_DISTINCT_REFS_TABLE
+
+    gauge_name: str = Column(String(100), primary_key=True, name="gaugeName")
+    distinct_value: str = Column(Text, primary_key=True, name="distinctValue")
+    refs: int = Column(BigInteger, nullable=False, name="refs")
+
+
+def install_gauge_counter_triggers(connection: Connection) -> None:
+    """Install the counter triggers and seed any missing counter rows.
+
+    Idempotent: the functions and triggers are ``CREATE OR REPLACE``, and only
+    gauges without a counter row are seeded (any stale deltas dropped and, for
+    COUNT(DISTINCT ...) gauges, their reference rows rebuilt from the source
+    table first). A no-op outside
+    Postgres, since the triggers rely on plpgsql and transition tables.
+    """
+    if connection.dialect.name != "postgresql":
+        return
+    for statement in build_counter_trigger_ddl():
+        connection.execute(text(statement))
+    for gauge_name in INCREMENTAL_GAUGE_NAMES:
+        has_counter = connection.execute(
+            text(
+                f'SELECT 1 FROM "{GAUGE_COUNTERS_TABLE}" '
+                'WHERE "gaugeName" = :gauge_name'
+            ),
+            {"gauge_name": gauge_name.value},
+        ).first()
+        if has_counter is not None:
+            continue
+        connection.execute(
+            text(
+                f'DELETE FROM "{GAUGE_COUNTER_DELTAS_TABLE}" '
+                'WHERE "gaugeName" = :gauge_name'
+            ),
+            {"gauge_name": gauge_name.value},
+        )
+        if GAUGE_REGISTRY[gauge_name].distinct_column is not None:
+            connection.execute(
+                text(
+                    f'DELETE FROM "{GAUGE_DISTINCT_REFS_TABLE}" '
+                    'WHERE "gaugeName" = :gauge_name'
+                ),
+                {"gauge_name": gauge_name.value},
+            )
+            connection.execute(text(build_distinct_refs_rebuild_sql(gauge_name)))
+        connection.execute(text(build_counter_seed_sql(gauge_name)))
+
+
+@event.listens_for(db.metadata, "after_create")
+def _install_gauge_counter_triggers_after_create(target, connection, **kw) -> None:
+    """Give ``db.create_all()`` schemas (tests, fresh dev DBs) the same triggers
+    the Alembic migration installs."""
+    install_gauge_counter_triggers(connection)
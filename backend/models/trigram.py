@@ -0,0 +1,33 @@
+from __future__ import annotations
+
+from sqlalchemy import Index, event, text
+
+from backend import db
+
+PG_TRGM_EXTENSION_SQL: str = "CREATE EXTENSION IF NOT EXISTS pg_trgm"
+
+
+def trigram_index(index_name: str, column_name: str) -> Index:
+    """A GIN ``gin_trgm_ops`` index on ``column_name``.
+
+    Serves the admin portal's case-insensitive substring filters
+    (``ILIKE '%query%'``), which a B-tree cannot: Postgres matches the
+    pattern's trigrams against the index and rechecks only the candidate rows.
+    Patterns shorter than three characters still scan. The same index serves
+    the ``%`` similarity operator behind the ranked user search.
+    """
+    return Index(
+        index_name,
+        column_name,
+        postgresql_using="gin",
+        postgresql_ops={column_name: "gin_trgm_ops"},
+    )
+
+
+@event.listens_for(db.metadata, "before_create")
+def _install_pg_trgm_before_create(target, connection, **kw) -> None:
+    """Give ``db.create_all()`` schemas (tests, fresh dev DBs) the ``pg_trgm``
+    extension the Alembic migration installs, ahead of the indexes using it."""
+    if connection.dialect.name != "postgresql":
+        return
+    connection.execute(text(PG_TRGM_EXTENSION_SQL))
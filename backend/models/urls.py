@@ -1,18 +1,43 @@
-from sqlalchemy import Column, DateTime, ForeignKey, Integer, String
+from __future__ import annotations
+
+import hashlib
+
+from sqlalchemy import Column, DateTime, ForeignKey, Index, Integer, LargeBinary, String
 
 from backend import db
+from backend.models.trigram import trigram_index
 from backend.utils.datetime_utils import utc_now
 
 
+def digest_url_string(url_string: str) -> bytes:
+    """SHA-256 of the normalized URL string; the fixed-width lookup key for `Urls`.
+
+    Must stay byte-for-byte identical to the SQL backfill expression
+    `sha256(convert_to("urlString", 'UTF8'))`.
+    """
+    return hashlib.sha256(url_string.encode("utf-8")).digest()
+
+
 class Urls(db.Model):
     """Class represents a URL. A URL is added by a single user, but can be used generically across multiple UTubs if it's already
-    stored in the server."""
+    stored in the server.
+
+    URL strings run up to 8000 characters, too wide for a B-tree, so uniqueness
+    and lookups go through the fixed-width `url_digest` instead. Use
+    `find_by_url_string` rather than filtering on `url_string` directly.
+    """
 
     __tablename__ = "Urls"
+    __table_args__ = (
+        Index("idx_urls_url_digest", "urlDigest", unique=True),
+        trigram_index("idx_urls_url_string_trgm", "urlString"),
+    )
+
     id: int = Column(Integer, primary_key=True)
     url_string: str = Column(
-        String(8000), nullable=False, unique=True, name="urlString"
+        String(8000), nullable=False, name="urlString"
     )  # Note that multiple UTubs can have the same URL
+    url_digest: bytes = Column(LargeBinary(32), nullable=False, name="urlDigest")
     created_by: int = Column(
         Integer, ForeignKey("Users.id"), nullable=False, name="createdBy"
     )
@@ -22,4 +47,14 @@ class Urls(db.Model):
 
     def __init__(self, normalized_url: str, current_user_id: int):
         self.url_string = normalized_url
+        self.url_digest = digest_url_string(normalized_url)
         self.created_by = int(current_user_id)
+
+    @staticmethod
+    def find_by_url_string(url_string: str) -> Urls | None:
+        # The digest probes the unique index; comparing the string as well
+        # rules out a (theoretical) digest collision returning the wrong row.
+        return Urls.query.filter(
+            Urls.url_digest == digest_url_string(url_string),
+            Urls.url_string == url_string,
+        ).first()
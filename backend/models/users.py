@@ -15,11 +15,12 @@ from sqlalchemy import (
     String,
     text,
 )
-from werkzeug.security import check_password_hash, generate_password_hash
 
 from backend import db
+from backend.extensions.password_hashing import get_password_hasher
 from backend.models.email_validations import Email_Validations
 from backend.models.forgot_passwords import Forgot_Passwords
+from backend.models.trigram import trigram_index
 from backend.models.user_oauth_identities import UserOAuthIdentity
 from backend.models.utub_members import Utub_Members
 from backend.utils.constants import EMAIL_CONSTANTS, USER_CONSTANTS
@@ -41,6 +42,11 @@ class Users(db.Model, UserMixin):
     # TODO - Verify email cannot be used as password
 
     __tablename__ = "Users"
+    # Admin-portal substring filters (audit-log actor filter) over both columns
+    __table_args__ = (
+        trigram_index("idx_users_username_trgm", "username"),
+        trigram_index("idx_users_email_trgm", "email"),
+    )
     id: int = Column(Integer, primary_key=True)
     username: str = Column(
         String(USER_CONSTANTS.MAX_USERNAME_LENGTH_ACTUAL), unique=True, nullable=False
@@ -114,22 +120,32 @@ class Users(db.Model, UserMixin):
         self.username = username
         self.email: str = email.lower()
         self.password = (
-            generate_password_hash(plaintext_password)
+            get_password_hasher().hash_password(plaintext_password)
             if plaintext_password is not None
             else None
         )
         self._email_confirmed = False
 
     def is_password_correct(self, plaintext_password: str) -> bool:
+        """
+        Verify a plaintext password against the stored hash. On a match, a hash
+        made with an outdated method or cost is replaced with one made with the
+        configured method; the caller's next commit persists it.
+        """
         if self.password is None:
             return False
-        return check_password_hash(self.password, plaintext_password)
+        password_hasher = get_password_hasher()
+        if not password_hasher.verify_password(self.password, plaintext_password):
+            return False
+        if password_hasher.needs_rehash(self.password):
+            self.password = password_hasher.hash_password(plaintext_password)
+        return True
 
     def is_admin(self) -> bool:
         return self.role == User_Role.ADMIN
 
     def change_password(self, new_plaintext_password: str):
-        self.password = generate_password_hash(new_plaintext_password)
+        self.password = get_password_hasher().hash_password(new_plaintext_password)
 
     def validate_email(self):
         self.email_validated = True
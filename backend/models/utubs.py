@@ -3,6 +3,7 @@ from datetime import datetime
 from sqlalchemy import Boolean, Column, DateTime, ForeignKey, Integer, String, text
 
 from backend import db
+from backend.models.trigram import trigram_index
 from backend.models.utub_members import Utub_Members
 from backend.models.utub_urls import Utub_Urls
 from backend.models.utub_tags import Utub_Tags
@@ -15,6 +16,10 @@ class Utubs(db.Model):
     is shared with. The UTub contains a set of URL's and their associated tags."""
 
     __tablename__ = "Utubs"
+    __table_args__ = (
+        trigram_index("idx_utubs_utub_name_trgm", "utubName"),
+        trigram_index("idx_utubs_utub_description_trgm", "utubDescription"),
+    )
     id: int = Column(Integer, primary_key=True)
     name: str = Column(
         String(UTUB_CONSTANTS.MAX_NAME_LENGTH), nullable=False, name="utubName"
@@ -6,6 +6,8 @@ from flask import jsonify
 from pydantic import Field
 
 from backend.api_common.responses import FlaskResponse
+from backend.extensions.request_timing import request_phase
+from backend.metrics.latency import LatencyMetricName
 from backend.schemas.base import BaseSchema
 from backend.utils.strings.json_strs import STD_JSON_RESPONSE as STD_JSON
 from backend.utils.strings.url_strs import URL_FAILURE
@@ -42,8 +44,9 @@ class ErrorResponse(BaseSchema):
     )
 
     def to_response(self, status_code: int) -> FlaskResponse:
-        payload = self.model_dump(by_alias=True, exclude_none=True)
-        return jsonify(payload), status_code
+        with request_phase(LatencyMetricName.SERIALIZE_DURATION):
+            payload = self.model_dump(by_alias=True, exclude_none=True)
+            return jsonify(payload), status_code
 
 
 def build_field_error_response(
@@ -460,11 +460,18 @@ class GaugesTimeseriesQuerySchema(BaseModel):
         return self
 
 
-# Latency `metric_name` filter. Only `api_request_duration` exists today; binding
-# to a Literal (rather than `str`) keeps the wire contract and OpenAPI surface in
-# lockstep with `LatencyMetricName` while rejecting unknown metric names at the
-# schema layer. `None` defaults to the sole metric at the route layer.
-LatencyMetricNameLiteral = Literal["api_request_duration"]
+# Latency `metric_name` filter. Binding to a Literal (rather than `str`) keeps
+# the wire contract and OpenAPI surface in lockstep with `LatencyMetricName`
+# while rejecting unknown metric names at the schema layer. `None` defaults to
+# `api_request_duration` at the route layer.
+LatencyMetricNameLiteral = Literal[
+    "api_request_duration",
+    "password_hash_duration",
+    "db_query_duration",
+    "auth_duration",
+    "serialize_duration",
+    "hooks_duration",
+]
 
 
 class LatencyQuerySchema(BaseModel):
@@ -510,8 +517,8 @@ class LatencyQuerySchema(BaseModel):
     @field_validator("metric_name", mode="before")
     @classmethod
     def _default_metric_name(cls, raw_metric_name: object) -> object:
-        # An absent or explicit-null `metric_name` resolves to the sole latency
-        # metric, so the route layer can consume the field unconditionally.
+        # An absent or explicit-null `metric_name` resolves to the request
+        # latency metric, so the route layer can consume the field unconditionally.
         if raw_metric_name is None:
             return LatencyMetricName.API_REQUEST_DURATION.value
         return raw_metric_name
@@ -562,8 +569,8 @@ class LatencyTimeseriesQuerySchema(BaseModel):
     @field_validator("metric_name", mode="before")
     @classmethod
     def _default_metric_name(cls, raw_metric_name: object) -> object:
-        # An absent or explicit-null `metric_name` resolves to the sole latency
-        # metric, so the route layer can consume the field unconditionally.
+        # An absent or explicit-null `metric_name` resolves to the request
+        # latency metric, so the route layer can consume the field unconditionally.
         if raw_metric_name is None:
             return LatencyMetricName.API_REQUEST_DURATION.value
         return raw_metric_name
@@ -1,5 +1,5 @@
 from __future__ import annotations
-from pydantic import BaseModel, Field, field_validator
+from pydantic import BaseModel, Field, field_validator, model_validator
 from backend.utils.constants import TAG_CONSTANTS, URL_CONSTANTS
 from backend.utils.strings.url_strs import URL_FAILURE
 from backend.schemas.requests._sanitize import SanitizedStr
@@ -62,3 +62,44 @@ class UpdateURLTitleRequest(BaseModel):
         if not stripped:
             raise ValueError(URL_FAILURE.INVALID_INPUT)
         return stripped
+
+
+class ImportURLItem(BaseModel):
+    """One URL to import. Validated per item by the import service, so a bad
+    entry is reported in the results instead of failing the whole request."""
+
+    urlString: str = Field(
+        max_length=URL_CONSTANTS.MAX_URL_LENGTH,
+        description="URL string to import",
+        examples=["https://example.com"],
+    )
+    urlTitle: str | None = Field(
+        default=None,
+        description="Display title; defaults to the URL when missing or empty",
+    )
+    tagStrings: list[str] = Field(
+        default_factory=list,
+        description="Optional tags to apply to the imported URL",
+        examples=[["python", "web"]],
+    )
+
+
+class ImportURLRequest(BaseModel):
+    urls: list[ImportURLItem] | None = Field(
+        default=None,
+        description="URLs to import, at most "
+        f"{URL_CONSTANTS.MAX_IMPORT_URLS}; mutually exclusive with bookmarksHtml",
+    )
+    bookmarksHtml: str | None = Field(
+        default=None,
+        min_length=1,
+        max_length=URL_CONSTANTS.MAX_IMPORT_HTML_LENGTH,
+        description="Netscape bookmarks file exported by a browser; mutually "
+        "exclusive with urls",
+    )
+
+    @model_validator(mode="after")
+    def exactly_one_source(self) -> ImportURLRequest:
+        if (self.urls is None) == (self.bookmarksHtml is None):
+            raise ValueError(URL_FAILURE.IMPORT_NEEDS_ONE_SOURCE)
+        return self
@@ -6,6 +6,7 @@ from pydantic import ConfigDict, Field
 
 from backend.schemas.base import BaseSchema
 from backend.schemas.tags import UtubTagOnAddDeleteSchema, UtubTagSchema
+from backend.urls.constants import URLImportStatus
 from backend.utils.strings.model_strs import ADDED_BY, TAG_COUNTS_MODIFIED
 from backend.utils.strings.model_strs import MODELS as M
 from backend.utils.strings.utub_strs import UTUB_ID, UTUB_NAME
@@ -148,5 +149,42 @@ class UrlUpdatedResponseSchema(BaseSchema):
     )
 
 
+class UrlImportResultSchema(BaseSchema):
+    index: int = Field(
+        alias=M.IMPORT_INDEX,
+        description="Position of the item in the submitted list or bookmarks file",
+    )
+    url_string: str = Field(
+        alias=M.URL_STRING,
+        description="Normalized URL string, or the submitted string if invalid",
+    )
+    status: URLImportStatus = Field(
+        alias=M.IMPORT_STATUS, description="Outcome of importing this item"
+    )
+    utub_url_id: int | None = Field(
+        default=None,
+        alias=M.UTUB_URL_ID,
+        description="ID of the URL within the UTub when added or already present",
+    )
+    detail: str | None = Field(
+        default=None,
+        alias=M.IMPORT_DETAIL,
+        description="Why the item was rejected, for invalid items",
+    )
+
+
+class UrlImportResponseSchema(BaseSchema):
+    utub_id: int = Field(
+        alias=UTUB_ID, description="ID of the UTub the URLs were imported into"
+    )
+    added_count: int = Field(
+        alias=M.ADDED_COUNT, description="Number of URLs added to the UTub"
+    )
+    results: list[UrlImportResultSchema] = Field(
+        alias=M.IMPORT_RESULTS,
+        description="Per-item outcome, in submission order",
+    )
+
+
 UtubUrlSchema.model_rebuild()
 UtubUrlDetailSchema.model_rebuild()
@@ -75,7 +75,10 @@ def send_forgot_password_email_to_user(
                     flush=True,
                 )
             email_send_result = email_sender.send_oauth_provider_hint_email(
-                user_with_email.email, user_with_email.username, provider_names
+                user_with_email.email,
+                user_with_email.username,
+                provider_names,
+                commit_session=True,
             )
             if email_send_result.status_code >= 500:
                 return handle_mailjet_failure(
@@ -161,7 +164,6 @@ def _send_forgot_password_email(
     """
 
     forgot_password_obj.increment_attempts()
-    db.session.commit()
 
     email_sender = safe_get_email_sender(current_app)
     if not email_sender.is_production() and not email_sender.is_testing():
@@ -174,10 +176,12 @@ def _send_forgot_password_email(
         token=forgot_password_obj.reset_token,
         _external=True,
     )
+    # Commits the attempt count, with the queued email in outbox mode
     email_send_result = email_sender.send_password_reset_email(
         email.lower(),
         user.username,
         url_for_reset,
+        commit_session=True,
     )
 
     return email_send_result
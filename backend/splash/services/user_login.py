@@ -1,9 +1,10 @@
 from urllib.parse import parse_qs, urlencode, urlparse
 from flask import request, url_for
 from flask_login import current_user, login_user
-from werkzeug.security import check_password_hash, generate_password_hash
+from backend import db
 from backend.api_common.responses import APIResponse, FlaskResponse
 from backend.app_logger import safe_add_log, warning_log
+from backend.extensions.password_hashing import get_password_hasher
 from backend.extensions.metrics.writer import record_event
 from backend.metrics.events import EventName
 from backend.models.users import Users
@@ -25,8 +26,6 @@ from backend.utils.all_routes import ROUTES
 from backend.utils.strings.user_strs import USER_FAILURE
 from backend.utils.strings.utub_strs import UTUB_ID_QUERY_PARAM
 
-DUMMY_HASH = generate_password_hash("__dummy__")
-
 
 def login_user_to_u4i(username: str, password: str) -> FlaskResponse:
     user: Users | None = Users.query.filter(Users.username == username).first()
@@ -53,10 +52,11 @@ def login_user_to_u4i(username: str, password: str) -> FlaskResponse:
         # an attacker cannot fingerprint password-less (OAuth-only) accounts. The
         # OAuth steer lives in the shared INVALID_PASSWORD message every failed
         # login sees; only the internal metrics reason distinguishes this case.
-        # Spend the same bcrypt time the wrong-password branch does so the two
-        # branches are indistinguishable by wall-clock latency as well as bytes.
-        # The result is intentionally discarded — only the elapsed time matters.
-        check_password_hash(DUMMY_HASH, password)
+        # Spend the same KDF time (and hashing slot) the wrong-password branch
+        # does so the two branches are indistinguishable by wall-clock latency
+        # as well as bytes. The result is intentionally discarded — only the
+        # elapsed time matters.
+        get_password_hasher().verify_dummy_password(password)
         return build_field_error_response(
             message=USER_FAILURE.UNABLE_TO_LOGIN,
             errors={"password": [USER_FAILURE.INVALID_PASSWORD]},
@@ -75,6 +75,10 @@ def login_user_to_u4i(username: str, password: str) -> FlaskResponse:
             error_code=LoginErrorCodes.INVALID_FORM_INPUT,
         )
 
+    if db.session.is_modified(user):
+        # is_password_correct replaced an outdated password hash
+        db.session.commit()
+
     if user.is_suspended:
         # Blocked BEFORE login_user(): a suspended user never reaches an
         # authenticated session. Only a correct password reaches this branch,
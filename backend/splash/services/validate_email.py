@@ -50,9 +50,9 @@ def send_validation_email_to_user() -> WerkzeugResponse | FlaskResponse:
         return build_response_for_max_email_attempts_sent()
 
     has_more_attempts = current_email_validation.increment_attempt()
-    db.session.commit()
 
     if not has_more_attempts:
+        db.session.commit()
         return build_response_for_email_attempts_rate_limited(current_email_validation)
 
     email_sender = safe_get_email_sender(current_app)
@@ -65,8 +65,12 @@ def send_validation_email_to_user() -> WerkzeugResponse | FlaskResponse:
         _external=True,
     )
 
+    # Commits the attempt count, with the queued email in outbox mode
     email_send_result = email_sender.send_account_email_confirmation(
-        current_user.email, current_user.username, url_for_confirmation
+        current_user.email,
+        current_user.username,
+        url_for_confirmation,
+        commit_session=True,
     )
 
     return handle_email_sending_result(email_send_result)
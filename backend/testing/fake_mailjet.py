@@ -0,0 +1,41 @@
+from __future__ import annotations
+
+# Stand-in for Mailjet's v3.1 send endpoint, shaped as the transport that
+# `scripts/send_email_outbox.py::run_send` takes, so outbox tests never reach
+# the network. Answers each message the way Mailjet does — a `Status` plus the
+# echoed `CustomID` — and can be told to reject addresses or to be unreachable.
+
+
+class FakeMailjet:
+    def __init__(self) -> None:
+        self.sent_messages: list[dict] = []
+        self.request_count = 0
+        self.rejected_addresses: set[str] = set()
+        self.unavailable = False
+
+    def __call__(self, messages: list[dict]) -> list[dict]:
+        self.request_count += 1
+        if self.unavailable:
+            raise ConnectionError("Fake Mailjet is unavailable")
+        return [self._answer(message) for message in messages]
+
+    def _answer(self, message: dict) -> dict:
+        recipients = [to_block["Email"] for to_block in message.get("To", [])]
+        if any(recipient in self.rejected_addresses for recipient in recipients):
+            return {
+                "Status": "error",
+                "CustomID": message.get("CustomID", ""),
+                "Errors": [
+                    {
+                        "ErrorCode": "mj-0013",
+                        "StatusCode": 400,
+                        "ErrorMessage": f"{recipients[0]} is an invalid email address.",
+                    }
+                ],
+            }
+        self.sent_messages.append(message)
+        return {
+            "Status": "success",
+            "CustomID": message.get("CustomID", ""),
+            "To": [{"Email": recipient} for recipient in recipients],
+        }
@@ -1,4 +1,4 @@
-from enum import IntEnum
+from enum import IntEnum, StrEnum
 
 
 class URLErrorCodes(IntEnum):
@@ -10,6 +10,7 @@ class URLErrorCodes(IntEnum):
     URL_ALREADY_IN_UTUB_ERROR = 6
     EMPTY_URL = 7
     UTUB_IS_LOCKED = 8
+    TOO_MANY_IMPORT_URLS = 9
 
 
 class URLState(IntEnum):
@@ -24,3 +25,11 @@ class URLNormalizationResult(IntEnum):
     INVALID_CREDENTIALS_URL = 2
     INVALID_URL = 3
     UNKNOWN_FAILURE_URL = 4
+
+
+class URLImportStatus(StrEnum):
+    ADDED = "added"
+    ALREADY_IN_UTUB = "alreadyInUtub"
+    DUPLICATE_IN_IMPORT = "duplicateInImport"
+    INVALID_URL = "invalidUrl"
+    INVALID_TAGS = "invalidTags"
@@ -12,12 +12,14 @@ from backend.models.utubs import Utubs
 from backend.schemas.errors import ErrorResponse
 from backend.schemas.requests.urls import (
     CreateURLRequest,
+    ImportURLRequest,
     UpdateURLStringRequest,
     UpdateURLTitleRequest,
 )
 from backend.schemas.urls import (
     UrlCreatedResponseSchema,
     UrlDeletedResponseSchema,
+    UrlImportResponseSchema,
     UrlReadResponseSchema,
     UrlTitleUpdatedResponseSchema,
     UrlUpdatedResponseSchema,
@@ -25,6 +27,7 @@ from backend.schemas.urls import (
 from backend.urls.constants import URLErrorCodes
 from backend.urls.services.create_urls import create_url_in_utub
 from backend.urls.services.delete_urls import delete_url_in_utub
+from backend.urls.services.import_urls import import_candidates_from_request
 from backend.urls.services.read_urls import get_url_in_utub
 from backend.urls.services.update_url_titles import update_url_title_if_new
 from backend.urls.services.update_urls import update_url_in_utub
@@ -71,6 +74,34 @@ def create_url(
     )
 
 
+@urls.route("/utubs/<int:utub_id>/urls/import", methods=["POST"])
+@utub_membership_required
+@api_route(
+    request_schema=ImportURLRequest,
+    response_schema=UrlImportResponseSchema,
+    error_message=URL_FAILURE.UNABLE_TO_IMPORT_URLS_FORM,
+    error_code=URLErrorCodes.INVALID_FORM_INPUT,
+    tags=[OPEN_API.URLS],
+    description="Import many URLs into a UTub from a list or a bookmarks file",
+    status_codes={
+        200: UrlImportResponseSchema,
+        400: ErrorResponse,
+        404: ErrorResponse,
+    },
+)
+def import_urls(
+    utub_id: int, current_utub: Utubs, import_url_request: ImportURLRequest
+) -> FlaskResponse:
+    """
+    User wants to add many URLs to a UTub at once. Each URL is reported as
+    added, already in the UTub, a duplicate within the import, or invalid.
+
+    Args:
+        utub_id (int): The Utubs to import the URLs into
+    """
+    return import_candidates_from_request(current_utub, import_url_request)
+
+
 @urls.route("/utubs/<int:utub_id>/urls/<int:utub_url_id>", methods=["GET"])
 @utub_membership_with_valid_url_in_utub_required
 @api_route(
@@ -183,7 +183,7 @@ def get_or_create_url(url_string: str) -> tuple[Urls, URLState]:
         - Urls: The URL (existing or newly created) model in the database
         - URLState: Either URLState.EXISTING_URL or URLState.FRESH_URL
     """
-    already_created_url: Urls = Urls.query.filter(Urls.url_string == url_string).first()
+    already_created_url = Urls.find_by_url_string(url_string)
 
     if already_created_url:
         return already_created_url, URLState.EXISTING_URL_IN_U4I
@@ -250,13 +250,7 @@ def _normalize_and_validate_url(url_string: str | None) -> NormalizedUrl:
     input_url = "" if not url_string else url_string
 
     try:
-        normalized_url = url_validator.normalize_url(url_string)
-
-        normalized_time = (time.perf_counter() - start) * 1000
-
-        validated_ada_url = url_validator.validate_url(normalized_url)
-
-        validation_time = (time.perf_counter() - start) * 1000
+        validated_ada_url = url_validator.process(url_string).raise_for_error()
 
     except URLWithCredentialsError as e:
         return NormalizedUrl(
@@ -286,8 +280,6 @@ def _normalize_and_validate_url(url_string: str | None) -> NormalizedUrl:
     safe_add_many_logs(
         [
             f"Finished checks for {url_string=}",
-            f"Took {normalized_time:.3f} ms for normalization",
-            f"Took {(validation_time - normalized_time):.3f} ms total for validation",
             f"Took {total_time:.3f} ms total",
         ]
     )
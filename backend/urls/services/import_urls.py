@@ -0,0 +1,558 @@
+from __future__ import annotations
+
+from dataclasses import dataclass, field
+from html.parser import HTMLParser
+import time
+from typing import Iterator, Sequence, TypeVar
+
+from flask import current_app
+from flask_login import current_user
+from sqlalchemy.dialects.postgresql import insert as pg_insert
+
+from backend import db
+from backend.api_common.input_sanitization import sanitize_user_input
+from backend.api_common.responses import APIResponse, FlaskResponse
+from backend.app_logger import safe_add_many_logs, warning_log
+from backend.extensions.extension_utils import safe_get_url_validator
+from backend.extensions.metrics.writer import record_event
+from backend.extensions.url_validation.url_validator import (
+    URLWithCredentialsError,
+)
+from backend.metrics.events import EventName
+from backend.metrics.tag_batch import bucket_url_tag_count
+from backend.models.urls import digest_url_string, Urls
+from backend.models.utub_tags import Utub_Tags
+from backend.models.utub_url_tags import Utub_Url_Tags
+from backend.models.utub_urls import Utub_Urls
+from backend.models.utubs import Utubs
+from backend.schemas.errors import build_message_error_response
+from backend.schemas.requests.tags import validate_tag_strings
+from backend.schemas.requests.urls import ImportURLRequest
+from backend.schemas.urls import UrlImportResponseSchema, UrlImportResultSchema
+from backend.urls.constants import URLErrorCodes, URLImportStatus
+from backend.utils.constants import TAG_CONSTANTS, URL_CONSTANTS
+from backend.utils.strings.url_strs import URL_FAILURE, URL_SUCCESS
+from backend.utubs.guards import reject_if_utub_locked
+
+# Rows per multi-row INSERT / IN (...) lookup. Keeps each statement well under
+# PostgreSQL's 65535 bind-parameter ceiling (Utub_Urls binds 6 per row).
+_IMPORT_BATCH_SIZE = 500
+
+_T = TypeVar("_T")
+
+
+@dataclass(frozen=True)
+class ImportCandidate:
+    """One URL to import, as submitted (JSON item or bookmarks anchor)."""
+
+    url_string: str
+    url_title: str | None = None
+    tag_strings: list[str] = field(default_factory=list)
+
+
+@dataclass
+class _PreparedImport:
+    index: int
+    url_string: str
+    url_title: str
+    tag_strings: list[str]
+    had_tracking: bool
+
+
+class _NetscapeBookmarksParser(HTMLParser):
+    """Collects `<A HREF="..." TAGS="a,b">title</A>` anchors in document order.
+
+    Folder structure (`<DL>`/`<H3>`) is ignored; the browser-exported `TAGS`
+    attribute (Firefox) becomes the item's tags.
+    """
+
+    def __init__(self) -> None:
+        super().__init__(convert_charrefs=True)
+        self.candidates: list[ImportCandidate] = []
+        self._open_href: str | None = None
+        self._open_tags: list[str] = []
+        self._title_parts: list[str] = []
+
+    def handle_starttag(self, tag: str, attrs: list[tuple[str, str | None]]) -> None:
+        if tag != "a":
+            return
+        attr_map = dict(attrs)
+        href = attr_map.get("href")
+        if not href:
+            return
+        raw_tags = attr_map.get("tags") or ""
+        self._open_href = href
+        self._open_tags = [
+            tag_string.strip()
+            for tag_string in raw_tags.split(",")
+            if tag_string.strip()
+        ]
+        self._title_parts = []
+
+    def handle_data(self, data: str) -> None:
+        if self._open_href is not None:
+            self._title_parts.append(data)
+
+    def handle_endtag(self, tag: str) -> None:
+        if tag != "a" or self._open_href is None:
+            return
+        self.candidates.append(
+            ImportCandidate(
+                url_string=self._open_href,
+                url_title="".join(self._title_parts),
+                tag_strings=self._open_tags,
+            )
+        )
+        self._open_href = None
+
+
+def parse_netscape_bookmarks(bookmarks_html: str) -> list[ImportCandidate]:
+    """
+    Extract the bookmarked URLs from a browser-exported Netscape bookmarks file.
+
+    Args:
+        bookmarks_html (str): Contents of the bookmarks HTML file
+
+    Returns:
+        list[ImportCandidate]: One candidate per bookmark anchor, in file order
+    """
+    parser = _NetscapeBookmarksParser()
+    parser.feed(bookmarks_html)
+    parser.close()
+    return parser.candidates
+
+
+def import_candidates_from_request(
+    current_utub: Utubs, import_url_request: ImportURLRequest
+) -> FlaskResponse:
+    """
+    Imports the URLs carried by an import request, from either its URL list or
+    its bookmarks file.
+
+    Args:
+        current_utub (Utubs): The UTub to import the URLs into
+        import_url_request (ImportURLRequest): The validated request body
+
+    Returns:
+        tuple[Response, int]: See import_urls_into_utub
+    """
+    if import_url_request.bookmarksHtml is not None:
+        candidates = parse_netscape_bookmarks(import_url_request.bookmarksHtml)
+    else:
+        candidates = [
+            ImportCandidate(
+                url_string=url_item.urlString,
+                url_title=url_item.urlTitle,
+                tag_strings=url_item.tagStrings,
+            )
+            for url_item in import_url_request.urls or []
+        ]
+    return import_urls_into_utub(current_utub, candidates)
+
+
+def import_urls_into_utub(
+    current_utub: Utubs, candidates: list[ImportCandidate]
+) -> FlaskResponse:
+    """
+    Imports many URLs into a UTub at once, reporting an outcome per item.
+
+    Every candidate is normalized and validated in memory first; invalid URLs
+    or tags, and repeats of an earlier candidate, are reported without touching
+    the database. The survivors are then written set-based inside a single
+    transaction: `Urls` are upserted, `Utub_Urls` rows inserted for URLs not
+    already in the UTub, and tags created and applied, each in batches.
+
+    Args:
+        current_utub (Utubs): The UTub to import the URLs into
+        candidates (list[ImportCandidate]): The URLs to import, in submission order
+
+    Returns:
+        tuple[Response, int]:
+        - Response: JSON response with the per-item results
+        - int: HTTP status code 200 (Success), or 400 if too many URLs were
+          submitted or the UTub is locked
+    """
+    utub_locked_error: FlaskResponse | None = reject_if_utub_locked(
+        current_utub, error_code=URLErrorCodes.UTUB_IS_LOCKED
+    )
+    if utub_locked_error is not None:
+        return utub_locked_error
+
+    if len(candidates) > URL_CONSTANTS.MAX_IMPORT_URLS:
+        warning_log(
+            f"User={current_user.id} tried importing {len(candidates)} URLs "
+            f"into UTub.id={current_utub.id}"
+        )
+        return build_message_error_response(
+            message=URL_FAILURE.TOO_MANY_IMPORT_URLS,
+            error_code=URLErrorCodes.TOO_MANY_IMPORT_URLS,
+            status_code=400,
+        )
+
+    start = time.perf_counter()
+    results: dict[int, UrlImportResultSchema] = {}
+    prepared = _prepare_candidates(candidates, results)
+    validation_time = (time.perf_counter() - start) * 1000
+
+    added: list[tuple[_PreparedImport, int]] = []
+    applied_tag_count = 0
+    if prepared:
+        try:
+            added, applied_tag_count = _write_import(current_utub, prepared, results)
+            if added:
+                current_utub.set_last_updated()
+            db.session.commit()
+        except Exception as exc:
+            db.session.rollback()
+            warning_log(
+                f"URL import failed | UTub.id={current_utub.id} "
+                f"| CandidateCount={len(candidates)} "
+                f"| error_type={type(exc).__name__}"
+            )
+            raise
+
+    for prepared_import, _ in added:
+        record_event(
+            EventName.URL_ADDED_TO_UTUB,
+            dimensions={
+                "tag_count_bucket": bucket_url_tag_count(
+                    len(prepared_import.tag_strings)
+                )
+            },
+        )
+        record_event(
+            EventName.URL_TRACKING_PARAMS_STRIPPED,
+            dimensions={
+                "stripped": "true" if prepared_import.had_tracking else "false"
+            },
+        )
+    for _ in range(applied_tag_count):
+        record_event(EventName.TAG_APPLIED)
+
+    safe_add_many_logs(
+        [
+            "Imported URLs into UTub",
+            f"UTub.id={current_utub.id}",
+            f"Submitted={len(candidates)} | Added={len(added)}",
+            f"Took {validation_time:.3f} ms for validation",
+            f"Took {(time.perf_counter() - start) * 1000:.3f} ms total",
+        ]
+    )
+
+    return APIResponse(
+        message=URL_SUCCESS.URLS_IMPORTED,
+        data=UrlImportResponseSchema(
+            utub_id=current_utub.id,
+            added_count=len(added),
+            results=[results[index] for index in range(len(candidates))],
+        ),
+    ).to_response()
+
+
+def _prepare_candidates(
+    candidates: list[ImportCandidate],
+    results: dict[int, UrlImportResultSchema],
+) -> list[_PreparedImport]:
+    """
+    Validate and de-duplicate the candidates without touching the database.
+
+    Rejected candidates get their final result recorded in `results`; the rest
+    are returned, keyed by normalized URL so each URL is written at most once.
+    """
+    url_validator = safe_get_url_validator(current_app)
+    prepared_by_url: dict[str, _PreparedImport] = {}
+
+    for index, candidate in enumerate(candidates):
+        try:
+            validation_result = url_validator.process(candidate.url_string)
+            validated_url = validation_result.raise_for_error()
+        except URLWithCredentialsError:
+            results[index] = _rejected_result(
+                index,
+                candidate.url_string,
+                URLImportStatus.INVALID_URL,
+                URL_FAILURE.URLS_WITH_CREDENTIALS_EXCEPTION,
+            )
+            continue
+        # Broad catch mirrors _normalize_and_validate_url: any validator failure
+        # rejects this item only, never the whole import.
+        except Exception as exc:
+            results[index] = _rejected_result(
+                index, candidate.url_string, URLImportStatus.INVALID_URL, str(exc)
+            )
+            continue
+
+        if len(validated_url) > URL_CONSTANTS.MAX_URL_LENGTH:
+            results[index] = _rejected_result(
+                index,
+                candidate.url_string,
+                URLImportStatus.INVALID_URL,
+                URL_FAILURE.UNABLE_TO_VALIDATE_THIS_URL,
+            )
+            continue
+
+        tag_strings = _clean_tag_strings(candidate.tag_strings)
+        if tag_strings is None:
+            results[index] = _rejected_result(
+                index,
+                validated_url,
+                URLImportStatus.INVALID_TAGS,
+                URL_FAILURE.INVALID_IMPORT_TAGS,
+            )
+            continue
+
+        if validated_url in prepared_by_url:
+            results[index] = _rejected_result(
+                index, validated_url, URLImportStatus.DUPLICATE_IN_IMPORT
+            )
+            continue
+
+        prepared_by_url[validated_url] = _PreparedImport(
+            index=index,
+            url_string=validated_url,
+            url_title=_clean_url_title(candidate.url_title, validated_url),
+            tag_strings=tag_strings,
+            had_tracking=validation_result.had_tracking,
+        )
+
+    return list(prepared_by_url.values())
+
+
+def _clean_url_title(url_title: str | None, url_string: str) -> str:
+    """
+    Lenient counterpart of the create-URL title validation: markup is stripped
+    rather than rejected and long titles are truncated, since bookmark titles
+    are page titles the user never typed. Falls back to the URL itself.
+    """
+    sanitized = (sanitize_user_input(url_title) or "").strip()
+    return (sanitized or url_string)[: URL_CONSTANTS.MAX_URL_TITLE_LENGTH]
+
+
+def _clean_tag_strings(tag_strings: list[str]) -> list[str] | None:
+    """Apply the create-URL tag rules; returns None if any tag breaks them."""
+    for tag_string in tag_strings:
+        stripped = tag_string.strip()
+        if (
+            len(stripped) > TAG_CONSTANTS.MAX_TAG_LENGTH
+            or sanitize_user_input(stripped) != stripped
+        ):
+            return None
+    try:
+        deduplicated = validate_tag_strings(tag_strings)
+    except ValueError:
+        return None
+    if len(deduplicated) > TAG_CONSTANTS.MAX_URL_TAGS:
+        return None
+    return deduplicated
+
+
+def _rejected_result(
+    index: int,
+    url_string: str,
+    status: URLImportStatus,
+    detail: str | None = None,
+) -> UrlImportResultSchema:
+    return UrlImportResultSchema(
+        index=index, url_string=url_string, status=status, detail=detail
+    )
+
+
+def _write_import(
+    current_utub: Utubs,
+    prepared: list[_PreparedImport],
+    results: dict[int, UrlImportResultSchema],
+) -> tuple[list[tuple[_PreparedImport, int]], int]:
+    """
+    Set-based writes for the validated candidates; the caller owns the commit.
+
+    Returns the (candidate, Utub_Urls.id) pairs actually added, and the number
+    of tag applications written.
+    """
+    url_ids = _upsert_urls([item.url_string for item in prepared])
+
+    existing_utub_url_ids: dict[int, int] = {}
+    for url_id_batch in _batched(list(url_ids.values())):
+        existing_utub_url_ids.update(
+            db.session.query(Utub_Urls.url_id, Utub_Urls.id)
+            .filter(
+                Utub_Urls.utub_id == current_utub.id,
+                Utub_Urls.url_id.in_(url_id_batch),
+            )
+            .all()
+        )
+
+    to_add: list[_PreparedImport] = []
+    for item in prepared:
+        existing_id = existing_utub_url_ids.get(url_ids[item.url_string])
+        if existing_id is not None:
+            results[item.index] = UrlImportResultSchema(
+                index=item.index,
+                url_string=item.url_string,
+                status=URLImportStatus.ALREADY_IN_UTUB,
+                utub_url_id=existing_id,
+            )
+        else:
+            to_add.append(item)
+
+    inserted_ids = _insert_utub_urls(current_utub.id, to_add, url_ids)
+
+    added: list[tuple[_PreparedImport, int]] = []
+    for item in to_add:
+        utub_url_id = inserted_ids.get(url_ids[item.url_string])
+        # A concurrent add of the same URL wins the unique constraint; report it
+        # the same way as a URL that was already present.
+        status = (
+            URLImportStatus.ADDED
+            if utub_url_id is not None
+            else URLImportStatus.ALREADY_IN_UTUB
+        )
+        results[item.index] = UrlImportResultSchema(
+            index=item.index,
+            url_string=item.url_string,
+            status=status,
+            utub_url_id=utub_url_id,
+        )
+        if utub_url_id is not None:
+            added.append((item, utub_url_id))
+
+    applied_tag_count = _apply_import_tags(current_utub.id, added)
+    return added, applied_tag_count
+
+
+def _upsert_urls(url_strings: list[str]) -> dict[str, int]:
+    """Insert any missing `Urls` rows and return the id of every URL string."""
+    url_ids: dict[str, int] = {}
+
+    for url_batch in _batched(url_strings):
+        url_ids.update(
+            db.session.execute(
+                pg_insert(Urls)
+                .values(
+                    [
+                        {
+                            Urls.url_string: url_string,
+                            Urls.url_digest: digest_url_string(url_string),
+                            Urls.created_by: current_user.id,
+                        }
+                        for url_string in url_batch
+                    ]
+                )
+                .on_conflict_do_nothing(index_elements=[Urls.url_digest])
+                .returning(Urls.url_string, Urls.id)
+            ).all()
+        )
+        # ON CONFLICT DO NOTHING returns only the rows it inserted.
+        already_stored = {
+            digest_url_string(url_string): url_string
+            for url_string in url_batch
+            if url_string not in url_ids
+        }
+        if already_stored:
+            # Digests only narrow the probe; the string recheck decides the match
+            stored_rows = (
+                db.session.query(Urls.url_digest, Urls.url_string, Urls.id)
+                .filter(Urls.url_digest.in_(already_stored))
+                .all()
+            )
+            url_ids.update(
+                (url_string, url_id)
+                for url_digest, url_string, url_id in stored_rows
+                if already_stored.get(url_digest) == url_string
+            )
+
+    return url_ids
+
+
+def _insert_utub_urls(
+    utub_id: int, to_add: list[_PreparedImport], url_ids: dict[str, int]
+) -> dict[int, int]:
+    """Insert the UTub-URL rows; returns Utub_Urls.id keyed by URL id."""
+    inserted_ids: dict[int, int] = {}
+
+    for add_batch in _batched(to_add):
+        inserted_ids.update(
+            db.session.execute(
+                pg_insert(Utub_Urls)
+                .values(
+                    [
+                        {
+                            Utub_Urls.utub_id: utub_id,
+                            Utub_Urls.url_id: url_ids[item.url_string],
+                            Utub_Urls.user_id: current_user.id,
+                            Utub_Urls.url_title: item.url_title,
+                        }
+                        for item in add_batch
+                    ]
+                )
+                .on_conflict_do_nothing(
+                    index_elements=[Utub_Urls.utub_id, Utub_Urls.url_id]
+                )
+                .returning(Utub_Urls.url_id, Utub_Urls.id)
+            ).all()
+        )
+
+    return inserted_ids
+
+
+def _apply_import_tags(utub_id: int, added: list[tuple[_PreparedImport, int]]) -> int:
+    """Create the UTub's missing tags, then apply them to the added URLs."""
+    tag_strings = list(
+        dict.fromkeys(
+            tag_string for item, _ in added for tag_string in item.tag_strings
+        )
+    )
+    if not tag_strings:
+        return 0
+
+    tag_ids: dict[str, int] = {}
+    for tag_batch in _batched(tag_strings):
+        tag_ids.update(
+            db.session.execute(
+                pg_insert(Utub_Tags)
+                .values(
+                    [
+                        {
+                            Utub_Tags.utub_id: utub_id,
+                            Utub_Tags.tag_string: tag_string,
+                            Utub_Tags.created_by: current_user.id,
+                        }
+                        for tag_string in tag_batch
+                    ]
+                )
+                .on_conflict_do_nothing(
+                    index_elements=[Utub_Tags.utub_id, Utub_Tags.tag_string]
+                )
+                .returning(Utub_Tags.tag_string, Utub_Tags.id)
+            ).all()
+        )
+        already_stored = [
+            tag_string for tag_string in tag_batch if tag_string not in tag_ids
+        ]
+        if already_stored:
+            tag_ids.update(
+                db.session.query(Utub_Tags.tag_string, Utub_Tags.id)
+                .filter(
+                    Utub_Tags.utub_id == utub_id,
+                    Utub_Tags.tag_string.in_(already_stored),
+                )
+                .all()
+            )
+
+    url_tag_rows = [
+        {
+            Utub_Url_Tags.utub_id: utub_id,
+            Utub_Url_Tags.utub_url_id: utub_url_id,
+            Utub_Url_Tags.utub_tag_id: tag_ids[tag_string],
+        }
+        for item, utub_url_id in added
+        for tag_string in item.tag_strings
+    ]
+    for url_tag_batch in _batched(url_tag_rows):
+        db.session.execute(pg_insert(Utub_Url_Tags).values(url_tag_batch))
+
+    return len(url_tag_rows)
+
+
+def _batched(items: Sequence[_T]) -> Iterator[Sequence[_T]]:
+    for start in range(0, len(items), _IMPORT_BATCH_SIZE):
+        yield items[start : start + _IMPORT_BATCH_SIZE]
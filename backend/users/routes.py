@@ -16,6 +16,8 @@ from backend.api_common.parse_request import api_route
 from backend.api_common.responses import FlaskResponse
 from backend.api_v1.services.tokens import decode_access_token
 from backend.app_logger import warning_log
+from backend.extensions.request_timing import request_phase
+from backend.metrics.latency import LatencyMetricName
 from backend.models.users import Users
 from backend.schemas.base import StatusMessageResponseSchema
 from backend.schemas.errors import ErrorResponse
@@ -48,19 +50,20 @@ def load_user(user_id) -> Users | None:
     stamp (predating the stamp mechanism) is rejected once any invalidation
     has been requested, which is the safe default.
     """
-    user: Users | None = Users.query.get(int(user_id))
-    if user is None:
-        return None
-    if user.is_suspended:
-        return None
-    if user.sessions_invalidated_at is not None:
-        session_issued_at = session.get(SESSION_ISSUED_AT_KEY)
-        if (
-            session_issued_at is None
-            or float(session_issued_at) < user.sessions_invalidated_at.timestamp()
-        ):
+    with request_phase(LatencyMetricName.AUTH_DURATION):
+        user: Users | None = Users.query.get(int(user_id))
+        if user is None:
             return None
-    return user
+        if user.is_suspended:
+            return None
+        if user.sessions_invalidated_at is not None:
+            session_issued_at = session.get(SESSION_ISSUED_AT_KEY)
+            if (
+                session_issued_at is None
+                or float(session_issued_at) < user.sessions_invalidated_at.timestamp()
+            ):
+                return None
+        return user
 
 
 @login_manager.request_loader
@@ -87,16 +90,17 @@ def load_user_from_request(incoming_request: Request) -> Users | None:
     if not authorization_header.startswith(API_AUTH.BEARER_PREFIX):
         return None
 
-    bearer_token = authorization_header[len(API_AUTH.BEARER_PREFIX) :]
-    bearer_user: Users | None = decode_access_token(token=bearer_token)
-    if bearer_user is None:
-        return None
-    if bearer_user.is_suspended:
-        # A still-unexpired access token dies immediately on suspension;
-        # refresh tokens are bulk-revoked by the suspend action itself.
-        return None
-    setattr(g, API_AUTH.BEARER_AUTHENTICATED_G_KEY, True)
-    return bearer_user
+    with request_phase(LatencyMetricName.AUTH_DURATION):
+        bearer_token = authorization_header[len(API_AUTH.BEARER_PREFIX) :]
+        bearer_user: Users | None = decode_access_token(token=bearer_token)
+        if bearer_user is None:
+            return None
+        if bearer_user.is_suspended:
+            # A still-unexpired access token dies immediately on suspension;
+            # refresh tokens are bulk-revoked by the suspend action itself.
+            return None
+        setattr(g, API_AUTH.BEARER_AUTHENTICATED_G_KEY, True)
+        return bearer_user
 
 
 @login_manager.unauthorized_handler
@@ -54,6 +54,7 @@ class URL_ROUTES:
     DELETE_URL = _URLS + "delete_url"
     GET_URL = _URLS + "get_url"
     CREATE_URL = _URLS + "create_url"
+    IMPORT_URLS = _URLS + "import_urls"
     UPDATE_URL = _URLS + "update_url"
     UPDATE_URL_TITLE = _URLS + "update_url_title"
 
@@ -152,6 +153,7 @@ class API_V1_ROUTES:
     REMOVE_MEMBER = _API_V1 + "api_v1_remove_member"
     # URL routes
     CREATE_URL = _API_V1 + "api_v1_create_url"
+    IMPORT_URLS = _API_V1 + "api_v1_import_urls"
     GET_URL = _API_V1 + "api_v1_get_url"
     UPDATE_URL = _API_V1 + "api_v1_update_url"
     UPDATE_URL_TITLE = _API_V1 + "api_v1_update_url_title"
@@ -169,6 +169,8 @@ class URL_CONSTANTS:
     MIN_URL_LENGTH = 1
     MAX_URL_TITLE_LENGTH = 100
     MAX_URL_LENGTH = 8000
+    MAX_IMPORT_URLS = 5000
+    MAX_IMPORT_HTML_LENGTH = 5_000_000
 
 
 class TAG_CONSTANTS:
@@ -13,6 +13,9 @@ API_REFRESH_TOKENS = "ApiRefreshTokens"
 EVENT_REGISTRY = "EventRegistry"
 ANONYMOUS_METRICS = "AnonymousMetrics"
 ANONYMOUS_GAUGES = "AnonymousGauges"
+GAUGE_COUNTERS = "GaugeCounters"
+GAUGE_COUNTER_DELTAS = "GaugeCounterDeltas"
+GAUGE_DISTINCT_REFS = "GaugeDistinctRefs"
 AUDIT_LOGS = "AuditLogs"
 ALEMBIC_VERSION = "alembic_version"
 
@@ -34,9 +37,15 @@ class TABLE_NAMES:
     EVENT_REGISTRY = EVENT_REGISTRY
     ANONYMOUS_METRICS = ANONYMOUS_METRICS
     ANONYMOUS_GAUGES = ANONYMOUS_GAUGES
+    GAUGE_COUNTERS = GAUGE_COUNTERS
+    GAUGE_COUNTER_DELTAS = GAUGE_COUNTER_DELTAS
+    GAUGE_DISTINCT_REFS = GAUGE_DISTINCT_REFS
     AUDIT_LOGS = AUDIT_LOGS
 
     SORTED_TABLES_FOR_DELETION = (
+        GAUGE_DISTINCT_REFS,
+        GAUGE_COUNTER_DELTAS,
+        GAUGE_COUNTERS,
         ANONYMOUS_GAUGES,
         ANONYMOUS_METRICS,
         EVENT_REGISTRY,
@@ -21,6 +21,8 @@ class ADMIN_PORTAL_STRINGS:
     DB_SEARCH_PLACEHOLDER: str = "Search this table…"
     DB_ROW_COUNT_SINGULAR: str = "row"
     DB_ROW_COUNT_PLURAL: str = "rows"
+    DB_ROW_COUNT_ESTIMATE_PREFIX: str = "about"
+    DB_COUNT_EXACTLY: str = "Count exactly"
     NAV_SYSTEM_OPS: str = "System Operations"
     NAV_USER_ACTIONS: str = "User Actions"
     NAV_UTUB_ACTIONS: str = "UTub Actions"
@@ -57,6 +59,9 @@ class ADMIN_PORTAL_STRINGS:
     USERS_SEARCH_PLACEHOLDER: str = "Search by username or email…"
     USERS_SEARCH_ARIA: str = "Search users by username or email"
     USERS_NO_RESULTS: str = "No users match this search."
+    USERS_RANK_BY_SIMILARITY: str = "Best matches first"
+    USERS_ORDER_BY_ID: str = "Order by ID"
+    USERS_RANKED_CANDIDATES_CAPPED: str = "ranking the best"
     USER_DETAIL_TITLE: str = "User Detail"
     USER_DETAIL_MEMBERSHIPS_HEADING: str = "UTub Memberships"
     USER_DETAIL_NO_MEMBERSHIPS: str = "Not a member of any UTubs."
@@ -21,6 +21,9 @@ class API_AUTH:
     # resolved from a bearer token; checked by api_authentication_required so
     # session-cookie identities can never reach the CSRF-exempt /api/v1 surface
     BEARER_AUTHENTICATED_G_KEY = "api_bearer_authenticated"
+    # Redis pub/sub channel fanning out access-token cache evictions (user ids
+    # as a JSON list) to every worker; see backend/extensions/access_token_cache.py
+    ACCESS_TOKEN_CACHE_INVALIDATION_CHANNEL = "api:access-token-cache:invalidate"
 
 
 class API_AUTH_FAILURE(FAILURE_GENERAL):
@@ -4,6 +4,8 @@ class CONFIG_ENVS:
     MAILJET_SECRET_KEY = "MAILJET_SECRET_KEY"
     MAILJET_API_KEY = "MAILJET_API_KEY"
     BASE_EMAIL = "BASE_EMAIL"
+    EMAIL_OUTBOX_ENABLED = "EMAIL_OUTBOX_ENABLED"
+    AUDIT_VIEWS_DEFERRED = "AUDIT_VIEWS_DEFERRED"
     REDIS_URI = "REDIS_URI"
     TEST_REDIS_URI = "TEST_REDIS_URI"
     POSTGRES_USER = "POSTGRES_USER"
@@ -22,7 +24,16 @@ class CONFIG_ENVS:
     X_FORWARDED_FOR = "X-Forwarded-For"
     NOTIFICATION_URL = "NOTIFICATION_URL"
     NOTIFICATION_MODULE = "NOTIFICATION_MODULE"
+    NOTIFICATION_WORKERS = "NOTIFICATION_WORKERS"
+    NOTIFICATION_QUEUE_MAX_SIZE = "NOTIFICATION_QUEUE_MAX_SIZE"
+    NOTIFICATION_DEDUPE_SECONDS = "NOTIFICATION_DEDUPE_SECONDS"
     LOG_DIR = "LOG_DIR"
+    LOG_QUEUE_ENABLED = "LOG_QUEUE_ENABLED"
+    LOG_QUEUE_MAX_SIZE = "LOG_QUEUE_MAX_SIZE"
+    PASSWORD_HASH_METHOD = "PASSWORD_HASH_METHOD"
+    PASSWORD_HASH_WORKERS = "PASSWORD_HASH_WORKERS"
+    PASSWORD_HASH_MAX_CONCURRENCY = "PASSWORD_HASH_MAX_CONCURRENCY"
+    PASSWORD_HASH_QUEUE_TIMEOUT_SECONDS = "PASSWORD_HASH_QUEUE_TIMEOUT_SECONDS"
     METRICS_BATCH_NONCE_TTL_SECONDS = "METRICS_BATCH_NONCE_TTL_SECONDS"
     METRICS_BUCKET_SECONDS = "METRICS_BUCKET_SECONDS"
     METRICS_ENABLED = "METRICS_ENABLED"
@@ -41,7 +52,14 @@ class CONFIG_ENVS:
     ENABLE_SSL = "ENABLE_SSL"
     GOOGLE_OAUTH_CLIENT_ID = "GOOGLE_OAUTH_CLIENT_ID"
     GOOGLE_OAUTH_CLIENT_SECRET = "GOOGLE_OAUTH_CLIENT_SECRET"
+    GOOGLE_OAUTH_JWKS_URL = "GOOGLE_OAUTH_JWKS_URL"
     GITHUB_OAUTH_CLIENT_ID = "GITHUB_OAUTH_CLIENT_ID"
     GITHUB_OAUTH_CLIENT_SECRET = "GITHUB_OAUTH_CLIENT_SECRET"
     API_ACCESS_TOKEN_LIFETIME_SECONDS = "API_ACCESS_TOKEN_LIFETIME_SECONDS"
     API_REFRESH_TOKEN_LIFETIME_SECONDS = "API_REFRESH_TOKEN_LIFETIME_SECONDS"
+    ACCESS_TOKEN_CACHE_MAX_ENTRIES = "ACCESS_TOKEN_CACHE_MAX_ENTRIES"
+    HEALTH_PROBES_CONCURRENT = "HEALTH_PROBES_CONCURRENT"
+    HEALTH_SNAPSHOT_CACHE_SECONDS = "HEALTH_SNAPSHOT_CACHE_SECONDS"
+    JSON_RESPONSE_ENCODER = "JSON_RESPONSE_ENCODER"
+    RESPONSE_COMPRESSION_ENABLED = "RESPONSE_COMPRESSION_ENABLED"
+    RESPONSE_COMPRESSION_MIN_BYTES = "RESPONSE_COMPRESSION_MIN_BYTES"
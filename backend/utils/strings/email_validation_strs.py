@@ -21,6 +21,8 @@ MAILJET_ERROR_MESSAGE = "ErrorMessage"
 MAILJET_ERROR_CODE = "ErrorCode"
 MAILJET_ERROR_RELATED_TO = "ErrorRelatedTo"
 MAILJET_ERRORS = "Errors"
+MAILJET_STATUS = "Status"
+QUEUED = "queued"
 ERROR_WITH_MAILJET = "Error with Mailjet service, retry later."
 INVALID_EMAIL_INPUT = "Invalid email address."
 VALIDATE_MY_EMAIL = "Validate My Email"
@@ -47,6 +49,8 @@ class EMAILS:
     MAILJET_ERROR_CODE = MAILJET_ERROR_CODE
     MAILJET_ERROR_RELATED_TO = MAILJET_ERROR_RELATED_TO
     MAILJET_ERRORS = MAILJET_ERRORS
+    MAILJET_STATUS = MAILJET_STATUS
+    QUEUED = QUEUED
     EMAIL_FAILED = EMAIL_FAILED
     ERROR_WITH_MAILJET = ERROR_WITH_MAILJET
     PASSWORD_RESET_SUBJECT = PASSWORD_RESET_SUBJECT
@@ -7,6 +7,7 @@ FAILURE = "Failure"
 SUCCESS = "Success"
 NO_CHANGE = "No change"
 TOO_MANY_REQUESTS = "Too many requests."
+SERVICE_BUSY = "The server is busy, please try again shortly."
 
 
 class STD_JSON_RESPONSE:
@@ -18,6 +19,7 @@ class STD_JSON_RESPONSE:
     SUCCESS = SUCCESS
     NO_CHANGE = NO_CHANGE
     TOO_MANY_REQUESTS = TOO_MANY_REQUESTS
+    SERVICE_BUSY = SERVICE_BUSY
     DETAILS = DETAILS
 
 
@@ -35,6 +35,11 @@ TAG_APPLIED = "tagApplied"
 TAG_COUNTS_MODIFIED = "tagCountsInUtub"
 SEARCH_RESULTS = "results"
 MATCHED_FIELDS = "matchedFields"
+IMPORT_RESULTS = "results"
+IMPORT_INDEX = "index"
+IMPORT_STATUS = "status"
+IMPORT_DETAIL = "detail"
+ADDED_COUNT = "addedCount"
 
 
 class MODELS:
@@ -72,3 +77,8 @@ class MODELS:
     TAG_APPLIED = TAG_APPLIED
     SEARCH_RESULTS = SEARCH_RESULTS
     MATCHED_FIELDS = MATCHED_FIELDS
+    IMPORT_RESULTS = IMPORT_RESULTS
+    IMPORT_INDEX = IMPORT_INDEX
+    IMPORT_STATUS = IMPORT_STATUS
+    IMPORT_DETAIL = IMPORT_DETAIL
+    ADDED_COUNT = ADDED_COUNT
@@ -21,6 +21,7 @@ URL_TITLE_MODIFIED = "URL title was modified."
 URL_OR_TITLE_MODIFIED = "URL and/or URL title modified."
 URL_MODIFIED = "URL modified."
 URL_FOUND_IN_UTUB = "URL found in UTub."
+URLS_IMPORTED = "URL import finished."
 TAG_IN_UTUB = "tagInUTub"
 DELETE_URL_WARNING = "You can always add it back again!"
 COPY_URL_TOOLTIP = "Copy URL"
@@ -56,6 +57,7 @@ class URL_SUCCESS(URL_GENERAL, UTUB_GENERAL):
     URL_MODIFIED = URL_MODIFIED
     UTUB_URL_ID = UTUB_URL_ID
     URL_FOUND_IN_UTUB = URL_FOUND_IN_UTUB
+    URLS_IMPORTED = URLS_IMPORTED
     URL_TAGS = URL_TAGS
     TAG_COUNTS_MODIFIED = TAG_COUNTS_MODIFIED
 
@@ -76,6 +78,10 @@ EMPTY_URL = "URL cannot be empty."
 TOO_MANY_WAYBACK_ATTEMPTS = "Too many attempts, please try again in one minute."
 UNEXPECTED_VALIDATION_EXCEPTION = "Unexpected exception while validating the URL."
 URLS_WITH_CREDENTIALS_EXCEPTION = "URLs with credentials not allowed."
+UNABLE_TO_IMPORT_URLS_FORM = "Unable to import these URLs, please check inputs."
+IMPORT_NEEDS_ONE_SOURCE = "Provide either a list of URLs or a bookmarks file."
+TOO_MANY_IMPORT_URLS = "Too many URLs to import at once."
+INVALID_IMPORT_TAGS = "One or more tags are empty, too long, or over the tag limit."
 
 
 class URL_FAILURE(FAILURE_GENERAL):
@@ -94,6 +100,10 @@ class URL_FAILURE(FAILURE_GENERAL):
     TOO_MANY_WAYBACK_ATTEMPTS = TOO_MANY_WAYBACK_ATTEMPTS
     UNEXPECTED_VALIDATION_EXCEPTION = UNEXPECTED_VALIDATION_EXCEPTION
     URLS_WITH_CREDENTIALS_EXCEPTION = URLS_WITH_CREDENTIALS_EXCEPTION
+    UNABLE_TO_IMPORT_URLS_FORM = UNABLE_TO_IMPORT_URLS_FORM
+    IMPORT_NEEDS_ONE_SOURCE = IMPORT_NEEDS_ONE_SOURCE
+    TOO_MANY_IMPORT_URLS = TOO_MANY_IMPORT_URLS
+    INVALID_IMPORT_TAGS = INVALID_IMPORT_TAGS
 
 
 # Strings for URL no change
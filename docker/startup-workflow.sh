@@ -30,5 +30,36 @@ python3 /app/build_container_env.py
 chmod 600 /app/container_environment
 chown workflow:workflow /app/container_environment
 
+if [ "$WORKFLOW_DAEMON" == "true" ]; then
+  # One long-running process runs the recurring Python jobs with a shared
+  # Postgres connection and Redis client; cron keeps only the backup jobs.
+  # Restarted if it ever exits, so a crash costs one job slot, not all of them.
+  # On SIGTERM the loop stops the daemon (which finishes its current jobs)
+  # and exits instead of restarting it.
+  echo -e "\nStarting workflow daemon...\n"
+  crontab -u workflow /app/crontab.workflow-daemon
+  (
+    trap 'kill -TERM "$daemon_pid" 2>/dev/null; wait "$daemon_pid"; exit 0' TERM
+    while true; do
+      runuser -u workflow -- /opt/metrics-venv/bin/python /app/workflow_daemon.py >> /app/workflow_logs/workflow-daemon.log 2>&1 &
+      daemon_pid=$!
+      wait "$daemon_pid"
+      sleep 5
+    done
+  ) &
+  daemon_loop_pid=$!
+fi
+
 echo -e "\nStarting cron daemon...\n"
-exec cron -f
+if [ -z "$daemon_loop_pid" ]; then
+  exec cron -f
+fi
+
+# This shell stays PID 1 so docker stop's SIGTERM reaches the daemon loop too,
+# not only cron.
+cron -f &
+cron_pid=$!
+trap 'kill -TERM "$cron_pid" "$daemon_loop_pid" 2>/dev/null' TERM INT
+wait "$cron_pid"
+kill -TERM "$daemon_loop_pid" 2>/dev/null
+wait "$daemon_loop_pid"
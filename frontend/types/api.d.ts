@@ -582,6 +582,23 @@ export interface paths {
     patch?: never;
     trace?: never;
   };
+  "/api/v1/utubs/{utub_id}/urls/import": {
+    parameters: {
+      query?: never;
+      header?: never;
+      path?: never;
+      cookie?: never;
+    };
+    get?: never;
+    put?: never;
+    /** @description Import many URLs into a UTub from a list or a bookmarks file */
+    post: operations["apiV1ImportUrls"];
+    delete?: never;
+    options?: never;
+    head?: never;
+    patch?: never;
+    trace?: never;
+  };
   "/api/v1/utubs/{utub_id}/urls/{utub_url_id}": {
     parameters: {
       query?: never;
@@ -1181,6 +1198,23 @@ export interface paths {
     patch?: never;
     trace?: never;
   };
+  "/utubs/{utub_id}/urls/import": {
+    parameters: {
+      query?: never;
+      header?: never;
+      path?: never;
+      cookie?: never;
+    };
+    get?: never;
+    put?: never;
+    /** @description Import many URLs into a UTub from a list or a bookmarks file */
+    post: operations["importUrls"];
+    delete?: never;
+    options?: never;
+    head?: never;
+    patch?: never;
+    trace?: never;
+  };
   "/utubs/{utub_id}/urls/{utub_url_id}": {
     parameters: {
       query?: never;
@@ -1654,7 +1688,76 @@ export interface components {
      * @description Error codes for URLErrorCodes
      * @enum {integer}
      */
-    URLErrorCodes: 1 | 2 | 3 | 4 | 5 | 6 | 7 | 8;
+    URLErrorCodes: 1 | 2 | 3 | 4 | 5 | 6 | 7 | 8 | 9;
+    /**
+     * @description One URL to import. Validated per item by the import service, so a bad
+     *     entry is reported in the results instead of failing the whole request.
+     */
+    ImportURLItem: {
+      /**
+       * @description URL string to import
+       * @example https://example.com
+       */
+      urlString: string;
+      /**
+       * @description Display title; defaults to the URL when missing or empty
+       * @default null
+       */
+      urlTitle: string | null;
+      /**
+       * @description Optional tags to apply to the imported URL
+       * @example [
+       *       "python",
+       *       "web"
+       *     ]
+       */
+      tagStrings?: string[];
+    };
+    ImportURLRequest: {
+      /**
+       * @description URLs to import, at most 5000; mutually exclusive with bookmarksHtml
+       * @default null
+       */
+      urls: components["schemas"]["ImportURLItem"][] | null;
+      /**
+       * @description Netscape bookmarks file exported by a browser; mutually exclusive with urls
+       * @default null
+       */
+      bookmarksHtml: string | null;
+    };
+    /** @enum {string} */
+    URLImportStatus:
+      | "added"
+      | "alreadyInUtub"
+      | "duplicateInImport"
+      | "invalidUrl"
+      | "invalidTags";
+    UrlImportResultSchema: {
+      /** @description Position of the item in the submitted list or bookmarks file */
+      index: number;
+      /** @description Normalized URL string, or the submitted string if invalid */
+      urlString: string;
+      /** @description Outcome of importing this item */
+      status: components["schemas"]["URLImportStatus"];
+      /**
+       * @description ID of the URL within the UTub when added or already present
+       * @default null
+       */
+      utubUrlID: number | null;
+      /**
+       * @description Why the item was rejected, for invalid items
+       * @default null
+       */
+      detail: string | null;
+    };
+    UrlImportResponseSchema: {
+      /** @description ID of the UTub the URLs were imported into */
+      utubID: number;
+      /** @description Number of URLs added to the UTub */
+      addedCount: number;
+      /** @description Per-item outcome, in submission order */
+      results: components["schemas"]["UrlImportResultSchema"][];
+    };
     UtubUrlDetailSchema: {
       /** @description Unique ID of the URL within the UTub */
       utubUrlID: number;
@@ -4615,6 +4718,69 @@ export interface operations {
       };
     };
   };
+  apiV1ImportUrls: {
+    parameters: {
+      query?: never;
+      header?: never;
+      path: {
+        utub_id: number;
+      };
+      cookie?: never;
+    };
+    requestBody?: {
+      content: {
+        "application/json": components["schemas"]["ImportURLRequest"];
+      };
+    };
+    responses: {
+      /** @description URL import */
+      200: {
+        headers: {
+          [name: string]: unknown;
+        };
+        content: {
+          "application/json": components["schemas"]["SuccessEnvelope"] &
+            components["schemas"]["UrlImportResponseSchema"];
+        };
+      };
+      /** @description Bad request */
+      400: {
+        headers: {
+          [name: string]: unknown;
+        };
+        content: {
+          "application/json": components["schemas"]["ErrorResponse_URLErrorCodes"];
+        };
+      };
+      /** @description Unauthorized */
+      401: {
+        headers: {
+          [name: string]: unknown;
+        };
+        content: {
+          "application/json": components["schemas"]["ErrorResponse"];
+        };
+      };
+      /** @description Forbidden */
+      403: {
+        headers: {
+          [name: string]: unknown;
+        };
+        content: {
+          "application/json": components["schemas"]["ErrorResponse"];
+        };
+      };
+      /** @description Not found */
+      404: {
+        headers: {
+          [name: string]: unknown;
+        };
+        content: {
+          "application/json": components["schemas"]["ErrorResponse"];
+        };
+      };
+    };
+  };
   apiV1GetUrl: {
     parameters: {
       query?: never;
@@ -6115,7 +6281,13 @@ export interface operations {
     parameters: {
       query?: {
         /** @description Latency metric to query; defaults to api_request_duration. */
-        metric_name?: "api_request_duration";
+        metric_name?:
+          | "api_request_duration"
+          | "password_hash_duration"
+          | "db_query_duration"
+          | "auth_duration"
+          | "serialize_duration"
+          | "hooks_duration";
         /** @description Relative time window: day | week | month | year | Nh | Nd. Validated by parse_window() at the route layer. Mutually exclusive with `start`+`end`. */
         window?: string;
         /** @description Inclusive start of an absolute range (ISO-8601 with timezone — e.g., `2026-06-06T00:00:00Z` or `2026-06-06T00:00:00+05:00`). Naive datetimes are rejected at the schema layer via `AwareDatetime`. Must be paired with `end` and is mutually exclusive with `window`. */
@@ -6180,7 +6352,13 @@ export interface operations {
     parameters: {
       query: {
         /** @description Latency metric to query; defaults to api_request_duration. */
-        metric_name?: "api_request_duration";
+        metric_name?:
+          | "api_request_duration"
+          | "password_hash_duration"
+          | "db_query_duration"
+          | "auth_duration"
+          | "serialize_duration"
+          | "hooks_duration";
         /** @description Relative time window: day | week | month | year | Nh | Nd. Validated by parse_window() at the route layer. Mutually exclusive with `start`+`end`. */
         window?: string;
         /** @description Inclusive start of an absolute range (ISO-8601 with timezone — e.g., `2026-06-06T00:00:00Z` or `2026-06-06T00:00:00+05:00`). Naive datetimes are rejected at the schema layer via `AwareDatetime`. Must be paired with `end` and is mutually exclusive with `window`. */
@@ -6772,6 +6950,51 @@ export interface operations {
       };
     };
   };
+  importUrls: {
+    parameters: {
+      query?: never;
+      header?: never;
+      path: {
+        utub_id: number;
+      };
+      cookie?: never;
+    };
+    requestBody?: {
+      content: {
+        "application/json": components["schemas"]["ImportURLRequest"];
+      };
+    };
+    responses: {
+      /** @description URL import */
+      200: {
+        headers: {
+          [name: string]: unknown;
+        };
+        content: {
+          "application/json": components["schemas"]["SuccessEnvelope"] &
+            components["schemas"]["UrlImportResponseSchema"];
+        };
+      };
+      /** @description Bad request */
+      400: {
+        headers: {
+          [name: string]: unknown;
+        };
+        content: {
+          "application/json": components["schemas"]["ErrorResponse_URLErrorCodes"];
+        };
+      };
+      /** @description Not found */
+      404: {
+        headers: {
+          [name: string]: unknown;
+        };
+        content: {
+          "application/json": components["schemas"]["ErrorResponse"];
+        };
+      };
+    };
+  };
   getUrl: {
     parameters: {
       query?: never;
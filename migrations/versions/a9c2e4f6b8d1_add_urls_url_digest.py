@@ -0,0 +1,113 @@
+"""add urlDigest to Urls and move uniqueness onto it
+
+Replaces the unique B-tree on the 8000-char ``"Urls"."urlString"`` with a
+unique index on a fixed 32-byte SHA-256 digest of the string. Lookups probe the
+digest and recheck the string, so index entries stay small no matter how long
+the URL is.
+
+Runs online against a live table:
+
+1. Adds ``urlDigest`` as a nullable column (metadata-only, no rewrite).
+2. Installs a ``BEFORE INSERT OR UPDATE OF "urlString"`` trigger that sets the
+   digest, so rows written by pre-upgrade app servers (which know nothing of
+   the column) get one during and after the backfill.
+3. Backfills it in id-range batches, each committed on its own, so no single
+   transaction holds row locks across the whole table.
+4. Builds the unique index CONCURRENTLY.
+5. Sets NOT NULL behind a validated CHECK so the ALTER skips its full scan.
+6. Drops the old ``Urls_urlString_key`` constraint last, so uniqueness is
+   enforced throughout.
+
+The digest expression is frozen here (not imported from backend.models) and
+must stay byte-for-byte identical to ``backend.models.urls.digest_url_string``.
+The downgrade restores the urlString constraint before dropping the trigger
+and the digest.
+
+Revision ID: a9c2e4f6b8d1
+Revises: e7b3c1d9f2a4
+Create Date: 2026-10-19 14:00:00.000000
+
+"""
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy import text
+
+# revision identifiers, used by Alembic.
+revision = "a9c2e4f6b8d1"
+down_revision = "e7b3c1d9f2a4"
+branch_labels = None
+depends_on = None
+
+_BACKFILL_BATCH_SIZE: int = 5000
+_NOT_NULL_CHECK: str = "ck_urls_url_digest_not_null"
+
+_DIGEST_FUNCTION: str = "urls_set_url_digest"
+_DIGEST_TRIGGER: str = "trg_urls_set_url_digest"
+
+# Frozen copy of backend.models.urls.digest_url_string, in SQL.
+_DIGEST_SQL: str = "sha256(convert_to(\"urlString\", 'UTF8'))"
+
+
+def _backfill_url_digests(connection) -> None:
+    max_id = connection.execute(text('SELECT max("id") FROM "Urls"')).scalar()
+    if max_id is None:
+        return
+
+    for low_id in range(0, max_id, _BACKFILL_BATCH_SIZE):
+        connection.execute(
+            text(f"""
+                UPDATE "Urls" SET "urlDigest" = {_DIGEST_SQL}
+                WHERE "id" > :low_id AND "id" <= :high_id
+                  AND "urlDigest" IS NULL
+                """),
+            {"low_id": low_id, "high_id": low_id + _BACKFILL_BATCH_SIZE},
+        )
+
+
+def upgrade():
+    op.add_column("Urls", sa.Column("urlDigest", sa.LargeBinary(32), nullable=True))
+
+    # Installed before the backfill so no write can leave a NULL digest behind
+    # a batch that has already passed its id range.
+    op.execute(f"""
+        CREATE OR REPLACE FUNCTION {_DIGEST_FUNCTION}() RETURNS trigger AS $$
+        BEGIN
+            NEW."urlDigest" := sha256(convert_to(NEW."urlString", 'UTF8'));
+            RETURN NEW;
+        END;
+        $$ LANGUAGE plpgsql
+        """)
+    op.execute(f"""
+        CREATE TRIGGER {_DIGEST_TRIGGER}
+        BEFORE INSERT OR UPDATE OF "urlString" ON "Urls"
+        FOR EACH ROW EXECUTE FUNCTION {_DIGEST_FUNCTION}()
+        """)
+
+    with op.get_context().autocommit_block():
+        _backfill_url_digests(op.get_bind())
+        op.create_index(
+            "idx_urls_url_digest",
+            "Urls",
+            ["urlDigest"],
+            unique=True,
+            postgresql_concurrently=True,
+        )
+
+    op.execute(f"""
+        ALTER TABLE "Urls" ADD CONSTRAINT {_NOT_NULL_CHECK}
+        CHECK ("urlDigest" IS NOT NULL) NOT VALID
+        """)
+    op.execute(f'ALTER TABLE "Urls" VALIDATE CONSTRAINT {_NOT_NULL_CHECK}')
+    op.alter_column("Urls", "urlDigest", nullable=False)
+    op.drop_constraint(_NOT_NULL_CHECK, "Urls", type_="check")
+
+    op.drop_constraint("Urls_urlString_key", "Urls", type_="unique")
+
+
+def downgrade():
+    op.create_unique_constraint("Urls_urlString_key", "Urls", ["urlString"])
+    op.drop_index("idx_urls_url_digest", table_name="Urls")
+    op.execute(f'DROP TRIGGER IF EXISTS {_DIGEST_TRIGGER} ON "Urls"')
+    op.execute(f"DROP FUNCTION IF EXISTS {_DIGEST_FUNCTION}()")
+    op.drop_column("Urls", "urlDigest")
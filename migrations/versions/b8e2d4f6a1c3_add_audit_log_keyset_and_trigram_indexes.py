@@ -0,0 +1,61 @@
+"""add keyset and trigram indexes for the admin audit-log viewer
+
+Purely additive. Installs the ``pg_trgm`` extension and builds, CONCURRENTLY so
+neither table is write-locked:
+
+- ``idx_audit_logs_created_at_id`` on ``AuditLogs ("createdAt" DESC, id DESC)``,
+  the viewer's keyset order, so every page is an index range scan.
+- GIN ``gin_trgm_ops`` indexes on ``AuditLogs.action``, ``Users.username`` and
+  ``Users.email`` for the viewer's ``ILIKE '%...%'`` action and actor filters.
+
+The downgrade drops the indexes and leaves the extension installed, as other
+objects may have come to depend on it.
+
+Revision ID: b8e2d4f6a1c3
+Revises: d4a7c2e9f1b6
+Create Date: 2026-10-19 20:00:00.000000
+
+"""
+
+from alembic import op
+from sqlalchemy import text
+
+# revision identifiers, used by Alembic.
+revision = "b8e2d4f6a1c3"
+down_revision = "d4a7c2e9f1b6"
+branch_labels = None
+depends_on = None
+
+# (index name, table, column) for each trigram index
+_TRIGRAM_INDEXES: tuple[tuple[str, str, str], ...] = (
+    ("idx_audit_logs_action_trgm", "AuditLogs", "action"),
+    ("idx_users_username_trgm", "Users", "username"),
+    ("idx_users_email_trgm", "Users", "email"),
+)
+
+
+def upgrade():
+    op.execute("CREATE EXTENSION IF NOT EXISTS pg_trgm")
+
+    with op.get_context().autocommit_block():
+        op.create_index(
+            "idx_audit_logs_created_at_id",
+            "AuditLogs",
+            [text('"createdAt" DESC'), text("id DESC")],
+            postgresql_concurrently=True,
+        )
+        for index_name, table_name, column_name in _TRIGRAM_INDEXES:
+            op.create_index(
+                index_name,
+                table_name,
+                [column_name],
+                postgresql_using="gin",
+                postgresql_ops={column_name: "gin_trgm_ops"},
+                postgresql_concurrently=True,
+            )
+
+
+def downgrade():
+    for index_name, table_name, _ in reversed(_TRIGRAM_INDEXES):
+        op.drop_index(index_name, table_name=table_name)
+    op.drop_index("idx_audit_logs_created_at_id", table_name="AuditLogs")
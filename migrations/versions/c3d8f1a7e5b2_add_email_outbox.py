@@ -0,0 +1,58 @@
+"""add EmailOutbox table
+
+Outbound email queued by EmailSender (EMAIL_OUTBOX_ENABLED) in the same
+transaction as the row it refers to, and sent by scripts/send_email_outbox.py
+from the workflow sidecar. The partial index backs the worker's claim query
+over due, not-yet-failed rows.
+
+Revision ID: c3d8f1a7e5b2
+Revises: a9c2e4f6b8d1
+Create Date: 2026-10-19 16:00:00.000000
+
+"""
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+# revision identifiers, used by Alembic.
+revision = "c3d8f1a7e5b2"
+down_revision = "a9c2e4f6b8d1"
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    op.create_table(
+        "EmailOutbox",
+        sa.Column("id", sa.Integer(), autoincrement=True, nullable=False),
+        sa.Column("message", postgresql.JSONB(astext_type=sa.Text()), nullable=False),
+        sa.Column("attempts", sa.Integer(), nullable=False),
+        sa.Column(
+            "nextAttemptAt",
+            sa.DateTime(timezone=True),
+            nullable=False,
+            server_default=sa.text("now()"),
+        ),
+        sa.Column("lastError", sa.String(length=1000), nullable=True),
+        sa.Column("failedAt", sa.DateTime(timezone=True), nullable=True),
+        sa.Column(
+            "createdAt",
+            sa.DateTime(timezone=True),
+            nullable=False,
+            server_default=sa.text("now()"),
+        ),
+        sa.PrimaryKeyConstraint("id"),
+    )
+    op.create_index(
+        "idx_email_outbox_pending",
+        "EmailOutbox",
+        ["nextAttemptAt"],
+        unique=False,
+        postgresql_where=sa.text('"failedAt" IS NULL'),
+    )
+
+
+def downgrade():
+    op.drop_index("idx_email_outbox_pending", table_name="EmailOutbox")
+    op.drop_table("EmailOutbox")
@@ -0,0 +1,233 @@
+"""add GaugeCounters / GaugeCounterDeltas / GaugeDistinctRefs tables and triggers
+
+Revision ID: c4e8a2f6b1d9
+Revises: b8d2f0c4e6a1
+Create Date: 2026-10-19 09:30:00.000000
+
+Additive: creates the base-total table behind the incrementally maintained
+VOLUME gauges (``GaugeCounters``), the append-only deltas the triggers write
+instead of updating those rows (``GaugeCounterDeltas``), and the per-value
+reference counts behind the COUNT(DISTINCT "tagString") gauge
+(``GaugeDistinctRefs``); installs the statement-level triggers keeping them
+current, and seeds the totals from the live tables. The downgrade drops the
+triggers, their functions, and the tables; the sampler falls back to scanning
+when a counter row is missing.
+
+The trigger SQL is a frozen copy of ``build_counter_trigger_ddl()`` in
+backend/metrics/gauges.py as of this revision — inlined (not imported) so the
+migration stays self-contained even if the gauge registry later changes,
+mirroring 681906a2f237_strip_tracking_query_params.
+
+"""
+
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision = "c4e8a2f6b1d9"
+down_revision = "b8d2f0c4e6a1"
+branch_labels = None
+depends_on = None
+
+# gaugeName -> source table for the COUNT(*) volume gauges.
+_COUNT_GAUGES: dict[str, str] = {
+    "total_users": "Users",
+    "total_utubs": "Utubs",
+    "total_urls": "Urls",
+    "total_utub_url_associations": "UtubUrls",
+}
+# gaugeName, source table, distinct column for the COUNT(DISTINCT ...) gauge.
+_DISTINCT_GAUGE: tuple[str, str, str] = ("total_tags", "UtubTags", "tagString")
+
+
+def _counter_delta(gauge_name: str, delta_expr: str) -> str:
+    return (
+        'INSERT INTO "GaugeCounterDeltas" ("gaugeName", "delta") '
+        f"SELECT '{gauge_name}', d FROM ({delta_expr}) AS delta_rows(d) "
+        "WHERE d <> 0;"
+    )
+
+
+def _counter_reset(gauge_name: str) -> str:
+    return (
+        'UPDATE "GaugeCounters" SET "value" = 0, "updatedAt" = now() '
+        f"WHERE \"gaugeName\" = '{gauge_name}'; "
+        'DELETE FROM "GaugeCounterDeltas" '
+        f"WHERE \"gaugeName\" = '{gauge_name}';"
+    )
+
+
+def _count_function_body(gauge_name: str) -> str:
+    return f"""
+BEGIN
+    IF TG_OP = 'INSERT' THEN
+        {_counter_delta(gauge_name, "SELECT COUNT(*) FROM new_rows")}
+    ELSIF TG_OP = 'DELETE' THEN
+        {_counter_delta(gauge_name, "SELECT -COUNT(*) FROM old_rows")}
+    ELSE
+        {_counter_reset(gauge_name)}
+    END IF;
+    RETURN NULL;
+END;
+"""
+
+
+def _distinct_function_body(gauge_name: str, column: str) -> str:
+    old_values = (
+        f'SELECT "{column}"::text AS v FROM old_rows WHERE "{column}" IS NOT NULL'
+    )
+    new_values = (
+        f'SELECT "{column}"::text AS v FROM new_rows WHERE "{column}" IS NOT NULL'
+    )
+
+    def decrement(removed_sql: str) -> str:
+        return f"""
+        UPDATE "GaugeDistinctRefs" AS r SET "refs" = r."refs" - d.n
+        FROM (SELECT v, COUNT(*) AS n FROM ({removed_sql}) AS removed GROUP BY v) AS d
+        WHERE r."gaugeName" = '{gauge_name}' AND r."distinctValue" = d.v;
+        DELETE FROM "GaugeDistinctRefs"
+        WHERE "gaugeName" = '{gauge_name}' AND "refs" <= 0
+        AND "distinctValue" IN (SELECT v FROM ({removed_sql}) AS removed);
+        GET DIAGNOSTICS affected = ROW_COUNT;
+        delta := delta - affected;"""
+
+    def increment(added_sql: str) -> str:
+        return f"""
+        WITH added AS (SELECT v, COUNT(*) AS n FROM ({added_sql}) AS a GROUP BY v),
+        upserted AS (
+            INSERT INTO "GaugeDistinctRefs" ("gaugeName", "distinctValue", "refs")
+            SELECT '{gauge_name}', v, n FROM added
+            ON CONFLICT ("gaugeName", "distinctValue") DO UPDATE
+            SET "refs" = "GaugeDistinctRefs"."refs" + EXCLUDED."refs"
+            RETURNING "distinctValue", "refs"
+        )
+        SELECT COUNT(*) INTO affected FROM upserted AS u
+        JOIN added ON added.v = u."distinctValue" WHERE u."refs" = added.n;
+        delta := delta + affected;"""
+
+    return f"""
+DECLARE
+    delta bigint := 0;
+    affected bigint;
+BEGIN
+    IF TG_OP = 'TRUNCATE' THEN
+        DELETE FROM "GaugeDistinctRefs" WHERE "gaugeName" = '{gauge_name}';
+        {_counter_reset(gauge_name)}
+        RETURN NULL;
+    END IF;
+    IF TG_OP = 'INSERT' THEN{increment(new_values)}
+    ELSIF TG_OP = 'DELETE' THEN{decrement(old_values)}
+    ELSE{decrement(f"({old_values}) EXCEPT ALL ({new_values})")}{increment(f"({new_values}) EXCEPT ALL ({old_values})")}
+    END IF;
+    IF delta <> 0 THEN
+        {_counter_delta(gauge_name, "SELECT delta")}
+    END IF;
+    RETURN NULL;
+END;
+"""
+
+
+def _create_function_and_triggers(
+    gauge_name: str, table: str, body: str, *, with_update: bool
+) -> None:
+    function_name = f"gauge_counter_{gauge_name}"
+    op.execute(
+        f'CREATE OR REPLACE FUNCTION "{function_name}"() RETURNS trigger '
+        f"LANGUAGE plpgsql AS $gauge_counter${body}$gauge_counter$"
+    )
+    trigger_events = [
+        ("ins", "INSERT", "REFERENCING NEW TABLE AS new_rows "),
+        ("del", "DELETE", "REFERENCING OLD TABLE AS old_rows "),
+        ("trunc", "TRUNCATE", ""),
+    ]
+    if with_update:
+        trigger_events.append(
+            (
+                "upd",
+                "UPDATE",
+                "REFERENCING OLD TABLE AS old_rows NEW TABLE AS new_rows ",
+            )
+        )
+    for suffix, event, referencing in trigger_events:
+        op.execute(
+            f'CREATE OR REPLACE TRIGGER "{function_name}_{suffix}" '
+            f'AFTER {event} ON "{table}" {referencing}'
+            f'FOR EACH STATEMENT EXECUTE FUNCTION "{function_name}"()'
+        )
+
+
+def upgrade():
+    op.create_table(
+        "GaugeCounters",
+        sa.Column("gaugeName", sa.String(length=100), nullable=False),
+        sa.Column("value", sa.BigInteger(), nullable=False),
+        sa.Column("updatedAt", sa.DateTime(timezone=True), nullable=False),
+        sa.PrimaryKeyConstraint("gaugeName"),
+    )
+    op.create_table(
+        "GaugeCounterDeltas",
+        sa.Column("id", sa.BigInteger(), nullable=False),
+        sa.Column("gaugeName", sa.String(length=100), nullable=False),
+        sa.Column("delta", sa.BigInteger(), nullable=False),
+        sa.PrimaryKeyConstraint("id"),
+    )
+    op.create_index(
+        "idx_gauge_counter_deltas_gauge_name", "GaugeCounterDeltas", ["gaugeName"]
+    )
+    op.create_table(
+        "GaugeDistinctRefs",
+        sa.Column("gaugeName", sa.String(length=100), nullable=False),
+        sa.Column("distinctValue", sa.Text(), nullable=False),
+        sa.Column("refs", sa.BigInteger(), nullable=False),
+        sa.PrimaryKeyConstraint("gaugeName", "distinctValue"),
+    )
+
+    for gauge_name, table in _COUNT_GAUGES.items():
+        _create_function_and_triggers(
+            gauge_name, table, _count_function_body(gauge_name), with_update=False
+        )
+    distinct_gauge_name, distinct_table, distinct_column = _DISTINCT_GAUGE
+    _create_function_and_triggers(
+        distinct_gauge_name,
+        distinct_table,
+        _distinct_function_body(distinct_gauge_name, distinct_column),
+        with_update=True,
+    )
+
+    # Seed last: CREATE TRIGGER holds a lock blocking writes to each source
+    # table until this migration commits, so no concurrent write can land
+    # between the seeded count and the first trigger firing.
+    for gauge_name, table in _COUNT_GAUGES.items():
+        op.execute(
+            'INSERT INTO "GaugeCounters" ("gaugeName", "value", "updatedAt") '
+            f"SELECT '{gauge_name}', COUNT(*), now() FROM \"{table}\""
+        )
+    op.execute(
+        'INSERT INTO "GaugeDistinctRefs" ("gaugeName", "distinctValue", "refs") '
+        f"SELECT '{distinct_gauge_name}', \"{distinct_column}\"::text, COUNT(*) "
+        f'FROM "{distinct_table}" WHERE "{distinct_column}" IS NOT NULL '
+        f'GROUP BY "{distinct_column}"'
+    )
+    op.execute(
+        'INSERT INTO "GaugeCounters" ("gaugeName", "value", "updatedAt") '
+        f"SELECT '{distinct_gauge_name}', COUNT(*), now() FROM \"GaugeDistinctRefs\" "
+        f"WHERE \"gaugeName\" = '{distinct_gauge_name}'"
+    )
+
+
+def downgrade():
+    gauge_tables = dict(_COUNT_GAUGES)
+    gauge_tables[_DISTINCT_GAUGE[0]] = _DISTINCT_GAUGE[1]
+    for gauge_name, table in gauge_tables.items():
+        function_name = f"gauge_counter_{gauge_name}"
+        for suffix in ("ins", "del", "trunc", "upd"):
+            op.execute(
+                f'DROP TRIGGER IF EXISTS "{function_name}_{suffix}" ON "{table}"'
+            )
+        op.execute(f'DROP FUNCTION IF EXISTS "{function_name}"()')
+    op.drop_table("GaugeDistinctRefs")
+    op.drop_index(
+        "idx_gauge_counter_deltas_gauge_name", table_name="GaugeCounterDeltas"
+    )
+    op.drop_table("GaugeCounterDeltas")
+    op.drop_table("GaugeCounters")
@@ -0,0 +1,55 @@
+"""store ApiRefreshTokens as SHA-256 digests
+
+Replaces the plaintext "token" column with "tokenHash", the hex SHA-256 digest
+of the token, under its own unique constraint. Existing rows are hashed in
+place, so refresh tokens already held by devices keep working.
+
+Downgrading cannot recover plaintext tokens, so it deletes every row; mobile
+clients then sign in again.
+
+Revision ID: d4a7c2e9f1b6
+Revises: c3d8f1a7e5b2
+Create Date: 2026-10-19 18:00:00.000000
+
+"""
+
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision = "d4a7c2e9f1b6"
+down_revision = "c3d8f1a7e5b2"
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    op.add_column(
+        "ApiRefreshTokens",
+        sa.Column("tokenHash", sa.String(length=64), nullable=True),
+    )
+    op.execute(
+        'UPDATE "ApiRefreshTokens" '
+        "SET \"tokenHash\" = encode(sha256(convert_to(\"token\", 'UTF8')), 'hex')"
+    )
+    op.alter_column("ApiRefreshTokens", "tokenHash", nullable=False)
+    op.create_unique_constraint(
+        "unique_api_refresh_token_hash", "ApiRefreshTokens", ["tokenHash"]
+    )
+    op.drop_constraint("unique_api_refresh_token", "ApiRefreshTokens", type_="unique")
+    op.drop_column("ApiRefreshTokens", "token")
+
+
+def downgrade():
+    op.execute('DELETE FROM "ApiRefreshTokens"')
+    op.add_column(
+        "ApiRefreshTokens",
+        sa.Column("token", sa.String(length=128), nullable=False),
+    )
+    op.create_unique_constraint(
+        "unique_api_refresh_token", "ApiRefreshTokens", ["token"]
+    )
+    op.drop_constraint(
+        "unique_api_refresh_token_hash", "ApiRefreshTokens", type_="unique"
+    )
+    op.drop_column("ApiRefreshTokens", "tokenHash")
@@ -0,0 +1,55 @@
+"""add trigram indexes for the admin UTub and URL searches
+
+Purely additive. Builds GIN ``gin_trgm_ops`` indexes, CONCURRENTLY so neither
+table is write-locked, on the string columns the admin portal searches with
+``ILIKE '%...%'``:
+
+- ``Utubs.utubName`` and ``Utubs.utubDescription``, searched by the UTub
+  Actions list.
+- ``Urls.urlString``, searched by the UTub detail URL filter and the DB
+  browser's Urls grid.
+
+``Users.username``/``email`` were indexed by b8e2d4f6a1c3, which also
+installed ``pg_trgm``; the extension is re-ensured here so this revision does
+not depend on it having survived.
+
+Revision ID: e3c5a7f9b2d4
+Revises: b8e2d4f6a1c3
+Create Date: 2026-10-19 22:00:00.000000
+
+"""
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision = "e3c5a7f9b2d4"
+down_revision = "b8e2d4f6a1c3"
+branch_labels = None
+depends_on = None
+
+# (index name, table, column) for each trigram index
+_TRIGRAM_INDEXES: tuple[tuple[str, str, str], ...] = (
+    ("idx_utubs_utub_name_trgm", "Utubs", "utubName"),
+    ("idx_utubs_utub_description_trgm", "Utubs", "utubDescription"),
+    ("idx_urls_url_string_trgm", "Urls", "urlString"),
+)
+
+
+def upgrade():
+    op.execute("CREATE EXTENSION IF NOT EXISTS pg_trgm")
+
+    with op.get_context().autocommit_block():
+        for index_name, table_name, column_name in _TRIGRAM_INDEXES:
+            op.create_index(
+                index_name,
+                table_name,
+                [column_name],
+                postgresql_using="gin",
+                postgresql_ops={column_name: "gin_trgm_ops"},
+                postgresql_concurrently=True,
+            )
+
+
+def downgrade():
+    for index_name, table_name, _ in reversed(_TRIGRAM_INDEXES):
+        op.drop_index(index_name, table_name=table_name)
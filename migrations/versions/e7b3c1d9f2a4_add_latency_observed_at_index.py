@@ -0,0 +1,31 @@
+"""add observedAt index to AnonymousLatencySamples
+
+Revision ID: e7b3c1d9f2a4
+Revises: c4e8a2f6b1d9
+Create Date: 2026-10-19 11:00:00.000000
+
+Purely additive: indexes ``AnonymousLatencySamples.observedAt`` on its own.
+The two existing composite indexes lead on metricName / endpoint, so neither
+serves a time-only range. This one backs the retention prune
+(``observedAt < cutoff``) and makes observedAt a keyset-pageable sort column
+in the admin DB browser. The downgrade drops the index.
+
+"""
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision = "e7b3c1d9f2a4"
+down_revision = "c4e8a2f6b1d9"
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    op.create_index(
+        "idx_latency_observed_at", "AnonymousLatencySamples", ["observedAt"]
+    )
+
+
+def downgrade():
+    op.drop_index("idx_latency_observed_at", table_name="AnonymousLatencySamples")
@@ -3,11 +3,16 @@
 The bash backup scripts (``daily-docker.sh`` orchestrating ``backup-database.sh``,
 ``backup-logs.sh``, ``remote-object-storage.sh``) cannot unit-test their own
 decisions. This module is the single source of truth for the two genuinely
-decidable concerns:
+decidable concerns, plus the database dump driver itself:
 
+  - ``run_dump`` — stream ``pg_dump`` through a multithreaded gzip compressor
+    straight into the archive, counting the dump's size and hashing the archive
+    in the same pass, then write a ``<archive>.manifest.json`` beside it. One
+    pass over the data, no uncompressed copy on disk, every core compressing.
   - ``verify_dump`` — is a gzipped backup actually a valid, non-truncated stream
     whose decompressed payload is at least ``min_size_bytes`` (proof the dump is
-    restorable, not merely that ``pg_dump`` exited 0)?
+    restorable, not merely that ``pg_dump`` exited 0)? ``run_dump`` applies the
+    same size floor as it streams, so its archives need no second pass.
   - log-prune selection (``select_files_to_prune`` + ``scan_log_entries`` +
     ``prune_logs``) — which dated log files are over the retention cap and should
     be removed, oldest-first, in a single run?
@@ -22,16 +27,201 @@ drift-guard test does not apply. Stdlib-only so the ``redis``+``psycopg2``-only
 from __future__ import annotations
 
 import argparse
+from collections import deque
+from concurrent.futures import Future, ThreadPoolExecutor
+from dataclasses import dataclass
 import gzip
+import hashlib
+import json
 import os
+import subprocess
 import sys
 from pathlib import Path
+from typing import BinaryIO
 
 DEFAULT_MIN_DUMP_BYTES: int = 1024
+DEFAULT_COMPRESS_LEVEL: int = 6
 EXIT_OK: int = 0
 EXIT_FAILURE: int = 1
+MANIFEST_SUFFIX: str = ".manifest.json"
 
 _READ_CHUNK_BYTES: int = 64 * 1024
+_COMPRESS_CHUNK_BYTES: int = 8 * 1024 * 1024
+_PARTIAL_SUFFIX: str = ".partial"
+
+
+@dataclass(frozen=True)
+class StreamDigest:
+    """What one pass over a dump stream measured."""
+
+    dump_bytes: int
+    archive_bytes: int
+    archive_sha256: str
+
+
+def compress_stream(
+    *,
+    source: BinaryIO,
+    destination: BinaryIO,
+    workers: int,
+    chunk_bytes: int = _COMPRESS_CHUNK_BYTES,
+    compress_level: int = DEFAULT_COMPRESS_LEVEL,
+) -> StreamDigest:
+    """Gzip ``source`` into ``destination`` on ``workers`` threads, in one pass.
+
+    Each ``chunk_bytes`` block becomes its own gzip member, compressed on a pool
+    thread (zlib releases the GIL) and written in order; concatenated members
+    are a valid gzip file that ``gunzip`` / ``gzip.open`` read as one stream.
+    At most ``2 * workers`` blocks are in flight, so memory stays bounded
+    whatever the dump size. The dump size and the archive's SHA-256 are
+    counted as the bytes go by.
+
+    Examples:
+        >>> # 20 MiB dump, 8 MiB chunks -> three gzip members written in order
+        >>> compress_stream(source=dump_pipe, destination=archive, workers=4)
+        StreamDigest(dump_bytes=20971520, archive_bytes=..., archive_sha256=...)
+    """
+    archive_hash = hashlib.sha256()
+    dump_bytes = 0
+    archive_bytes = 0
+    pending: deque[Future[bytes]] = deque()
+
+    def _write_next() -> None:
+        nonlocal archive_bytes
+        member = pending.popleft().result()
+        destination.write(member)
+        archive_hash.update(member)
+        archive_bytes += len(member)
+
+    with ThreadPoolExecutor(max_workers=max(workers, 1)) as executor:
+        while True:
+            chunk = source.read(chunk_bytes)
+            if not chunk:
+                break
+            dump_bytes += len(chunk)
+            pending.append(
+                executor.submit(
+                    gzip.compress, chunk, compresslevel=compress_level, mtime=0
+                )
+            )
+            if len(pending) >= 2 * max(workers, 1):
+                _write_next()
+        while pending:
+            _write_next()
+
+    return StreamDigest(
+        dump_bytes=dump_bytes,
+        archive_bytes=archive_bytes,
+        archive_sha256=archive_hash.hexdigest(),
+    )
+
+
+def build_pg_dump_command(*, host: str, username: str, dbname: str) -> list[str]:
+    """The plain-SQL ``pg_dump`` invocation ``db_backup_loader.sh`` restores.
+
+    Plain format (not ``-Fd -j``) keeps the archive a single ``.sql.gz`` that
+    ``gunzip | psql`` restores; the parallelism is in the compressor instead.
+    The password reaches ``pg_dump`` through the inherited ``PGPASSWORD``.
+    """
+    return [
+        "pg_dump",
+        "-h",
+        host,
+        "-U",
+        username,
+        "-d",
+        dbname,
+        "--clean",
+        "--if-exists",
+        "--create",
+    ]
+
+
+def write_manifest(*, archive_path: str, digest: StreamDigest) -> str:
+    """Write ``<archive_path>.manifest.json`` for ``digest``; returns its path.
+
+    Examples:
+        >>> write_manifest(archive_path="/backups/u4i.sql.gz", digest=digest)
+        '/backups/u4i.sql.gz.manifest.json'
+    """
+    manifest_path = archive_path + MANIFEST_SUFFIX
+    manifest = {
+        "archive": Path(archive_path).name,
+        "format": "plain-sql+gzip",
+        "dump_bytes": digest.dump_bytes,
+        "archive_bytes": digest.archive_bytes,
+        "archive_sha256": digest.archive_sha256,
+    }
+    Path(manifest_path).write_text(json.dumps(manifest, indent=2) + "\n")
+    return manifest_path
+
+
+def run_dump(
+    *,
+    pg_dump_command: list[str],
+    output_path: str,
+    min_size_bytes: int,
+    workers: int,
+) -> tuple[int, str]:
+    """Stream ``pg_dump_command``'s stdout into the gzip archive ``output_path``.
+
+    The archive is written under ``<output_path>.partial`` and renamed into
+    place, with its manifest, only once ``pg_dump`` exited 0 and the dump met
+    ``min_size_bytes``; any failure removes the partial file, so a failed run
+    never leaves a plausible-looking archive behind.
+
+    Examples:
+        >>> run_dump(pg_dump_command=["pg_dump", ...],
+        ...          output_path="/backups/u4i.sql.gz",
+        ...          min_size_bytes=1024, workers=4)
+        (0, 'backup ok: 52428800b -> 7340032b sha256=3f1c...: /backups/u4i.sql.gz')
+        >>> # pg_dump exited 1 (e.g. authentication failed)
+        (1, 'backup failed: pg_dump exited 1: /backups/u4i.sql.gz')
+    """
+    partial_path = output_path + _PARTIAL_SUFFIX
+    try:
+        with open(partial_path, "wb") as archive:
+            dump_process = subprocess.Popen(pg_dump_command, stdout=subprocess.PIPE)
+            with dump_process:
+                digest = compress_stream(
+                    source=dump_process.stdout,
+                    destination=archive,
+                    workers=workers,
+                )
+            archive.flush()
+            os.fsync(archive.fileno())
+    except OSError as dump_error:
+        _remove_quietly(partial_path)
+        return (EXIT_FAILURE, f"backup failed: {dump_error}: {output_path}")
+
+    if dump_process.returncode != 0:
+        _remove_quietly(partial_path)
+        return (
+            EXIT_FAILURE,
+            f"backup failed: pg_dump exited {dump_process.returncode}: {output_path}",
+        )
+    if digest.dump_bytes < min_size_bytes:
+        _remove_quietly(partial_path)
+        return (
+            EXIT_FAILURE,
+            f"backup too small: {digest.dump_bytes}b < {min_size_bytes}b: "
+            f"{output_path}",
+        )
+
+    os.replace(partial_path, output_path)
+    write_manifest(archive_path=output_path, digest=digest)
+    return (
+        EXIT_OK,
+        f"backup ok: {digest.dump_bytes}b -> {digest.archive_bytes}b "
+        f"sha256={digest.archive_sha256}: {output_path}",
+    )
+
+
+def _remove_quietly(path: str) -> None:
+    try:
+        os.remove(path)
+    except OSError:
+        pass
 
 
 def verify_dump(*, path: str, min_size_bytes: int) -> tuple[int, str]:
@@ -172,9 +362,12 @@ def prune_logs(
 
 
 def main(argv: list[str]) -> int:
-    """Dispatch the ``verify-dump`` / ``prune-logs`` subcommands from ``argv``.
+    """Dispatch the ``dump`` / ``verify-dump`` / ``prune-logs`` subcommands.
 
     Examples:
+        >>> main(["dump", "--output", "/backups/u4i.sql.gz", "--host", "db",
+        ...       "--username", "u4i", "--dbname", "u4i"])  # prints, returns 0
+        0
         >>> main(["verify-dump", "--path", "/ok.sql.gz"])  # prints, returns 0
         0
         >>> main(["prune-logs", "--directory", "/logs", "--max-files", "90"])
@@ -183,6 +376,14 @@ def main(argv: list[str]) -> int:
     parser = argparse.ArgumentParser(prog="backup_maintenance")
     subparsers = parser.add_subparsers(dest="command", required=True)
 
+    dump_parser = subparsers.add_parser("dump")
+    dump_parser.add_argument("--output", required=True)
+    dump_parser.add_argument("--host", required=True)
+    dump_parser.add_argument("--username", required=True)
+    dump_parser.add_argument("--dbname", required=True)
+    dump_parser.add_argument("--min-size", type=int, default=DEFAULT_MIN_DUMP_BYTES)
+    dump_parser.add_argument("--workers", type=int, default=os.cpu_count() or 1)
+
     verify_parser = subparsers.add_parser("verify-dump")
     verify_parser.add_argument("--path", required=True)
     verify_parser.add_argument("--min-size", type=int, default=DEFAULT_MIN_DUMP_BYTES)
@@ -194,6 +395,18 @@ def main(argv: list[str]) -> int:
 
     args = parser.parse_args(argv)
 
+    if args.command == "dump":
+        exit_code, message = run_dump(
+            pg_dump_command=build_pg_dump_command(
+                host=args.host, username=args.username, dbname=args.dbname
+            ),
+            output_path=args.output,
+            min_size_bytes=args.min_size,
+            workers=args.workers,
+        )
+        print(message)
+        return exit_code
+
     if args.command == "verify-dump":
         exit_code, message = verify_dump(path=args.path, min_size_bytes=args.min_size)
         print(message)
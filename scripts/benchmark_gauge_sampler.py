@@ -0,0 +1,179 @@
+"""Timing harness: per-gauge vs compiled gauge sampling on a seeded database.
+
+Developer tool, not a cron job. Creates a scratch ``gauge_bench`` schema
+holding stand-in copies of every gauge source table (only the columns the
+gauge SQL reads), seeds them set-based with ``generate_series`` at the
+requested size, points ``search_path`` at the schema so the unqualified gauge
+SQL resolves to the scratch tables, then times both sampler modes of
+``collect_gauge_values``. The live tables are never read or written, and the
+schema is dropped on exit (pass ``--keep`` to inspect it).
+
+Both modes must return identical values; a mismatch exits non-zero so the
+harness doubles as an equivalence check on realistic volumes.
+
+Usage (from the project root, with the POSTGRES_* env vars of a dev DB):
+    python -m scripts.benchmark_gauge_sampler --utubs 20000 --repeat 5
+"""
+
+from __future__ import annotations
+
+import argparse
+import statistics
+import sys
+import time
+
+import psycopg2.extensions
+
+from scripts.sample_gauges import (
+    SAMPLE_MODE_COMPILED,
+    SAMPLE_MODE_PER_GAUGE,
+    _build_pg_conn_from_env,
+    collect_gauge_values,
+)
+
+BENCH_SCHEMA: str = "gauge_bench"
+
+# Stand-in tables: the gauge SQL only touches these columns. `padding` keeps
+# the row width near the real tables so sequential-scan cost stays realistic.
+CREATE_TABLES_SQL: tuple[str, ...] = (
+    f'CREATE TABLE {BENCH_SCHEMA}."Users" (id integer PRIMARY KEY, padding text)',
+    f'CREATE TABLE {BENCH_SCHEMA}."Utubs" (id integer PRIMARY KEY, padding text)',
+    f'CREATE TABLE {BENCH_SCHEMA}."Urls" (id integer PRIMARY KEY, padding text)',
+    f'CREATE TABLE {BENCH_SCHEMA}."UtubMembers" '
+    '("utubID" integer, "userID" integer, PRIMARY KEY ("utubID", "userID"))',
+    f'CREATE TABLE {BENCH_SCHEMA}."UtubUrls" (id integer PRIMARY KEY, '
+    '"utubID" integer, "urlID" integer, "userID" integer, padding text)',
+    f'CREATE TABLE {BENCH_SCHEMA}."UtubTags" (id integer PRIMARY KEY, '
+    '"utubID" integer, "tagString" text)',
+    f'CREATE TABLE {BENCH_SCHEMA}."UtubUrlTags" (id integer PRIMARY KEY, '
+    '"utubUrlID" integer, "utubTagID" integer)',
+)
+
+# Every statement takes the same named parameters; psycopg2 ignores unused ones.
+SEED_SQL: tuple[str, ...] = (
+    f'INSERT INTO {BENCH_SCHEMA}."Users" '
+    "SELECT g, md5(g::text) FROM generate_series(1, %(users)s) g",
+    f'INSERT INTO {BENCH_SCHEMA}."Utubs" '
+    "SELECT g, md5(g::text) FROM generate_series(1, %(utubs)s) g",
+    f'INSERT INTO {BENCH_SCHEMA}."Urls" '
+    "SELECT g, repeat(md5(g::text), 3) FROM generate_series(1, %(urls)s) g",
+    f'INSERT INTO {BENCH_SCHEMA}."UtubMembers" '
+    "SELECT DISTINCT u, 1 + (u * 7919 + m * 104729) %% %(users)s "
+    "FROM generate_series(1, %(utubs)s) u, "
+    "generate_series(1, %(members_per_utub)s) m",
+    f'INSERT INTO {BENCH_SCHEMA}."UtubUrls" '
+    "SELECT row_number() OVER (), u, 1 + (u * 31 + n * 7) %% %(urls)s, "
+    "1 + (u * 7919 + (n %% %(members_per_utub)s) * 104729) %% %(users)s, "
+    "md5(n::text) "
+    "FROM generate_series(1, %(utubs)s) u, "
+    "generate_series(1, 1 + ((u::bigint * 2654435761) %% (2 * %(urls_per_utub)s))::int) n",
+    f'INSERT INTO {BENCH_SCHEMA}."UtubTags" '
+    "SELECT row_number() OVER (), u, 'tag' || (u * 13 + t) %% 5000 "
+    "FROM generate_series(1, %(utubs)s) u, "
+    "generate_series(1, %(tags_per_utub)s) t",
+    f'INSERT INTO {BENCH_SCHEMA}."UtubUrlTags" '
+    "SELECT row_number() OVER (), uu.id, 1 + (uu.id * 17) %% %(tags)s "
+    f'FROM {BENCH_SCHEMA}."UtubUrls" uu WHERE uu.id %% 2 = 0',
+)
+
+
+def seed_bench_schema(
+    *, pg_conn: psycopg2.extensions.connection, sizes: dict[str, int]
+) -> None:
+    """(Re)create the scratch schema and seed it at ``sizes``; commits."""
+    with pg_conn.cursor() as cursor:
+        cursor.execute(f"DROP SCHEMA IF EXISTS {BENCH_SCHEMA} CASCADE")
+        cursor.execute(f"CREATE SCHEMA {BENCH_SCHEMA}")
+        for create_sql in CREATE_TABLES_SQL:
+            cursor.execute(create_sql)
+        for seed_sql in SEED_SQL:
+            cursor.execute(seed_sql, sizes)
+        for create_sql in CREATE_TABLES_SQL:
+            table_name = create_sql.split()[2]
+            cursor.execute(f"ANALYZE {table_name}")
+    pg_conn.commit()
+
+
+def time_mode(
+    *, pg_conn: psycopg2.extensions.connection, mode: str, repeat: int
+) -> tuple[list[float], dict[object, object]]:
+    """Run ``collect_gauge_values`` ``repeat`` times; return timings (ms) + values."""
+    timings_ms: list[float] = []
+    gauge_values: dict[object, object] = {}
+    with pg_conn.cursor() as cursor:
+        cursor.execute(f"SET search_path TO {BENCH_SCHEMA}")
+        for _ in range(repeat):
+            started_at = time.perf_counter()
+            gauge_values = collect_gauge_values(cursor=cursor, mode=mode)
+            timings_ms.append((time.perf_counter() - started_at) * 1000)
+        cursor.execute("RESET search_path")
+    pg_conn.rollback()
+    return timings_ms, gauge_values
+
+
+def _build_arg_parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(
+        description="Compare per-gauge and compiled gauge sampling timings."
+    )
+    parser.add_argument("--users", type=int, default=5_000)
+    parser.add_argument("--utubs", type=int, default=10_000)
+    parser.add_argument("--urls", type=int, default=50_000)
+    parser.add_argument("--urls-per-utub", type=int, default=20)
+    parser.add_argument("--members-per-utub", type=int, default=3)
+    parser.add_argument("--tags-per-utub", type=int, default=5)
+    parser.add_argument("--repeat", type=int, default=5)
+    parser.add_argument(
+        "--keep", action="store_true", help="Keep the scratch schema afterwards."
+    )
+    return parser
+
+
+def main(argv: list[str] | None = None) -> int:
+    args = _build_arg_parser().parse_args(argv)
+    sizes = {
+        "users": args.users,
+        "utubs": args.utubs,
+        "urls": args.urls,
+        "urls_per_utub": args.urls_per_utub,
+        "members_per_utub": args.members_per_utub,
+        "tags_per_utub": args.tags_per_utub,
+        "tags": args.utubs * args.tags_per_utub,
+    }
+    pg_conn = _build_pg_conn_from_env()
+    try:
+        seed_started_at = time.perf_counter()
+        seed_bench_schema(pg_conn=pg_conn, sizes=sizes)
+        print(f"seeded {sizes} in {time.perf_counter() - seed_started_at:.1f}s")
+
+        results: dict[str, tuple[list[float], dict[object, object]]] = {}
+        for mode in (SAMPLE_MODE_PER_GAUGE, SAMPLE_MODE_COMPILED):
+            results[mode] = time_mode(pg_conn=pg_conn, mode=mode, repeat=args.repeat)
+
+        print("mode\tmin_ms\tmedian_ms\tmax_ms")
+        for mode, (timings_ms, _) in results.items():
+            print(
+                f"{mode}\t{min(timings_ms):.1f}\t{statistics.median(timings_ms):.1f}"
+                f"\t{max(timings_ms):.1f}"
+            )
+
+        per_gauge_values = results[SAMPLE_MODE_PER_GAUGE][1]
+        compiled_values = results[SAMPLE_MODE_COMPILED][1]
+        mismatched = sorted(
+            str(gauge_name)
+            for gauge_name in per_gauge_values
+            if per_gauge_values[gauge_name] != compiled_values.get(gauge_name)
+        )
+        if mismatched:
+            print(f"MISMATCH between modes: {', '.join(mismatched)}", file=sys.stderr)
+            return 1
+        return 0
+    finally:
+        if not args.keep:
+            with pg_conn.cursor() as cursor:
+                cursor.execute(f"DROP SCHEMA IF EXISTS {BENCH_SCHEMA} CASCADE")
+            pg_conn.commit()
+        pg_conn.close()
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -22,6 +22,9 @@ from pathlib import Path
 
 ALLOW_VARS: tuple[str, ...] = (
     "ACCESS_KEY",
+    "GAUGE_SAMPLE_MODE",
+    "MAILJET_API_KEY",
+    "MAILJET_SECRET_KEY",
     "METRICS_BUCKET_SECONDS",
     "METRICS_FLUSH_LIVENESS_THRESHOLD_SECONDS",
     "METRICS_REDIS_URI",
@@ -0,0 +1,184 @@
+"""Standalone compaction of dead ``ApiRefreshTokens`` families.
+
+Invoked once per day by cron in the workflow sidecar container. Every mobile
+refresh adds a row to its device's family and keeps the superseded one, so
+without compaction the table grows forever. A family is dead, and all of its
+rows are deleted, once either:
+
+- every token in it expired more than ``COMPACTION_GRACE_DAYS`` ago, or
+- the whole family was revoked (logout, reuse detection, admin action) more
+  than ``COMPACTION_GRACE_DAYS`` ago.
+
+Rotated rows of a live family are kept: presenting one is how reuse is
+detected. Deleted tokens behave exactly like revoked ones when presented —
+both are rejected as invalid.
+
+Families are deleted ``BATCH_SIZE`` at a time, one transaction per batch, so
+no single statement holds row locks on a large slice of the table.
+
+Has no Flask/SQLAlchemy dependency — only ``psycopg2`` is imported, matching
+the ``purge_audit_log.py`` workflow-venv precedent.
+"""
+
+from __future__ import annotations
+
+from dataclasses import dataclass
+import logging
+import os
+import sys
+import time
+from pathlib import Path
+
+import psycopg2
+import psycopg2.extensions
+
+logging.basicConfig(
+    level=logging.INFO,
+    format="%(asctime)s [%(levelname)s] %(message)s",
+    stream=sys.stderr,
+)
+logger = logging.getLogger("refresh_token_compaction")
+
+CONTAINER_ENVIRONMENT_FILE: str = "/app/container_environment"
+
+COMPACTION_GRACE_DAYS: int = 7
+BATCH_SIZE: int = 500
+MAX_BATCHES_PER_RUN: int = 200
+
+DELETE_DEAD_FAMILIES_SQL: str = """
+    WITH dead_families AS (
+        SELECT "familyId" FROM "ApiRefreshTokens"
+        GROUP BY "familyId"
+        HAVING max("expiresAt") < now() - %(grace_days)s * INTERVAL '1 day'
+            OR bool_and(
+                "revokedAt" IS NOT NULL
+                AND "revokedAt" < now() - %(grace_days)s * INTERVAL '1 day'
+            )
+        LIMIT %(batch_size)s
+    )
+    DELETE FROM "ApiRefreshTokens"
+    WHERE "familyId" IN (SELECT "familyId" FROM dead_families)
+    RETURNING "familyId"
+"""
+
+
+@dataclass(frozen=True)
+class CompactionResult:
+    families: int = 0
+    rows: int = 0
+
+
+def run_compaction(
+    *,
+    pg_conn: psycopg2.extensions.connection,
+    grace_days: int = COMPACTION_GRACE_DAYS,
+    batch_size: int = BATCH_SIZE,
+    max_batches: int = MAX_BATCHES_PER_RUN,
+) -> CompactionResult:
+    """Delete dead refresh-token families, ``batch_size`` families at a time.
+
+    Each batch commits on its own and the run stops at the first batch with
+    fewer than ``batch_size`` families, or after ``max_batches``. On any
+    failure the open batch rolls back and the error is re-raised; batches
+    already committed stay deleted.
+
+    Example: with ``grace_days=7``, a family whose newest token expired 8 days
+    ago is deleted, while one revoked 2 days ago is kept until next week.
+    """
+    families = rows = 0
+    try:
+        for _ in range(max_batches):
+            with pg_conn.cursor() as cursor:
+                cursor.execute(
+                    DELETE_DEAD_FAMILIES_SQL,
+                    {"grace_days": grace_days, "batch_size": batch_size},
+                )
+                deleted_family_ids = [row[0] for row in cursor.fetchall()]
+            pg_conn.commit()
+            batch_families = len(set(deleted_family_ids))
+            families += batch_families
+            rows += len(deleted_family_ids)
+            if batch_families < batch_size:
+                break
+    except Exception:
+        pg_conn.rollback()
+        raise
+    return CompactionResult(families=families, rows=rows)
+
+
+def _load_env_from_container_dump(path: str = CONTAINER_ENVIRONMENT_FILE) -> None:
+    """Best-effort merge of the workflow container's env dump into ``os.environ``.
+
+    Mirrors the cron-line pattern (``set -a && . /app/container_environment &&
+    set +a``) for callers that bypass cron — e.g., a manual ``docker compose
+    exec workflow`` run. Parses ``KEY=value`` lines and only sets entries not
+    already present in ``os.environ`` so genuine env-var overrides win.
+    Silently no-ops if the file is missing.
+    """
+    dump_path = Path(path)
+    if not dump_path.is_file():
+        return
+    try:
+        for raw_line in dump_path.read_text(encoding="utf-8").splitlines():
+            stripped_line = raw_line.strip()
+            if not stripped_line or stripped_line.startswith("#"):
+                continue
+            if "=" not in stripped_line:
+                continue
+            key, _, value = stripped_line.partition("=")
+            key = key.strip()
+            if not key or key in os.environ:
+                continue
+            os.environ[key] = value
+    except OSError:
+        return
+
+
+def _build_pg_conn_from_env() -> psycopg2.extensions.connection:
+    pg_user = os.environ.get("POSTGRES_USER")
+    pg_password = os.environ.get("POSTGRES_PASSWORD")
+    pg_db = os.environ.get("POSTGRES_DB")
+    if not pg_user or not pg_password or not pg_db:
+        _load_env_from_container_dump()
+        pg_user = os.environ.get("POSTGRES_USER")
+        pg_password = os.environ.get("POSTGRES_PASSWORD")
+        pg_db = os.environ.get("POSTGRES_DB")
+    if not pg_user or not pg_password or not pg_db:
+        raise RuntimeError(
+            "POSTGRES_USER, POSTGRES_PASSWORD, and POSTGRES_DB are required"
+        )
+    pg_host = os.environ.get("POSTGRES_HOST", "db")
+    pg_port = int(os.environ.get("POSTGRES_PORT", "5432"))
+    return psycopg2.connect(
+        host=pg_host,
+        port=pg_port,
+        user=pg_user,
+        password=pg_password,
+        dbname=pg_db,
+    )
+
+
+if __name__ == "__main__":
+    started_at = time.time()
+    pg_conn_main: psycopg2.extensions.connection | None = None
+    try:
+        pg_conn_main = _build_pg_conn_from_env()
+        compaction_result = run_compaction(pg_conn=pg_conn_main)
+        elapsed_ms = int((time.time() - started_at) * 1000)
+        logger.info(
+            "families=%d rows=%d grace_days=%d elapsed_ms=%d",
+            compaction_result.families,
+            compaction_result.rows,
+            COMPACTION_GRACE_DAYS,
+            elapsed_ms,
+        )
+        sys.exit(0)
+    except Exception as compaction_error:
+        logger.exception("refresh-token compaction failed: %s", compaction_error)
+        sys.exit(1)
+    finally:
+        if pg_conn_main is not None:
+            try:
+                pg_conn_main.close()
+            except Exception:
+                pass
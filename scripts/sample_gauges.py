@@ -1,10 +1,20 @@
 """Standalone Postgres -> Postgres gauge sampler for anonymous metrics.
 
-Invoked once per hour by cron in the workflow sidecar container. Runs each
-gauge's generated aggregate SQL against the relational tables and writes one
-``AnonymousGauges`` row per gauge per run (a point-in-time snapshot). Has no
-Flask/SQLAlchemy dependency — only ``psycopg2`` (and optionally ``redis`` for a
-best-effort liveness sentinel) are imported.
+Invoked once per hour by cron in the workflow sidecar container. Runs the
+generated gauge SQL against the relational tables and writes one
+``AnonymousGauges`` row per gauge per run (a point-in-time snapshot). The
+default ``incremental`` mode folds the trigger-appended ``GaugeCounterDeltas``
+into their ``GaugeCounters`` rows, reads the VOLUME gauges from those rows, and
+runs one compiled CTE statement per source table for the rest;
+``GAUGE_SAMPLE_MODE=compiled`` scans for every gauge that way, and
+``GAUGE_SAMPLE_MODE=per_gauge`` runs each gauge's own aggregate (see
+``scripts/benchmark_gauge_sampler.py``). Has no Flask/SQLAlchemy dependency —
+only ``psycopg2`` (and optionally ``redis`` for a best-effort liveness
+sentinel) are imported.
+
+Invoked daily with ``--reconcile`` instead, it resets each ``GaugeCounters``
+row to the true count (see ``run_reconcile``) so trigger-bypassing writes —
+e.g. a restore loaded with triggers disabled — cannot leave lasting drift.
 
 The gauge definitions and per-gauge SQL come from ``backend/metrics/gauges.py``,
 a pure leaf module side-loaded by absolute path via ``_load_module_direct`` (the
@@ -84,6 +94,12 @@ _notify_module = _load_module_direct("_notify", "scripts/notify.py")
 GaugeName = _gauges_module.GaugeName
 GAUGE_REGISTRY = _gauges_module.GAUGE_REGISTRY
 build_gauge_sql = _gauges_module.build_gauge_sql
+build_compiled_gauge_queries = _gauges_module.build_compiled_gauge_queries
+build_distinct_refs_rebuild_sql = _gauges_module.build_distinct_refs_rebuild_sql
+INCREMENTAL_GAUGE_NAMES = _gauges_module.INCREMENTAL_GAUGE_NAMES
+GAUGE_COUNTERS_TABLE = _gauges_module.GAUGE_COUNTERS_TABLE
+GAUGE_COUNTER_DELTAS_TABLE = _gauges_module.GAUGE_COUNTER_DELTAS_TABLE
+GAUGE_DISTINCT_REFS_TABLE = _gauges_module.GAUGE_DISTINCT_REFS_TABLE
 value_column_for = _gauges_module.value_column_for
 METRICS_REDIS = _metrics_strs_module.METRICS_REDIS
 build_message = _notify_module.build_message
@@ -110,24 +126,181 @@ INSERT_SQL: str = (
 # explicit follow-up non-goal. Written best-effort (see _record_sample_success).
 GAUGE_LAST_SUCCESS_KEY: str = METRICS_REDIS.GAUGE_LAST_SUCCESS_KEY
 
+# Sampler modes: ``incremental`` (default) reads the VOLUME gauges from
+# GaugeCounters and compiles the rest; ``compiled`` runs one CTE statement per
+# source table for every gauge; ``per_gauge`` runs each gauge's own aggregate.
+# Selected per run via the GAUGE_SAMPLE_MODE env var so an operator can fall
+# back without a deploy.
+SAMPLE_MODE_ENV_VAR: str = "GAUGE_SAMPLE_MODE"
+SAMPLE_MODE_PER_GAUGE: str = "per_gauge"
+SAMPLE_MODE_COMPILED: str = "compiled"
+SAMPLE_MODE_INCREMENTAL: str = "incremental"
+
+# A gauge's value: its base row plus the deltas its triggers appended since the
+# last fold.
+COUNTER_READ_SQL: str = (
+    f'SELECT c."gaugeName", c."value" + COALESCE((SELECT SUM(d."delta") '
+    f'FROM "{GAUGE_COUNTER_DELTAS_TABLE}" AS d '
+    f'WHERE d."gaugeName" = c."gaugeName"), 0) '
+    f'FROM "{GAUGE_COUNTERS_TABLE}" AS c WHERE c."gaugeName" = ANY(%s)'
+)
+COUNTER_ENSURE_SQL: str = (
+    f'INSERT INTO "{GAUGE_COUNTERS_TABLE}" ("gaugeName", "value", "updatedAt") '
+    'VALUES (%s, 0, now()) ON CONFLICT ("gaugeName") DO NOTHING'
+)
+COUNTER_SET_SQL: str = (
+    f'UPDATE "{GAUGE_COUNTERS_TABLE}" SET "value" = %s, "updatedAt" = now() '
+    'WHERE "gaugeName" = %s'
+)
+COUNTER_DELTAS_FOLD_SQL: str = (
+    f'DELETE FROM "{GAUGE_COUNTER_DELTAS_TABLE}" WHERE "gaugeName" = %s'
+)
+# Moves the pending deltas into their base rows in one statement, so exactly
+# the delta rows it deletes are the ones it adds; rows appended meanwhile stay
+# for the next fold.
+COUNTER_DELTAS_APPLY_SQL: str = (
+    f'WITH folded AS (DELETE FROM "{GAUGE_COUNTER_DELTAS_TABLE}" '
+    'WHERE "gaugeName" = ANY(%s) RETURNING "gaugeName", "delta"), '
+    'folded_sums AS (SELECT "gaugeName", SUM("delta") AS "delta" '
+    'FROM folded GROUP BY "gaugeName") '
+    f'UPDATE "{GAUGE_COUNTERS_TABLE}" AS c '
+    'SET "value" = c."value" + f."delta", "updatedAt" = now() '
+    'FROM folded_sums AS f WHERE c."gaugeName" = f."gaugeName"'
+)
+# Serializes the sampler's fold with the reconcile; the triggers only append
+# deltas, so they never wait on it. Taken before any query, so a REPEATABLE
+# READ snapshot starts after the other side has committed.
+COUNTER_LOCK_SQL: str = (
+    f'LOCK TABLE "{GAUGE_COUNTERS_TABLE}" IN SHARE ROW EXCLUSIVE MODE'
+)
+RECONCILE_ISOLATION_SQL: str = "SET TRANSACTION ISOLATION LEVEL REPEATABLE READ"
+DISTINCT_REFS_CLEAR_SQL: str = (
+    f'DELETE FROM "{GAUGE_DISTINCT_REFS_TABLE}" WHERE "gaugeName" = %s'
+)
+
 # Transition-throttle flag — set on the first failure of an outage and cleared
 # on the first subsequent success, so Discord receives at most one failure
 # message and one recovery message per outage rather than a per-run flood.
 GAUGE_FAILURE_FLAG_KEY: str = "metrics:gauge:failure_notified"
 
 
+def _collect_per_gauge_values(
+    cursor: psycopg2.extensions.cursor,
+) -> dict[object, object]:
+    """Run each gauge's own ``build_gauge_sql`` statement — one query per gauge."""
+    gauge_values: dict[object, object] = {}
+    for gauge_name in GaugeName:
+        cursor.execute(build_gauge_sql(gauge_name))
+        gauge_values[gauge_name] = cursor.fetchone()[0]
+    return gauge_values
+
+
+def _collect_compiled_values(
+    cursor: psycopg2.extensions.cursor,
+    gauge_names: list[object] | None = None,
+) -> dict[object, object]:
+    """Run one statement per source table from ``build_compiled_gauge_queries``.
+
+    Each compiled statement returns a single row whose columns line up with
+    its ``gauge_names``, so the sixteen gauges cost one scan per table rather
+    than one scan per gauge. ``gauge_names`` restricts the run to a subset.
+    """
+    gauge_values: dict[object, object] = {}
+    for compiled_query in build_compiled_gauge_queries(gauge_names):
+        cursor.execute(compiled_query.sql)
+        result_row = cursor.fetchone()
+        for gauge_name, scalar_result in zip(compiled_query.gauge_names, result_row):
+            gauge_values[gauge_name] = scalar_result
+    return gauge_values
+
+
+def _collect_incremental_values(
+    cursor: psycopg2.extensions.cursor,
+) -> dict[object, object]:
+    """Read the VOLUME gauges from ``GaugeCounters``; compile the rest.
+
+    The deltas appended since the previous run are first folded into their
+    base rows, so the delta table stays about an hour of writes deep. One read
+    of the base rows (plus any deltas appended since the fold) then replaces
+    the five volume-gauge table scans. A gauge
+    whose counter row is missing (e.g. a schema built without the counter
+    triggers) is logged and falls back to the compiled scan, so the sample is
+    always complete.
+    """
+    incremental_gauge_values = [
+        gauge_name.value for gauge_name in INCREMENTAL_GAUGE_NAMES
+    ]
+    cursor.execute(COUNTER_LOCK_SQL)
+    cursor.execute(COUNTER_DELTAS_APPLY_SQL, (incremental_gauge_values,))
+    cursor.execute(COUNTER_READ_SQL, (incremental_gauge_values,))
+    gauge_values: dict[object, object] = {
+        GaugeName(gauge_name): counter_value
+        for gauge_name, counter_value in cursor.fetchall()
+    }
+    missing_counters = [
+        gauge_name
+        for gauge_name in INCREMENTAL_GAUGE_NAMES
+        if gauge_name not in gauge_values
+    ]
+    if missing_counters:
+        logger.warning(
+            "gauge counters missing, scanning instead: %s",
+            ", ".join(gauge_name.value for gauge_name in missing_counters),
+        )
+    remaining_gauges = [
+        gauge_name for gauge_name in GaugeName if gauge_name not in gauge_values
+    ]
+    gauge_values.update(_collect_compiled_values(cursor, remaining_gauges))
+    return gauge_values
+
+
+_VALUE_COLLECTORS: dict[str, Callable[..., dict[object, object]]] = {
+    SAMPLE_MODE_PER_GAUGE: _collect_per_gauge_values,
+    SAMPLE_MODE_COMPILED: _collect_compiled_values,
+    SAMPLE_MODE_INCREMENTAL: _collect_incremental_values,
+}
+
+
+def collect_gauge_values(
+    *,
+    cursor: psycopg2.extensions.cursor,
+    mode: str = SAMPLE_MODE_INCREMENTAL,
+) -> dict[object, object]:
+    """Return ``{GaugeName: raw scalar}`` for every gauge using ``mode``.
+
+    Every mode produces identical values (``incremental`` once its counters
+    are reconciled); ``per_gauge`` is kept as the reference implementation and
+    for the timing harness.
+    """
+    if mode not in _VALUE_COLLECTORS:
+        raise ValueError(
+            f"Unknown gauge sample mode {mode!r}; expected one of "
+            f"{sorted(_VALUE_COLLECTORS)}"
+        )
+    return _VALUE_COLLECTORS[mode](cursor)
+
+
+def resolve_sample_mode() -> str:
+    """Sample mode from ``GAUGE_SAMPLE_MODE``, defaulting to ``incremental``."""
+    return os.environ.get(SAMPLE_MODE_ENV_VAR, "").strip() or SAMPLE_MODE_INCREMENTAL
+
+
 def run_sample(
     *,
     pg_conn: psycopg2.extensions.connection,
     now_epoch: int,
+    mode: str = SAMPLE_MODE_INCREMENTAL,
 ) -> int:
     """Sample every gauge once and write one AnonymousGauges row per gauge.
 
     Captures a single aware-UTC ``sampled_at`` from ``now_epoch`` for the whole
-    run, then for each ``GaugeName`` member executes the gauge's generated SQL,
-    routes the scalar result to ``valueInt`` vs ``valueFloat`` (the other stays
-    ``None``) per ``value_column_for(kind)``, and bulk-inserts every row in one
-    ``execute_values`` batch under one transaction.
+    run, collects every gauge's scalar via ``collect_gauge_values`` (counter
+    reads plus one statement per remaining source table in ``incremental``
+    mode, one statement per source table in ``compiled`` mode, one per gauge
+    in ``per_gauge`` mode), routes each result to ``valueInt`` vs ``valueFloat``
+    (the other stays ``None``) per ``value_column_for(kind)``, and
+    bulk-inserts every row in one ``execute_values`` batch under one
+    transaction.
 
     Returns the number of inserted rows (always ``len(GaugeName)``). On any
     failure, calls ``rollback()`` and re-raises — there is no partial-sample
@@ -137,10 +310,10 @@ def run_sample(
     rows: list[tuple[object, ...]] = []
     try:
         with pg_conn.cursor() as cursor:
+            gauge_values = collect_gauge_values(cursor=cursor, mode=mode)
             for gauge_name in GaugeName:
                 definition = GAUGE_REGISTRY[gauge_name]
-                cursor.execute(build_gauge_sql(gauge_name))
-                scalar_result = cursor.fetchone()[0]
+                scalar_result = gauge_values[gauge_name]
                 value_int: int | None = None
                 value_float: float | None = None
                 if scalar_result is not None:
@@ -172,6 +345,58 @@ def run_sample(
     return len(rows)
 
 
+def run_reconcile(*, pg_conn: psycopg2.extensions.connection) -> dict[object, int]:
+    """Fold the pending deltas into each ``GaugeCounters`` row and reset it to
+    its gauge's true value.
+
+    Each gauge is reconciled in its own short REPEATABLE READ transaction, so
+    the recount and the deletion of the folded ``GaugeCounterDeltas`` rows see
+    one snapshot: a writer either committed before it (its rows are counted
+    and its delta folded) or its delta row stays behind for the next read; no
+    write is lost or counted twice, and the triggers are never blocked. A
+    COUNT(DISTINCT ...) gauge also rebuilds its ``GaugeDistinctRefs`` rows; its
+    source table is locked against writes (``SHARE``) for that rebuild, taken
+    before the snapshot so in-flight writers have committed. ``GaugeCounters``
+    is locked the same way against a concurrent sampler fold.
+
+    Returns ``{GaugeName: drift}`` — true value minus the stored value (base
+    plus deltas) — for every incremental gauge; non-zero drift is logged. On
+    any failure, rolls back the current gauge's transaction and re-raises.
+    """
+    drift_by_gauge: dict[object, int] = {}
+    for gauge_name in INCREMENTAL_GAUGE_NAMES:
+        definition = GAUGE_REGISTRY[gauge_name]
+        try:
+            with pg_conn.cursor() as cursor:
+                cursor.execute(RECONCILE_ISOLATION_SQL)
+                cursor.execute(COUNTER_LOCK_SQL)
+                if definition.distinct_column is not None:
+                    cursor.execute(f'LOCK TABLE "{definition.table}" IN SHARE MODE')
+                cursor.execute(COUNTER_ENSURE_SQL, (gauge_name.value,))
+                cursor.execute(COUNTER_READ_SQL, ([gauge_name.value],))
+                stored_value = int(cursor.fetchone()[1])
+                if definition.distinct_column is not None:
+                    cursor.execute(DISTINCT_REFS_CLEAR_SQL, (gauge_name.value,))
+                    cursor.execute(build_distinct_refs_rebuild_sql(gauge_name))
+                cursor.execute(build_gauge_sql(gauge_name))
+                true_value = int(cursor.fetchone()[0])
+                cursor.execute(COUNTER_DELTAS_FOLD_SQL, (gauge_name.value,))
+                cursor.execute(COUNTER_SET_SQL, (true_value, gauge_name.value))
+            pg_conn.commit()
+        except Exception:
+            pg_conn.rollback()
+            raise
+        drift_by_gauge[gauge_name] = true_value - stored_value
+        if true_value != stored_value:
+            logger.warning(
+                "gauge counter drift corrected: gauge=%s stored=%d actual=%d",
+                gauge_name.value,
+                stored_value,
+                true_value,
+            )
+    return drift_by_gauge
+
+
 def _record_sample_success(now_epoch: int) -> None:
     """Best-effort stamp of the gauge liveness sentinel after a successful run.
 
@@ -261,6 +486,7 @@ def run_sample_job(
     redis_client: redis.Redis,
     now_epoch: int,
     notifier: Callable[..., int] = send,
+    mode: str = SAMPLE_MODE_INCREMENTAL,
 ) -> int:
     """Run a gauge sample and emit transition-throttled failure/recovery alerts.
 
@@ -276,7 +502,7 @@ def run_sample_job(
     wiring; tests inject a spy.
     """
     try:
-        sampled_rows = run_sample(pg_conn=pg_conn, now_epoch=now_epoch)
+        sampled_rows = run_sample(pg_conn=pg_conn, now_epoch=now_epoch, mode=mode)
     except Exception as sample_error:
         if mark_failure_and_should_notify(redis_client, GAUGE_FAILURE_FLAG_KEY):
             production, notification_url = resolve_notification_env()
@@ -300,7 +526,35 @@ def run_sample_job(
     return sampled_rows
 
 
+def _reconcile_main() -> int:
+    started_at = time.time()
+    pg_conn: psycopg2.extensions.connection | None = None
+    try:
+        pg_conn = _build_pg_conn_from_env()
+        drift_by_gauge = run_reconcile(pg_conn=pg_conn)
+        elapsed_ms = int((time.time() - started_at) * 1000)
+        logger.info(
+            "reconciled=%d drifted=%d elapsed_ms=%d",
+            len(drift_by_gauge),
+            sum(1 for drift in drift_by_gauge.values() if drift != 0),
+            elapsed_ms,
+        )
+        return 0
+    except Exception as reconcile_error:
+        logger.exception("gauge counter reconcile failed: %s", reconcile_error)
+        return 1
+    finally:
+        if pg_conn is not None:
+            try:
+                pg_conn.close()
+            except Exception:
+                pass
+
+
 if __name__ == "__main__":
+    if "--reconcile" in sys.argv[1:]:
+        sys.exit(_reconcile_main())
+
     started_at = time.time()
     redis_client_main: redis.Redis | None = None
     pg_conn_main: psycopg2.extensions.connection | None = None
@@ -312,6 +566,7 @@ if __name__ == "__main__":
             pg_conn=pg_conn_main,
             redis_client=redis_client_main,
             now_epoch=now_epoch_main,
+            mode=resolve_sample_mode(),
         )
         elapsed_ms = int((time.time() - started_at) * 1000)
         logger.info("sampled=%d elapsed_ms=%d", sampled_rows, elapsed_ms)
@@ -0,0 +1,350 @@
+"""Standalone sender for the ``EmailOutbox`` table.
+
+Invoked once per minute by cron in the workflow sidecar container. The web
+app, with ``EMAIL_OUTBOX_ENABLED``, writes each outbound email as a fully
+rendered Mailjet v3.1 message in the same transaction as the token row it
+carries; this worker delivers them, so request latency never depends on
+Mailjet.
+
+Each batch is claimed with ``FOR UPDATE SKIP LOCKED`` (an overlapping cron
+run skips rows another run is sending) and sent as one Mailjet request of up
+to ``MAILJET_BATCH_SIZE`` messages, with an explicit timeout. Per message:
+
+- accepted by Mailjet: the row is deleted;
+- rejected by Mailjet (bad address, invalid payload): ``failedAt`` is set,
+  since resending the same payload cannot succeed;
+- whole request failed (timeout, connection error, 5xx, 429, auth): the
+  attempt is counted and the row retried after an exponential backoff, up to
+  ``MAX_SEND_ATTEMPTS``. The run stops at the first such failure rather than
+  hammering a provider that is down.
+
+Failed rows are kept for ``FAILED_RETENTION_DAYS`` for inspection, then
+purged.
+
+Has no Flask/SQLAlchemy dependency — only ``psycopg2`` and the standard
+library are imported, matching the ``purge_audit_log.py`` workflow-venv
+precedent. The transport is injectable; tests use
+``backend/testing/fake_mailjet.py`` instead of the network.
+"""
+
+from __future__ import annotations
+
+import base64
+from collections.abc import Callable
+from dataclasses import dataclass
+import json
+import logging
+import os
+import sys
+import time
+import urllib.error
+import urllib.request
+from pathlib import Path
+
+import psycopg2
+import psycopg2.extensions
+
+logging.basicConfig(
+    level=logging.INFO,
+    format="%(asctime)s [%(levelname)s] %(message)s",
+    stream=sys.stderr,
+)
+logger = logging.getLogger("email_outbox")
+
+CONTAINER_ENVIRONMENT_FILE: str = "/app/container_environment"
+
+MAILJET_SEND_URL: str = "https://api.mailjet.com/v3.1/send"
+# Mailjet v3.1 accepts at most 50 messages per send request
+MAILJET_BATCH_SIZE: int = 50
+MAILJET_TIMEOUT_SECONDS: float = 10.0
+MAX_BATCHES_PER_RUN: int = 20
+
+MAX_SEND_ATTEMPTS: int = 6
+BACKOFF_BASE_SECONDS: int = 60
+BACKOFF_MAX_SECONDS: int = 3600
+FAILED_RETENTION_DAYS: int = 30
+
+CUSTOM_ID_PREFIX: str = "outbox-"
+LAST_ERROR_MAX_LENGTH: int = 1000
+
+CLAIM_BATCH_SQL: str = """
+    SELECT "id", "message", "attempts" FROM "EmailOutbox"
+    WHERE "failedAt" IS NULL AND "nextAttemptAt" <= now()
+    ORDER BY "nextAttemptAt", "id"
+    LIMIT %s
+    FOR UPDATE SKIP LOCKED
+"""
+DELETE_SENT_SQL: str = 'DELETE FROM "EmailOutbox" WHERE "id" = ANY(%s)'
+MARK_FAILED_SQL: str = """
+    UPDATE "EmailOutbox"
+    SET "attempts" = "attempts" + 1, "failedAt" = now(), "lastError" = %s
+    WHERE "id" = %s
+"""
+SCHEDULE_RETRY_SQL: str = """
+    UPDATE "EmailOutbox"
+    SET "attempts" = %s, "lastError" = %s,
+        "nextAttemptAt" = now() + %s * INTERVAL '1 second'
+    WHERE "id" = %s
+"""
+PURGE_FAILED_SQL: str = (
+    'DELETE FROM "EmailOutbox" WHERE "failedAt" < now() - %s * INTERVAL \'1 day\''
+)
+
+# Takes a list of Mailjet v3.1 messages and returns Mailjet's per-message
+# results. Raises OSError when the request as a whole did not go through.
+MailjetTransport = Callable[[list[dict]], list[dict]]
+
+
+@dataclass(frozen=True)
+class OutboxRunResult:
+    sent: int = 0
+    failed: int = 0
+    retried: int = 0
+    purged: int = 0
+
+
+def backoff_seconds(attempts: int) -> int:
+    """Delay before retry number ``attempts`` (1-based), doubling up to a cap.
+
+    Example:
+        >>> [backoff_seconds(attempt) for attempt in (1, 2, 3, 7, 8)]
+        [60, 120, 240, 3600, 3600]
+    """
+    return min(BACKOFF_BASE_SECONDS * 2 ** (attempts - 1), BACKOFF_MAX_SECONDS)
+
+
+def build_mailjet_transport(
+    *,
+    api_key: str,
+    api_secret: str,
+    url: str = MAILJET_SEND_URL,
+    timeout_seconds: float = MAILJET_TIMEOUT_SECONDS,
+) -> MailjetTransport:
+    credentials = base64.b64encode(f"{api_key}:{api_secret}".encode()).decode()
+
+    def send(messages: list[dict]) -> list[dict]:
+        send_request = urllib.request.Request(
+            url,
+            data=json.dumps({"Messages": messages}).encode("utf-8"),
+            headers={
+                "Authorization": f"Basic {credentials}",
+                "Content-Type": "application/json",
+            },
+            method="POST",
+        )
+        try:
+            with urllib.request.urlopen(send_request, timeout=timeout_seconds) as resp:
+                return json.load(resp)["Messages"]
+        except urllib.error.HTTPError as http_error:
+            # A 400 carries the per-message breakdown; anything else is a
+            # request-level failure and propagates (HTTPError is an OSError).
+            if http_error.code != 400:
+                raise
+            try:
+                return json.load(http_error)["Messages"]
+            except (ValueError, KeyError) as parse_error:
+                raise OSError(f"Unreadable Mailjet 400 response: {parse_error}")
+
+    return send
+
+
+def _custom_id(outbox_id: int) -> str:
+    return f"{CUSTOM_ID_PREFIX}{outbox_id}"
+
+
+def _error_text(result: dict) -> str:
+    return json.dumps(result.get("Errors", result))[:LAST_ERROR_MAX_LENGTH]
+
+
+def _retry_or_fail(
+    cursor: psycopg2.extensions.cursor, row_id: int, attempts: int, error_text: str
+) -> bool:
+    """Schedule the row's next attempt, or fail it once out of attempts.
+
+    Returns True if a retry was scheduled.
+    """
+    if attempts + 1 >= MAX_SEND_ATTEMPTS:
+        cursor.execute(MARK_FAILED_SQL, (error_text, row_id))
+        return False
+    cursor.execute(
+        SCHEDULE_RETRY_SQL,
+        (attempts + 1, error_text, backoff_seconds(attempts + 1), row_id),
+    )
+    return True
+
+
+def _send_batch(
+    cursor: psycopg2.extensions.cursor,
+    transport: MailjetTransport,
+    rows: list[tuple[int, dict, int]],
+) -> tuple[OutboxRunResult, bool]:
+    """Send one claimed batch and record the outcome of every row.
+
+    Returns the batch's counts and whether the run should go on.
+    """
+    messages = [
+        {**message, "CustomID": _custom_id(row_id)} for row_id, message, _ in rows
+    ]
+    try:
+        results = transport(messages)
+    except OSError as send_error:
+        logger.warning("mailjet request failed: %s", send_error)
+        error_text = str(send_error)[:LAST_ERROR_MAX_LENGTH]
+        retried = sum(
+            _retry_or_fail(cursor, row_id, attempts, error_text)
+            for row_id, _, attempts in rows
+        )
+        return OutboxRunResult(failed=len(rows) - retried, retried=retried), False
+
+    results_by_custom_id = {result.get("CustomID"): result for result in results}
+    sent_ids: list[int] = []
+    failed = retried = 0
+    for row_id, _, attempts in rows:
+        result = results_by_custom_id.get(_custom_id(row_id))
+        if result is None:
+            if _retry_or_fail(
+                cursor, row_id, attempts, "Missing from Mailjet response"
+            ):
+                retried += 1
+            else:
+                failed += 1
+        elif result.get("Status") == "success":
+            sent_ids.append(row_id)
+        else:
+            cursor.execute(MARK_FAILED_SQL, (_error_text(result), row_id))
+            failed += 1
+
+    if sent_ids:
+        cursor.execute(DELETE_SENT_SQL, (sent_ids,))
+    return OutboxRunResult(sent=len(sent_ids), failed=failed, retried=retried), True
+
+
+def run_send(
+    *,
+    pg_conn: psycopg2.extensions.connection,
+    transport: MailjetTransport,
+    batch_size: int = MAILJET_BATCH_SIZE,
+    max_batches: int = MAX_BATCHES_PER_RUN,
+    failed_retention_days: int = FAILED_RETENTION_DAYS,
+) -> OutboxRunResult:
+    """Send due outbox rows in batches, then purge expired failed rows.
+
+    Each batch is its own transaction: the claimed rows stay locked while
+    Mailjet is called and the outcome is committed before the next claim. On
+    an unexpected error the open batch rolls back, leaving its rows due, and
+    the error is re-raised.
+    """
+    sent = failed = retried = 0
+    try:
+        for _ in range(max_batches):
+            with pg_conn.cursor() as cursor:
+                cursor.execute(CLAIM_BATCH_SQL, (batch_size,))
+                rows = cursor.fetchall()
+                if not rows:
+                    pg_conn.commit()
+                    break
+                batch_result, keep_going = _send_batch(cursor, transport, rows)
+            pg_conn.commit()
+            sent += batch_result.sent
+            failed += batch_result.failed
+            retried += batch_result.retried
+            if not keep_going:
+                break
+
+        with pg_conn.cursor() as cursor:
+            cursor.execute(PURGE_FAILED_SQL, (failed_retention_days,))
+            purged = cursor.rowcount
+        pg_conn.commit()
+    except Exception:
+        pg_conn.rollback()
+        raise
+    return OutboxRunResult(sent=sent, failed=failed, retried=retried, purged=purged)
+
+
+def _load_env_from_container_dump(path: str = CONTAINER_ENVIRONMENT_FILE) -> None:
+    """Best-effort merge of the workflow container's env dump into ``os.environ``.
+
+    Mirrors the cron-line pattern (``set -a && . /app/container_environment &&
+    set +a``) for callers that bypass cron — e.g., a manual ``docker compose
+    exec workflow`` run. Parses ``KEY=value`` lines and only sets entries not
+    already present in ``os.environ`` so genuine env-var overrides win.
+    Silently no-ops if the file is missing.
+    """
+    dump_path = Path(path)
+    if not dump_path.is_file():
+        return
+    try:
+        for raw_line in dump_path.read_text(encoding="utf-8").splitlines():
+            stripped_line = raw_line.strip()
+            if not stripped_line or stripped_line.startswith("#"):
+                continue
+            if "=" not in stripped_line:
+                continue
+            key, _, value = stripped_line.partition("=")
+            key = key.strip()
+            if not key or key in os.environ:
+                continue
+            os.environ[key] = value
+    except OSError:
+        return
+
+
+def _build_pg_conn_from_env() -> psycopg2.extensions.connection:
+    pg_user = os.environ.get("POSTGRES_USER")
+    pg_password = os.environ.get("POSTGRES_PASSWORD")
+    pg_db = os.environ.get("POSTGRES_DB")
+    if not pg_user or not pg_password or not pg_db:
+        _load_env_from_container_dump()
+        pg_user = os.environ.get("POSTGRES_USER")
+        pg_password = os.environ.get("POSTGRES_PASSWORD")
+        pg_db = os.environ.get("POSTGRES_DB")
+    if not pg_user or not pg_password or not pg_db:
+        raise RuntimeError(
+            "POSTGRES_USER, POSTGRES_PASSWORD, and POSTGRES_DB are required"
+        )
+    pg_host = os.environ.get("POSTGRES_HOST", "db")
+    pg_port = int(os.environ.get("POSTGRES_PORT", "5432"))
+    return psycopg2.connect(
+        host=pg_host,
+        port=pg_port,
+        user=pg_user,
+        password=pg_password,
+        dbname=pg_db,
+    )
+
+
+def _build_transport_from_env() -> MailjetTransport:
+    api_key = os.environ.get("MAILJET_API_KEY")
+    api_secret = os.environ.get("MAILJET_SECRET_KEY")
+    if not api_key or not api_secret:
+        raise RuntimeError("MAILJET_API_KEY and MAILJET_SECRET_KEY are required")
+    return build_mailjet_transport(api_key=api_key, api_secret=api_secret)
+
+
+if __name__ == "__main__":
+    started_at = time.time()
+    pg_conn_main: psycopg2.extensions.connection | None = None
+    try:
+        pg_conn_main = _build_pg_conn_from_env()
+        run_result = run_send(
+            pg_conn=pg_conn_main, transport=_build_transport_from_env()
+        )
+        elapsed_ms = int((time.time() - started_at) * 1000)
+        logger.info(
+            "sent=%d failed=%d retried=%d purged=%d elapsed_ms=%d",
+            run_result.sent,
+            run_result.failed,
+            run_result.retried,
+            run_result.purged,
+            elapsed_ms,
+        )
+        sys.exit(0)
+    except Exception as send_error:
+        logger.exception("email outbox send failed: %s", send_error)
+        sys.exit(1)
+    finally:
+        if pg_conn_main is not None:
+            try:
+                pg_conn_main.close()
+            except Exception:
+                pass
@@ -0,0 +1,358 @@
+"""Long-running scheduler for the workflow sidecar's recurring jobs.
+
+The alternative to the per-job cron lines in ``docker/crontab.workflow``,
+enabled by ``WORKFLOW_DAEMON=true`` (see ``docker/startup-workflow.sh``). Cron
+starts a fresh Python process for every job run, and each run re-side-loads
+its leaf modules, re-reads ``/app/container_environment``, and opens its own
+Postgres connection and Redis client. This daemon does all of that once and
+then runs every job on its schedule, in one process:
+
+=========================  ===============  ====================================
+Job                        Schedule (UTC)   Entry point
+=========================  ===============  ====================================
+``metrics_flush``          every minute     ``flush_metrics.run_flush_job`` (also
+                                            drains, rolls up and prunes latency)
+``email_outbox``           every minute     ``send_email_outbox.run_send``
+``gauge_sample``           hourly at :00    ``sample_gauges.run_sample_job``
+``audit_purge``            daily 02:00      ``purge_audit_log.run_purge``
+``refresh_token_compact``  daily 02:30      ``compact_refresh_tokens.run_compaction``
+``gauge_reconcile``        daily 03:00      ``sample_gauges.run_reconcile``
+=========================  ===============  ====================================
+
+The jobs are the same functions the cron entry points call, so each keeps its
+own Redis lock, liveness sentinel (``metrics:flush:last_success_epoch`` for the
+flush, the gauge sentinel for sampling) and transition-throttled failure /
+recovery notifications. The backup jobs stay on cron: they shell out to
+``daily-docker.sh`` and gain nothing from a warm process.
+
+The jobs run in two lanes. The minutely and hourly jobs share the main
+thread; the daily jobs run one at a time on a worker thread with their own
+Postgres connection, so a long purge or reconcile never holds up the metrics
+flush past ``METRICS_FLUSH_LIVENESS_THRESHOLD_SECONDS`` and trips its liveness
+alert. Within a lane, a job that overruns its next slot skips the slots it
+missed instead of queueing them, as an overlapping cron run would have been
+turned away by the job's own lock anyway. Each lane keeps its Postgres
+connection open and checks it with ``SELECT 1`` before each job (a server-side
+idle disconnect reconnects instead of failing the job); the Redis client, and
+its connection pool, is shared. A failed job is logged and the daemon carries
+on; SIGTERM / SIGINT stop both lanes between jobs.
+
+Has no Flask/SQLAlchemy dependency — only ``redis`` and ``psycopg2`` are
+imported, through the side-loaded job scripts.
+"""
+
+from __future__ import annotations
+
+from collections.abc import Callable
+from dataclasses import dataclass
+import importlib.util
+import logging
+import signal
+import sys
+import threading
+import time
+from pathlib import Path
+from types import ModuleType
+
+import psycopg2
+import psycopg2.extensions
+import redis
+
+logging.basicConfig(
+    level=logging.INFO,
+    format="%(asctime)s [%(levelname)s] %(message)s",
+    stream=sys.stderr,
+)
+logger = logging.getLogger("workflow_daemon")
+
+
+def _load_sibling_script(module_name: str, file_name: str) -> ModuleType:
+    """Load a job script that sits next to this file, once, for the daemon's life.
+
+    The scripts are siblings both in the workflow container (``/app/<name>``)
+    and in the source tree (``scripts/<name>``); each one side-loads its own
+    backend leaf modules with ``_load_module_direct`` as it loads.
+    """
+    module_path = Path(__file__).resolve().parent / file_name
+    spec = importlib.util.spec_from_file_location(module_name, module_path)
+    if spec is None or spec.loader is None:
+        raise ImportError(f"Could not load spec for {module_path}")
+    module = importlib.util.module_from_spec(spec)
+    sys.modules[spec.name] = module
+    spec.loader.exec_module(module)
+    return module
+
+
+_flush_metrics = _load_sibling_script("_flush_metrics", "flush_metrics.py")
+_send_email_outbox = _load_sibling_script("_send_email_outbox", "send_email_outbox.py")
+_sample_gauges = _load_sibling_script("_sample_gauges", "sample_gauges.py")
+_purge_audit_log = _load_sibling_script("_purge_audit_log", "purge_audit_log.py")
+_compact_refresh_tokens = _load_sibling_script(
+    "_compact_refresh_tokens", "compact_refresh_tokens.py"
+)
+
+MINUTE_SECONDS: int = 60
+HOUR_SECONDS: int = 3600
+DAY_SECONDS: int = 86_400
+
+
+class WorkflowConnections:
+    """The Postgres connection and Redis client every job shares.
+
+    ``pg_connect`` opens a new connection; it is only called by the first job
+    and after the open connection is found dead.
+    """
+
+    def __init__(
+        self,
+        *,
+        pg_connect: Callable[[], psycopg2.extensions.connection],
+        redis_client: redis.Redis,
+    ) -> None:
+        self._pg_connect = pg_connect
+        self._pg_conn: psycopg2.extensions.connection | None = None
+        self.redis_client = redis_client
+
+    def pg_conn(self) -> psycopg2.extensions.connection:
+        """The shared connection, reconnected first if it no longer answers."""
+        if self._pg_conn is not None and not self._pg_conn.closed:
+            try:
+                # Also ends any transaction a failed job left open
+                self._pg_conn.rollback()
+                with self._pg_conn.cursor() as cursor:
+                    cursor.execute("SELECT 1")
+                self._pg_conn.rollback()
+                return self._pg_conn
+            except (psycopg2.OperationalError, psycopg2.InterfaceError):
+                logger.warning("postgres connection lost, reconnecting")
+                self.discard_pg_conn()
+        self._pg_conn = self._pg_connect()
+        return self._pg_conn
+
+    def discard_pg_conn(self) -> None:
+        if self._pg_conn is None:
+            return
+        try:
+            self._pg_conn.close()
+        except Exception:
+            pass
+        self._pg_conn = None
+
+    def close(self) -> None:
+        self.discard_pg_conn()
+        try:
+            self.redis_client.close()
+        except Exception:
+            pass
+
+
+@dataclass
+class ScheduledJob:
+    """One recurring job, run every ``interval_seconds`` at ``offset_seconds``.
+
+    Slots are aligned to the UTC epoch like a cron line: an hourly job with no
+    offset runs at every :00, a daily job with ``offset_seconds=7200`` at 02:00.
+    ``run`` does the work and returns the summary that is logged on success.
+    """
+
+    name: str
+    interval_seconds: int
+    run: Callable[[WorkflowConnections, int], str]
+    offset_seconds: int = 0
+    next_run_epoch: int = 0
+
+    def schedule_after(self, now_epoch: int) -> None:
+        """Move ``next_run_epoch`` to the first slot strictly after ``now_epoch``.
+
+        Example: an hourly job checked at 10:59:30 next runs at 11:00:00; one
+        that overran from 11:00 until 12:20 skips 12:00 and next runs at 13:00.
+        """
+        slots_elapsed = (now_epoch - self.offset_seconds) // self.interval_seconds
+        self.next_run_epoch = (
+            slots_elapsed + 1
+        ) * self.interval_seconds + self.offset_seconds
+
+
+def _run_metrics_flush(connections: WorkflowConnections, now_epoch: int) -> str:
+    upserted_rows = _flush_metrics.run_flush_job(
+        redis_client=connections.redis_client, pg_conn=connections.pg_conn()
+    )
+    return f"upserted={upserted_rows}"
+
+
+def _run_email_outbox(connections: WorkflowConnections, now_epoch: int) -> str:
+    run_result = _send_email_outbox.run_send(
+        pg_conn=connections.pg_conn(),
+        transport=_send_email_outbox._build_transport_from_env(),
+    )
+    return (
+        f"sent={run_result.sent} failed={run_result.failed} "
+        f"retried={run_result.retried} purged={run_result.purged}"
+    )
+
+
+def _run_gauge_sample(connections: WorkflowConnections, now_epoch: int) -> str:
+    sampled_rows = _sample_gauges.run_sample_job(
+        pg_conn=connections.pg_conn(),
+        redis_client=connections.redis_client,
+        now_epoch=now_epoch,
+        mode=_sample_gauges.resolve_sample_mode(),
+    )
+    return f"sampled={sampled_rows}"
+
+
+def _run_audit_purge(connections: WorkflowConnections, now_epoch: int) -> str:
+    deleted_row_count = _purge_audit_log.run_purge(pg_conn=connections.pg_conn())
+    return f"purged={deleted_row_count}"
+
+
+def _run_refresh_token_compaction(
+    connections: WorkflowConnections, now_epoch: int
+) -> str:
+    compaction_result = _compact_refresh_tokens.run_compaction(
+        pg_conn=connections.pg_conn()
+    )
+    return f"families={compaction_result.families} rows={compaction_result.rows}"
+
+
+def _run_gauge_reconcile(connections: WorkflowConnections, now_epoch: int) -> str:
+    drift_by_gauge = _sample_gauges.run_reconcile(pg_conn=connections.pg_conn())
+    drifted = sum(1 for drift in drift_by_gauge.values() if drift != 0)
+    return f"reconciled={len(drift_by_gauge)} drifted={drifted}"
+
+
+def build_default_jobs() -> list[ScheduledJob]:
+    """The crontab.workflow schedule for every job this daemon takes over."""
+    return [
+        ScheduledJob("metrics_flush", MINUTE_SECONDS, _run_metrics_flush),
+        ScheduledJob("email_outbox", MINUTE_SECONDS, _run_email_outbox),
+        ScheduledJob("gauge_sample", HOUR_SECONDS, _run_gauge_sample),
+        ScheduledJob(
+            "audit_purge", DAY_SECONDS, _run_audit_purge, offset_seconds=2 * 3600
+        ),
+        ScheduledJob(
+            "refresh_token_compact",
+            DAY_SECONDS,
+            _run_refresh_token_compaction,
+            offset_seconds=2 * 3600 + 30 * 60,
+        ),
+        ScheduledJob(
+            "gauge_reconcile",
+            DAY_SECONDS,
+            _run_gauge_reconcile,
+            offset_seconds=3 * 3600,
+        ),
+    ]
+
+
+def split_daily_jobs(
+    jobs: list[ScheduledJob],
+) -> tuple[list[ScheduledJob], list[ScheduledJob]]:
+    """``(frequent jobs, daily jobs)``, the jobs of the main and worker lanes."""
+    frequent_jobs = [job for job in jobs if job.interval_seconds < DAY_SECONDS]
+    daily_jobs = [job for job in jobs if job.interval_seconds >= DAY_SECONDS]
+    return frequent_jobs, daily_jobs
+
+
+def run_due_jobs(
+    jobs: list[ScheduledJob],
+    connections: WorkflowConnections,
+    *,
+    clock: Callable[[], float] = time.time,
+) -> list[str]:
+    """Run every job whose slot has come, in order, and reschedule each one.
+
+    Returns the names of the jobs that failed. A failure is logged and never
+    stops the remaining jobs; after one, the Postgres connection is rolled
+    back, or dropped if it is no longer usable, before the next job runs.
+    """
+    failed_job_names: list[str] = []
+    for job in jobs:
+        now_epoch = int(clock())
+        if job.next_run_epoch > now_epoch:
+            continue
+        started_at = clock()
+        try:
+            summary = job.run(connections, now_epoch)
+            elapsed_ms = int((clock() - started_at) * 1000)
+            logger.info("job=%s %s elapsed_ms=%d", job.name, summary, elapsed_ms)
+        except Exception as job_error:
+            failed_job_names.append(job.name)
+            logger.exception("job=%s failed: %s", job.name, job_error)
+            if isinstance(
+                job_error, (psycopg2.OperationalError, psycopg2.InterfaceError)
+            ):
+                connections.discard_pg_conn()
+        job.schedule_after(int(clock()))
+    return failed_job_names
+
+
+def run_forever(
+    jobs: list[ScheduledJob],
+    connections: WorkflowConnections,
+    stop_event: threading.Event,
+    *,
+    clock: Callable[[], float] = time.time,
+) -> None:
+    """Run the jobs on their schedules until ``stop_event`` is set.
+
+    Every job waits for its first slot after start-up, as under cron.
+    """
+    for job in jobs:
+        job.schedule_after(int(clock()))
+    while not stop_event.is_set():
+        run_due_jobs(jobs, connections, clock=clock)
+        next_run_epoch = min(job.next_run_epoch for job in jobs)
+        stop_event.wait(max(next_run_epoch - clock(), 0))
+
+
+def main() -> int:
+    stop_event = threading.Event()
+
+    def _request_stop(signum: int, frame: object) -> None:
+        logger.info("received signal %d, stopping after the current job", signum)
+        stop_event.set()
+
+    signal.signal(signal.SIGTERM, _request_stop)
+    signal.signal(signal.SIGINT, _request_stop)
+
+    # Read once for the daemon's life rather than on every job run. Postgres is
+    # connected on the first job, so a database that is still starting fails
+    # that job (and alerts) instead of the daemon.
+    _flush_metrics._load_env_from_container_dump()
+    try:
+        connections = WorkflowConnections(
+            pg_connect=_flush_metrics._build_pg_conn_from_env,
+            redis_client=_flush_metrics._build_redis_client_from_env(),
+        )
+    except Exception as startup_error:
+        logger.exception("workflow daemon failed to start: %s", startup_error)
+        return 1
+
+    jobs = build_default_jobs()
+    frequent_jobs, daily_jobs = split_daily_jobs(jobs)
+    daily_connections = WorkflowConnections(
+        pg_connect=_flush_metrics._build_pg_conn_from_env,
+        redis_client=connections.redis_client,
+    )
+    daily_lane = threading.Thread(
+        target=run_forever,
+        args=(daily_jobs, daily_connections, stop_event),
+        name="workflow-daily",
+    )
+    logger.info("workflow daemon started: %s", ", ".join(job.name for job in jobs))
+    daily_lane.start()
+    try:
+        run_forever(frequent_jobs, connections, stop_event)
+    finally:
+        # Also stops the daily lane if the main lane died on its own
+        stop_event.set()
+        daily_lane.join()
+        daily_connections.discard_pg_conn()
+        connections.close()
+    logger.info("workflow daemon stopped")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
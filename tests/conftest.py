@@ -1,6 +1,16 @@
 import os
 import logging
-from typing import Any, Awaitable, Generator, Optional, Tuple, Union
+from contextlib import contextmanager
+from typing import (
+    Any,
+    Awaitable,
+    Callable,
+    ContextManager,
+    Generator,
+    Optional,
+    Tuple,
+    Union,
+)
 
 from flask import Flask
 from flask.testing import FlaskCliRunner, FlaskClient
@@ -15,6 +25,7 @@ from sqlalchemy import create_engine, event, inspect as sa_inspect, text
 from sqlalchemy.orm import scoped_session, sessionmaker
 
 from backend import create_app, db
+from backend.extensions.sql_tracing import SqlTrace, capture_sql_statements
 from backend.config import (
     ConfigTest,
     IS_DOCKER,
@@ -492,6 +503,28 @@ def client(app: Flask) -> FlaskClient:
     return app.test_client()
 
 
+@pytest.fixture
+def assert_max_queries() -> Callable[[int], ContextManager[SqlTrace]]:
+    """
+    Fails the test when the wrapped block runs more than `max_queries` SQL
+    statements, listing the statements that repeated (likely N+1 loops).
+
+    Usage:
+        with assert_max_queries(5):
+            client.get(url)
+    """
+
+    @contextmanager
+    def _assert_max_queries(max_queries: int) -> Generator[SqlTrace, None, None]:
+        with capture_sql_statements() as sql_trace:
+            yield sql_trace
+        assert (
+            sql_trace.statement_count <= max_queries
+        ), f"Expected at most {max_queries} statement(s), ran {sql_trace.describe()}"
+
+    return _assert_max_queries
+
+
 @pytest.fixture
 def load_register_page(
     client: FlaskClient,
@@ -1,7 +1,7 @@
 from __future__ import annotations
 
 from datetime import datetime, timedelta, timezone
-from typing import Tuple
+from typing import Callable, ContextManager, Tuple
 from urllib.parse import quote
 
 import pytest
@@ -10,6 +10,7 @@ from flask.testing import FlaskClient
 
 from backend import db
 from backend.admin.audit_service import AuditLogFilters, query_audit_log
+from backend.extensions.sql_tracing import SqlTrace
 from backend.models.audit_log import AuditLog
 from backend.models.users import Users
 from backend.utils.strings.admin_portal_strs import (
@@ -45,6 +46,13 @@ _TARGET_TYPE_USERS_PLURAL: str = "Users"
 _PAGINATION_SEED_COUNT: int = 5
 _PAGINATION_LIMIT: int = 2
 
+# Query-count test: rows from several actors, rendered with each actor's
+# username. Loading the session user, the planner estimate, the exact count
+# and the page itself are the whole budget; a per-row actor load exceeds it.
+_QUERY_COUNT_ACTOR_COUNT: int = 4
+_QUERY_COUNT_ROWS_PER_ACTOR: int = 2
+_AUDIT_LOG_ROWS_MAX_QUERIES: int = 5
+
 
 def _utc_days_ago(days: int) -> datetime:
     """Return a timezone-aware UTC datetime `days` days before now."""
@@ -584,6 +592,108 @@ def test_admin_audit_log_pagination_pages_are_disjoint(
     assert page_one_ids.isdisjoint(page_two_ids)
 
 
+def test_admin_audit_log_cursor_pages_follow_newest_first_order(
+    login_admin_user_with_register: Tuple[FlaskClient, str, Users, Flask],
+) -> None:
+    """
+    GIVEN five seeded audit rows, two of them sharing a created_at
+    WHEN query_audit_log() pages forward by next_cursor with a limit of 2, then
+         back from the last page by previous_cursor
+    THEN the forward pages cover every row once in (created_at, id) DESC
+         order, the last page has no next_cursor, and paging back returns
+         the middle page again.
+    """
+    _, _, admin_user, app = login_admin_user_with_register
+    shared_moment = _utc_days_ago(2)
+
+    with app.app_context():
+        for row_index in range(_PAGINATION_SEED_COUNT):
+            _seed_audit_row(
+                actor_id=admin_user.id,
+                action=f"admin.test.cursor{row_index}",
+                created_at=shared_moment if row_index < 2 else _utc_days_ago(1),
+            )
+
+    with app.app_context():
+        expected_ids = [
+            audit_row.id
+            for audit_row in AuditLog.query.order_by(
+                AuditLog.created_at.desc(), AuditLog.id.desc()
+            ).all()
+        ]
+        first_page = query_audit_log(filters=AuditLogFilters(), limit=_PAGINATION_LIMIT)
+        second_page = query_audit_log(
+            filters=AuditLogFilters(),
+            limit=_PAGINATION_LIMIT,
+            offset=first_page.next_offset,
+            after=first_page.next_cursor,
+        )
+        third_page = query_audit_log(
+            filters=AuditLogFilters(),
+            limit=_PAGINATION_LIMIT,
+            offset=second_page.next_offset,
+            after=second_page.next_cursor,
+        )
+        back_to_second_page = query_audit_log(
+            filters=AuditLogFilters(),
+            limit=_PAGINATION_LIMIT,
+            offset=third_page.previous_offset,
+            before=third_page.previous_cursor,
+        )
+
+    forward_ids = [
+        entry.id
+        for audit_page in (first_page, second_page, third_page)
+        for entry in audit_page.entries
+    ]
+    assert forward_ids == expected_ids
+    assert first_page.total_count == _PAGINATION_SEED_COUNT
+    assert not first_page.count_is_estimate
+    assert third_page.has_previous and not third_page.has_next
+    assert [entry.id for entry in back_to_second_page.entries] == [
+        entry.id for entry in second_page.entries
+    ]
+    assert back_to_second_page.has_previous and back_to_second_page.has_next
+
+
+def test_admin_audit_log_rows_query_count_does_not_grow_with_actors(
+    login_admin_user_with_register: Tuple[FlaskClient, str, Users, Flask],
+    assert_max_queries: Callable[[int], ContextManager[SqlTrace]],
+) -> None:
+    """
+    GIVEN audit rows from four different actors
+    WHEN GET /admin/audit-log/rows
+    THEN every actor's username is rendered, and the request runs a fixed
+         number of SQL statements rather than one actor load per row.
+    """
+    client, _, _, app = login_admin_user_with_register
+
+    with app.app_context():
+        actors = [
+            _make_user(
+                f"{_ACTOR_ALPHA_USERNAME}{actor_index}",
+                f"actor{actor_index}.{_ACTOR_ALPHA_EMAIL}",
+            )
+            for actor_index in range(_QUERY_COUNT_ACTOR_COUNT)
+        ]
+        db.session.commit()
+        actor_ids_by_username = {actor.username: actor.id for actor in actors}
+
+    with app.app_context():
+        for actor_id in actor_ids_by_username.values():
+            for row_index in range(_QUERY_COUNT_ROWS_PER_ACTOR):
+                _seed_audit_row(
+                    actor_id=actor_id, action=f"admin.test.queries{row_index}"
+                )
+
+    with assert_max_queries(_AUDIT_LOG_ROWS_MAX_QUERIES):
+        response = client.get(_ADMIN_AUDIT_LOG_ROWS_URL)
+
+    assert response.status_code == 200
+    for actor_username in actor_ids_by_username:
+        assert actor_username.encode() in response.data
+
+
 def test_admin_audit_log_rows_empty_result_set_renders_cleanly(
     login_admin_user_with_register: Tuple[FlaskClient, str, Users, Flask],
 ) -> None:
@@ -1,6 +1,6 @@
 from __future__ import annotations
 
-from typing import Tuple
+from typing import Callable, ContextManager, Tuple
 from urllib.parse import quote, urlsplit
 
 import pytest
@@ -8,7 +8,9 @@ from flask import Flask
 from flask.testing import FlaskClient
 
 from backend import db
+from backend.admin import user_service
 from backend.admin.user_service import search_users
+from backend.extensions.sql_tracing import SqlTrace
 from backend.models.audit_log import AuditLog
 from backend.models.users import Users
 from backend.utils.strings.admin_portal_strs import (
@@ -32,6 +34,11 @@ _BETA_EMAIL: str = "beta@x.com"
 _PAGINATION_USERNAME_BASE: str = "paginationuser"
 _PAGINATION_EMAIL_DOMAIN: str = "@pagination.example.com"
 _PAGINATION_EXTRA_COUNT: int = 3
+# Session user, planner estimate, exact count, page, and the audit insert.
+_USER_SEARCH_MAX_QUERIES: int = 6
+# Created least-similar first, so id order is the reverse of rank order.
+_RANKED_USERNAMES: tuple[str, ...] = ("johnathan", "johnny", "john")
+_RANKED_EMAIL_DOMAIN: str = "@ranked.example.com"
 _DETAIL_USERNAME: str = "detailtestuser"
 _DETAIL_EMAIL: str = "detailtest@example.com"
 
@@ -276,6 +283,153 @@ def test_search_users_pagination(
     assert response.status_code == 200
 
 
+def test_admin_users_search_query_count_does_not_grow_with_results(
+    login_admin_user_with_register: Tuple[FlaskClient, str, Users, Flask],
+    assert_max_queries: Callable[[int], ContextManager[SqlTrace]],
+) -> None:
+    """
+    GIVEN a logged-in admin user and three additional users
+    WHEN GET /admin/users/search?q= renders all four users
+    THEN every user is listed, and the request runs a fixed number of SQL
+         statements rather than one reload per listed user after the audit
+         entry's commit.
+    """
+    client, _, _, app = login_admin_user_with_register
+
+    with app.app_context():
+        for extra_user_index in range(1, _PAGINATION_EXTRA_COUNT + 1):
+            db.session.add(
+                Users(
+                    username=f"{_PAGINATION_USERNAME_BASE}{extra_user_index}",
+                    email=f"{_PAGINATION_USERNAME_BASE}{extra_user_index}{_PAGINATION_EMAIL_DOMAIN}",
+                    plaintext_password=f"PaginationPassword{extra_user_index}",
+                )
+            )
+        db.session.commit()
+
+    with assert_max_queries(_USER_SEARCH_MAX_QUERIES):
+        response = client.get(f"{_ADMIN_USERS_SEARCH_URL}?q=")
+
+    assert response.status_code == 200
+    for extra_user_index in range(1, _PAGINATION_EXTRA_COUNT + 1):
+        assert (
+            f"{_PAGINATION_USERNAME_BASE}{extra_user_index}".encode() in response.data
+        )
+
+
+def _add_ranked_users() -> None:
+    for ranked_username in _RANKED_USERNAMES:
+        db.session.add(
+            Users(
+                username=ranked_username,
+                email=f"{ranked_username}{_RANKED_EMAIL_DOMAIN}",
+                plaintext_password="RankedPassword1234",
+            )
+        )
+    db.session.commit()
+
+
+def test_search_users_ranked_cursor_pages_follow_similarity_order(
+    app: Flask, register_first_user
+) -> None:
+    """
+    GIVEN users "johnathan", "johnny", and "john", created in that order
+    WHEN search_users() is called for "john" one user per page, following
+        next_cursor, in ranked mode and then by id, and then ranked mode is
+        paged back with previous_cursor from the last page
+    THEN ranked pages come best match first ("john", "johnny", "johnathan"),
+        id-ordered pages in creation order, and the backwards page is the
+        ranked page before the last one.
+    """
+    with app.app_context():
+        _add_ranked_users()
+
+        pages_by_mode: dict[bool, list] = {}
+        for ranked in (True, False):
+            search_page = search_users(query="john", limit=1, ranked=ranked)
+            mode_pages = [search_page]
+            while search_page.next_cursor is not None:
+                search_page = search_users(
+                    query="john",
+                    limit=1,
+                    offset=search_page.next_offset,
+                    after=search_page.next_cursor,
+                    ranked=ranked,
+                )
+                mode_pages.append(search_page)
+            pages_by_mode[ranked] = mode_pages
+
+        last_ranked_page = pages_by_mode[True][-1]
+        backwards_page = search_users(
+            query="john",
+            limit=1,
+            offset=last_ranked_page.previous_offset,
+            before=last_ranked_page.previous_cursor,
+            ranked=True,
+        )
+
+    def _page_usernames(mode_pages: list) -> list[str]:
+        return [
+            matched_user.username
+            for search_page in mode_pages
+            for matched_user in search_page.users
+        ]
+
+    assert _page_usernames(pages_by_mode[True]) == ["john", "johnny", "johnathan"]
+    assert _page_usernames(pages_by_mode[False]) == list(_RANKED_USERNAMES)
+    assert all(search_page.ranked for search_page in pages_by_mode[True])
+    assert [matched_user.username for matched_user in backwards_page.users] == [
+        "johnny"
+    ]
+    assert backwards_page.has_previous and backwards_page.has_next
+
+
+def test_search_users_ranked_mode_keeps_the_best_capped_candidates(
+    app: Flask, register_first_user, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    """
+    GIVEN users "johnathan", "johnny", and "john", created in that order, and
+        ranked mode capped at two candidates
+    WHEN search_users() is called for "john" in ranked mode
+    THEN the two most similar matches are ranked, best match first, leaving
+        out the lowest-id "johnathan", and the page counts all three matches
+        and reports the cap.
+    """
+    monkeypatch.setattr(user_service, "RANKED_CANDIDATE_LIMIT", 2)
+    with app.app_context():
+        _add_ranked_users()
+        search_page = search_users(query="john", ranked=True)
+
+    assert search_page.ranked
+    assert [matched_user.username for matched_user in search_page.users] == [
+        "john",
+        "johnny",
+    ]
+    assert search_page.total_count == len(_RANKED_USERNAMES)
+    assert search_page.candidates_capped
+
+
+def test_search_users_short_query_is_not_ranked(
+    app: Flask, register_first_user
+) -> None:
+    """
+    GIVEN users "johnathan", "johnny", and "john", created in that order
+    WHEN search_users() is called in ranked mode for "jo", shorter than a
+        trigram
+    THEN the results are ordered by id instead, and the page does not offer
+        ranking.
+    """
+    with app.app_context():
+        _add_ranked_users()
+        search_page = search_users(query="jo", ranked=True)
+
+    assert not search_page.ranked
+    assert not search_page.can_rank
+    assert [matched_user.username for matched_user in search_page.users] == list(
+        _RANKED_USERNAMES
+    )
+
+
 def test_search_users_garbage_offset_falls_back_to_zero(
     login_admin_user_with_register: Tuple[FlaskClient, str, Users, Flask],
 ) -> None:
@@ -3,6 +3,7 @@ from __future__ import annotations
 import datetime
 import decimal
 from typing import Tuple
+from unittest import mock
 
 import pytest
 from flask import Flask
@@ -15,7 +16,7 @@ from backend.admin.db_browser_service import (
     TableSummary,
     format_cell_value,
 )
-from backend.models.api_refresh_tokens import ApiRefreshTokens
+from backend.models.api_refresh_tokens import ApiRefreshTokens, hash_refresh_token
 from backend.models.email_validations import Email_Validations
 from backend.models.forgot_passwords import Forgot_Passwords
 from backend.models.user_oauth_identities import UserOAuthIdentity
@@ -37,7 +38,7 @@ _EMAIL_VALIDATIONS_TABLE: str = "EmailValidations"
 _USER_OAUTH_IDENTITIES_TABLE: str = "UserOAuthIdentities"
 
 _PASSWORD_COLUMN_KEY: str = "password"
-_TOKEN_COLUMN_KEY: str = "token"
+_TOKEN_COLUMN_KEY: str = "token_hash"
 _RESET_TOKEN_COLUMN_KEY: str = "reset_token"
 _VALIDATION_TOKEN_COLUMN_KEY: str = "validation_token"
 _PROVIDER_SUBJECT_COLUMN_KEY: str = "provider_subject"
@@ -57,6 +58,8 @@ _EVENT_REGISTRY_NAME: str = "db_browser_service_test_event"
 _ALPHA_USERNAME: str = "alphauser"
 _BETA_USERNAME: str = "betauser"
 _USERNAME_COLUMN_KEY: str = "username"
+_UTUBS_TABLE: str = "Utubs"
+_UTUB_NAME_COLUMN_KEY: str = "name"
 _ROLE_COLUMN_KEY: str = "role"
 _ID_COLUMN_KEY: str = "id"
 _UNKNOWN_COLUMN_KEY: str = "not_a_real_column"
@@ -174,6 +177,10 @@ def test_format_cell_value_decimal_preserves_trailing_zero() -> None:
     assert format_cell_value(decimal.Decimal("5.20")) == "5.20"
 
 
+def test_format_cell_value_bytes_uses_hex() -> None:
+    assert format_cell_value(bytes([0xAB, 0x01])) == "ab01"
+
+
 def test_format_cell_value_enum_uses_value() -> None:
     assert format_cell_value(User_Role.ADMIN) == User_Role.ADMIN.value
 
@@ -287,7 +294,7 @@ def test_get_row_detail_refresh_tokens_masks_token_column(app: Flask) -> None:
     with app.app_context():
         seeded_user = _seed_users(1)[0]
         refresh_token = _seed_refresh_token(user_id=seeded_user.id)
-        assert refresh_token.token == _SEEDED_REFRESH_TOKEN
+        assert refresh_token.token_hash == hash_refresh_token(_SEEDED_REFRESH_TOKEN)
 
         row_detail = db_browser_service.get_row_detail(
             table_name=_API_REFRESH_TOKENS_TABLE, raw_pk=str(refresh_token.id)
@@ -677,3 +684,144 @@ def test_get_table_page_echoes_sort_direction_and_query_state(app: Flask) -> Non
         assert table_page.direction == "desc"
         assert table_page.query == "alpha"
         assert table_page.total_count == 1
+
+
+# ---------------------------------------------------------------------------
+# get_table_page — keyset pagination and estimated counts
+# ---------------------------------------------------------------------------
+
+
+def test_get_table_page_cursors_walk_forward_and_back(app: Flask) -> None:
+    """
+    GIVEN five users
+    WHEN get_table_page pages by username descending two rows at a time,
+         following next_cursor to the end and then previous_cursor back
+    THEN the forward pages are disjoint and in order, only the last page has
+         no next cursor, and paging back reproduces the middle page.
+    """
+    with app.app_context():
+        _seed_users(5)
+        page_kwargs = dict(
+            table_name=_USERS_TABLE,
+            sort_key=_USERNAME_COLUMN_KEY,
+            direction="desc",
+            limit=2,
+        )
+
+        first_page = db_browser_service.get_table_page(**page_kwargs)
+        second_page = db_browser_service.get_table_page(
+            **page_kwargs,
+            offset=first_page.next_offset,
+            after=first_page.next_cursor,
+        )
+        third_page = db_browser_service.get_table_page(
+            **page_kwargs,
+            offset=second_page.next_offset,
+            after=second_page.next_cursor,
+        )
+        back_page = db_browser_service.get_table_page(
+            **page_kwargs,
+            offset=third_page.previous_offset,
+            before=third_page.previous_cursor,
+        )
+
+        assert _usernames_in_order(first_page) == [
+            f"{_SEEDED_USERNAME_BASE}4",
+            f"{_SEEDED_USERNAME_BASE}3",
+        ]
+        assert _usernames_in_order(second_page) == [
+            f"{_SEEDED_USERNAME_BASE}2",
+            f"{_SEEDED_USERNAME_BASE}1",
+        ]
+        assert _usernames_in_order(third_page) == [f"{_SEEDED_USERNAME_BASE}0"]
+        assert first_page.has_next and second_page.has_next
+        assert not third_page.has_next
+        assert not first_page.has_previous and third_page.has_previous
+        assert _usernames_in_order(back_page) == _usernames_in_order(second_page)
+        assert back_page.offset == 2 and back_page.has_next
+
+
+def test_get_table_page_malformed_cursor_falls_back_to_offset(app: Flask) -> None:
+    """
+    GIVEN three users
+    WHEN get_table_page receives an undecodable cursor alongside offset 1
+    THEN the cursor is ignored and the page starts at the offset.
+    """
+    with app.app_context():
+        seeded_users = _seed_users(3)
+
+        table_page = db_browser_service.get_table_page(
+            table_name=_USERS_TABLE, offset=1, after="not-a-cursor"
+        )
+
+        assert table_page is not None
+        assert [row.pk_segment for row in table_page.rows] == [
+            str(user.id) for user in seeded_users[1:]
+        ]
+
+
+def test_get_table_page_unindexed_sort_key_falls_back_to_pk(app: Flask) -> None:
+    """
+    GIVEN the Users table, whose role column is not backed by an index
+    WHEN get_table_page is asked to sort by role
+    THEN the primary key is used instead and role is not offered as sortable.
+    """
+    with app.app_context():
+        _seed_users(1)
+
+        table_page = db_browser_service.get_table_page(
+            table_name=_USERS_TABLE, sort_key=_ROLE_COLUMN_KEY
+        )
+
+        assert table_page is not None
+        assert table_page.sort_key == _ID_COLUMN_KEY
+        assert _ROLE_COLUMN_KEY not in table_page.sortable_keys
+        assert _USERNAME_COLUMN_KEY in table_page.sortable_keys
+
+
+def test_get_table_page_trigram_indexed_column_is_not_sortable(app: Flask) -> None:
+    """
+    GIVEN the Utubs table, whose utubName column is backed only by a GIN
+        trigram index
+    WHEN get_table_page is asked to sort by name
+    THEN the primary key is used instead and name is not offered as sortable,
+        since a GIN index cannot return rows in order.
+    """
+    with app.app_context():
+        table_page = db_browser_service.get_table_page(
+            table_name=_UTUBS_TABLE, sort_key=_UTUB_NAME_COLUMN_KEY
+        )
+
+        assert table_page is not None
+        assert table_page.sort_key == _ID_COLUMN_KEY
+        assert _UTUB_NAME_COLUMN_KEY not in table_page.sortable_keys
+
+
+def test_get_table_page_uses_catalog_estimate_for_large_unfiltered_table(
+    app: Flask,
+) -> None:
+    """
+    GIVEN a catalog row estimate above the exact-count threshold for Users
+    WHEN get_table_page runs unfiltered, with exact_count, and with a search
+    THEN the unfiltered page reports the estimate, while exact_count and the
+         filtered page report real counts.
+    """
+    with app.app_context():
+        _seed_users(2)
+        with mock.patch.object(
+            db_browser_service,
+            "_estimated_row_counts",
+            return_value={_USERS_TABLE: 250_000},
+        ):
+            estimated = db_browser_service.get_table_page(table_name=_USERS_TABLE)
+            exact = db_browser_service.get_table_page(
+                table_name=_USERS_TABLE, exact_count=True
+            )
+            filtered = db_browser_service.get_table_page(
+                table_name=_USERS_TABLE, query=_SEEDED_USERNAME_BASE
+            )
+
+        assert estimated.total_count == 250_000 and estimated.count_is_estimate
+        assert exact.total_count == 2 and not exact.count_is_estimate
+        assert filtered.total_count == 2 and not filtered.count_is_estimate
+        assert not estimated.has_next
@@ -0,0 +1,318 @@
+from typing import Tuple
+
+from click.testing import Result
+from flask import Flask
+from flask.testing import FlaskCliRunner
+import pytest
+
+from backend import db
+from backend.admin.account_data_service import (
+    TOMBSTONE_USERNAME_PREFIX,
+    build_tombstone_username,
+)
+from backend.cli.admin import (
+    ERASE_USERS_ACTOR_NOT_ADMIN,
+    ERASE_USERS_NO_IDS,
+    ERASE_USERS_SUMMARY_HEADER,
+)
+from backend.models.audit_log import AuditLog
+from backend.models.users import User_Role, Users
+from backend.models.utub_members import Member_Role, Utub_Members
+from backend.models.utubs import Utubs
+from backend.utils.strings.admin_portal_strs import ADMIN_AUDIT_ACTIONS
+
+pytestmark = pytest.mark.cli
+
+_MOCK_REASON: str = "cli batch erasure"
+_PLAINTEXT_PASSWORD: str = "TestPass1!"
+
+
+def _seed_user(app: Flask, name: str, *, role: User_Role = User_Role.USER) -> int:
+    with app.app_context():
+        user = Users(
+            username=name,
+            email=f"{name}@test.com",
+            plaintext_password=_PLAINTEXT_PASSWORD,
+        )
+        user.email_validated = True
+        user.role = role
+        db.session.add(user)
+        db.session.commit()
+        return user.id
+
+
+def _seed_utub(app: Flask, *, creator_id: int, members: dict[int, Member_Role]) -> int:
+    with app.app_context():
+        utub = Utubs(name="BatchUTub", utub_creator=creator_id, utub_description="")
+        db.session.add(utub)
+        db.session.flush()
+        db.session.add_all(
+            [
+                Utub_Members(utub_id=utub.id, user_id=user_id, member_role=role)
+                for user_id, role in members.items()
+            ]
+        )
+        db.session.commit()
+        return utub.id
+
+
+def test_erase_users_batch_resolves_shared_memberships(
+    runner: Tuple[Flask, FlaskCliRunner],
+):
+    """
+    GIVEN an admin, two target users who are the only two members of one UTub,
+        and a UTub created by the first target shared with a MEMBER and a
+        higher-id CO_CREATOR
+    WHEN the admin runs `flask admin erase-users` for both targets
+    THEN the shared UTub with no survivors is deleted, ownership of the other
+        UTub moves to the CO_CREATOR, both users are tombstoned, and one
+        USER_ERASE audit row is written per erased user
+    """
+    app, cli_runner = runner
+    admin_id = _seed_user(app, "batch_admin", role=User_Role.ADMIN)
+    first_target_id = _seed_user(app, "batch_target_a")
+    second_target_id = _seed_user(app, "batch_target_b")
+    member_id = _seed_user(app, "batch_member")
+    co_creator_id = _seed_user(app, "batch_cocreator")
+
+    solo_utub_id = _seed_utub(
+        app,
+        creator_id=first_target_id,
+        members={
+            first_target_id: Member_Role.CREATOR,
+            second_target_id: Member_Role.MEMBER,
+        },
+    )
+    transfer_utub_id = _seed_utub(
+        app,
+        creator_id=first_target_id,
+        members={
+            first_target_id: Member_Role.CREATOR,
+            member_id: Member_Role.MEMBER,
+            co_creator_id: Member_Role.CO_CREATOR,
+        },
+    )
+
+    result: Result = cli_runner.invoke(
+        args=[
+            "admin",
+            "erase-users",
+            "--actor-id",
+            str(admin_id),
+            "--reason",
+            _MOCK_REASON,
+            str(first_target_id),
+            str(second_target_id),
+        ]
+    )
+
+    assert result.exit_code == 0
+    assert ERASE_USERS_SUMMARY_HEADER in result.output
+
+    with app.app_context():
+        assert Utubs.query.get(solo_utub_id) is None
+        transfer_utub: Utubs = Utubs.query.get(transfer_utub_id)
+        assert transfer_utub.utub_creator == co_creator_id
+        new_owner: Utub_Members = Utub_Members.query.filter_by(
+            utub_id=transfer_utub_id, user_id=co_creator_id
+        ).one()
+        assert new_owner.member_role == Member_Role.CREATOR
+        assert (
+            Utub_Members.query.filter(
+                Utub_Members.user_id.in_([first_target_id, second_target_id])
+            ).count()
+            == 0
+        )
+
+        for target_id in (first_target_id, second_target_id):
+            erased_user: Users = Users.query.get(target_id)
+            assert erased_user.username == build_tombstone_username(user_id=target_id)
+            assert erased_user.password is None
+
+        audit_rows: list[AuditLog] = AuditLog.query.filter_by(
+            action=ADMIN_AUDIT_ACTIONS.USER_ERASE
+        ).all()
+        metadata_by_target = {row.target_id: row.log_metadata for row in audit_rows}
+
+    assert set(metadata_by_target) == {str(first_target_id), str(second_target_id)}
+    first_metadata = metadata_by_target[str(first_target_id)]
+    assert first_metadata["utubs_deleted"] == 1
+    assert first_metadata["ownerships_transferred"] == 1
+    assert first_metadata["memberships_removed"] == 1
+    assert first_metadata["batch_size"] == 2
+    second_metadata = metadata_by_target[str(second_target_id)]
+    assert second_metadata["utubs_deleted"] == 0
+    assert second_metadata["memberships_removed"] == 0
+
+
+def test_erase_users_credits_each_shared_solo_utub_once(
+    runner: Tuple[Flask, FlaskCliRunner],
+):
+    """
+    GIVEN an admin and two target users who are the only two members of two
+        UTubs, one created by each target
+    WHEN the admin runs `flask admin erase-users` for both targets
+    THEN both UTubs are deleted, and each deletion is credited only to its
+        creator's audit row, so the per-user utubs_deleted add up to the
+        UTubs actually deleted
+    """
+    app, cli_runner = runner
+    admin_id = _seed_user(app, "credit_admin", role=User_Role.ADMIN)
+    first_target_id = _seed_user(app, "credit_target_a")
+    second_target_id = _seed_user(app, "credit_target_b")
+
+    utub_ids = [
+        _seed_utub(
+            app,
+            creator_id=creator_id,
+            members={
+                creator_id: Member_Role.CREATOR,
+                co_member_id: Member_Role.MEMBER,
+            },
+        )
+        for creator_id, co_member_id in (
+            (first_target_id, second_target_id),
+            (second_target_id, first_target_id),
+        )
+    ]
+
+    result: Result = cli_runner.invoke(
+        args=[
+            "admin",
+            "erase-users",
+            "--actor-id",
+            str(admin_id),
+            "--reason",
+            _MOCK_REASON,
+            str(first_target_id),
+            str(second_target_id),
+        ]
+    )
+
+    assert result.exit_code == 0
+    with app.app_context():
+        assert Utubs.query.filter(Utubs.id.in_(utub_ids)).count() == 0
+        audit_rows: list[AuditLog] = AuditLog.query.filter_by(
+            action=ADMIN_AUDIT_ACTIONS.USER_ERASE
+        ).all()
+        metadata_by_target = {row.target_id: row.log_metadata for row in audit_rows}
+
+    assert metadata_by_target[str(first_target_id)]["utubs_deleted"] == 1
+    assert metadata_by_target[str(second_target_id)]["utubs_deleted"] == 1
+
+
+def test_erase_users_reports_skipped_ids(runner: Tuple[Flask, FlaskCliRunner]):
+    """
+    GIVEN an admin, an already-erased user, and an id with no user
+    WHEN the admin runs `flask admin erase-users` with both ids and their own id
+    THEN nothing is erased, the skipped ids are reported, and no audit rows
+        are written
+    """
+    app, cli_runner = runner
+    admin_id = _seed_user(app, "skip_admin", role=User_Role.ADMIN)
+    erased_id = _seed_user(app, "skip_target")
+    with app.app_context():
+        erased_user: Users = Users.query.get(erased_id)
+        erased_user.username = build_tombstone_username(user_id=erased_id)
+        db.session.commit()
+    missing_id = erased_id + 1000
+
+    result: Result = cli_runner.invoke(
+        args=[
+            "admin",
+            "erase-users",
+            "--actor-id",
+            str(admin_id),
+            "--reason",
+            _MOCK_REASON,
+            str(admin_id),
+            str(erased_id),
+            str(missing_id),
+        ]
+    )
+
+    assert result.exit_code == 0
+    assert f"Already erased: {erased_id}" in result.output
+    assert f"Not found: {missing_id}" in result.output
+    with app.app_context():
+        assert AuditLog.query.count() == 0
+        admin_user: Users = Users.query.get(admin_id)
+        assert not admin_user.username.startswith(TOMBSTONE_USERNAME_PREFIX)
+
+
+def test_erase_users_blocks_last_active_admins(runner: Tuple[Flask, FlaskCliRunner]):
+    """
+    GIVEN a suspended acting admin and one other admin who is the only
+        active admin left
+    WHEN `flask admin erase-users` targets that active admin
+    THEN the admin is skipped and reported instead of erased
+    """
+    app, cli_runner = runner
+    actor_id = _seed_user(app, "suspended_actor", role=User_Role.ADMIN)
+    target_admin_id = _seed_user(app, "only_active_admin", role=User_Role.ADMIN)
+    with app.app_context():
+        actor: Users = Users.query.get(actor_id)
+        actor.is_suspended = True
+        db.session.commit()
+
+    result: Result = cli_runner.invoke(
+        args=[
+            "admin",
+            "erase-users",
+            "--actor-id",
+            str(actor_id),
+            "--reason",
+            _MOCK_REASON,
+            str(target_admin_id),
+        ]
+    )
+
+    assert result.exit_code == 0
+    assert f"would leave no active admin): {target_admin_id}" in result.output
+    with app.app_context():
+        untouched_admin: Users = Users.query.get(target_admin_id)
+        assert untouched_admin.username == "only_active_admin"
+
+
+def test_erase_users_rejects_non_admin_actor(runner: Tuple[Flask, FlaskCliRunner]):
+    """
+    GIVEN a regular (non-admin) user
+    WHEN `flask admin erase-users` names them as the actor
+    THEN the command exits 1 without erasing anyone
+    """
+    app, cli_runner = runner
+    actor_id = _seed_user(app, "regular_actor")
+    target_id = _seed_user(app, "regular_target")
+
+    result: Result = cli_runner.invoke(
+        args=[
+            "admin",
+            "erase-users",
+            "--actor-id",
+            str(actor_id),
+            "--reason",
+            _MOCK_REASON,
+            str(target_id),
+        ]
+    )
+
+    assert result.exit_code == 1
+    assert ERASE_USERS_ACTOR_NOT_ADMIN in result.output
+    with app.app_context():
+        assert Users.query.get(target_id).username == "regular_target"
+
+
+def test_erase_users_without_ids_is_noop(runner: Tuple[Flask, FlaskCliRunner]):
+    """
+    GIVEN no user ids
+    WHEN `flask admin erase-users` runs
+    THEN the command exits 0 and says there is nothing to erase
+    """
+    _, cli_runner = runner
+
+    result: Result = cli_runner.invoke(
+        args=["admin", "erase-users", "--actor-id", "1", "--reason", _MOCK_REASON]
+    )
+
+    assert result.exit_code == 0
+    assert ERASE_USERS_NO_IDS in result.output
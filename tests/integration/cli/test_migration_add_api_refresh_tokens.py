@@ -16,10 +16,12 @@ _PRE_API_REFRESH_TOKENS_REVISION = "1c458837fe0c"
 _API_REFRESH_TOKENS_TABLE = "ApiRefreshTokens"
 _USERS_TABLE = "Users"
 _ALEMBIC_VERSION_TABLE = "alembic_version"
+# Head schema: d4a7c2e9f1b6 later swapped the plaintext "token" column (and its
+# unique constraint) for the "tokenHash" digest.
 _EXPECTED_COLUMNS = {
     "id",
     "userID",
-    "token",
+    "tokenHash",
     "familyId",
     "issuedAt",
     "expiresAt",
@@ -27,7 +29,7 @@ _EXPECTED_COLUMNS = {
     "replacedBy",
     "revokedAt",
 }
-_EXPECTED_UNIQUE_CONSTRAINTS = {"unique_api_refresh_token"}
+_EXPECTED_UNIQUE_CONSTRAINTS = {"unique_api_refresh_token_hash"}
 _EXPECTED_INDEXES = {"idx_api_refresh_token_user", "idx_api_refresh_token_family"}
 
 _MANAGEDB_DROP_ARGS = ["managedb", "drop", "test"]
@@ -0,0 +1,244 @@
+"""Integration tests for the /api/v1 access-token cache with the cache on.
+
+``ConfigTest`` disables the cache, so these tests install one sized like
+production, with its Redis pub/sub stood in for by a fake that confirms the
+subscription and records what is published. The outer test transaction never
+commits, so each test calls the after-commit hook itself to check the fan-out.
+"""
+
+from __future__ import annotations
+
+import json
+import queue
+from typing import Generator
+from unittest import mock
+
+from flask import Flask, g, url_for
+from flask.testing import FlaskClient
+import pytest
+
+from backend import db
+from backend.admin.account_data_service import erase_users_in_batch
+from backend.api_v1.services.tokens import (
+    create_access_token,
+    mark_all_refresh_tokens_revoked_for_users,
+)
+from backend.config import ACCESS_TOKEN_CACHE_MAX_ENTRIES
+from backend.extensions.access_token_cache import (
+    ACCESS_TOKEN_CACHE,
+    AccessTokenCache,
+    _publish_pending_invalidations,
+)
+from backend.models.users import Users
+from backend.utils.all_routes import ROUTES
+from backend.utils.strings.api_auth_strs import API_AUTH
+from backend.utils.strings.model_strs import MODELS
+from backend.utils.strings.splash_form_strs import REGISTER_FORM
+from tests.models_for_test import valid_user_1
+
+pytestmark = pytest.mark.mobile_api
+
+_FIRST_USER_ID: int = 1
+# A second registered user; audit rows need a real actor
+_ACTOR_ID: int = 2
+_ERASE_REASON = "integration test erase"
+_RENAMED_USERNAME = "renamed_behind_the_cache"
+
+
+class _SubscribedPubSub:
+    """Confirms the subscription once, then waits for messages that never come."""
+
+    def __init__(self) -> None:
+        self.messages: queue.Queue[dict] = queue.Queue()
+        self.messages.put({"type": "subscribe", "data": 1})
+
+    def subscribe(self, channel: str) -> None:
+        self.channel = channel
+
+    def get_message(self, timeout: float) -> dict | None:
+        try:
+            return self.messages.get(timeout=timeout)
+        except queue.Empty:
+            return None
+
+    def close(self) -> None:
+        pass
+
+
+@pytest.fixture
+def redis_client() -> mock.MagicMock:
+    redis_client = mock.MagicMock()
+    redis_client.pubsub.return_value = _SubscribedPubSub()
+    return redis_client
+
+
+@pytest.fixture
+def access_token_cache(
+    app: Flask, redis_client: mock.MagicMock
+) -> Generator[AccessTokenCache, None, None]:
+    """Swap the app's disabled cache for a production-sized, subscribed one."""
+    cache = AccessTokenCache(
+        max_entries=ACCESS_TOKEN_CACHE_MAX_ENTRIES, redis_client=redis_client
+    )
+    # The subscriber thread starts on first use
+    assert cache.get("not-a-token") is None
+    assert cache._subscribed.wait(timeout=5)
+
+    disabled_cache = app.extensions[ACCESS_TOKEN_CACHE]
+    app.extensions[ACCESS_TOKEN_CACHE] = cache
+    try:
+        yield cache
+    finally:
+        app.extensions[ACCESS_TOKEN_CACHE] = disabled_cache
+        cache.shutdown()
+
+
+def _me_url(app: Flask) -> str:
+    with app.test_request_context():
+        return url_for(ROUTES.API_V1.GET_ME)
+
+
+def _clear_flask_login_request_cache() -> None:
+    """Drop Flask-Login's per-request user cache, as in
+    test_account_state_gates_api.py, so the next request runs the loader."""
+    if hasattr(g, "_login_user"):
+        delattr(g, "_login_user")
+
+
+def _fill_the_cache(
+    app: Flask, api_client: FlaskClient, bearer_headers: dict[str, str]
+) -> None:
+    response = api_client.get(_me_url(app), headers=bearer_headers)
+    assert response.status_code == 200
+    _clear_flask_login_request_cache()
+
+
+def _assert_invalidation_published(
+    app: Flask, redis_client: mock.MagicMock, user_ids: list[int]
+) -> None:
+    with app.app_context():
+        _publish_pending_invalidations(db.session)
+    redis_client.publish.assert_called_once_with(
+        API_AUTH.ACCESS_TOKEN_CACHE_INVALIDATION_CHANNEL, json.dumps(user_ids)
+    )
+
+
+def test_cached_bearer_token_is_served_from_the_cache(
+    app: Flask,
+    api_client: FlaskClient,
+    bearer_headers_first_user: dict[str, str],
+    access_token_cache: AccessTokenCache,
+):
+    """
+    GIVEN the access-token cache enabled, and a bearer token already used once
+    WHEN the user's row is changed behind the ORM and the token is used again
+    THEN the request is authenticated from the cached snapshot: /me still
+        returns the username the cache was filled with.
+    """
+    _fill_the_cache(app, api_client, bearer_headers_first_user)
+    assert len(access_token_cache) == 1
+
+    with app.app_context():
+        Users.query.filter(Users.id == _FIRST_USER_ID).update(
+            {Users.username: _RENAMED_USERNAME}, synchronize_session=False
+        )
+        db.session.commit()
+
+    response = api_client.get(_me_url(app), headers=bearer_headers_first_user)
+    assert response.status_code == 200
+    assert response.get_json()[MODELS.USERNAME] == valid_user_1[REGISTER_FORM.USERNAME]
+
+
+def test_cached_bearer_token_stops_authenticating_after_suspension(
+    app: Flask,
+    api_client: FlaskClient,
+    bearer_headers_first_user: dict[str, str],
+    access_token_cache: AccessTokenCache,
+    redis_client: mock.MagicMock,
+):
+    """
+    GIVEN the access-token cache enabled, and a bearer token already cached
+    WHEN the user is suspended through the ORM (the ``Users`` after_update
+        listener) and the session commits
+    THEN the token stops authenticating at once, and the commit publishes the
+        user's id to every other worker.
+    """
+    _fill_the_cache(app, api_client, bearer_headers_first_user)
+
+    with app.app_context():
+        target_user: Users = Users.query.get(_FIRST_USER_ID)
+        target_user.is_suspended = True
+        db.session.commit()
+    assert len(access_token_cache) == 0
+
+    response = api_client.get(_me_url(app), headers=bearer_headers_first_user)
+    assert response.status_code == 401
+    _assert_invalidation_published(app, redis_client, [_FIRST_USER_ID])
+
+
+def test_cached_bearer_token_stops_authenticating_after_bulk_revocation(
+    app: Flask,
+    api_client: FlaskClient,
+    bearer_headers_first_user: dict[str, str],
+    access_token_cache: AccessTokenCache,
+    redis_client: mock.MagicMock,
+):
+    """
+    GIVEN the access-token cache enabled, and a bearer token already cached
+    WHEN the user is suspended with a bulk UPDATE, which skips ORM events,
+        alongside ``mark_all_refresh_tokens_revoked_for_users``, and the
+        session commits
+    THEN the revocation drops the cached token, so it stops authenticating,
+        and the commit publishes the user's id to every other worker.
+    """
+    _fill_the_cache(app, api_client, bearer_headers_first_user)
+
+    with app.app_context():
+        Users.query.filter(Users.id == _FIRST_USER_ID).update(
+            {Users.is_suspended: True}, synchronize_session=False
+        )
+        mark_all_refresh_tokens_revoked_for_users(user_ids=[_FIRST_USER_ID])
+        db.session.commit()
+    assert len(access_token_cache) == 0
+
+    response = api_client.get(_me_url(app), headers=bearer_headers_first_user)
+    assert response.status_code == 401
+    _assert_invalidation_published(app, redis_client, [_FIRST_USER_ID])
+
+
+def test_cached_bearer_token_stops_serving_the_profile_after_batch_erasure(
+    app: Flask,
+    api_client: FlaskClient,
+    register_multiple_users,
+    make_bearer_headers,
+    access_token_cache: AccessTokenCache,
+    redis_client: mock.MagicMock,
+):
+    """
+    GIVEN the access-token cache enabled, and a bearer token already cached
+    WHEN the user is erased with ``erase_users_in_batch``
+    THEN the cached snapshot is dropped: the token no longer resolves to the
+        pre-erasure identity, and the commit publishes the user's id to every
+        other worker.
+    """
+    with app.app_context():
+        bearer_headers_first_user = make_bearer_headers(
+            create_access_token(user=Users.query.get(_FIRST_USER_ID))
+        )
+    _fill_the_cache(app, api_client, bearer_headers_first_user)
+
+    with app.app_context():
+        result = erase_users_in_batch(
+            actor_id=_ACTOR_ID,
+            target_user_ids=[_FIRST_USER_ID],
+            reason=_ERASE_REASON,
+        )
+    assert list(result.erased) == [_FIRST_USER_ID]
+    assert len(access_token_cache) == 0
+
+    response = api_client.get(_me_url(app), headers=bearer_headers_first_user)
+    assert response.status_code == 200
+    response_json = response.get_json()
+    assert response_json[MODELS.USERNAME] != valid_user_1[REGISTER_FORM.USERNAME]
+    assert not response_json[MODELS.EMAIL_VALIDATED]
+    _assert_invalidation_published(app, redis_client, [_FIRST_USER_ID])
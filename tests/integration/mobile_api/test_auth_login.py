@@ -4,7 +4,7 @@ import pytest
 
 from backend import db
 from backend.api_v1.constants import ApiAuthErrorCodes
-from backend.models.api_refresh_tokens import ApiRefreshTokens
+from backend.models.api_refresh_tokens import ApiRefreshTokens, hash_refresh_token
 from backend.models.users import Users
 from backend.utils.all_routes import ROUTES
 from backend.utils.strings.json_strs import STD_JSON_RESPONSE as STD_JSON
@@ -70,7 +70,9 @@ def test_login_issues_token_pair(
     with app.app_context():
         persisted_rows = ApiRefreshTokens.query.all()
         assert len(persisted_rows) == 1
-        assert persisted_rows[0].token == response_json[_REFRESH_TOKEN_KEY]
+        assert persisted_rows[0].token_hash == hash_refresh_token(
+            response_json[_REFRESH_TOKEN_KEY]
+        )
         assert persisted_rows[0].user_id == 1
 
     me_response = api_client.get(
@@ -14,7 +14,7 @@ from backend.api_v1.services.tokens import (
     revoke_refresh_token_family,
     rotate_refresh_token,
 )
-from backend.models.api_refresh_tokens import ApiRefreshTokens
+from backend.models.api_refresh_tokens import ApiRefreshTokens, hash_refresh_token
 from backend.models.users import Users
 from backend.utils.datetime_utils import utc_now
 from backend.utils.strings.api_auth_strs import API_AUTH
@@ -129,7 +129,7 @@ def test_issue_refresh_token_creates_active_row(app: Flask, register_first_user)
         all_rows = ApiRefreshTokens.query.all()
         assert len(all_rows) == 1
         issued_row = all_rows[0]
-        assert issued_row.token == issued_token_value
+        assert issued_row.token_hash == hash_refresh_token(issued_token_value)
         assert issued_row.user_id == 1
         assert issued_row.is_active()
         assert not issued_row.is_expired()
@@ -157,10 +157,11 @@ def test_rotate_refresh_token_issues_replacement_in_same_family(
         assert rotation_result.new_refresh_token != original_token_value
 
         original_row = ApiRefreshTokens.query.filter(
-            ApiRefreshTokens.token == original_token_value
+            ApiRefreshTokens.token_hash == hash_refresh_token(original_token_value)
         ).first()
         replacement_row = ApiRefreshTokens.query.filter(
-            ApiRefreshTokens.token == rotation_result.new_refresh_token
+            ApiRefreshTokens.token_hash
+            == hash_refresh_token(rotation_result.new_refresh_token)
         ).first()
 
         assert original_row.is_rotated()
@@ -216,7 +217,7 @@ def test_rotate_expired_token_is_invalid(app: Flask, register_first_user):
     with app.app_context():
         issued_token_value = issue_refresh_token(user=_first_user())
         issued_row = ApiRefreshTokens.query.filter(
-            ApiRefreshTokens.token == issued_token_value
+            ApiRefreshTokens.token_hash == hash_refresh_token(issued_token_value)
         ).first()
         issued_row.expires_at = utc_now() - timedelta(seconds=1)
         db.session.commit()
@@ -275,11 +276,11 @@ def test_revoke_all_refresh_tokens_for_user(app: Flask, register_multiple_users)
         assert revoked_count == 2
         for revoked_token_value in (first_device_token, second_device_token):
             revoked_row = ApiRefreshTokens.query.filter(
-                ApiRefreshTokens.token == revoked_token_value
+                ApiRefreshTokens.token_hash == hash_refresh_token(revoked_token_value)
             ).first()
             assert revoked_row.is_revoked()
 
         second_user_row = ApiRefreshTokens.query.filter(
-            ApiRefreshTokens.token == second_user_token
+            ApiRefreshTokens.token_hash == hash_refresh_token(second_user_token)
         ).first()
         assert second_user_row.is_active()
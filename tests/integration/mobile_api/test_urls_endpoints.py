@@ -1,6 +1,7 @@
 """
 Integration tests for the bearer-token URL endpoints:
   POST   /api/v1/utubs/<utub_id>/urls
+  POST   /api/v1/utubs/<utub_id>/urls/import
   GET    /api/v1/utubs/<utub_id>/urls/<utub_url_id>
   PATCH  /api/v1/utubs/<utub_id>/urls/<utub_url_id>
   PATCH  /api/v1/utubs/<utub_id>/urls/<utub_url_id>/title
@@ -22,6 +23,7 @@ import pytest
 from backend.api_v1.services.tokens import create_access_token
 from backend.models.users import Users
 from backend.models.utub_urls import Utub_Urls
+from backend.urls.constants import URLImportStatus
 from backend.utils.all_routes import ROUTES
 from backend.utils.strings.api_auth_strs import API_AUTH, API_AUTH_FAILURE
 from backend.utils.strings.json_strs import STD_JSON_RESPONSE as STD_JSON
@@ -54,6 +56,11 @@ def _create_url_url(app: Flask, utub_id: int) -> str:
         return url_for(ROUTES.API_V1.CREATE_URL, utub_id=utub_id)
 
 
+def _import_urls_url(app: Flask, utub_id: int) -> str:
+    with app.test_request_context():
+        return url_for(ROUTES.API_V1.IMPORT_URLS, utub_id=utub_id)
+
+
 def _get_url_url(app: Flask, utub_id: int, utub_url_id: int) -> str:
     with app.test_request_context():
         return url_for(ROUTES.API_V1.GET_URL, utub_id=utub_id, utub_url_id=utub_url_id)
@@ -253,6 +260,72 @@ def test_create_url_duplicate_is_409(
         assert Utub_Urls.query.count() == initial_count
 
 
+# ===========================================================================
+# POST /api/v1/utubs/<utub_id>/urls/import — bulk import URLs
+# ===========================================================================
+
+
+def test_import_urls_happy_path(
+    app: Flask,
+    api_client: FlaskClient,
+    bearer_headers_first_user: dict[str, str],
+    add_single_utub_as_user_without_logging_in,
+):
+    """
+    GIVEN a validated user (ID=1) who is a member of UTub 1 with no URLs
+    WHEN POST /api/v1/utubs/1/urls/import with two URLs, one repeated
+    THEN 200 with addedCount=2 and per-item statuses; two Utub_Urls rows created
+    """
+    response = api_client.post(
+        _import_urls_url(app, utub_id=1),
+        json={
+            MODELS.URLS: [
+                {MODELS.URL_STRING: _UTUB_1_URL_STRING},
+                {MODELS.URL_STRING: _UPDATED_URL_STRING},
+                {MODELS.URL_STRING: _UTUB_1_URL_STRING},
+            ]
+        },
+        headers=bearer_headers_first_user,
+    )
+
+    assert response.status_code == 200
+    response_json = response.get_json()
+    assert response_json[STD_JSON.STATUS] == STD_JSON.SUCCESS
+    assert response_json[STD_JSON.MESSAGE] == URL_SUCCESS.URLS_IMPORTED
+    assert response_json[MODELS.ADDED_COUNT] == 2
+    assert [
+        result[MODELS.IMPORT_STATUS] for result in response_json[MODELS.IMPORT_RESULTS]
+    ] == [
+        URLImportStatus.ADDED,
+        URLImportStatus.ADDED,
+        URLImportStatus.DUPLICATE_IN_IMPORT,
+    ]
+
+    with app.app_context():
+        assert Utub_Urls.query.filter(Utub_Urls.utub_id == 1).count() == 2
+
+
+def test_import_urls_no_token_is_401(
+    app: Flask,
+    api_client: FlaskClient,
+    add_single_utub_as_user_without_logging_in,
+):
+    """
+    GIVEN no Authorization header
+    WHEN POST /api/v1/utubs/1/urls/import
+    THEN 401 JSON failure envelope
+    """
+    response = api_client.post(
+        _import_urls_url(app, utub_id=1),
+        json={MODELS.URLS: [{MODELS.URL_STRING: _UTUB_1_URL_STRING}]},
+    )
+
+    assert response.status_code == 401
+    response_json = response.get_json()
+    assert response_json[STD_JSON.STATUS] == STD_JSON.FAILURE
+    assert response_json[STD_JSON.MESSAGE] == API_AUTH_FAILURE.AUTHENTICATION_REQUIRED
+
+
 # ===========================================================================
 # GET /api/v1/utubs/<utub_id>/urls/<utub_url_id> — retrieve URL
 # ===========================================================================
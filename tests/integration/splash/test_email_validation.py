@@ -182,7 +182,7 @@ def test_valid_token_generated_on_user_register(
         )
 
 
-@mock.patch("backend.extensions.notifications.notifications.requests.post")
+@mock.patch("backend.extensions.notifications.notifications.requests.Session.post")
 def test_token_validates_user(mock_request_post, app, load_register_page):
     """
     GIVEN a user trying to register via the register page
@@ -239,7 +239,7 @@ def test_token_validates_user(mock_request_post, app, load_register_page):
         assert user.email_validated and user.email_confirm is None
 
 
-@mock.patch("backend.extensions.notifications.notifications.requests.post")
+@mock.patch("backend.extensions.notifications.notifications.requests.Session.post")
 def test_token_validates_user_records_email_verified_metric(
     mock_request_post,
     metrics_enabled_app,
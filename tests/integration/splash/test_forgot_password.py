@@ -10,6 +10,8 @@ from backend.splash.utils import verify_token
 from backend.utils.strings.html_identifiers import IDENTIFIERS
 from tests.models_for_test import valid_user_1
 from backend import db
+from backend.extensions.extension_utils import safe_get_email_sender
+from backend.models.email_outbox import Email_Outbox
 from backend.models.forgot_passwords import Forgot_Passwords
 from backend.models.users import Users
 from backend.utils import constants as U4I_CONSTANTS
@@ -552,3 +554,42 @@ def test_forgot_password_response_conforms_to_schema(
         ForgotPasswordResponseSchema,
         {STD_JSON.STATUS, STD_JSON.MESSAGE},
     )
+
+
+def test_forgot_password_with_email_outbox_queues_reset_email(
+    app, register_first_user, load_login_page, monkeypatch
+):
+    """
+    GIVEN a validated user, and the email sender in outbox mode
+    WHEN the user submits the forgot password form
+    THEN server responds with the usual success, and one EmailOutbox row
+        addressed to the user and carrying their reset link is committed
+        alongside the Forgot_Passwords attempt, without calling Mailjet.
+    """
+    new_user, _ = register_first_user
+    client, csrf_token = load_login_page
+    email_sender = safe_get_email_sender(app)
+    monkeypatch.setattr(email_sender, "_use_outbox", True)
+    monkeypatch.setattr(
+        email_sender._mailjet_client.send,
+        "create",
+        lambda **_: pytest.fail("Mailjet called in outbox mode"),
+    )
+
+    response = client.post(
+        url_for(ROUTES.SPLASH.FORGOT_PASSWORD_PAGE),
+        json={FORGOT_PASSWORD.EMAIL: new_user[FORGOT_PASSWORD.EMAIL]},
+        headers={"X-CSRFToken": csrf_token},
+    )
+
+    assert response.status_code == 200
+    assert response.json[STD_JSON.MESSAGE] == FORGOT_PASSWORD.EMAIL_SENT_MESSAGE
+
+    with app.app_context():
+        user: Users = Users.query.filter(
+            Users.email == new_user[FORGOT_PASSWORD.EMAIL].lower()
+        ).one()
+        assert user.forgot_password.attempts == 1
+        outbox_row: Email_Outbox = Email_Outbox.query.one()
+        assert outbox_row.message["To"][0]["Email"] == user.email
+        assert user.forgot_password.reset_token in outbox_row.message["TextPart"]
@@ -0,0 +1,137 @@
+"""Integration tests for the compact_refresh_tokens workflow script.
+
+Uses a raw psycopg2 connection (via build_pg_conn) against the test DB,
+following tests/integration/admin/test_purge_audit_log.py.
+"""
+
+from __future__ import annotations
+
+from datetime import datetime, timedelta, timezone
+from typing import Any
+
+import pytest
+from flask import Flask
+from flask.testing import FlaskCliRunner
+
+from backend.models.api_refresh_tokens import hash_refresh_token
+from scripts.compact_refresh_tokens import CompactionResult, run_compaction
+from tests.integration.system.metrics_helpers import build_pg_conn
+
+pytestmark = pytest.mark.cli
+
+_SEED_PASSWORD = "hashed-placeholder"
+
+
+def _truncate_refresh_tokens(pg_conn: Any) -> None:
+    with pg_conn.cursor() as cursor:
+        cursor.execute('TRUNCATE TABLE "ApiRefreshTokens" RESTART IDENTITY')
+    pg_conn.commit()
+
+
+def _seed_user(pg_conn: Any, username: str) -> int:
+    with pg_conn.cursor() as cursor:
+        cursor.execute(
+            'INSERT INTO "Users" '
+            '(username, email, password, "createdAt", role, "emailValidated") '
+            "VALUES (%s, %s, %s, now(), 'USER', true) RETURNING id",
+            (username, f"{username}@example.com", _SEED_PASSWORD),
+        )
+        user_id: int = cursor.fetchone()[0]
+    pg_conn.commit()
+    return user_id
+
+
+def _seed_token(
+    pg_conn: Any,
+    user_id: int,
+    family_id: str,
+    *,
+    expires_at: datetime,
+    revoked_at: datetime | None = None,
+) -> None:
+    with pg_conn.cursor() as cursor:
+        cursor.execute(
+            'INSERT INTO "ApiRefreshTokens" '
+            '("userID", "tokenHash", "familyId", "issuedAt", "expiresAt", '
+            '"revokedAt") VALUES (%s, %s, %s, now(), %s, %s)',
+            (
+                user_id,
+                hash_refresh_token(f"{family_id}-{expires_at.isoformat()}"),
+                family_id,
+                expires_at,
+                revoked_at,
+            ),
+        )
+    pg_conn.commit()
+
+
+def _remaining_families(pg_conn: Any) -> set[str]:
+    with pg_conn.cursor() as cursor:
+        cursor.execute('SELECT DISTINCT "familyId" FROM "ApiRefreshTokens"')
+        return {row[0] for row in cursor.fetchall()}
+
+
+def test_run_compaction_deletes_only_dead_families(
+    runner: tuple[Flask, FlaskCliRunner],
+) -> None:
+    """
+    GIVEN refresh-token families that are live, long expired, recently
+        expired, long revoked, recently revoked, and partly revoked
+    WHEN run_compaction is called with a 7-day grace period and a batch size
+        of one family
+    THEN only the long-expired and long-revoked families are deleted, over
+        several batches, and every other family is kept.
+    """
+    app, _ = runner
+    pg_conn = build_pg_conn(app)
+    try:
+        _truncate_refresh_tokens(pg_conn)
+        user_id = _seed_user(pg_conn, "compaction_test_user")
+        now_utc = datetime.now(timezone.utc)
+        long_ago = now_utc - timedelta(days=8)
+        recently = now_utc - timedelta(days=2)
+        in_future = now_utc + timedelta(days=20)
+
+        # A rotated-and-expired row alongside the live one keeps the family live
+        _seed_token(pg_conn, user_id, "live", expires_at=long_ago)
+        _seed_token(pg_conn, user_id, "live", expires_at=in_future)
+        _seed_token(pg_conn, user_id, "expired-long-ago", expires_at=long_ago)
+        _seed_token(pg_conn, user_id, "expired-recently", expires_at=recently)
+        for offset_minutes in range(2):
+            _seed_token(
+                pg_conn,
+                user_id,
+                "revoked-long-ago",
+                expires_at=in_future - timedelta(minutes=offset_minutes),
+                revoked_at=long_ago,
+            )
+        _seed_token(
+            pg_conn,
+            user_id,
+            "revoked-recently",
+            expires_at=in_future,
+            revoked_at=recently,
+        )
+        _seed_token(
+            pg_conn,
+            user_id,
+            "partly-revoked",
+            expires_at=in_future,
+            revoked_at=long_ago,
+        )
+        _seed_token(
+            pg_conn, user_id, "partly-revoked", expires_at=in_future - timedelta(days=1)
+        )
+
+        compaction_result = run_compaction(pg_conn=pg_conn, grace_days=7, batch_size=1)
+
+        assert compaction_result == CompactionResult(families=2, rows=3)
+        assert _remaining_families(pg_conn) == {
+            "live",
+            "expired-recently",
+            "revoked-recently",
+            "partly-revoked",
+        }
+    finally:
+        _truncate_refresh_tokens(pg_conn)
+        pg_conn.close()
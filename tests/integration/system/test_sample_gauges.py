@@ -8,9 +8,16 @@ import pytest
 from flask import Flask
 from redis import Redis
 
-from backend.metrics.gauges import GaugeName
+from backend import db
+from backend.metrics.gauges import INCREMENTAL_GAUGE_NAMES, GaugeName
+from backend.models.gauge_counters import install_gauge_counter_triggers
 from scripts.sample_gauges import (
     GAUGE_FAILURE_FLAG_KEY,
+    SAMPLE_MODE_COMPILED,
+    SAMPLE_MODE_INCREMENTAL,
+    SAMPLE_MODE_PER_GAUGE,
+    collect_gauge_values,
+    run_reconcile,
     run_sample,
     run_sample_job,
 )
@@ -70,9 +77,9 @@ def _seed_utub(pg_conn: Any, name: str, creator_id: int) -> int:
 def _seed_url(pg_conn: Any, url_string: str, creator_id: int) -> int:
     with pg_conn.cursor() as cursor:
         cursor.execute(
-            'INSERT INTO "Urls" ("urlString", "createdBy", "createdAt") '
-            "VALUES (%s, %s, %s) RETURNING id",
-            (url_string, creator_id, _SEED_TIMESTAMP),
+            'INSERT INTO "Urls" ("urlString", "urlDigest", "createdBy", "createdAt") '
+            "VALUES (%s, sha256(convert_to(%s, 'UTF8')), %s, %s) RETURNING id",
+            (url_string, url_string, creator_id, _SEED_TIMESTAMP),
         )
         url_id = cursor.fetchone()[0]
     pg_conn.commit()
@@ -90,6 +97,47 @@ def _seed_utub_url(pg_conn: Any, utub_id: int, url_id: int, user_id: int) -> Non
     pg_conn.commit()
 
 
+def _seed_utub_tag(pg_conn: Any, utub_id: int, tag_string: str, user_id: int) -> int:
+    with pg_conn.cursor() as cursor:
+        cursor.execute(
+            'INSERT INTO "UtubTags" ("utubID", "tagString", "createdBy", "createdAt") '
+            "VALUES (%s, %s, %s, %s) RETURNING id",
+            (utub_id, tag_string, user_id, _SEED_TIMESTAMP),
+        )
+        tag_id = cursor.fetchone()[0]
+    pg_conn.commit()
+    return tag_id
+
+
+def _install_counters(app: Flask) -> None:
+    """Install the counter triggers and rows on the test schema.
+
+    ``db.create_all()`` installs them too, but a schema rebuilt from reflected
+    metadata (``clear_database``) does not, so tests relying on live counters
+    install them explicitly.
+    """
+    with app.app_context():
+        with db.engine.begin() as connection:
+            install_gauge_counter_triggers(connection)
+
+
+def _counter_values(pg_conn: Any) -> dict[str, int]:
+    """Each gauge's counter: its base row plus its pending deltas."""
+    with pg_conn.cursor() as cursor:
+        cursor.execute(
+            'SELECT c."gaugeName", c."value" + COALESCE(SUM(d."delta"), 0) '
+            'FROM "GaugeCounters" AS c LEFT JOIN "GaugeCounterDeltas" AS d '
+            'ON d."gaugeName" = c."gaugeName" GROUP BY c."gaugeName", c."value"'
+        )
+        return dict(cursor.fetchall())
+
+
+def _pending_delta_count(pg_conn: Any) -> int:
+    with pg_conn.cursor() as cursor:
+        cursor.execute('SELECT COUNT(*) FROM "GaugeCounterDeltas"')
+        return cursor.fetchone()[0]
+
+
 def _count_gauge_rows(pg_conn: Any) -> int:
     with pg_conn.cursor() as cursor:
         cursor.execute('SELECT COUNT(*) FROM "AnonymousGauges"')
@@ -226,6 +274,201 @@ def test_distribution_max_k_anonymity_below_threshold(
         pg_conn.close()
 
 
+@pytest.mark.parametrize("utub_count", [3, 6])
+def test_compiled_mode_matches_per_gauge_mode(
+    metrics_enabled_runner_app: Flask, utub_count: int
+):
+    """
+    GIVEN UTubs with uneven URL counts, both below and above MIN_GAUGE_POPULATION
+    WHEN gauge values are collected in per-gauge mode and in compiled mode
+    THEN both modes return identical values for every gauge, including the
+        k-anonymity-suppressed NULLs.
+    """
+    app = metrics_enabled_runner_app
+    pg_conn = build_pg_conn(app)
+    try:
+        _truncate_all(pg_conn)
+        creator_id = _seed_user(pg_conn, "creator")
+        url_serial = 0
+        for utub_index in range(utub_count):
+            utub_id = _seed_utub(pg_conn, f"utub{utub_index}", creator_id)
+            for _ in range(utub_index + 1):
+                url_id = _seed_url(pg_conn, f"https://e.com/{url_serial}", creator_id)
+                _seed_utub_url(pg_conn, utub_id, url_id, creator_id)
+                url_serial += 1
+
+        with pg_conn.cursor() as cursor:
+            per_gauge_values = collect_gauge_values(
+                cursor=cursor, mode=SAMPLE_MODE_PER_GAUGE
+            )
+            compiled_values = collect_gauge_values(
+                cursor=cursor, mode=SAMPLE_MODE_COMPILED
+            )
+
+        assert set(per_gauge_values) == set(GaugeName)
+        assert compiled_values == per_gauge_values
+    finally:
+        _truncate_all(pg_conn)
+        pg_conn.close()
+
+
+def test_incremental_counters_follow_inserts_deletes_and_truncate(
+    metrics_enabled_runner_app: Flask,
+):
+    """
+    GIVEN the counter triggers installed and users, UTubs, URLs, associations,
+        and tags (two UTubs sharing the tag string "shared") seeded row by row
+    WHEN gauge values are collected in incremental mode, after seeding, after
+        deleting one UTub (cascading to its associations and tags), and after
+        truncating the source tables
+    THEN every collection matches per-gauge mode, the volume gauges are served
+        from GaugeCounters plus the deltas the triggers appended, and
+        TOTAL_TAGS only drops once the last "shared" tag row is gone.
+    """
+    app = metrics_enabled_runner_app
+    _install_counters(app)
+    pg_conn = build_pg_conn(app)
+    try:
+        _truncate_all(pg_conn)
+        creator_id = _seed_user(pg_conn, "creator")
+        _seed_user(pg_conn, "member")
+        first_utub_id = _seed_utub(pg_conn, "utub0", creator_id)
+        second_utub_id = _seed_utub(pg_conn, "utub1", creator_id)
+        for url_serial in range(3):
+            url_id = _seed_url(pg_conn, f"https://e.com/{url_serial}", creator_id)
+            _seed_utub_url(pg_conn, first_utub_id, url_id, creator_id)
+            _seed_utub_url(pg_conn, second_utub_id, url_id, creator_id)
+        _seed_utub_tag(pg_conn, first_utub_id, "shared", creator_id)
+        _seed_utub_tag(pg_conn, second_utub_id, "shared", creator_id)
+        _seed_utub_tag(pg_conn, first_utub_id, "only-first", creator_id)
+
+        with pg_conn.cursor() as cursor:
+            incremental_values = collect_gauge_values(
+                cursor=cursor, mode=SAMPLE_MODE_INCREMENTAL
+            )
+            per_gauge_values = collect_gauge_values(
+                cursor=cursor, mode=SAMPLE_MODE_PER_GAUGE
+            )
+        assert incremental_values == per_gauge_values
+        assert _counter_values(pg_conn) == {
+            GaugeName.TOTAL_USERS.value: 2,
+            GaugeName.TOTAL_UTUBS.value: 2,
+            GaugeName.TOTAL_URLS.value: 3,
+            GaugeName.TOTAL_TAGS.value: 2,
+            GaugeName.TOTAL_UTUB_URL_ASSOCIATIONS.value: 6,
+        }
+
+        with pg_conn.cursor() as cursor:
+            cursor.execute('DELETE FROM "Utubs" WHERE id = %s', (first_utub_id,))
+        pg_conn.commit()
+
+        with pg_conn.cursor() as cursor:
+            incremental_values = collect_gauge_values(
+                cursor=cursor, mode=SAMPLE_MODE_INCREMENTAL
+            )
+            per_gauge_values = collect_gauge_values(
+                cursor=cursor, mode=SAMPLE_MODE_PER_GAUGE
+            )
+        assert incremental_values == per_gauge_values
+        assert incremental_values[GaugeName.TOTAL_TAGS] == 1
+        assert incremental_values[GaugeName.TOTAL_UTUB_URL_ASSOCIATIONS] == 3
+
+        _truncate_all(pg_conn)
+        assert set(_counter_values(pg_conn).values()) == {0}
+    finally:
+        _truncate_all(pg_conn)
+        pg_conn.close()
+
+
+def test_run_sample_folds_pending_deltas_into_counters(
+    metrics_enabled_runner_app: Flask,
+):
+    """
+    GIVEN the counter triggers installed and users and UTubs seeded row by
+        row, leaving one pending delta per write statement
+    WHEN run_sample is invoked in incremental mode
+    THEN no delta rows are left, the counter base rows alone hold the true
+        counts, and the sampled volume gauges match them.
+    """
+    app = metrics_enabled_runner_app
+    _install_counters(app)
+    pg_conn = build_pg_conn(app)
+    try:
+        _truncate_all(pg_conn)
+        creator_id = _seed_user(pg_conn, "creator")
+        _seed_user(pg_conn, "member")
+        _seed_utub(pg_conn, "utub0", creator_id)
+        assert _pending_delta_count(pg_conn) > 0
+
+        run_sample(
+            pg_conn=pg_conn,
+            now_epoch=int(time.time()),
+            mode=SAMPLE_MODE_INCREMENTAL,
+        )
+
+        assert _pending_delta_count(pg_conn) == 0
+        with pg_conn.cursor() as cursor:
+            cursor.execute('SELECT "gaugeName", "value" FROM "GaugeCounters"')
+            base_values = dict(cursor.fetchall())
+        assert base_values[GaugeName.TOTAL_USERS.value] == 2
+        assert base_values[GaugeName.TOTAL_UTUBS.value] == 1
+        assert _gauge_value(pg_conn, GaugeName.TOTAL_USERS) == (2, None)
+        assert _gauge_value(pg_conn, GaugeName.TOTAL_UTUBS) == (1, None)
+    finally:
+        _truncate_all(pg_conn)
+        pg_conn.close()
+
+
+def test_reconcile_resets_drifted_counters(metrics_enabled_runner_app: Flask):
+    """
+    GIVEN the counter triggers installed, a seeded fixture, and counters made
+        to drift (values bumped and the tag reference rows wiped, as a restore
+        loaded with triggers disabled would leave them)
+    WHEN run_reconcile is invoked
+    THEN it reports each gauge's drift, folds every pending delta into the
+        counter rows, the counters equal the true counts again, and later
+        writes keep them in step.
+    """
+    app = metrics_enabled_runner_app
+    _install_counters(app)
+    pg_conn = build_pg_conn(app)
+    try:
+        _truncate_all(pg_conn)
+        creator_id = _seed_user(pg_conn, "creator")
+        utub_id = _seed_utub(pg_conn, "utub0", creator_id)
+        _seed_utub_tag(pg_conn, utub_id, "tag", creator_id)
+        with pg_conn.cursor() as cursor:
+            cursor.execute('UPDATE "GaugeCounters" SET "value" = "value" + 7')
+            cursor.execute('DELETE FROM "GaugeDistinctRefs"')
+        pg_conn.commit()
+
+        assert _pending_delta_count(pg_conn) > 0
+
+        drift_by_gauge = run_reconcile(pg_conn=pg_conn)
+
+        assert set(drift_by_gauge) == set(INCREMENTAL_GAUGE_NAMES)
+        assert set(drift_by_gauge.values()) == {-7}
+        assert _pending_delta_count(pg_conn) == 0
+        assert _counter_values(pg_conn)[GaugeName.TOTAL_USERS.value] == 1
+        assert _counter_values(pg_conn)[GaugeName.TOTAL_TAGS.value] == 1
+
+        _seed_utub_tag(
+            pg_conn, _seed_utub(pg_conn, "utub1", creator_id), "tag", creator_id
+        )
+        with pg_conn.cursor() as cursor:
+            incremental_values = collect_gauge_values(
+                cursor=cursor, mode=SAMPLE_MODE_INCREMENTAL
+            )
+            per_gauge_values = collect_gauge_values(
+                cursor=cursor, mode=SAMPLE_MODE_PER_GAUGE
+            )
+        assert incremental_values == per_gauge_values
+        assert incremental_values[GaugeName.TOTAL_TAGS] == 1
+    finally:
+        _truncate_all(pg_conn)
+        pg_conn.close()
+
+
 def test_relational_max_utubs_per_url_and_urls_per_user(
     metrics_enabled_runner_app: Flask,
 ):
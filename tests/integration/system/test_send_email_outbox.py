@@ -0,0 +1,162 @@
+"""Integration tests for the send_email_outbox workflow script.
+
+Uses a raw psycopg2 connection (via build_pg_conn) against the test DB and the
+in-process Mailjet stand-in, following tests/integration/admin/test_purge_audit_log.py.
+"""
+
+from __future__ import annotations
+
+from datetime import datetime, timedelta, timezone
+import json
+from typing import Any
+
+import pytest
+from flask import Flask
+from flask.testing import FlaskCliRunner
+
+from backend.testing.fake_mailjet import FakeMailjet
+from scripts.send_email_outbox import OutboxRunResult, run_send
+from tests.integration.system.metrics_helpers import build_pg_conn
+
+pytestmark = pytest.mark.cli
+
+
+def _truncate_email_outbox(pg_conn: Any) -> None:
+    with pg_conn.cursor() as cursor:
+        cursor.execute('TRUNCATE TABLE "EmailOutbox" RESTART IDENTITY')
+    pg_conn.commit()
+
+
+def _seed_outbox_row(
+    pg_conn: Any,
+    to_email: str,
+    *,
+    next_attempt_at: datetime | None = None,
+    failed_at: datetime | None = None,
+) -> int:
+    message = {
+        "From": {"Email": "team@urls4irl.app", "Name": "URLS4IRL Team"},
+        "To": [{"Email": to_email, "Name": "user"}],
+        "Subject": "URLS4IRL Account Confirmation",
+        "TextPart": "confirm",
+        "HTMLPart": "<p>confirm</p>",
+    }
+    with pg_conn.cursor() as cursor:
+        cursor.execute(
+            'INSERT INTO "EmailOutbox" '
+            '("message", "attempts", "nextAttemptAt", "failedAt", "createdAt") '
+            "VALUES (%s, 0, COALESCE(%s, now()), %s, now()) RETURNING id",
+            (json.dumps(message), next_attempt_at, failed_at),
+        )
+        outbox_id: int = cursor.fetchone()[0]
+    pg_conn.commit()
+    return outbox_id
+
+
+def _outbox_rows(pg_conn: Any) -> dict[int, tuple]:
+    with pg_conn.cursor() as cursor:
+        cursor.execute(
+            'SELECT "id", "attempts", "nextAttemptAt" > now(), '
+            '"failedAt" IS NOT NULL FROM "EmailOutbox"'
+        )
+        return {row[0]: row[1:] for row in cursor.fetchall()}
+
+
+def test_run_send_delivers_due_rows_in_batches(
+    runner: tuple[Flask, FlaskCliRunner],
+) -> None:
+    """
+    GIVEN five due outbox rows, one not yet due, and one to a rejected address
+    WHEN run_send is called with a batch size of two
+    THEN the due deliverable rows are sent over several Mailjet requests and
+        deleted, the rejected row is marked failed, and the future row is left
+        untouched.
+    """
+    app, _ = runner
+    pg_conn = build_pg_conn(app)
+    try:
+        _truncate_email_outbox(pg_conn)
+        for index in range(4):
+            _seed_outbox_row(pg_conn, f"user{index}@example.com")
+        rejected_id = _seed_outbox_row(pg_conn, "bad@example.com")
+        future_id = _seed_outbox_row(
+            pg_conn,
+            "later@example.com",
+            next_attempt_at=datetime.now(timezone.utc) + timedelta(hours=1),
+        )
+        fake_mailjet = FakeMailjet()
+        fake_mailjet.rejected_addresses.add("bad@example.com")
+
+        run_result = run_send(pg_conn=pg_conn, transport=fake_mailjet, batch_size=2)
+
+        assert run_result == OutboxRunResult(sent=4, failed=1)
+        assert fake_mailjet.request_count == 3
+        assert _outbox_rows(pg_conn) == {
+            rejected_id: (1, False, True),
+            future_id: (0, True, False),
+        }
+    finally:
+        _truncate_email_outbox(pg_conn)
+        pg_conn.close()
+
+
+def test_run_send_backs_off_when_mailjet_is_unreachable(
+    runner: tuple[Flask, FlaskCliRunner],
+) -> None:
+    """
+    GIVEN three due outbox rows
+    WHEN run_send is called with a batch size of two while Mailjet is down
+    THEN only one request is made, the claimed rows are rescheduled into the
+        future with one attempt counted, and the unclaimed row stays due.
+    """
+    app, _ = runner
+    pg_conn = build_pg_conn(app)
+    try:
+        _truncate_email_outbox(pg_conn)
+        outbox_ids = [
+            _seed_outbox_row(pg_conn, f"user{index}@example.com") for index in range(3)
+        ]
+        fake_mailjet = FakeMailjet()
+        fake_mailjet.unavailable = True
+
+        run_result = run_send(pg_conn=pg_conn, transport=fake_mailjet, batch_size=2)
+
+        assert run_result == OutboxRunResult(retried=2)
+        assert fake_mailjet.request_count == 1
+        assert _outbox_rows(pg_conn) == {
+            outbox_ids[0]: (1, True, False),
+            outbox_ids[1]: (1, True, False),
+            outbox_ids[2]: (0, False, False),
+        }
+    finally:
+        _truncate_email_outbox(pg_conn)
+        pg_conn.close()
+
+
+def test_run_send_purges_expired_failed_rows(
+    runner: tuple[Flask, FlaskCliRunner],
+) -> None:
+    """
+    GIVEN failed outbox rows from 31 days ago and from yesterday
+    WHEN run_send is called with the default 30-day retention
+    THEN only the 31-day-old row is purged.
+    """
+    app, _ = runner
+    pg_conn = build_pg_conn(app)
+    try:
+        _truncate_email_outbox(pg_conn)
+        now_utc = datetime.now(timezone.utc)
+        _seed_outbox_row(
+            pg_conn, "old@example.com", failed_at=now_utc - timedelta(days=31)
+        )
+        recent_id = _seed_outbox_row(
+            pg_conn, "recent@example.com", failed_at=now_utc - timedelta(days=1)
+        )
+
+        run_result = run_send(pg_conn=pg_conn, transport=FakeMailjet())
+
+        assert run_result == OutboxRunResult(purged=1)
+        assert list(_outbox_rows(pg_conn)) == [recent_id]
+    finally:
+        _truncate_email_outbox(pg_conn)
+        pg_conn.close()
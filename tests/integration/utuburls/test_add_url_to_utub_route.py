@@ -12,7 +12,7 @@ from backend.extensions.url_validation.url_validator import (
     UrlValidator,
 )
 from backend.metrics.events import EventName
-from backend.models.urls import Urls
+from backend.models.urls import digest_url_string, Urls
 from backend.models.utubs import Utubs
 from backend.models.utub_members import Utub_Members
 from backend.models.utub_tags import Utub_Tags
@@ -671,11 +671,11 @@ def test_url_create_rejected_credentials_url(
     assert count_counter_keys(provide_metrics_redis, EventName.URL_ADDED_TO_UTUB) == 0
 
 
-@mock.patch("backend.extensions.notifications.notifications.threading.Thread")
+@mock.patch("backend.extensions.notifications.notifications.requests.Session.post")
 @mock.patch("backend.extensions.url_validation.url_validator.UrlValidator.validate_url")
 def test_url_create_rejected_unexpected_error(
     mock_validate_url,
-    mock_thread,
+    mock_session_post,
     metrics_enabled_app,
     provide_metrics_redis,
     every_user_in_every_utub,
@@ -688,9 +688,7 @@ def test_url_create_rejected_unexpected_error(
         counter key is written with reason="unexpected_error", and no
         URL_ADDED_TO_UTUB counter is written.
     """
-    mock_thread_response = mock.MagicMock()
-    mock_thread_response.start.return_value = None
-    mock_thread.return_value = mock_thread_response
+    mock_session_post.return_value = mock.Mock(status_code=200)
 
     client, csrf_token, _, app = login_first_user_without_register
     valid_url_to_add = valid_url_strings[0]
@@ -1398,6 +1396,14 @@ def test_add_fresh_url_to_utub(
             Urls.query.get(url_id_added).url_string == ada_url.URL(validated_url).href
         )
 
+        # Ensure the digest is stored and resolves back to the same row
+        assert Urls.query.get(url_id_added).url_digest == digest_url_string(
+            ada_url.URL(validated_url).href
+        )
+        assert (
+            Urls.find_by_url_string(ada_url.URL(validated_url).href).id == url_id_added
+        )
+
         # Ensure URL now in UTub
         assert (
             Utub_Urls.query.filter(
@@ -2689,11 +2695,11 @@ def test_add_invalid_url_log(
     assert is_string_in_logs(f"url_string={valid_url_to_add}", caplog.records)
 
 
-@mock.patch("backend.extensions.notifications.notifications.threading.Thread")
+@mock.patch("backend.extensions.notifications.notifications.requests.Session.post")
 @mock.patch("backend.extensions.url_validation.url_validator.UrlValidator.validate_url")
 def test_add_url_unknown_exception_log(
     mock_validate_url,
-    mock_thread,
+    mock_session_post,
     every_user_in_every_utub,
     login_first_user_without_register,
     caplog,
@@ -2705,9 +2711,7 @@ def test_add_url_unknown_exception_log(
         - By POST to "/utubs/<int:utub_id>/urls" where "utub_id" is an integer representing UTub ID
     THEN ensure that the server responds with a 400 HTTP status code and the logs are valid
     """
-    mock_thread_response = mock.MagicMock()
-    mock_thread_response.start.return_value = None
-    mock_thread.return_value = mock_thread_response
+    mock_session_post.return_value = mock.Mock(status_code=200)
 
     client, csrf_token, user, app = login_first_user_without_register
     valid_url_to_add = valid_url_strings[0]
@@ -2838,7 +2842,7 @@ def test_add_url_invalid_form_log(
     assert is_string_in_logs("Invalid JSON:", caplog.records)
 
 
-@mock.patch("backend.extensions.notifications.notifications.requests.post")
+@mock.patch("backend.extensions.notifications.notifications.requests.Session.post")
 @mock.patch("backend.extensions.url_validation.url_validator.UrlValidator.validate_url")
 def test_add_invalid_url_sends_notification(
     mock_validate_url,
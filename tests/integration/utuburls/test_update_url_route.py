@@ -2226,11 +2226,11 @@ def test_update_valid_url_updates_utub_last_updated(
         assert (current_utub.last_updated - initial_last_updated).total_seconds() > 0
 
 
-@mock.patch("backend.extensions.notifications.notifications.threading.Thread")
+@mock.patch("backend.extensions.notifications.notifications.requests.Session.post")
 @mock.patch("backend.extensions.url_validation.url_validator.UrlValidator.validate_url")
 def test_update_valid_url_with_invalid_url_does_not_update_utub_last_updated(
     mock_validate_url,
-    mock_thread,
+    mock_session_post,
     add_two_url_and_all_users_to_each_utub_no_tags,
     login_first_user_without_register,
 ):
@@ -2242,9 +2242,7 @@ def test_update_valid_url_with_invalid_url_does_not_update_utub_last_updated(
             URL_FORM.URL_STRING: String of URL to add
     THEN the server sends back a 400 HTTP status code, and the UTub last updated field is not modified
     """
-    mock_thread_response = mock.MagicMock()
-    mock_thread_response.start.return_value = None
-    mock_thread.return_value = mock_thread_response
+    mock_session_post.return_value = mock.Mock(status_code=200)
 
     mock_validate_url.side_effect = InvalidURLError
     client, csrf_token_string, _, app = login_first_user_without_register
@@ -2581,11 +2579,11 @@ def test_update_valid_url_with_same_url_before_normalization_url_log(
     )
 
 
-@mock.patch("backend.extensions.notifications.notifications.threading.Thread")
+@mock.patch("backend.extensions.notifications.notifications.requests.Session.post")
 @mock.patch("backend.extensions.url_validation.url_validator.UrlValidator.validate_url")
 def test_update_to_invalid_url_log(
     mock_validate_url,
-    mock_thread,
+    mock_session_post,
     add_one_url_and_all_users_to_each_utub_with_all_tags,
     login_first_user_without_register,
     caplog,
@@ -2598,9 +2596,7 @@ def test_update_to_invalid_url_log(
             "urlString": String of URL to add
     THEN verify the server sends back a 400 HTTP status code, and the logs are valid
     """
-    mock_thread_response = mock.MagicMock()
-    mock_thread_response.start.return_value = None
-    mock_thread.return_value = mock_thread_response
+    mock_session_post.return_value = mock.Mock(status_code=200)
 
     client, csrf_token_string, user, app = login_first_user_without_register
     mock_validate_url.side_effect = InvalidURLError("Invalid URL error")
@@ -2800,7 +2796,7 @@ def test_update_url_with_invalid_form_log(
     assert is_string_in_logs("Missing JSON body", caplog.records)
 
 
-@mock.patch("backend.extensions.notifications.notifications.requests.post")
+@mock.patch("backend.extensions.notifications.notifications.requests.Session.post")
 @mock.patch("backend.extensions.url_validation.url_validator.UrlValidator.validate_url")
 def test_update_url_unknown_exception_sends_notification(
     mock_validate_url,
@@ -1,7 +1,11 @@
 import pytest
 from pydantic import ValidationError
 
-from backend.schemas.requests.urls import CreateURLRequest, UpdateURLTitleRequest
+from backend.schemas.requests.urls import (
+    CreateURLRequest,
+    ImportURLRequest,
+    UpdateURLTitleRequest,
+)
 from backend.utils.constants import TAG_CONSTANTS
 from backend.utils.strings.model_strs import MODELS as M
 
@@ -197,6 +201,29 @@ class TestCreateURLRequestTagStrings:
             )
 
 
+class TestImportURLRequestSource:
+    """Tests that ImportURLRequest takes exactly one of urls / bookmarksHtml."""
+
+    def test_url_list_accepted_with_lenient_items(self):
+        request = ImportURLRequest(
+            urls=[{"urlString": "not a url", "tagStrings": ["   "]}]
+        )
+        assert request.urls[0].urlTitle is None
+        assert request.urls[0].tagStrings == ["   "]
+
+    def test_bookmarks_html_accepted(self):
+        request = ImportURLRequest(bookmarksHtml="<DL><DT><A HREF='x'>x</A></DL>")
+        assert request.urls is None
+
+    def test_both_sources_rejected(self):
+        with pytest.raises(ValidationError):
+            ImportURLRequest(urls=[], bookmarksHtml="<DL></DL>")
+
+    def test_neither_source_rejected(self):
+        with pytest.raises(ValidationError):
+            ImportURLRequest()
+
+
 class TestUpdateURLTitleRequestWhitespaceStripping:
     """Tests that UpdateURLTitleRequest strips leading/trailing whitespace from urlTitle."""
 
@@ -0,0 +1,121 @@
+from __future__ import annotations
+
+import json
+import queue
+import time
+from unittest import mock
+
+import pytest
+
+from backend.extensions.access_token_cache import AccessTokenCache, CachedAccessToken
+from backend.utils.strings.api_auth_strs import API_AUTH
+
+pytestmark = pytest.mark.unit
+
+NOW = 1_751_700_000.0
+
+
+def _entry(user_id: int, expires_at: float = NOW + 900) -> CachedAccessToken:
+    return CachedAccessToken(
+        user_id=user_id, expires_at=expires_at, user_columns={"id": user_id}
+    )
+
+
+class _FakePubSub:
+    """Replays queued pub/sub messages to the cache's subscriber thread.
+
+    Subscribing queues nothing; the test confirms the subscription itself.
+    """
+
+    def __init__(self) -> None:
+        self.messages: queue.Queue[dict] = queue.Queue()
+
+    def subscribe(self, channel: str) -> None:
+        self.channel = channel
+
+    def get_message(self, timeout: float) -> dict | None:
+        try:
+            return self.messages.get(timeout=timeout)
+        except queue.Empty:
+            return None
+
+    def close(self) -> None:
+        pass
+
+
+def test_entries_expire_at_token_exp_and_oldest_are_evicted_first():
+    """
+    GIVEN a local cache with room for two tokens
+    WHEN three tokens are stored, one of them expiring soon
+    THEN the least recently used token is evicted, and a token past its exp
+        is a miss.
+    """
+    cache = AccessTokenCache(max_entries=2)
+    cache.put("token-a", _entry(1), generation=cache.begin_fill())
+    cache.put("token-b", _entry(2, expires_at=NOW + 10), generation=cache.begin_fill())
+    assert cache.get("token-a", now=NOW) is not None
+    cache.put("token-c", _entry(3), generation=cache.begin_fill())
+
+    assert cache.get("token-b", now=NOW) is None
+    assert cache.get("token-a", now=NOW).user_id == 1
+    assert cache.get("token-c", now=NOW).user_id == 3
+    assert cache.get("token-c", now=NOW + 900) is None
+    assert len(cache) == 1
+
+
+def test_fill_begun_before_an_eviction_is_discarded():
+    """
+    GIVEN a lookup that began filling the cache for a user
+    WHEN that user's tokens are evicted before the fill is stored
+    THEN the stale fill is dropped, and a fill begun afterwards is kept.
+    """
+    cache = AccessTokenCache(max_entries=10)
+    cache.put("token-other", _entry(2), generation=cache.begin_fill())
+
+    stale_generation = cache.begin_fill()
+    cache.evict_users([1])
+
+    assert not cache.put("token-a", _entry(1), generation=stale_generation)
+    assert cache.get("token-a", now=NOW) is None
+    assert cache.get("token-other", now=NOW) is not None
+    assert cache.put("token-a", _entry(1), generation=cache.begin_fill())
+
+
+def test_redis_backed_cache_serves_only_while_subscribed_and_fans_out():
+    """
+    GIVEN a cache fanning out invalidations over Redis pub/sub
+    WHEN it is used before and after its subscription is confirmed, another
+        worker publishes an invalidation, and this worker publishes one
+    THEN nothing is served or stored until the subscription is confirmed,
+        published user ids are evicted, and this worker's invalidations are
+        published as a JSON list of user ids.
+    """
+    fake_pubsub = _FakePubSub()
+    redis_client = mock.MagicMock()
+    redis_client.pubsub.return_value = fake_pubsub
+    cache = AccessTokenCache(max_entries=10, redis_client=redis_client)
+
+    try:
+        assert not cache.put("token-a", _entry(1), generation=cache.begin_fill())
+        assert cache.get("token-a", now=NOW) is None
+
+        fake_pubsub.messages.put({"type": "subscribe", "data": 1})
+        assert cache._subscribed.wait(timeout=5)
+        assert cache.put("token-a", _entry(1), generation=cache.begin_fill())
+        assert cache.put("token-b", _entry(2), generation=cache.begin_fill())
+
+        fake_pubsub.messages.put({"type": "message", "data": json.dumps([1]).encode()})
+        for _ in range(100):
+            if cache.get("token-a", now=NOW) is None:
+                break
+            time.sleep(0.01)
+        assert cache.get("token-a", now=NOW) is None
+        assert cache.get("token-b", now=NOW) is not None
+
+        cache.publish_invalidation([2, 2])
+        assert cache.get("token-b", now=NOW) is None
+        redis_client.publish.assert_called_once_with(
+            API_AUTH.ACCESS_TOKEN_CACHE_INVALIDATION_CHANNEL, "[2]"
+        )
+    finally:
+        cache.shutdown()
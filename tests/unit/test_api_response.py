@@ -1,8 +1,16 @@
+import datetime
+
+from flask import Flask
 import pytest
 from pydantic import Field
 
-from backend.api_common.responses import APIResponse
-from backend.schemas.base import BaseSchema
+from backend.api_common.responses import (
+    APIResponse,
+    JSON_ENCODER_PYDANTIC,
+    JSON_ENCODER_STDLIB,
+)
+from backend.schemas.base import BaseSchema, StatusMessageResponseSchema
+from backend.utils.strings.config_strs import CONFIG_ENVS
 
 pytestmark = pytest.mark.unit
 
@@ -61,3 +69,83 @@ def test_api_response_with_pydantic_model_failure_response(app):
     assert status_code == 400
     assert payload["itemId"] == 1
     assert payload["label"] == "err"
+
+
+class TimestampedSchema(BaseSchema):
+    item_id: int = Field(alias="itemId")
+    created_at: datetime.datetime = Field(alias="createdAt")
+    nested: list[SampleSchema] = Field(alias="nested")
+
+
+class EmptySchema(BaseSchema):
+    pass
+
+
+def _encoder_app(encoder: str) -> Flask:
+    app = Flask(__name__)
+    app.config[CONFIG_ENVS.JSON_RESPONSE_ENCODER] = encoder
+    return app
+
+
+@pytest.mark.parametrize(
+    "api_response",
+    [
+        APIResponse(
+            data=TimestampedSchema(
+                item_id=7,
+                created_at=datetime.datetime(
+                    2026, 6, 6, 17, 0, tzinfo=datetime.timezone.utc
+                ),
+                nested=[SampleSchema(item_id=1, label="é & <b>")],
+            ),
+            message="ok",
+        ),
+        APIResponse(
+            data=SampleSchema(item_id=2, label="x"),
+            status_code=400,
+            message="bad",
+            error_code=3,
+            errors={"label": ["Too long"]},
+            details="detail",
+        ),
+        APIResponse(data=SampleSchema(item_id=3, label="x"), status="No change"),
+        APIResponse(
+            data=StatusMessageResponseSchema(status="No change", message="inner"),
+            message="outer",
+        ),
+        APIResponse(data=EmptySchema(), status_code=201),
+        APIResponse(data={"someKey": [1, 2]}, status_code=404, message="missing"),
+    ],
+)
+def test_pydantic_encoder_matches_stdlib_encoder(api_response: APIResponse):
+    """
+    GIVEN an APIResponse with schema data (with and without envelope-key
+        overlap, nested and datetime fields, an empty schema) or dict data
+    WHEN to_response() is called under the pydantic and the stdlib encoders
+    THEN both produce the same status code, content type, and JSON payload.
+    """
+    rendered = {}
+    for encoder in (JSON_ENCODER_PYDANTIC, JSON_ENCODER_STDLIB):
+        with _encoder_app(encoder).app_context():
+            response, status_code = api_response.to_response()
+        rendered[encoder] = (status_code, response.mimetype, response.get_json())
+
+    assert rendered[JSON_ENCODER_PYDANTIC] == rendered[JSON_ENCODER_STDLIB]
+    assert rendered[JSON_ENCODER_PYDANTIC][0] == api_response.status_code
+
+
+def test_pydantic_encoder_keeps_envelope_key_order():
+    """
+    GIVEN an APIResponse with schema data and a message
+    WHEN it is rendered with the pydantic encoder
+    THEN the body is compact JSON with status first, then the schema's fields,
+        then the message.
+    """
+    with _encoder_app(JSON_ENCODER_PYDANTIC).app_context():
+        response, _ = APIResponse(
+            data=SampleSchema(item_id=1, label="a"), message="done"
+        ).to_response()
+
+    assert response.get_data() == (
+        b'{"status":"Success","itemId":1,"label":"a","message":"done"}'
+    )
@@ -0,0 +1,146 @@
+from __future__ import annotations
+
+from datetime import date, timedelta
+import io
+import logging
+import os
+import queue
+
+from flask import Flask
+import pytest
+
+from backend import app_logger
+from backend.app_logger import (
+    BoundedQueueHandler,
+    ConsoleFormatter,
+    DailyFileHandler,
+    DETAILED_INFO,
+    get_dropped_log_count,
+    stop_log_queue,
+)
+from backend.utils.strings.config_strs import CONFIG_ENVS
+
+pytestmark = pytest.mark.unit
+
+
+def _record(message: str = "hello", **extra) -> logging.LogRecord:
+    record = logging.LogRecord("u4i", logging.INFO, __file__, 1, message, None, None)
+    record.__dict__.update(extra)
+    return record
+
+
+@pytest.fixture
+def queued_logging_app():
+    app = Flask(__name__)
+    app.config["TESTING"] = True
+    app.config[CONFIG_ENVS.LOG_QUEUE_ENABLED] = True
+    app.config[CONFIG_ENVS.LOG_QUEUE_MAX_SIZE] = 100
+    original_handlers = list(app.logger.handlers)
+    app_logger.init_app(app)
+
+    @app.route("/ping")
+    def _ping():
+        return "pong"
+
+    yield app
+
+    stop_log_queue(app)
+    app.logger.handlers = original_handlers
+
+
+def test_console_formatter_selects_format_per_record():
+    """
+    GIVEN a ConsoleFormatter with distinct regular and detailed formats
+    WHEN a plain record and a record flagged with DETAILED_INFO are formatted
+    THEN each gets its own format, without mutating any handler.
+    """
+    console_formatter = ConsoleFormatter(
+        logging.Formatter("regular: %(message)s"),
+        logging.Formatter("detailed: %(message)s"),
+    )
+
+    assert console_formatter.format(_record()) == "regular: hello"
+    assert (
+        console_formatter.format(_record(**{DETAILED_INFO: True})) == "detailed: hello"
+    )
+
+
+def test_bounded_queue_handler_counts_dropped_records():
+    """
+    GIVEN a BoundedQueueHandler over a queue that holds one record
+    WHEN three records are emitted with nothing draining the queue
+    THEN the first is queued with its message resolved, and the other two are
+        dropped and counted instead of blocking or raising.
+    """
+    log_queue: queue.Queue = queue.Queue(maxsize=1)
+    queue_handler = BoundedQueueHandler(log_queue)
+
+    for index in range(3):
+        queue_handler.handle(
+            logging.LogRecord(
+                "u4i", logging.INFO, __file__, 1, "record %d", (index,), None
+            )
+        )
+
+    queued_record = log_queue.get_nowait()
+    assert queued_record.msg == "record 0"
+    assert queued_record.args is None
+    assert queue_handler.dropped_count == 2
+
+
+def test_queued_logging_writes_detailed_request_log(queued_logging_app: Flask):
+    """
+    GIVEN an app with LOG_QUEUE_ENABLED
+    WHEN a request is served with an X-Request-ID header
+    THEN the console handler sits behind the listener, not on app.logger, and once the listener drains
+        the queue the console shows the request line in the detailed format
+        and the response line in the regular format, both with the request ID.
+    """
+    request_id = "abcdef123456"
+    listener = getattr(queued_logging_app, "_log_queue_listener")
+    (console_handler,) = listener.handlers
+    console_output = io.StringIO()
+    console_handler.setStream(console_output)
+
+    response = queued_logging_app.test_client().get(
+        "/ping", headers={CONFIG_ENVS.X_REQUEST_ID: request_id}
+    )
+    stop_log_queue(queued_logging_app)
+
+    assert response.status_code == 200
+    assert console_handler.name == CONFIG_ENVS.U4I_LOGGER
+    assert console_handler not in queued_logging_app.logger.handlers
+    assert get_dropped_log_count(queued_logging_app) == 0
+
+    request_line, response_line = console_output.getvalue().strip().splitlines()
+    assert f"[{request_id}] [127.0.0.1]" in request_line
+    assert "Request:" in request_line
+    assert f"[{request_id}] _ping: Response:" in response_line
+
+
+def test_daily_file_handler_reuses_stream_until_midnight(tmp_path):
+    """
+    GIVEN a DailyFileHandler writing today's log file
+    WHEN a record from today and then one from after midnight are emitted
+    THEN the first reuses the open stream, and the second rolls over to the
+        next day's file.
+    """
+    file_handler = DailyFileHandler(str(tmp_path))
+    file_handler.setFormatter(logging.Formatter("%(message)s"))
+    today_path = file_handler.baseFilename
+    original_stream = file_handler.stream
+
+    file_handler.emit(_record("today"))
+    assert file_handler.stream is original_stream
+
+    tomorrow = date.today() + timedelta(days=1)
+    file_handler.emit(_record("tomorrow", created=file_handler._rollover_at + 1))
+    file_handler.close()
+
+    assert file_handler.baseFilename == os.path.join(
+        str(tmp_path), f"{tomorrow.strftime('%Y-%m-%d')}_daily.log"
+    )
+    with open(today_path) as today_file:
+        assert today_file.read() == "today\n"
+    with open(file_handler.baseFilename) as tomorrow_file:
+        assert tomorrow_file.read() == "tomorrow\n"
@@ -1,7 +1,11 @@
 from __future__ import annotations
 
 import gzip
+import hashlib
+import io
+import json
 import os
+import sys
 from unittest import mock
 
 import pytest
@@ -11,8 +15,11 @@ from scripts.backup_maintenance import (
     DEFAULT_MIN_DUMP_BYTES,
     EXIT_FAILURE,
     EXIT_OK,
+    MANIFEST_SUFFIX,
+    compress_stream,
     main,
     prune_logs,
+    run_dump,
     scan_log_entries,
     select_files_to_prune,
     verify_dump,
@@ -21,6 +28,17 @@ from scripts.backup_maintenance import (
 pytestmark = pytest.mark.unit
 
 
+def _fake_pg_dump(*, payload_bytes: int, exit_code: int = 0) -> list[str]:
+    """A stand-in ``pg_dump`` command writing ``payload_bytes`` of SQL to stdout."""
+    return [
+        sys.executable,
+        "-c",
+        "import sys; "
+        f"sys.stdout.buffer.write(b'-- sql\\n' * {payload_bytes // 7}); "
+        f"sys.exit({exit_code})",
+    ]
+
+
 def test_verify_dump_valid_gzip_at_or_above_min_returns_ok(tmp_path):
     """
     GIVEN a valid gzip whose decompressed size (2048 bytes) is >= the minimum
@@ -163,6 +181,94 @@ def test_verify_dump_missing_path_returns_missing(tmp_path):
     assert "missing" in message
 
 
+def test_compress_stream_writes_ordered_gzip_members_and_hashes_them():
+    """
+    GIVEN a payload spanning several compression chunks
+    WHEN compress_stream gzips it on several workers
+    THEN the output decompresses back to the payload, and the digest reports
+        the payload size, the output size, and the output's SHA-256.
+    """
+    payload = b"".join(
+        f"INSERT INTO t VALUES ({row_index});\n".encode() for row_index in range(5_000)
+    )
+    archive = io.BytesIO()
+
+    digest = compress_stream(
+        source=io.BytesIO(payload), destination=archive, workers=3, chunk_bytes=4096
+    )
+
+    assert gzip.decompress(archive.getvalue()) == payload
+    assert digest.dump_bytes == len(payload)
+    assert digest.archive_bytes == len(archive.getvalue())
+    assert digest.archive_sha256 == hashlib.sha256(archive.getvalue()).hexdigest()
+
+
+def test_run_dump_streams_archive_and_writes_manifest(tmp_path):
+    """
+    GIVEN a dump command producing 7000 bytes of SQL
+    WHEN run_dump streams it into an archive
+    THEN it returns EXIT_OK, the archive passes verify_dump, no partial file
+        is left, and the manifest records the archive's size and SHA-256.
+    """
+    archive_path = tmp_path / "u4i_daily.sql.gz"
+
+    exit_code, message = run_dump(
+        pg_dump_command=_fake_pg_dump(payload_bytes=7000),
+        output_path=str(archive_path),
+        min_size_bytes=1024,
+        workers=2,
+    )
+
+    assert exit_code == EXIT_OK, message
+    assert "7000b" in message
+    assert verify_dump(path=str(archive_path), min_size_bytes=1024)[0] == EXIT_OK
+    assert sorted(path.name for path in tmp_path.iterdir()) == [
+        "u4i_daily.sql.gz",
+        "u4i_daily.sql.gz" + MANIFEST_SUFFIX,
+    ]
+    manifest = json.loads(
+        (tmp_path / ("u4i_daily.sql.gz" + MANIFEST_SUFFIX)).read_text()
+    )
+    assert manifest["dump_bytes"] == 7000
+    assert manifest["archive_bytes"] == archive_path.stat().st_size
+    assert (
+        manifest["archive_sha256"]
+        == hashlib.sha256(archive_path.read_bytes()).hexdigest()
+    )
+
+
+@pytest.mark.parametrize(
+    "payload_bytes,dump_exit_code,expected_fragment",
+    [
+        (7000, 1, "pg_dump exited 1"),
+        (70, 0, "too small"),
+    ],
+)
+def test_run_dump_failure_leaves_no_archive(
+    tmp_path, payload_bytes, dump_exit_code, expected_fragment
+):
+    """
+    GIVEN a dump command that fails, or one whose dump is below the minimum
+    WHEN run_dump streams it
+    THEN it returns EXIT_FAILURE naming the cause, and leaves neither an
+        archive, a manifest, nor a partial file behind.
+    """
+    archive_path = tmp_path / "u4i_daily.sql.gz"
+
+    exit_code, message = run_dump(
+        pg_dump_command=_fake_pg_dump(
+            payload_bytes=payload_bytes, exit_code=dump_exit_code
+        ),
+        output_path=str(archive_path),
+        min_size_bytes=1024,
+        workers=2,
+    )
+
+    assert exit_code == EXIT_FAILURE
+    assert expected_fragment in message
+    assert list(tmp_path.iterdir()) == []
+
+
 def test_select_files_to_prune_below_cap_returns_empty():
     """
     GIVEN fewer entries than max_files
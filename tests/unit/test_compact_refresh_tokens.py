@@ -0,0 +1,34 @@
+from __future__ import annotations
+
+from unittest import mock
+
+import pytest
+
+from scripts.compact_refresh_tokens import CompactionResult, run_compaction
+
+pytestmark = pytest.mark.unit
+
+
+def test_run_compaction_stops_after_a_short_batch():
+    """
+    GIVEN a connection whose first delete batch removes two full families and
+        whose second removes one
+    WHEN run_compaction is called with a batch size of two
+    THEN it commits each batch, stops after the short one, and counts
+        families and rows separately.
+    """
+    pg_conn = mock.MagicMock()
+    cursor = pg_conn.cursor.return_value.__enter__.return_value
+    cursor.fetchall.side_effect = [
+        [("family-a",), ("family-a",), ("family-b",)],
+        [("family-c",)],
+        [],
+    ]
+
+    compaction_result = run_compaction(pg_conn=pg_conn, grace_days=7, batch_size=2)
+
+    assert compaction_result == CompactionResult(families=3, rows=4)
+    assert cursor.execute.call_count == 2
+    assert pg_conn.commit.call_count == 2
+    _, sql_params = cursor.execute.call_args.args
+    assert sql_params == {"grace_days": 7, "batch_size": 2}
@@ -0,0 +1,97 @@
+from __future__ import annotations
+
+import time
+
+from flask import Flask
+import pytest
+
+from backend.extensions.audit.deferred import DeferredAuditWriter
+
+pytestmark = pytest.mark.unit
+
+
+class _RecordingInserts:
+    """Stands in for the multi-row INSERT; rejects batches holding ``bad_action``."""
+
+    def __init__(self, bad_action: str | None = None) -> None:
+        self.bad_action = bad_action
+        self.batches: list[list[dict]] = []
+
+    def __call__(self, audit_rows: list[dict]) -> None:
+        if any(audit_row["action"] == self.bad_action for audit_row in audit_rows):
+            raise RuntimeError("insert or update violates foreign key constraint")
+        self.batches.append(audit_rows)
+
+
+def test_buffered_views_are_inserted_in_batches_and_a_bad_entry_is_dropped():
+    """
+    GIVEN a deferred audit writer with a batch size of 2 and three buffered
+        views, one of which the database rejects
+    WHEN the buffer is flushed
+    THEN the good entries are written, each stamped with its view time and
+        keyed by AuditLogs column, and only the rejected entry is dropped.
+    """
+    inserts = _RecordingInserts(bad_action="admin.gone.view")
+    writer = DeferredAuditWriter(
+        Flask(__name__), insert_rows=inserts, batch_size=2, flush_interval_seconds=60
+    )
+    try:
+        for action in ("admin.portal.view", "admin.gone.view", "admin.health.view"):
+            assert writer.enqueue(actor_id=1, action=action)
+
+        written_count = writer.flush()
+    finally:
+        writer.shutdown()
+
+    assert written_count == 2
+    assert [
+        [audit_row["action"] for audit_row in batch] for batch in inserts.batches
+    ] == [["admin.portal.view"], ["admin.health.view"]]
+    written_row = inserts.batches[0][0]
+    assert written_row["actorId"] == 1 and written_row["createdAt"] is not None
+
+
+def test_full_batch_wakes_the_flusher_and_a_full_buffer_refuses_entries():
+    """
+    GIVEN one deferred audit writer flushing in batches of 3, and another
+        holding at most 3 entries that never fills a batch
+    WHEN three views fill the first writer's batch, and four views reach the
+        second writer
+    THEN the first writer's flusher writes the batch without waiting for its
+        interval, and the second refuses the entry past its buffer limit (so
+        the view records it synchronously) and flushes the rest on shutdown.
+    """
+    batch_inserts = _RecordingInserts()
+    batching_writer = DeferredAuditWriter(
+        Flask(__name__),
+        insert_rows=batch_inserts,
+        batch_size=3,
+        flush_interval_seconds=60,
+    )
+    bounded_inserts = _RecordingInserts()
+    bounded_writer = DeferredAuditWriter(
+        Flask(__name__),
+        insert_rows=bounded_inserts,
+        batch_size=10,
+        max_buffered=3,
+        flush_interval_seconds=60,
+    )
+    try:
+        for _ in range(3):
+            assert batching_writer.enqueue(actor_id=1, action="admin.user.search")
+        deadline = time.time() + 5
+        while not batch_inserts.batches and time.time() < deadline:
+            time.sleep(0.01)
+
+        enqueued = [
+            bounded_writer.enqueue(actor_id=1, action="admin.user.view")
+            for _ in range(4)
+        ]
+        assert bounded_inserts.batches == []
+    finally:
+        batching_writer.shutdown()
+        bounded_writer.shutdown()
+
+    assert [len(batch) for batch in batch_inserts.batches] == [3]
+    assert enqueued == [True, True, True, False]
+    assert [len(batch) for batch in bounded_inserts.batches] == [3]
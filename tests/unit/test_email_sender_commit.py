@@ -0,0 +1,68 @@
+from __future__ import annotations
+
+from unittest import mock
+
+import pytest
+
+from backend.extensions.email_sender import email_sender as email_sender_module
+from backend.extensions.email_sender.email_sender import EmailSender
+from backend.utils.strings.email_validation_strs import EMAILS
+
+pytestmark = pytest.mark.unit
+
+_MESSAGE: dict[str, list[dict]] = {EMAILS.MESSAGES: [{EMAILS.SUBJECT: "subject"}]}
+
+
+def _email_sender(*, use_outbox: bool) -> tuple[EmailSender, mock.Mock]:
+    email_sender = EmailSender()
+    email_sender._use_outbox = use_outbox
+    email_sender._mailjet_client = mock.Mock()
+    call_order = mock.Mock()
+    call_order.attach_mock(email_sender._mailjet_client.send.create, "send")
+    return email_sender, call_order
+
+
+def test_commit_session_commits_before_a_synchronous_mailjet_send():
+    """
+    GIVEN an email sender without the outbox
+    WHEN a message is sent with commit_session=True
+    THEN the session commits before Mailjet is called, so the caller's row
+        locks are not held across the request.
+    """
+    email_sender, call_order = _email_sender(use_outbox=False)
+    with mock.patch.object(email_sender_module, "db") as mock_db:
+        call_order.attach_mock(mock_db.session.commit, "commit")
+        email_sender._send_or_fail(_MESSAGE, commit_session=True)
+
+    assert [name for name, *_ in call_order.mock_calls] == ["commit", "send"]
+
+
+def test_commit_session_commits_after_the_outbox_insert():
+    """
+    GIVEN an email sender with the outbox enabled
+    WHEN a message is sent with commit_session=True
+    THEN the outbox row is added first and then committed, in the same
+        transaction as the caller's pending changes, and Mailjet is not called.
+    """
+    email_sender, call_order = _email_sender(use_outbox=True)
+    with mock.patch.object(email_sender_module, "db") as mock_db:
+        call_order.attach_mock(mock_db.session.add, "add")
+        call_order.attach_mock(mock_db.session.commit, "commit")
+        response = email_sender._send_or_fail(_MESSAGE, commit_session=True)
+
+    assert response.status_code == 200
+    assert [name for name, *_ in call_order.mock_calls] == ["add", "commit"]
+
+
+def test_send_without_commit_session_leaves_the_commit_to_the_caller():
+    """
+    GIVEN an email sender with and without the outbox
+    WHEN a message is sent without commit_session
+    THEN the session is never committed.
+    """
+    for use_outbox in (False, True):
+        email_sender, _ = _email_sender(use_outbox=use_outbox)
+        with mock.patch.object(email_sender_module, "db") as mock_db:
+            email_sender._send_or_fail(_MESSAGE)
+
+        mock_db.session.commit.assert_not_called()
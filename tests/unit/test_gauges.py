@@ -18,10 +18,16 @@ import pytest
 from backend.metrics import gauges
 from backend.metrics.gauges import (
     GAUGE_REGISTRY,
+    INCREMENTAL_GAUGE_NAMES,
     GaugeDefinition,
     GaugeKind,
     GaugeName,
+    build_compiled_gauge_queries,
+    build_counter_seed_sql,
+    build_counter_trigger_ddl,
+    build_distinct_refs_rebuild_sql,
     build_gauge_sql,
+    counter_function_name,
     value_column_for,
 )
 
@@ -207,3 +213,138 @@ def test_value_column_for() -> None:
     assert value_column_for(GaugeKind.VOLUME) == "valueInt"
     assert value_column_for(GaugeKind.DISTRIBUTION_MAX) == "valueInt"
     assert value_column_for(GaugeKind.EVENT_DERIVED_MAX) == "valueInt"
+
+
+def test_compiled_gauge_queries_cover_every_gauge_exactly_once() -> None:
+    compiled_gauge_names = [
+        gauge_name
+        for compiled_query in build_compiled_gauge_queries()
+        for gauge_name in compiled_query.gauge_names
+    ]
+    assert sorted(compiled_gauge_names) == sorted(GaugeName)
+
+
+def test_compiled_gauge_queries_one_statement_per_table() -> None:
+    compiled_queries = build_compiled_gauge_queries()
+    tables = [compiled_query.table for compiled_query in compiled_queries]
+    assert len(tables) == len(set(tables))
+    assert set(tables) == {definition.table for definition in GAUGE_REGISTRY.values()}
+    for compiled_query in compiled_queries:
+        for gauge_name in compiled_query.gauge_names:
+            assert GAUGE_REGISTRY[gauge_name].table == compiled_query.table
+
+
+def test_compiled_gauge_query_single_gauge_table_reuses_build_gauge_sql() -> None:
+    users_query = next(
+        compiled_query
+        for compiled_query in build_compiled_gauge_queries()
+        if compiled_query.table == "Users"
+    )
+    assert users_query.gauge_names == (GaugeName.TOTAL_USERS,)
+    assert users_query.sql == build_gauge_sql(GaugeName.TOTAL_USERS)
+
+
+def test_compiled_gauge_query_scans_table_once_and_shares_groups() -> None:
+    members_query = next(
+        compiled_query
+        for compiled_query in build_compiled_gauge_queries()
+        if compiled_query.table == "UtubMembers"
+    )
+    assert members_query.sql.count('FROM "UtubMembers"') == 1
+    assert "MATERIALIZED" in members_query.sql
+    # MAX_MEMBERS_PER_UTUB and AVG_MEMBERS_PER_UTUB share one grouped CTE;
+    # MAX_UTUBS_PER_USER groups a different column, so two CTEs total.
+    assert members_query.sql.count("GROUP BY") == 2
+    assert f") < {gauges.MIN_GAUGE_POPULATION} THEN NULL" in members_query.sql
+    assert 'COUNT("utubID")' in members_query.sql
+    assert 'COUNT("userID")' in members_query.sql
+
+
+def test_incremental_gauges_are_exactly_the_volume_gauges() -> None:
+    assert set(INCREMENTAL_GAUGE_NAMES) == {
+        gauge_name
+        for gauge_name, definition in GAUGE_REGISTRY.items()
+        if definition.kind is GaugeKind.VOLUME
+    }
+
+
+def test_compiled_gauge_queries_restricted_to_subset() -> None:
+    remaining = [
+        gauge_name
+        for gauge_name in GaugeName
+        if gauge_name not in INCREMENTAL_GAUGE_NAMES
+    ]
+    compiled_queries = build_compiled_gauge_queries(remaining)
+    compiled_gauge_names = [
+        gauge_name
+        for compiled_query in compiled_queries
+        for gauge_name in compiled_query.gauge_names
+    ]
+    assert sorted(compiled_gauge_names) == sorted(remaining)
+    assert "Users" not in {compiled_query.table for compiled_query in compiled_queries}
+
+
+def test_counter_trigger_ddl_covers_every_incremental_gauge() -> None:
+    ddl = build_counter_trigger_ddl()
+    for gauge_name in INCREMENTAL_GAUGE_NAMES:
+        definition = GAUGE_REGISTRY[gauge_name]
+        function_name = counter_function_name(gauge_name)
+        assert any(
+            statement.startswith(f'CREATE OR REPLACE FUNCTION "{function_name}"()')
+            for statement in ddl
+        )
+        expected_events = {"INSERT", "DELETE", "TRUNCATE"}
+        if definition.distinct_column is not None:
+            expected_events.add("UPDATE")
+        trigger_events = {
+            statement.split()[6]
+            for statement in ddl
+            if statement.startswith(f'CREATE OR REPLACE TRIGGER "{function_name}_')
+        }
+        assert trigger_events == expected_events
+        for statement in ddl:
+            if f'EXECUTE FUNCTION "{function_name}"()' in statement:
+                assert f'ON "{definition.table}"' in statement
+                assert "FOR EACH STATEMENT" in statement
+
+
+def test_counter_triggers_append_deltas_instead_of_updating_counters() -> None:
+    """
+    GIVEN the generated counter-trigger functions
+    WHEN their INSERT / DELETE / UPDATE branches are inspected
+    THEN each appends a GaugeCounterDeltas row, and GaugeCounters is only
+        updated in the TRUNCATE reset, never locked on the hot write path.
+    """
+    for gauge_name in INCREMENTAL_GAUGE_NAMES:
+        function_sql = next(
+            statement
+            for statement in build_counter_trigger_ddl()
+            if statement.startswith(
+                f'CREATE OR REPLACE FUNCTION "{counter_function_name(gauge_name)}"'
+            )
+        )
+        assert 'INSERT INTO "GaugeCounterDeltas"' in function_sql
+        assert "FOR UPDATE" not in function_sql
+        assert function_sql.count('UPDATE "GaugeCounters"') == 1
+        if GAUGE_REGISTRY[gauge_name].distinct_column is None:
+            assert function_sql.index('UPDATE "GaugeCounters"') > function_sql.index(
+                "ELSE"
+            )
+        else:
+            assert function_sql.index('UPDATE "GaugeCounters"') < function_sql.index(
+                "RETURN NULL"
+            )
+            assert "EXCEPT ALL" in function_sql
+
+
+def test_counter_seed_and_refs_rebuild_sql() -> None:
+    assert build_counter_seed_sql(GaugeName.TOTAL_USERS) == (
+        'INSERT INTO "GaugeCounters" ("gaugeName", "value", "updatedAt") '
+        "SELECT 'total_users', (SELECT COUNT(*) FROM \"Users\"), now() "
+        'ON CONFLICT ("gaugeName") DO NOTHING'
+    )
+    assert build_distinct_refs_rebuild_sql(GaugeName.TOTAL_TAGS) == (
+        'INSERT INTO "GaugeDistinctRefs" ("gaugeName", "distinctValue", "refs") '
+        'SELECT \'total_tags\', "tagString"::text, COUNT(*) FROM "UtubTags" '
+        'WHERE "tagString" IS NOT NULL GROUP BY "tagString"'
+    )
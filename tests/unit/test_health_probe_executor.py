@@ -0,0 +1,197 @@
+from __future__ import annotations
+
+import threading
+from unittest import mock
+
+from flask import Flask, current_app
+import pytest
+
+from backend.admin import health_service
+from backend.admin.health_service import (
+    _HealthProbe,
+    _run_probes,
+    _SnapshotCache,
+)
+from backend.utils.strings.config_strs import CONFIG_ENVS
+
+pytestmark = pytest.mark.unit
+
+
+def _build_app(*, concurrent: bool) -> Flask:
+    app = Flask(__name__)
+    app.config[CONFIG_ENVS.HEALTH_PROBES_CONCURRENT] = concurrent
+    return app
+
+
+def test_run_probes_serially_calls_each_probe_on_the_calling_thread():
+    """
+    GIVEN HEALTH_PROBES_CONCURRENT disabled
+    WHEN _run_probes runs two probes
+    THEN both run on the calling thread and their results are keyed by name.
+    """
+    app = _build_app(concurrent=False)
+    caller_thread = threading.get_ident()
+    with app.app_context():
+        results = _run_probes(
+            {
+                "first": _HealthProbe(run=threading.get_ident, fallback=None),
+                "second": _HealthProbe(run=lambda: "ok", fallback=None),
+            }
+        )
+    assert results == {"first": caller_thread, "second": "ok"}
+
+
+def test_run_probes_concurrently_runs_probes_side_by_side_in_app_context():
+    """
+    GIVEN HEALTH_PROBES_CONCURRENT enabled and two probes that each wait for
+        the other to start
+    WHEN _run_probes runs them
+    THEN both complete (so they ran at the same time), each inside an app
+        context for the calling app.
+    """
+    app = _build_app(concurrent=True)
+    both_started = threading.Barrier(2, timeout=2)
+
+    def _probe() -> str:
+        both_started.wait()
+        return current_app.name
+
+    with app.app_context():
+        results = _run_probes(
+            {
+                "first": _HealthProbe(run=_probe, fallback=None),
+                "second": _HealthProbe(run=_probe, fallback=None),
+            }
+        )
+    assert results == {"first": app.name, "second": app.name}
+
+
+def test_run_probes_reports_fallback_for_a_probe_past_its_deadline():
+    """
+    GIVEN HEALTH_PROBES_CONCURRENT enabled and one probe that blocks past its
+        deadline next to one that returns immediately
+    WHEN _run_probes runs them
+    THEN the slow probe reports its fallback, the fast probe its result, and
+        the timeout is logged.
+    """
+    app = _build_app(concurrent=True)
+    release_slow_probe = threading.Event()
+    try:
+        with app.app_context(), mock.patch.object(
+            health_service, "warning_log"
+        ) as mock_warning_log:
+            results = _run_probes(
+                {
+                    "slow": _HealthProbe(
+                        run=lambda: release_slow_probe.wait(5),
+                        fallback="fallback",
+                        timeout_seconds=0.05,
+                    ),
+                    "fast": _HealthProbe(run=lambda: "fresh", fallback="fallback"),
+                }
+            )
+    finally:
+        release_slow_probe.set()
+    assert results == {"slow": "fallback", "fast": "fresh"}
+    mock_warning_log.assert_called_once()
+    assert "slow probe timed out" in mock_warning_log.call_args.args[0]
+
+
+def test_run_probes_skips_a_probe_whose_previous_run_is_still_in_flight():
+    """
+    GIVEN HEALTH_PROBES_CONCURRENT enabled and a probe that outlived its
+        deadline in one snapshot and is still running
+    WHEN the next snapshot runs the same probe, and another runs after the
+        first run finished
+    THEN the second snapshot reports the fallback without starting the probe
+        again, and the third starts it as usual.
+    """
+    app = _build_app(concurrent=True)
+    release_hung_probe = threading.Event()
+    rerun_probe = mock.Mock(return_value="fresh")
+    try:
+        with app.app_context(), mock.patch.object(
+            health_service, "warning_log"
+        ) as mock_warning_log:
+            first_results = _run_probes(
+                {
+                    "hung": _HealthProbe(
+                        run=lambda: release_hung_probe.wait(5),
+                        fallback="fallback",
+                        timeout_seconds=0.05,
+                    )
+                }
+            )
+            second_results = _run_probes(
+                {"hung": _HealthProbe(run=rerun_probe, fallback="fallback")}
+            )
+            release_hung_probe.set()
+            health_service._in_flight_probes["hung"].result(timeout=2)
+            third_results = _run_probes(
+                {"hung": _HealthProbe(run=rerun_probe, fallback="fallback")}
+            )
+    finally:
+        release_hung_probe.set()
+    assert first_results == second_results == {"hung": "fallback"}
+    assert third_results == {"hung": "fresh"}
+    rerun_probe.assert_called_once()
+    assert "previous run still in flight" in mock_warning_log.call_args_list[1].args[0]
+
+
+def test_run_probes_sets_a_statement_timeout_for_database_probes():
+    """
+    GIVEN HEALTH_PROBES_CONCURRENT enabled, a database probe with a 1.5s
+        deadline, and a probe that does not use the database
+    WHEN _run_probes runs them
+    THEN only the database probe's session gets a transaction-local
+        statement_timeout of 1500ms, set before the probe runs.
+    """
+    app = _build_app(concurrent=True)
+    with app.app_context(), mock.patch.object(health_service, "db") as mock_db:
+        results = _run_probes(
+            {
+                "database": _HealthProbe(
+                    run=lambda: mock_db.session.execute.call_count,
+                    fallback=None,
+                    timeout_seconds=1.5,
+                    uses_database=True,
+                ),
+                "disk": _HealthProbe(run=lambda: "ok", fallback=None),
+            }
+        )
+    assert results == {"database": 1, "disk": "ok"}
+    statement, params = mock_db.session.execute.call_args.args
+    assert "statement_timeout" in str(statement)
+    assert params == {"timeout": "1500ms"}
+
+
+def test_snapshot_cache_shares_one_computation_until_expiry():
+    """
+    GIVEN an empty snapshot cache
+    WHEN it is read twice within the TTL, then again after clear()
+    THEN the snapshot is computed once for the first two reads and again after
+        the clear.
+    """
+    snapshot_cache = _SnapshotCache()
+    compute = mock.Mock(side_effect=["first", "second"])
+
+    assert snapshot_cache.get_or_compute(ttl_seconds=60, compute=compute) == "first"
+    assert snapshot_cache.get_or_compute(ttl_seconds=60, compute=compute) == "first"
+    assert compute.call_count == 1
+
+    snapshot_cache.clear()
+    assert snapshot_cache.get_or_compute(ttl_seconds=60, compute=compute) == "second"
+    assert compute.call_count == 2
+
+
+def test_snapshot_cache_recomputes_once_the_ttl_has_lapsed():
+    """
+    GIVEN a cached snapshot with a zero-length TTL
+    WHEN it is read again
+    THEN the snapshot is recomputed.
+    """
+    snapshot_cache = _SnapshotCache()
+    compute = mock.Mock(side_effect=["first", "second"])
+
+    snapshot_cache.get_or_compute(ttl_seconds=0, compute=compute)
+    assert snapshot_cache.get_or_compute(ttl_seconds=0, compute=compute) == "second"
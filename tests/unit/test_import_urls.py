@@ -0,0 +1,71 @@
+import pytest
+
+from backend.urls.services.import_urls import (
+    ImportCandidate,
+    _clean_tag_strings,
+    parse_netscape_bookmarks,
+)
+from backend.utils.constants import TAG_CONSTANTS
+
+pytestmark = pytest.mark.unit
+
+_BOOKMARKS_HTML = """<!DOCTYPE NETSCAPE-Bookmark-file-1>
+<META HTTP-EQUIV="Content-Type" CONTENT="text/html; charset=UTF-8">
+<TITLE>Bookmarks</TITLE>
+<H1>Bookmarks Menu</H1>
+<DL><p>
+    <DT><H3 ADD_DATE="1700000000">Reading</H3>
+    <DL><p>
+        <DT><A HREF="https://example.com/a" ADD_DATE="1700000000" TAGS="python,web">Example &amp; Co</A>
+        <DT><A HREF="https://example.com/b">  </A>
+    </DL><p>
+    <DT><A HREF="place:sort=8&maxResults=10">Recent</A>
+    <DT><A>No href</A>
+</DL>
+"""
+
+
+def test_parse_netscape_bookmarks_collects_anchors_in_file_order():
+    """
+    GIVEN a browser-exported bookmarks file with nested folders
+    WHEN it is parsed
+    THEN every anchor with an HREF becomes a candidate, in file order, with
+        entities decoded in the title and the TAGS attribute split on commas.
+    """
+    assert parse_netscape_bookmarks(_BOOKMARKS_HTML) == [
+        ImportCandidate(
+            url_string="https://example.com/a",
+            url_title="Example & Co",
+            tag_strings=["python", "web"],
+        ),
+        ImportCandidate(url_string="https://example.com/b", url_title="  "),
+        ImportCandidate(url_string="place:sort=8&maxResults=10", url_title="Recent"),
+    ]
+
+
+def test_parse_netscape_bookmarks_drops_blank_tags():
+    """
+    GIVEN an anchor whose TAGS attribute has blank entries
+    WHEN it is parsed
+    THEN only the non-blank, stripped tags are kept.
+    """
+    candidates = parse_netscape_bookmarks(
+        '<A HREF="https://example.com" TAGS=" one,, two ,">x</A>'
+    )
+    assert candidates[0].tag_strings == ["one", "two"]
+
+
+def test_clean_tag_strings_dedupes_and_rejects_rule_breaking_tags():
+    """
+    GIVEN tag lists from an import item
+    WHEN they are cleaned
+    THEN duplicates are dropped case-insensitively, and empty, over-long,
+        markup-carrying, or over-limit lists are rejected as a whole.
+    """
+    assert _clean_tag_strings(["Python", "python ", "web"]) == ["Python", "web"]
+    assert _clean_tag_strings([]) == []
+    assert _clean_tag_strings(["   "]) is None
+    assert _clean_tag_strings(["a" * (TAG_CONSTANTS.MAX_TAG_LENGTH + 1)]) is None
+    assert _clean_tag_strings(["<b>bold</b>"]) is None
+    too_many = [f"tag{index}" for index in range(TAG_CONSTANTS.MAX_URL_TAGS + 1)]
+    assert _clean_tag_strings(too_many) is None
@@ -0,0 +1,193 @@
+from __future__ import annotations
+
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+import json
+import threading
+import time
+from typing import Any, Iterator
+
+from cryptography.hazmat.primitives.asymmetric import rsa
+from flask import Flask
+import jwt
+from jwt.algorithms import RSAAlgorithm
+import pytest
+
+from backend.api_v1.services.google_tokens import verify_google_id_token
+from backend.extensions.jwks_cache import GOOGLE_JWKS_CACHE, JwksCache, init_app
+from backend.utils.strings.config_strs import CONFIG_ENVS
+
+pytestmark = pytest.mark.unit
+
+CLIENT_ID = "test-google-client-id"
+
+
+class _StandInJwks:
+    """A local JWKS endpoint; tests swap its keys, status and max-age."""
+
+    def __init__(self) -> None:
+        self.private_keys: dict[str, rsa.RSAPrivateKey] = {}
+        self.status = 200
+        self.max_age = 3600
+        self.requests = 0
+
+    def add_key(self, kid: str) -> None:
+        self.private_keys[kid] = rsa.generate_private_key(
+            public_exponent=65537, key_size=2048
+        )
+
+    def jwks(self) -> dict[str, Any]:
+        return {
+            "keys": [
+                {
+                    **RSAAlgorithm.to_jwk(private_key.public_key(), as_dict=True),
+                    "kid": kid,
+                    "use": "sig",
+                    "alg": "RS256",
+                }
+                for kid, private_key in self.private_keys.items()
+            ]
+        }
+
+    def id_token(self, kid: str) -> str:
+        now = int(time.time())
+        return jwt.encode(
+            {
+                "iss": "https://accounts.google.com",
+                "aud": CLIENT_ID,
+                "sub": "google-subject",
+                "email": "jwks@example.com",
+                "email_verified": True,
+                "iat": now,
+                "exp": now + 300,
+            },
+            self.private_keys[kid],
+            algorithm="RS256",
+            headers={"kid": kid},
+        )
+
+
+class _FakeRedis:
+    def __init__(self) -> None:
+        self.values: dict[str, str] = {}
+
+    def get(self, key: str) -> str | None:
+        return self.values.get(key)
+
+    def set(self, key: str, value: str, ex: int) -> None:
+        self.values[key] = value
+
+
+@pytest.fixture
+def stand_in() -> Iterator[tuple[_StandInJwks, str]]:
+    endpoint = _StandInJwks()
+    endpoint.add_key("key-1")
+
+    class _Handler(BaseHTTPRequestHandler):
+        def do_GET(self) -> None:
+            endpoint.requests += 1
+            body = json.dumps(endpoint.jwks()).encode()
+            self.send_response(endpoint.status)
+            self.send_header("Content-Type", "application/json")
+            self.send_header("Cache-Control", f"public, max-age={endpoint.max_age}")
+            self.end_headers()
+            self.wfile.write(body)
+
+        def log_message(self, *args) -> None:
+            pass
+
+    server = ThreadingHTTPServer(("127.0.0.1", 0), _Handler)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    try:
+        yield endpoint, f"http://127.0.0.1:{server.server_port}/certs"
+    finally:
+        server.shutdown()
+        server.server_close()
+
+
+def test_google_id_token_verifies_against_cached_keys(stand_in):
+    """
+    GIVEN an app whose Google JWKS URL points at a local stand-in
+    WHEN an id_token is verified twice, then one signed with an unknown kid
+    THEN the keys are fetched once, both verifications succeed, and the
+        unknown kid fails without another fetch inside the refetch interval.
+    """
+    endpoint, jwks_url = stand_in
+    app = Flask(__name__)
+    app.config[CONFIG_ENVS.GOOGLE_OAUTH_CLIENT_ID] = CLIENT_ID
+    app.config[CONFIG_ENVS.GOOGLE_OAUTH_JWKS_URL] = jwks_url
+    init_app(app)
+    id_token = endpoint.id_token("key-1")
+    endpoint.add_key("key-unpublished")
+    unknown_kid_token = endpoint.id_token("key-unpublished")
+    del endpoint.private_keys["key-unpublished"]
+
+    try:
+        with app.app_context():
+            assert endpoint.requests == 0
+            first_claims = verify_google_id_token(id_token=id_token)
+            second_claims = verify_google_id_token(id_token=id_token)
+            assert verify_google_id_token(id_token=unknown_kid_token) is None
+    finally:
+        app.extensions[GOOGLE_JWKS_CACHE].shutdown()
+
+    assert first_claims is not None and first_claims.subject == "google-subject"
+    assert second_claims == first_claims
+    assert endpoint.requests == 1
+
+
+def test_expired_keys_are_served_while_refresh_fails_then_replaced(stand_in):
+    """
+    GIVEN keys fetched with max-age=0 and an endpoint that then starts failing
+    WHEN keys are looked up while the background refresher keeps failing, and
+        again after the endpoint recovers with a rotated key
+    THEN the expired keys keep being served, and the rotated key is picked up
+        by the refresher without a lookup waiting on it.
+    """
+    endpoint, jwks_url = stand_in
+    endpoint.max_age = 0
+    cache = JwksCache(
+        jwks_url=jwks_url,
+        refresh_ahead_seconds=0,
+        min_refetch_interval_seconds=0.05,
+        retry_seconds=0.05,
+    )
+    try:
+        assert cache.get_signing_key("key-1").key_id == "key-1"
+        endpoint.status = 500
+        failing_since = endpoint.requests
+        deadline = time.time() + 5
+        while endpoint.requests < failing_since + 2 and time.time() < deadline:
+            time.sleep(0.01)
+        assert endpoint.requests >= failing_since + 2
+        assert cache.get_signing_key("key-1").key_id == "key-1"
+
+        endpoint.add_key("key-2")
+        endpoint.status = 200
+        deadline = time.time() + 5
+        while "key-2" not in cache._key_set.keys_by_id and time.time() < deadline:
+            time.sleep(0.01)
+        assert cache.get_signing_key("key-2").key_id == "key-2"
+    finally:
+        cache.shutdown()
+
+
+def test_workers_share_fetched_keys_through_redis(stand_in):
+    """
+    GIVEN two workers' caches backed by the same Redis
+    WHEN the first worker fetches the keys and the second looks one up
+    THEN the second worker uses the persisted copy and never calls the
+        endpoint itself.
+    """
+    endpoint, jwks_url = stand_in
+    shared_redis = _FakeRedis()
+    first_worker = JwksCache(jwks_url=jwks_url, redis_client=shared_redis)
+    second_worker = JwksCache(jwks_url=jwks_url, redis_client=shared_redis)
+    try:
+        first_worker.get_signing_key("key-1")
+        assert endpoint.requests == 1
+
+        assert second_worker.get_signing_key("key-1").key_id == "key-1"
+        assert endpoint.requests == 1
+    finally:
+        first_worker.shutdown()
+        second_worker.shutdown()
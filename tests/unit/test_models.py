@@ -1,8 +1,10 @@
+import hashlib
+
 import pytest
 
 from backend.extensions.url_validation.url_validator import UrlValidator
 from backend.models.utub_tags import Utub_Tags
-from backend.models.urls import Urls
+from backend.models.urls import digest_url_string, Urls
 from backend.models.users import User_Role, Users
 from backend.models.utubs import Utubs
 
@@ -106,6 +108,22 @@ def test_url_model(app):
             new_url["url_string"]
         )
         assert new_url_object.created_by == new_url["creator"]
+        assert new_url_object.url_digest == digest_url_string(new_url_object.url_string)
+
+
+def test_digest_url_string_is_utf8_sha256():
+    """
+    GIVEN a URL string containing non-ASCII characters
+    WHEN digest_url_string hashes it
+    THEN it returns the 32-byte SHA-256 of the UTF-8 encoding, matching the
+        migration's sha256(convert_to("urlString", 'UTF8')) backfill.
+    """
+    url_string = "https://example.com/caf\u00e9"
+    digest = digest_url_string(url_string)
+
+    assert len(digest) == 32
+    assert digest == hashlib.sha256(url_string.encode("utf-8")).digest()
+    assert digest != digest_url_string(url_string + "/")
 
 
 def test_tag_model(app):
@@ -0,0 +1,115 @@
+from __future__ import annotations
+
+import threading
+from unittest import mock
+
+import pytest
+
+from backend.extensions.notifications import notifications
+from backend.extensions.notifications.notifications import (
+    NotificationDispatcher,
+    NotificationDispatchStats,
+    NotificationType,
+)
+
+pytestmark = pytest.mark.unit
+
+URL = "https://webhook.example.com"
+
+
+def _blocking_send_msg() -> tuple[mock.MagicMock, threading.Event, threading.Event]:
+    """A `_send_msg` stand-in that holds the first call until released."""
+    first_call_started = threading.Event()
+    release = threading.Event()
+
+    def _send(*args, **kwargs):
+        first_call_started.set()
+        release.wait(timeout=5)
+        return mock.Mock(status_code=204)
+
+    return mock.MagicMock(side_effect=_send), first_call_started, release
+
+
+def _submit(dispatcher: NotificationDispatcher, msg: str, dedupe: bool = True) -> bool:
+    return dispatcher.submit(
+        URL, msg, "req-id", NotificationType.THREADED_NOTIFICATIONS, dedupe=dedupe
+    )
+
+
+def test_inline_dispatcher_suppresses_repeats_within_window():
+    """
+    GIVEN a dispatcher delivering on the calling thread with a 60s dedupe window
+    WHEN the same notification is submitted twice and a different one once
+    THEN only two requests are made, reusing one session, and the repeat is
+        counted as suppressed.
+    """
+    dispatcher = NotificationDispatcher(workers=0, dedupe_seconds=60)
+
+    with mock.patch.object(
+        notifications, "_send_msg", return_value=mock.Mock(status_code=204)
+    ) as send_msg:
+        assert _submit(dispatcher, "same")
+        assert _submit(dispatcher, "same")
+        assert _submit(dispatcher, "other")
+
+    assert [call.args[1] for call in send_msg.call_args_list] == ["same", "other"]
+    first_session, second_session = (call.args[5] for call in send_msg.call_args_list)
+    assert first_session is second_session
+    assert dispatcher.stats() == NotificationDispatchStats(
+        queue_depth=0, sent=2, failed=0, coalesced=0, suppressed=1, dropped=0
+    )
+
+
+def test_worker_coalesces_duplicates_waiting_in_queue():
+    """
+    GIVEN a single-worker dispatcher busy with one notification
+    WHEN the same new notification is submitted three times while it waits
+    THEN it is sent once, noting the two coalesced duplicates.
+    """
+    send_msg, first_call_started, release = _blocking_send_msg()
+    dispatcher = NotificationDispatcher(workers=1, dedupe_seconds=60)
+
+    with mock.patch.object(notifications, "_send_msg", send_msg):
+        _submit(dispatcher, "blocker")
+        assert first_call_started.wait(timeout=5)
+        for _ in range(3):
+            assert _submit(dispatcher, "burst")
+        assert dispatcher.stats().queue_depth == 1
+
+        release.set()
+        dispatcher.shutdown()
+
+    sent_msgs = [call.args[1] for call in send_msg.call_args_list]
+    assert sent_msgs[0] == "blocker"
+    assert sent_msgs[1].startswith("burst")
+    assert "+2 identical notification(s) coalesced" in sent_msgs[1]
+    assert dispatcher.stats() == NotificationDispatchStats(
+        queue_depth=0, sent=2, failed=0, coalesced=2, suppressed=0, dropped=0
+    )
+
+
+def test_full_queue_drops_and_counts_new_notifications():
+    """
+    GIVEN a single-worker dispatcher with room for one queued notification
+    WHEN the worker is busy and two distinct notifications are submitted
+    THEN the first is queued, the second is rejected, and the queue depth and
+        drop count are reported.
+    """
+    send_msg, first_call_started, release = _blocking_send_msg()
+    dispatcher = NotificationDispatcher(workers=1, max_queue_size=1)
+
+    with mock.patch.object(notifications, "_send_msg", send_msg):
+        _submit(dispatcher, "blocker")
+        assert first_call_started.wait(timeout=5)
+        assert _submit(dispatcher, "queued", dedupe=False)
+        assert not _submit(dispatcher, "dropped", dedupe=False)
+
+        busy_stats = dispatcher.stats()
+        release.set()
+        dispatcher.shutdown()
+
+    assert (busy_stats.queue_depth, busy_stats.dropped) == (1, 1)
+    assert [call.args[1] for call in send_msg.call_args_list] == [
+        "blocker",
+        "queued",
+    ]
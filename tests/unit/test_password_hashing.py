@@ -0,0 +1,107 @@
+from __future__ import annotations
+
+from flask import Flask
+import pytest
+from werkzeug.security import generate_password_hash
+
+from backend.extensions.password_hashing import (
+    PasswordHasher,
+    PasswordHashingBusyError,
+    handle_503_password_hashing_busy,
+    init_app,
+)
+from backend.models.users import Users
+from backend.utils.strings.config_strs import CONFIG_ENVS
+
+pytestmark = pytest.mark.unit
+
+FAST_METHOD = "pbkdf2:sha256:1000"
+
+
+def test_hasher_flags_hashes_from_other_methods_for_rehash():
+    """
+    GIVEN a hasher configured for a tuned PBKDF2 cost
+    WHEN it hashes a password and is shown a scrypt hash of the same password
+    THEN both verify, and only the scrypt hash needs rehashing.
+    """
+    hasher = PasswordHasher(method=FAST_METHOD)
+    own_hash = hasher.hash_password("hunter22")
+    scrypt_hash = generate_password_hash("hunter22", "scrypt")
+
+    assert own_hash.startswith(f"{FAST_METHOD}$")
+    assert hasher.verify_password(own_hash, "hunter22")
+    assert hasher.verify_password(scrypt_hash, "hunter22")
+    assert not hasher.verify_password(own_hash, "hunter23")
+    assert not hasher.needs_rehash(own_hash)
+    assert hasher.needs_rehash(scrypt_hash)
+
+
+def test_hasher_process_pool_round_trip():
+    """
+    GIVEN a hasher backed by a one-process pool
+    WHEN a password is hashed and then verified
+    THEN the KDF work runs in the pool and gives the same answers as inline.
+    """
+    hasher = PasswordHasher(method=FAST_METHOD, workers=1)
+    try:
+        password_hash = hasher.hash_password("hunter22")
+        assert hasher.verify_password(password_hash, "hunter22")
+        assert not hasher.verify_password(password_hash, "wrong")
+    finally:
+        hasher.shutdown()
+
+
+def test_hasher_raises_busy_when_no_slot_frees_up():
+    """
+    GIVEN a hasher allowing one concurrent KDF call, with that slot taken
+    WHEN another call waits longer than the queue timeout
+    THEN PasswordHashingBusyError is raised and the app answers with a 503.
+    """
+    app = Flask(__name__)
+    app.register_error_handler(
+        PasswordHashingBusyError, handle_503_password_hashing_busy
+    )
+    hasher = PasswordHasher(
+        method=FAST_METHOD, max_concurrency=1, queue_timeout_seconds=0.01
+    )
+
+    @app.route("/login")
+    def _login():
+        hasher.verify_dummy_password("hunter22")
+        return "ok"
+
+    hasher._slots.acquire()
+    try:
+        with pytest.raises(PasswordHashingBusyError):
+            hasher.hash_password("hunter22")
+        response = app.test_client().get("/login")
+    finally:
+        hasher._slots.release()
+
+    assert response.status_code == 503
+    assert response.headers["Retry-After"] == "1"
+
+
+def test_correct_password_rehashes_outdated_hash():
+    """
+    GIVEN an app hashing with a tuned method and a user whose stored hash
+        was made with scrypt
+    WHEN the user's password is checked
+    THEN a wrong password leaves the hash alone, and the right one verifies
+        and replaces the hash with one made with the tuned method.
+    """
+    app = Flask(__name__)
+    app.config[CONFIG_ENVS.PASSWORD_HASH_METHOD] = FAST_METHOD
+    init_app(app)
+
+    with app.app_context():
+        user = Users(username="rehash", email="rehash@example.com")
+        scrypt_hash = generate_password_hash("hunter22", "scrypt")
+        user.password = scrypt_hash
+
+        assert not user.is_password_correct("wrong")
+        assert user.password == scrypt_hash
+
+        assert user.is_password_correct("hunter22")
+        assert user.password.startswith(f"{FAST_METHOD}$")
+        assert user.is_password_correct("hunter22")
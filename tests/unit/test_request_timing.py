@@ -1,9 +1,20 @@
 from __future__ import annotations
 
+import time
+
 from flask import Flask, g
 import pytest
 
-from backend.extensions.request_timing import init_app, request_elapsed_ms
+from backend.api_common.auth_decorators import _auth_phase
+from backend.extensions.request_timing import (
+    init_app,
+    init_hook_timing,
+    request_elapsed_ms,
+    request_phase,
+    request_phase_durations,
+)
+from backend.extensions.sql_tracing import init_app as init_sql_tracing
+from backend.metrics.latency import LatencyMetricName
 
 pytestmark = pytest.mark.unit
 
@@ -58,3 +69,128 @@ def test_init_app_registers_a_before_request_hook():
 
     registered = app.before_request_funcs.get(None, [])
     assert any(func.__name__ == "_stash_request_start" for func in registered)
+
+
+class _FakeClock:
+    def __init__(self) -> None:
+        self.now = 100.0
+
+    def __call__(self) -> float:
+        return self.now
+
+    def advance_ms(self, duration_ms: float) -> None:
+        self.now += duration_ms / 1000.0
+
+
+@pytest.fixture
+def fake_clock(monkeypatch) -> _FakeClock:
+    clock = _FakeClock()
+    monkeypatch.setattr(time, "perf_counter", clock)
+    return clock
+
+
+def test_request_phases_are_exclusive_and_leave_out_sql(fake_clock):
+    """
+    GIVEN a view that spends time in auth, serializes inside auth, runs SQL
+        inside auth, and does its own work outside any phase
+    WHEN the phase durations are read
+    THEN each phase is charged only its own time: the nested serialize pauses
+        auth, and the SQL and the view's own work are charged to no phase.
+    """
+    app = Flask(__name__)
+    init_app(app)
+    init_sql_tracing(app)
+    init_hook_timing(app)
+
+    with app.test_request_context("/"):
+        app.preprocess_request()
+        with request_phase(LatencyMetricName.AUTH_DURATION):
+            fake_clock.advance_ms(10)
+            with request_phase(LatencyMetricName.SERIALIZE_DURATION):
+                fake_clock.advance_ms(3)
+            fake_clock.advance_ms(5)
+            g.sql_trace.record("SELECT 1", 5.0)
+        fake_clock.advance_ms(40)
+
+        assert request_phase_durations() == {
+            LatencyMetricName.AUTH_DURATION: pytest.approx(10),
+            LatencyMetricName.SERIALIZE_DURATION: pytest.approx(3),
+            LatencyMetricName.HOOKS_DURATION: 0,
+        }
+
+
+def test_auth_phase_charges_chained_checks_but_not_the_view(fake_clock):
+    """
+    GIVEN two chained auth decorators wrapped in _auth_phase, each spending
+        time on its checks, guarding a view that does its own work
+    WHEN the view is called and the phase durations are read
+    THEN the auth phase is the time in both sets of checks only, and the
+        view's own work is charged to no phase.
+    """
+    app = Flask(__name__)
+    init_app(app)
+    init_hook_timing(app)
+
+    def _checking_decorator(check_ms: float):
+        @_auth_phase
+        def checking_decorator(func):
+            def decorated_view(*args, **kwargs):
+                fake_clock.advance_ms(check_ms)
+                return func(*args, **kwargs)
+
+            return decorated_view
+
+        return checking_decorator
+
+    @_checking_decorator(4)
+    @_checking_decorator(6)
+    def view():
+        fake_clock.advance_ms(40)
+        return "ok"
+
+    with app.test_request_context("/"):
+        app.preprocess_request()
+        assert view() == "ok"
+
+        assert request_phase_durations() == {
+            LatencyMetricName.AUTH_DURATION: pytest.approx(10),
+            LatencyMetricName.HOOKS_DURATION: 0,
+        }
+
+
+def test_hooks_phase_spans_before_and_after_request_hooks(fake_clock):
+    """
+    GIVEN an app whose before_request and after_request hooks take time, with
+        hook timing registered last
+    WHEN a request is served and the phases are read at teardown
+    THEN the hooks phase is the time in both sets of hooks, and the view's
+        own work is not charged to it.
+    """
+    app = Flask(__name__)
+    init_app(app)
+    phase_durations: dict[LatencyMetricName, float] = {}
+
+    @app.teardown_request
+    def _read_phases(exception) -> None:
+        phase_durations.update(request_phase_durations())
+
+    @app.before_request
+    def _slow_before_request() -> None:
+        fake_clock.advance_ms(2)
+
+    @app.after_request
+    def _slow_after_request(response):
+        fake_clock.advance_ms(7)
+        return response
+
+    @app.route("/work")
+    def _work():
+        fake_clock.advance_ms(50)
+        return "ok"
+
+    init_hook_timing(app)
+
+    assert app.test_client().get("/work").status_code == 200
+    assert phase_durations == {
+        LatencyMetricName.HOOKS_DURATION: pytest.approx(9),
+    }
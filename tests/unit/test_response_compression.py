@@ -0,0 +1,128 @@
+from __future__ import annotations
+
+import gzip
+import json
+from unittest import mock
+
+from flask import Flask, jsonify, Response
+import pytest
+
+from backend.extensions import response_compression
+from backend.extensions.response_compression import GZIP, init_app
+from backend.utils.strings.config_strs import CONFIG_ENVS
+
+pytestmark = pytest.mark.unit
+
+_ROWS = [
+    {"utubUrlID": index, "urlString": f"https://example.com/{index}"}
+    for index in range(200)
+]
+
+
+@pytest.fixture
+def compression_app() -> Flask:
+    app = Flask(__name__)
+    app.config[CONFIG_ENVS.RESPONSE_COMPRESSION_ENABLED] = True
+    app.config[CONFIG_ENVS.RESPONSE_COMPRESSION_MIN_BYTES] = 512
+    init_app(app)
+
+    @app.route("/large")
+    def _large():
+        return jsonify(urls=_ROWS)
+
+    @app.route("/small")
+    def _small():
+        return jsonify(ok=True)
+
+    @app.route("/binary")
+    def _binary():
+        return Response(b"\0" * 4096, mimetype="application/octet-stream")
+
+    @app.route("/etagged")
+    def _etagged():
+        response = jsonify(urls=_ROWS)
+        response.set_etag("urls-v1")
+        return response
+
+    return app
+
+
+def test_large_json_is_gzipped_when_accepted(compression_app: Flask):
+    """
+    GIVEN compression enabled and a JSON response over the size threshold
+    WHEN the client accepts gzip
+    THEN the body is gzip-encoded, decodes to the original JSON, and the
+        response varies on Accept-Encoding.
+    """
+    with mock.patch.object(
+        response_compression,
+        "available_encodings",
+        return_value={GZIP: response_compression._compress_gzip},
+    ):
+        response = compression_app.test_client().get(
+            "/large", headers={"Accept-Encoding": "gzip, deflate"}
+        )
+
+    assert response.headers["Content-Encoding"] == GZIP
+    assert "Accept-Encoding" in response.headers["Vary"]
+    assert int(response.headers["Content-Length"]) == len(response.data)
+    assert json.loads(gzip.decompress(response.data)) == {"urls": _ROWS}
+
+
+@pytest.mark.parametrize(
+    "path,accept_encoding",
+    [
+        ("/large", None),
+        ("/large", "identity"),
+        ("/small", "gzip"),
+        ("/binary", "gzip"),
+    ],
+)
+def test_response_left_uncompressed(
+    compression_app: Flask, path: str, accept_encoding: str | None
+):
+    """
+    GIVEN compression enabled
+    WHEN the client accepts no supported encoding, or the body is under the
+        threshold, or its content type is not allowlisted
+    THEN the response is sent unencoded.
+    """
+    headers = {"Accept-Encoding": accept_encoding} if accept_encoding else {}
+    response = compression_app.test_client().get(path, headers=headers)
+
+    assert "Content-Encoding" not in response.headers
+
+
+def test_compression_disabled_by_config(compression_app: Flask):
+    """
+    GIVEN RESPONSE_COMPRESSION_ENABLED turned off at runtime
+    WHEN a large JSON response is requested with gzip accepted
+    THEN the response is sent unencoded.
+    """
+    compression_app.config[CONFIG_ENVS.RESPONSE_COMPRESSION_ENABLED] = False
+    response = compression_app.test_client().get(
+        "/large", headers={"Accept-Encoding": "gzip"}
+    )
+
+    assert "Content-Encoding" not in response.headers
+
+
+def test_strong_etag_is_weakened_when_compressed(compression_app: Flask):
+    """
+    GIVEN a large response that carries a strong ETag
+    WHEN it is requested with gzip accepted
+    THEN the body is gzip-encoded and the ETag is weakened, since the encoded
+        bytes differ from the identity body.
+    """
+    with mock.patch.object(
+        response_compression,
+        "available_encodings",
+        return_value={GZIP: response_compression._compress_gzip},
+    ):
+        response = compression_app.test_client().get(
+            "/etagged", headers={"Accept-Encoding": "gzip"}
+        )
+
+    assert response.headers["Content-Encoding"] == GZIP
+    assert response.headers["ETag"] == 'W/"urls-v1"'
+    assert json.loads(gzip.decompress(response.data)) == {"urls": _ROWS}
@@ -0,0 +1,129 @@
+from __future__ import annotations
+
+from unittest import mock
+
+import pytest
+
+from backend.extensions.email_sender import email_sender as email_sender_module
+from backend.extensions.email_sender.email_sender import EmailSender
+from backend.models.email_outbox import Email_Outbox
+from backend.testing.fake_mailjet import FakeMailjet
+from scripts.send_email_outbox import (
+    DELETE_SENT_SQL,
+    MARK_FAILED_SQL,
+    MAX_SEND_ATTEMPTS,
+    SCHEDULE_RETRY_SQL,
+    OutboxRunResult,
+    _send_batch,
+    backoff_seconds,
+)
+
+pytestmark = pytest.mark.unit
+
+
+def _message(to_email: str) -> dict:
+    return {
+        "From": {"Email": "team@urls4irl.app", "Name": "URLS4IRL Team"},
+        "To": [{"Email": to_email, "Name": to_email.split("@")[0]}],
+        "Subject": "URLS4IRL Password Reset",
+        "TextPart": "reset",
+        "HTMLPart": "<p>reset</p>",
+    }
+
+
+def _executed(cursor: mock.MagicMock, sql: str) -> list[tuple]:
+    return [
+        call.args[1] for call in cursor.execute.call_args_list if call.args[0] == sql
+    ]
+
+
+def test_backoff_doubles_then_caps():
+    """
+    GIVEN successive retry numbers
+    WHEN backoff_seconds is computed for each
+    THEN the delay doubles from one minute and stops growing at one hour.
+    """
+    assert [backoff_seconds(attempt) for attempt in range(1, 9)] == [
+        60,
+        120,
+        240,
+        480,
+        960,
+        1920,
+        3600,
+        3600,
+    ]
+
+
+def test_send_batch_deletes_sent_and_fails_rejected_rows():
+    """
+    GIVEN a claimed batch of two outbox rows, one to an address Mailjet rejects
+    WHEN the batch is sent through the Mailjet stand-in
+    THEN both go out in one request tagged with their outbox CustomID, the
+        accepted row is deleted, the rejected row is marked failed with
+        Mailjet's error, and the run goes on.
+    """
+    fake_mailjet = FakeMailjet()
+    fake_mailjet.rejected_addresses.add("bad@example.com")
+    cursor = mock.MagicMock()
+    rows = [(1, _message("good@example.com"), 0), (2, _message("bad@example.com"), 0)]
+
+    batch_result, keep_going = _send_batch(cursor, fake_mailjet, rows)
+
+    assert batch_result == OutboxRunResult(sent=1, failed=1)
+    assert keep_going
+    assert fake_mailjet.request_count == 1
+    assert [message["CustomID"] for message in fake_mailjet.sent_messages] == [
+        "outbox-1"
+    ]
+    assert _executed(cursor, DELETE_SENT_SQL) == [([1],)]
+    ((last_error, failed_id),) = _executed(cursor, MARK_FAILED_SQL)
+    assert failed_id == 2
+    assert "bad@example.com is an invalid email address." in last_error
+
+
+def test_send_batch_retries_with_backoff_when_mailjet_is_unreachable():
+    """
+    GIVEN a claimed batch where one row has already used all but one attempt
+    WHEN Mailjet cannot be reached
+    THEN the fresh row is rescheduled after the first backoff step, the
+        exhausted row is marked failed, nothing is deleted, and the run stops.
+    """
+    fake_mailjet = FakeMailjet()
+    fake_mailjet.unavailable = True
+    cursor = mock.MagicMock()
+    rows = [
+        (1, _message("first@example.com"), 0),
+        (2, _message("second@example.com"), MAX_SEND_ATTEMPTS - 1),
+    ]
+
+    batch_result, keep_going = _send_batch(cursor, fake_mailjet, rows)
+
+    assert batch_result == OutboxRunResult(failed=1, retried=1)
+    assert not keep_going
+    ((attempts, _, delay_seconds, retried_id),) = _executed(cursor, SCHEDULE_RETRY_SQL)
+    assert (attempts, delay_seconds, retried_id) == (1, backoff_seconds(1), 1)
+    assert [args[1] for args in _executed(cursor, MARK_FAILED_SQL)] == [2]
+    assert _executed(cursor, DELETE_SENT_SQL) == []
+
+
+def test_email_sender_outbox_mode_queues_instead_of_sending():
+    """
+    GIVEN an EmailSender with the outbox enabled
+    WHEN it is asked to send a message
+    THEN the message is added to the session as an Email_Outbox row, Mailjet
+        is never called, and the caller gets a 200 result.
+    """
+    email_sender = EmailSender()
+    email_sender._use_outbox = True
+    email_sender._mailjet_client = mock.MagicMock()
+    message = _message("user@example.com")
+
+    with mock.patch.object(email_sender_module.db, "session") as session:
+        email_send_result = email_sender._send_or_fail({"Messages": [message]})
+
+    assert email_send_result.status_code == 200
+    (outbox_row,), _ = session.add.call_args
+    assert isinstance(outbox_row, Email_Outbox)
+    assert outbox_row.message == message
+    email_sender._mailjet_client.send.create.assert_not_called()
@@ -0,0 +1,103 @@
+from __future__ import annotations
+
+from flask import Flask, g
+import pytest
+from sqlalchemy import create_engine, text
+
+from backend.extensions.sql_tracing import (
+    fingerprint_statement,
+    init_app,
+    sql_trace_log_fields,
+)
+
+pytestmark = pytest.mark.unit
+
+
+@pytest.fixture
+def sqlite_engine():
+    engine = create_engine("sqlite://")
+    with engine.begin() as connection:
+        connection.execute(text("CREATE TABLE tags (id INTEGER, name TEXT)"))
+    yield engine
+    engine.dispose()
+
+
+def test_fingerprint_folds_values_and_expanded_in_lists():
+    """
+    GIVEN statements differing only in bound parameters, literals, IN-list
+        length, and whitespace
+    WHEN they are fingerprinted
+    THEN they fold to one fingerprint, and casts are left intact.
+    """
+    assert (
+        fingerprint_statement(
+            'SELECT "Tags".id FROM "Tags"\n  WHERE "Tags"."utubID" = %(utub_id_1)s '
+            "AND \"Tags\".id IN (%(id_1_1)s, %(id_1_2)s) AND name = 'a'"
+        )
+        == fingerprint_statement(
+            'SELECT "Tags".id FROM "Tags" WHERE "Tags"."utubID" = 7 '
+            "AND \"Tags\".id IN (%(id_1_1)s) AND name = 'it''s'"
+        )
+        == 'SELECT "Tags".id FROM "Tags" WHERE "Tags"."utubID" = ? '
+        'AND "Tags".id IN (...) AND name = ?'
+    )
+    assert fingerprint_statement("SELECT now()::date") == "SELECT now()::date"
+
+
+def test_request_trace_counts_statements_and_repeated_fingerprints(sqlite_engine):
+    """
+    GIVEN an app with SQL tracing whose view looks tags up one id at a time
+    WHEN the view runs
+    THEN the request's trace counts every statement and its DB time, and the
+        log fields report the per-id lookup as one repeated fingerprint.
+    """
+    app = Flask(__name__)
+    init_app(app)
+
+    @app.route("/tags")
+    def _tags():
+        with sqlite_engine.connect() as connection:
+            connection.execute(text("SELECT count(*) FROM tags"))
+            for tag_id in range(3):
+                connection.execute(
+                    text("SELECT name FROM tags WHERE id = :tag_id"),
+                    {"tag_id": tag_id},
+                )
+        g.log_fields = sql_trace_log_fields()
+        return "ok"
+
+    with app.test_request_context("/tags"):
+        app.preprocess_request()
+        app.dispatch_request()
+        log_fields = g.log_fields
+
+    assert log_fields["db_statement_count"] == 4
+    assert log_fields["db_time_ms"] >= 0
+    assert log_fields["db_repeated_statements"] == [
+        {"fingerprint": "SELECT name FROM tags WHERE id = ?", "count": 3}
+    ]
+
+
+def test_assert_max_queries_reports_repeated_statements(
+    sqlite_engine, assert_max_queries
+):
+    """
+    GIVEN the assert_max_queries fixture
+    WHEN a block stays within its statement budget, and another exceeds it
+    THEN the first passes, and the second fails listing the repeated statement.
+    """
+    with sqlite_engine.connect() as connection:
+        with assert_max_queries(2) as sql_trace:
+            connection.execute(text("SELECT 1"))
+        assert sql_trace.statement_count == 1
+
+        with pytest.raises(AssertionError) as assertion_error:
+            with assert_max_queries(2):
+                for tag_id in range(3):
+                    connection.execute(
+                        text("SELECT name FROM tags WHERE id = :tag_id"),
+                        {"tag_id": tag_id},
+                    )
+
+    assert "ran 3 statement(s)" in str(assertion_error.value)
+    assert "3x SELECT name FROM tags WHERE id = ?" in str(assertion_error.value)
@@ -0,0 +1,179 @@
+from __future__ import annotations
+
+from datetime import datetime, timezone
+
+import psycopg2
+import pytest
+
+from scripts.workflow_daemon import (
+    DAY_SECONDS,
+    HOUR_SECONDS,
+    ScheduledJob,
+    WorkflowConnections,
+    build_default_jobs,
+    run_due_jobs,
+    split_daily_jobs,
+)
+
+pytestmark = pytest.mark.unit
+
+
+def _epoch(hour: int, minute: int, second: int = 0) -> int:
+    return int(
+        datetime(2026, 7, 1, hour, minute, second, tzinfo=timezone.utc).timestamp()
+    )
+
+
+class _FakeCursor:
+    def __init__(self, connection: _FakeConnection) -> None:
+        self.connection = connection
+
+    def __enter__(self) -> _FakeCursor:
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        pass
+
+    def execute(self, sql: str) -> None:
+        if not self.connection.alive:
+            raise psycopg2.OperationalError("server closed the connection")
+        self.connection.executed.append(sql)
+
+
+class _FakeConnection:
+    def __init__(self) -> None:
+        self.alive = True
+        self.closed = 0
+        self.executed: list[str] = []
+
+    def cursor(self) -> _FakeCursor:
+        return _FakeCursor(self)
+
+    def rollback(self) -> None:
+        if not self.alive:
+            raise psycopg2.InterfaceError("connection already closed")
+
+    def close(self) -> None:
+        self.closed = 1
+
+
+def test_jobs_are_scheduled_on_cron_aligned_slots():
+    """
+    GIVEN the daemon's default jobs
+    WHEN each is scheduled from 01:59:30 UTC, and an hourly job that overran
+        from 11:00 until 12:20 is rescheduled
+    THEN every job lands on its crontab.workflow slot, and the overrun job
+        skips the 12:00 slot it missed.
+    """
+    now_epoch = _epoch(1, 59, 30)
+    jobs = {job.name: job for job in build_default_jobs()}
+    for job in jobs.values():
+        job.schedule_after(now_epoch)
+
+    assert jobs["metrics_flush"].next_run_epoch == _epoch(2, 0)
+    assert jobs["email_outbox"].next_run_epoch == _epoch(2, 0)
+    assert jobs["gauge_sample"].next_run_epoch == _epoch(2, 0)
+    assert jobs["audit_purge"].next_run_epoch == _epoch(2, 0)
+    assert jobs["refresh_token_compact"].next_run_epoch == _epoch(2, 30)
+    assert jobs["gauge_reconcile"].next_run_epoch == _epoch(3, 0)
+    assert jobs["gauge_reconcile"].interval_seconds == DAY_SECONDS
+
+    overrun_job = ScheduledJob("overrun", HOUR_SECONDS, lambda *_: "")
+    overrun_job.schedule_after(_epoch(12, 20))
+    assert overrun_job.next_run_epoch == _epoch(13, 0)
+
+
+def test_daily_jobs_run_in_their_own_lane():
+    """
+    GIVEN the daemon's default jobs
+    WHEN they are split into the main and worker lanes
+    THEN the minutely and hourly jobs stay on the main lane and only the daily
+        jobs move to the worker lane, so none of them can delay the flush.
+    """
+    frequent_jobs, daily_jobs = split_daily_jobs(build_default_jobs())
+
+    assert [job.name for job in frequent_jobs] == [
+        "metrics_flush",
+        "email_outbox",
+        "gauge_sample",
+    ]
+    assert [job.name for job in daily_jobs] == [
+        "audit_purge",
+        "refresh_token_compact",
+        "gauge_reconcile",
+    ]
+
+
+def test_failed_job_does_not_stop_the_others_and_drops_a_dead_connection():
+    """
+    GIVEN two due jobs sharing one connection, the first failing because the
+        database dropped the connection, and a job not yet due
+    WHEN the due jobs are run
+    THEN the failure is reported, the second job runs on a fresh connection,
+        the job not yet due does not run, and every run job is rescheduled.
+    """
+    opened: list[_FakeConnection] = []
+
+    def _connect() -> _FakeConnection:
+        opened.append(_FakeConnection())
+        return opened[-1]
+
+    connections = WorkflowConnections(pg_connect=_connect, redis_client=None)
+    ran: list[str] = []
+
+    def _drops_connection(job_connections: WorkflowConnections, now_epoch: int):
+        job_connections.pg_conn().alive = False
+        raise psycopg2.OperationalError("terminating connection")
+
+    def _records(name: str):
+        def _run(job_connections: WorkflowConnections, now_epoch: int) -> str:
+            ran.append(name)
+            job_connections.pg_conn()
+            return "ok"
+
+        return _run
+
+    now_epoch = _epoch(2, 0, 5)
+    jobs = [
+        ScheduledJob("first", 60, _drops_connection, next_run_epoch=_epoch(2, 0)),
+        ScheduledJob("second", 60, _records("second"), next_run_epoch=_epoch(2, 0)),
+        ScheduledJob("later", 3600, _records("later"), next_run_epoch=_epoch(3, 0)),
+    ]
+
+    failed_job_names = run_due_jobs(jobs, connections, clock=lambda: now_epoch)
+
+    assert failed_job_names == ["first"]
+    assert ran == ["second"]
+    assert len(opened) == 2 and opened[0].closed
+    assert [job.next_run_epoch for job in jobs] == [
+        _epoch(2, 1),
+        _epoch(2, 1),
+        _epoch(3, 0),
+    ]
+
+
+def test_connection_is_reused_while_alive_and_replaced_once_it_stops_answering():
+    """
+    GIVEN a shared connection
+    WHEN it is requested twice while alive, then after the server closed it
+    THEN the same connection is reused with a SELECT 1 check, and a new one is
+        opened once the check fails.
+    """
+    opened: list[_FakeConnection] = []
+
+    def _connect() -> _FakeConnection:
+        opened.append(_FakeConnection())
+        return opened[-1]
+
+    connections = WorkflowConnections(pg_connect=_connect, redis_client=None)
+
+    first = connections.pg_conn()
+    assert connections.pg_conn() is first
+    assert first.executed == ["SELECT 1"]
+
+    first.alive = False
+    replacement = connections.pg_conn()
+
+    assert replacement is not first
+    assert first.closed
+    assert len(opened) == 2
@@ -35,6 +35,10 @@ _FLUSH_METRICS_SCRIPT: Path = _PROJECT_ROOT / "scripts" / "flush_metrics.py"
 _CHECK_LIVENESS_SCRIPT: Path = _PROJECT_ROOT / "scripts" / "check_flush_liveness.py"
 _PURGE_AUDIT_LOG_SCRIPT: Path = _PROJECT_ROOT / "scripts" / "purge_audit_log.py"
 _SAMPLE_GAUGES_SCRIPT: Path = _PROJECT_ROOT / "scripts" / "sample_gauges.py"
+_SEND_EMAIL_OUTBOX_SCRIPT: Path = _PROJECT_ROOT / "scripts" / "send_email_outbox.py"
+_COMPACT_REFRESH_TOKENS_SCRIPT: Path = (
+    _PROJECT_ROOT / "scripts" / "compact_refresh_tokens.py"
+)
 _NOTIFY_SCRIPT: Path = _PROJECT_ROOT / "scripts" / "notify.py"
 _BACKUP_SENTINEL_SCRIPT: Path = _PROJECT_ROOT / "scripts" / "backup_sentinel.py"
 _RUN_BACKUP_IF_REQUESTED_SCRIPT: Path = (
@@ -213,6 +217,30 @@ def test_allow_list_covers_purge_audit_log_env_reads():
     ), f"purge_audit_log.py reads {sorted(reads - _ALLOWED)} not in ALLOW_VARS"
 
 
+def test_allow_list_covers_send_email_outbox_env_reads():
+    """
+    GIVEN the env-var keys read by scripts/send_email_outbox.py
+    WHEN they are compared against ALLOW_VARS
+    THEN every read key is present in ALLOW_VARS.
+    """
+    reads = _walk_env_reads(_SEND_EMAIL_OUTBOX_SCRIPT.read_text())
+    assert (
+        reads <= _ALLOWED
+    ), f"send_email_outbox.py reads {sorted(reads - _ALLOWED)} not in ALLOW_VARS"
+
+
+def test_allow_list_covers_compact_refresh_tokens_env_reads():
+    """
+    GIVEN the env-var keys read by scripts/compact_refresh_tokens.py
+    WHEN they are compared against ALLOW_VARS
+    THEN every read key is present in ALLOW_VARS.
+    """
+    reads = _walk_env_reads(_COMPACT_REFRESH_TOKENS_SCRIPT.read_text())
+    assert (
+        reads <= _ALLOWED
+    ), f"compact_refresh_tokens.py reads {sorted(reads - _ALLOWED)} not in ALLOW_VARS"
+
+
 def test_allow_list_covers_notify_env_reads():
     """
     GIVEN the env-var keys read by scripts/notify.py